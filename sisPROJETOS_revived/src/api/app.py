@@ -15,6 +15,8 @@ Documentação interativa disponível em:
 
 import os
 import sys
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 # Garante que src/ esteja no path para importações dos módulos
 _SRC = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -26,6 +28,14 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from __version__ import __version__  # noqa: E402
 from api.routes import catenary, converter, cqt, data, electrical, health, pole_load, project_creator
+from modules.cqt.batch import shutdown_pool
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Encerra o pool de processos do CQT em lote no desligamento do servidor."""
+    yield
+    shutdown_pool()
 
 
 def create_app() -> FastAPI:
@@ -46,6 +56,7 @@ def create_app() -> FastAPI:
         ),
         contact={"name": "sisPROJETOS", "url": "https://github.com/jrlampa/sisPROJETOS_v1.1"},
         license_info={"name": "MIT"},
+        lifespan=_lifespan,
         openapi_tags=[
             {"name": "Elétrico", "description": "Cálculos elétricos (NBR 5410 / ANEEL PRODIST) e batch"},
             {"name": "CQT", "description": "Custo de Queda de Tensão — Metodologia Enel"},
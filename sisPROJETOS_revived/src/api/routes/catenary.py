@@ -5,12 +5,16 @@ Endpoints:
 - POST /api/v1/catenary/calculate   Calcula flecha e constante catenária (NBR 5422).
 - POST /api/v1/catenary/dxf         Gera arquivo DXF da curva catenária (retorna Base64).
 - POST /api/v1/catenary/batch       Calcula múltiplos vãos em lote (BIM efficiency).
+- POST /api/v1/catenary/section     Seção de tensionamento: vão regulador e todos os vãos.
+- POST /api/v1/catenary/terrain-clearance  Distância ao solo sobre o perfil do terreno.
+- POST /api/v1/catenary/inverse     Tração ou vão máximo para flecha/folga alvo (lote).
 - GET  /api/v1/catenary/clearances  Tabela de folgas mínimas NBR 5422 / PRODIST Módulo 6.
 """
 
 import base64
-from typing import List, Optional
+from typing import Any, List, Optional
 
+import numpy as np
 from fastapi import APIRouter, HTTPException
 
 from api.schemas import (
@@ -19,14 +23,25 @@ from api.schemas import (
     CatenaryBatchResponseItem,
     CatenaryDxfRequest,
     CatenaryDxfResponse,
+    CatenaryInverseRequest,
+    CatenaryInverseResponse,
+    CatenaryInverseResponseItem,
     CatenaryRequest,
     CatenaryResponse,
+    CatenarySectionRequest,
+    CatenarySectionResponse,
     ClearancesResponse,
     ClearanceTypeOut,
+    TerrainClearanceRequest,
+    TerrainClearanceResponse,
+    TerrainSpanOut,
+    TerrainViolationOut,
 )
+from api.schemas_catenary import TERRAIN_MAX_PROFILE_POINTS
 from domain.services import CatenaryDomainService
 from domain.value_objects import CatenaryResult
-from modules.catenaria.logic import CatenaryLogic
+from modules.catenaria.clearance import TerrainProfile
+from modules.catenaria.logic import DEFAULT_CURVE_POINTS, CatenaryLogic
 from utils.dxf_manager import DXFManager
 from utils.logger import get_logger
 
@@ -35,6 +50,16 @@ router = APIRouter(prefix="/catenary", tags=["Catenária"])
 _logic = CatenaryLogic()
 _domain_service = CatenaryDomainService()
 
+# Pontos da curva (x, y) por vão quando nem 'curve_points' nem 'curve_tolerance_m'
+# são informados — mesmo padrão de ``CatenaryLogic.calculate_catenary``.
+_CURVE_POINTS = DEFAULT_CURVE_POINTS
+
+
+def _curve_points(request: Any) -> int:
+    """Pontos fixos da curva pedidos na requisição (padrão ``_CURVE_POINTS``)."""
+    return request.curve_points or _CURVE_POINTS
+
+
 # ── Tabela de folgas mínimas NBR 5422 / PRODIST Módulo 6 ─────────────────────
 # Valores de referência para o campo min_clearance_m do endpoint /calculate.
 # Hierarquia: norma da concessionária > ANEEL/PRODIST > ABNT.
@@ -95,8 +120,9 @@ _CLEARANCES: List[ClearanceTypeOut] = [
         "Quando 'min_clearance_m' é fornecido, retorna 'within_clearance' "
         "indicando se a flecha respeita a distância mínima ao solo (NBR 5422: "
         "BT urbana=6,0 m, BT rural=5,5 m, MT=7,0 m). "
-        "Quando 'include_curve=true', retorna os 100 pontos (X,Y) da curva para "
-        "renderização em ferramentas BIM e CAD externas."
+        "Quando 'include_curve=true', retorna os pontos (X,Y) da curva para "
+        "renderização em ferramentas BIM e CAD externas: 100 por padrão, 'curve_points' fixos ou, "
+        "com 'curve_tolerance_m', o mínimo que mantém o erro de corda abaixo da tolerância."
     ),
 )
 def calculate_catenary(request: CatenaryRequest) -> CatenaryResponse:
@@ -107,6 +133,8 @@ def calculate_catenary(request: CatenaryRequest) -> CatenaryResponse:
         hb=request.hb,
         tension_daN=request.tension_daN,
         weight_kg_m=request.weight_kg_m,
+        curve_points=_curve_points(request),
+        curve_tolerance_m=request.curve_tolerance_m,
     )
     if result is None:
         logger.warning("Cálculo de catenária retornou None para %s", request.model_dump())
@@ -146,7 +174,9 @@ def calculate_catenary(request: CatenaryRequest) -> CatenaryResponse:
         "para integração com ferramentas BIM e CAD. "
         "O DXF segue a convenção 2.5D com layers: CATENARY_CURVE (verde), "
         "SUPPORTS (amarelo) e ANNOTATIONS (branco/preto). "
-        "Compatível com AutoCAD, QGIS, Civil 3D e outros viewers CAD."
+        "Compatível com AutoCAD, QGIS, Civil 3D e outros viewers CAD. "
+        "'curve_tolerance_m' define o erro de corda máximo da polilinha (vãos longos recebem mais "
+        "vértices, vãos curtos menos); sem ele a curva tem 'curve_points' (padrão 100) vértices."
     ),
 )
 def generate_catenary_dxf(request: CatenaryDxfRequest) -> CatenaryDxfResponse:
@@ -157,6 +187,8 @@ def generate_catenary_dxf(request: CatenaryDxfRequest) -> CatenaryDxfResponse:
         hb=request.hb,
         tension_daN=request.tension_daN,
         weight_kg_m=request.weight_kg_m,
+        curve_points=_curve_points(request),
+        curve_tolerance_m=request.curve_tolerance_m,
     )
     if result is None:
         logger.warning("Cálculo de catenária retornou None para DXF: %s", request.model_dump())
@@ -203,65 +235,56 @@ def get_clearances() -> ClearancesResponse:
     response_model=CatenaryBatchResponse,
     summary="Cálculo de catenária em lote (múltiplos vãos — BIM)",
     description=(
-        "Calcula flecha, tensão e constante catenária para até 20 vãos em uma única chamada, "
-        "evitando N chamadas individuais ao endpoint /calculate. "
-        "Ideal para integração BIM com linhas de distribuição com múltiplos vãos. "
+        "Calcula flecha, tensão e constante catenária para até 10 000 vãos em uma única chamada "
+        "(um passe vetorizado), evitando N chamadas individuais ao endpoint /calculate. "
+        "Ideal para integração BIM com rotas completas de linhas de distribuição. "
+        "A curva (x, y) de cada vão só é gerada com 'include_curve=true' ('curve_tolerance_m' "
+        "ajusta o número de pontos de cada vão ao erro de corda pedido). "
         "Vãos com parâmetros inválidos retornam 'success=false' com descrição do erro, "
         "sem abortar o processamento dos demais itens."
     ),
 )
 def calculate_catenary_batch(request: CatenaryBatchRequest) -> CatenaryBatchResponse:
-    """Processa múltiplos vãos de catenária em lote; erros individuais não abortam o lote."""
-    response_items: List[CatenaryBatchResponseItem] = []
-
-    for idx, item in enumerate(request.items):
-        try:
-            result = _logic.calculate_catenary(
-                span=item.span,
-                ha=item.ha,
-                hb=item.hb,
-                tension_daN=item.tension_daN,
-                weight_kg_m=item.weight_kg_m,
-            )
-            if result is None:
+    """Processa múltiplos vãos de catenária em um passe vetorizado; erros individuais não abortam o lote."""
+    items = request.items
+    try:
+        result = _logic.calculate_batch(
+            span=[item.span for item in items],
+            ha=[item.ha for item in items],
+            hb=[item.hb for item in items],
+            tension_daN=[item.tension_daN for item in items],
+            weight_kg_m=[item.weight_kg_m for item in items],
+            min_clearance_m=[np.nan if item.min_clearance_m is None else item.min_clearance_m for item in items],
+            curve_points=_curve_points(request) if request.include_curve else 0,
+            curve_tolerance_m=request.curve_tolerance_m if request.include_curve else None,
+        )
+    except Exception as exc:
+        logger.warning("Erro no lote de catenária: %s", exc)
+        response_items = [
+            CatenaryBatchResponseItem(index=idx, label=item.label, success=False, error=str(exc))
+            for idx, item in enumerate(items)
+        ]
+    else:
+        sag, constant, tension = result.sag.tolist(), result.catenary_constant.tolist(), result.tension.tolist()
+        checked, within = result.clearance_checked.tolist(), result.within_clearance.tolist()
+        response_items = []
+        for idx, item in enumerate(items):
+            if idx in result.errors:
                 response_items.append(
-                    CatenaryBatchResponseItem(
-                        index=idx,
-                        label=item.label,
-                        success=False,
-                        error="Peso linear zero ou dados inválidos para o cálculo.",
-                    )
+                    CatenaryBatchResponseItem(index=idx, label=item.label, success=False, error=result.errors[idx])
                 )
                 continue
-
-            within_clearance: Optional[bool] = None
-            if item.min_clearance_m is not None:
-                domain_result = CatenaryResult(
-                    sag=float(result["sag"]),
-                    tension=float(result["tension"]),
-                    catenary_constant=float(result["catenary_constant"]),
-                )
-                within_clearance = _domain_service.is_within_clearance(domain_result, item.min_clearance_m)
-
             response_items.append(
                 CatenaryBatchResponseItem(
                     index=idx,
                     label=item.label,
                     success=True,
-                    sag=float(result["sag"]),
-                    tension=float(result["tension"]),
-                    catenary_constant=float(result["catenary_constant"]),
-                    within_clearance=within_clearance,
-                )
-            )
-        except Exception as exc:
-            logger.warning("Erro no item %d do lote de catenária: %s", idx, exc)
-            response_items.append(
-                CatenaryBatchResponseItem(
-                    index=idx,
-                    label=item.label,
-                    success=False,
-                    error=str(exc),
+                    sag=sag[idx],
+                    tension=tension[idx],
+                    catenary_constant=constant[idx],
+                    within_clearance=within[idx] if checked[idx] else None,
+                    curve_x=result.x_vals[idx].tolist() if result.x_vals is not None else None,
+                    curve_y=result.y_vals[idx].tolist() if result.y_vals is not None else None,
                 )
             )
 
@@ -272,3 +295,164 @@ def calculate_catenary_batch(request: CatenaryBatchRequest) -> CatenaryBatchResp
         error_count=len(response_items) - success_count,
         items=response_items,
     )
+
+
+@router.post(
+    "/section",
+    response_model=CatenarySectionResponse,
+    summary="Seção de tensionamento: vão regulador e flechas de todos os vãos (NBR 5422)",
+    description=(
+        "Calcula o vão regulador (vão equivalente) de uma seção entre ancoragens e, com a tração "
+        "horizontal comum, a flecha, a constante catenária e a tração no apoio de cada vão em um "
+        "único passe vetorizado (até 10 000 vãos). Informe 'support_heights' com um elemento a mais "
+        "que 'spans'. Com 'conductor' e 'temperature', 'tension_daN' é a tração do vão regulador na "
+        "'reference_temperature' e a tração da seção é obtida pela equação de mudança de estado."
+    ),
+)
+def calculate_catenary_section(request: CatenarySectionRequest) -> CatenarySectionResponse:
+    """Calcula vão regulador e resultados por vão de uma seção; dados inconsistentes retornam 422."""
+    try:
+        result = _logic.calculate_section(
+            spans=request.spans,
+            support_heights=request.support_heights,
+            tension_daN=request.tension_daN,
+            weight_kg_m=request.weight_kg_m,
+            conductor=request.conductor,
+            temperature=request.temperature,
+            reference_temperature=request.reference_temperature,
+            min_clearance_m=request.min_clearance_m,
+            curve_points=_curve_points(request) if request.include_curve else 0,
+            curve_tolerance_m=request.curve_tolerance_m if request.include_curve else None,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+    spans = result.spans
+    return CatenarySectionResponse(
+        count=spans.size,
+        ruling_span=result.ruling_span,
+        ruling_sag=result.ruling_sag,
+        tension=result.tension_daN,
+        weight_kg_m=result.weight_kg_m,
+        sag=spans.sag.tolist(),
+        catenary_constant=spans.catenary_constant.tolist(),
+        max_tension=result.max_tension.tolist(),
+        within_clearance=spans.within_clearance.tolist() if request.min_clearance_m is not None else None,
+        curve_x=[x.tolist() for x in spans.x_vals] if spans.x_vals is not None else None,
+        curve_y=[y.tolist() for y in spans.y_vals] if spans.y_vals is not None else None,
+    )
+
+
+@router.post(
+    "/terrain-clearance",
+    response_model=TerrainClearanceResponse,
+    summary="Distância ao solo ao longo da curva sobre o perfil do terreno (NBR 5422)",
+    description=(
+        "Verifica a distância vertical condutor–solo ao longo de toda a curva de cada vão, com o terreno "
+        "linear entre as estacas informadas (ao contrário de 'min_clearance_m' em /calculate, que compara "
+        "apenas a flecha). 'ha'/'hb' são cotas de fixação no mesmo referencial das cotas do terreno. "
+        "Retorna a menor distância e a estaca onde ocorre em cada vão e as estacas em violação; rotas "
+        "inteiras (até 10 000 vãos) são resolvidas em uma chamada vetorizada."
+    ),
+)
+def check_terrain_clearance(request: TerrainClearanceRequest) -> TerrainClearanceResponse:
+    """Calcula a distância ao solo de todos os vãos; perfis inconsistentes retornam 422."""
+    items = request.spans
+    try:
+        profile = TerrainProfile.from_spans([(item.stations, item.elevations) for item in items])
+        if profile.station.size > TERRAIN_MAX_PROFILE_POINTS:
+            raise ValueError(f"Perfil com mais de {TERRAIN_MAX_PROFILE_POINTS} estacas.")
+        result = _logic.check_terrain_clearance(
+            span=[item.span for item in items],
+            ha=[item.ha for item in items],
+            hb=[item.hb for item in items],
+            tension_daN=[item.tension_daN for item in items],
+            weight_kg_m=[item.weight_kg_m for item in items],
+            profile=profile,
+            min_clearance_m=[item.min_clearance_m for item in items],
+        )
+        if not result.checked.all():
+            missing = int(np.flatnonzero(~result.checked)[0])
+            reason = result.errors.get(missing, "perfil do terreno vazio.")
+            raise ValueError(f"Vão {missing + 1}: {reason}")
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+    min_c, min_x, within = result.min_clearance.tolist(), result.min_station.tolist(), result.within_clearance.tolist()
+    violations = result.violations()
+    worst = result.worst_span
+    return TerrainClearanceResponse(
+        count=len(items),
+        violation_span_count=within.count(False),
+        worst_span=worst,
+        min_clearance=min_c[worst],
+        spans=[
+            TerrainSpanOut(
+                index=i, label=item.label, min_clearance=min_c[i], min_station=min_x[i], within_clearance=within[i]
+            )
+            for i, item in enumerate(items)
+        ],
+        violations=[
+            TerrainViolationOut(span_index=s, station=x, clearance=c)
+            for s, x, c in violations[: request.max_violations]
+        ],
+        violation_count=len(violations),
+    )
+
+
+def _nan_if_none(values: List[Optional[float]]) -> List[float]:
+    return [np.nan if v is None else v for v in values]
+
+
+@router.post(
+    "/inverse",
+    response_model=CatenaryInverseResponse,
+    summary="Cálculo inverso: tração ou vão máximo para flecha ou folga alvo (lote)",
+    description=(
+        "Resolve, para até 10 000 itens em passes vetorizados, a tração horizontal ('solve_for=tension', "
+        "com 'span') ou o vão máximo ('solve_for=span', com 'tension_daN') que atinge a flecha alvo "
+        "('target=sag', com 'sag_m') ou mantém o ponto mais baixo da curva na folga alvo sobre solo "
+        "nivelado ('target=clearance', com 'clearance_m', 'ha' e 'hb'). Mesma curva de /calculate; "
+        "substitui a busca manual por tentativas. Itens sem os campos exigidos ou com alvo inatingível "
+        "retornam 'success=false' sem abortar o lote."
+    ),
+)
+def solve_catenary_inverse(request: CatenaryInverseRequest) -> CatenaryInverseResponse:
+    """Resolve o cálculo inverso de todos os itens em uma chamada vetorizada."""
+    items = request.items
+    result = _logic.solve_inverse(
+        request.solve_for,
+        request.target,
+        weight_kg_m=[item.weight_kg_m for item in items],
+        span=_nan_if_none([item.span for item in items]),
+        tension_daN=_nan_if_none([item.tension_daN for item in items]),
+        sag_m=_nan_if_none([item.sag_m for item in items]),
+        clearance_m=_nan_if_none([item.clearance_m for item in items]),
+        ha=[item.ha for item in items],
+        hb=[item.hb for item in items],
+    )
+    tension, span = result.tension.tolist(), result.span.tolist()
+    sag, constant = result.sag.tolist(), result.catenary_constant.tolist()
+    response_items = [
+        (
+            CatenaryInverseResponseItem(index=i, label=item.label, success=False, error=result.errors[i])
+            if i in result.errors
+            else CatenaryInverseResponseItem(
+                index=i,
+                label=item.label,
+                success=True,
+                tension=tension[i],
+                span=span[i],
+                sag=sag[i],
+                catenary_constant=constant[i],
+            )
+        )
+        for i, item in enumerate(items)
+    ]
+    success_count = result.size - len(result.errors)
+    return CatenaryInverseResponse(
+        count=result.size,
+        success_count=success_count,
+        error_count=len(result.errors),
+        items=response_items,
+    )
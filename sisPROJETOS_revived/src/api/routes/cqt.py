@@ -1,13 +1,24 @@
 """
 Rota de cálculo CQT — API REST sisPROJETOS.
 
-Endpoint: POST /api/v1/cqt/calculate
-Calcula queda de tensão de circuito (CQT) pela metodologia Enel.
+Endpoints:
+- POST /api/v1/cqt/calculate  Calcula queda de tensão de circuito (CQT) pela metodologia Enel.
+- POST /api/v1/cqt/batch      Calcula várias redes independentes em um pool de processos.
 """
 
+from typing import List
+
 from fastapi import APIRouter
 
-from api.schemas import CQTRequest, CQTResponse
+from api.schemas import (
+    CQT_BATCH_MAX_ITEMS,
+    CQTBatchRequest,
+    CQTBatchResponse,
+    CQTBatchResponseItem,
+    CQTRequest,
+    CQTResponse,
+)
+from modules.cqt.batch import calculate_networks
 from modules.cqt.logic import CQTLogic
 from utils.logger import get_logger
 
@@ -23,13 +34,65 @@ _logic = CQTLogic()
     description=(
         "Executa o cálculo de Custo de Queda de Tensão (CQT) e "
         "Balanço de Demanda e Investimento (BDI) para uma rede de distribuição, "
-        "conforme metodologia Enel (CNS-OMBR-MAT-19-0285)."
+        "conforme metodologia Enel (CNS-OMBR-MAT-19-0285). "
+        "Para redes grandes, 'result_format' = 'columnar' ou 'base64' devolve os resultados "
+        "por ponto como arrays paralelos em 'columns' (JSON muito menor e mais rápido de processar)."
     ),
 )
 def calculate_cqt(request: CQTRequest) -> CQTResponse:
     """Calcula CQT por ordenação topológica dos trechos de rede."""
     segments = [seg.model_dump() for seg in request.segments]
-    result = _logic.calculate(segments, request.trafo_kva, request.social_class)
+    result = _logic.calculate(segments, request.trafo_kva, request.social_class, request.result_format)
     # Promote segments_over_limit from summary to top-level for direct API access
     segments_over_limit = result.get("summary", {}).get("segments_over_limit") if result.get("success") else None
     return CQTResponse(**result, segments_over_limit=segments_over_limit)
+
+
+@router.post(
+    "/batch",
+    response_model=CQTBatchResponse,
+    summary="Cálculo CQT em lote (múltiplas redes — BIM)",
+    description=(
+        f"Calcula CQT/BDI para até {CQT_BATCH_MAX_ITEMS} redes independentes (um TRAFO cada) em uma "
+        "única chamada, distribuindo as redes em um pool de processos configurável: "
+        "ideal para regiões de alimentador com centenas de transformadores. "
+        "Redes inválidas retornam 'success=false' com descrição do erro, "
+        "sem abortar o processamento das demais."
+    ),
+)
+def calculate_cqt_batch(request: CQTBatchRequest) -> CQTBatchResponse:
+    """Processa múltiplas redes CQT em lote; erros individuais não abortam o lote."""
+    jobs = [
+        {
+            "segments": [seg.model_dump() for seg in item.segments],
+            "trafo_kva": item.trafo_kva,
+            "social_class": item.social_class,
+            "result_format": request.result_format,
+        }
+        for item in request.items
+    ]
+    results = calculate_networks(jobs, workers=request.workers, include_results=request.include_results, logic=_logic)
+
+    response_items: List[CQTBatchResponseItem] = []
+    for idx, (item, result) in enumerate(zip(request.items, results)):
+        summary = result.get("summary")
+        response_items.append(
+            CQTBatchResponseItem(
+                index=idx,
+                label=item.label,
+                success=bool(result.get("success")),
+                error=result.get("error"),
+                summary=summary,
+                results=result.get("results"),
+                columns=result.get("columns"),
+                segments_over_limit=summary.get("segments_over_limit") if summary else None,
+            )
+        )
+
+    success_count = sum(1 for r in response_items if r.success)
+    return CQTBatchResponse(
+        count=len(response_items),
+        success_count=success_count,
+        error_count=len(response_items) - success_count,
+        items=response_items,
+    )
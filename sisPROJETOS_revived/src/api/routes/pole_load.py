@@ -4,7 +4,8 @@ Rota de cálculo de esforços em postes — API REST sisPROJETOS.
 Endpoints:
 - POST /api/v1/pole-load/resultant  — Calcula resultante de esforços em poste
 - POST /api/v1/pole-load/report     — Gera relatório PDF em Base64 (NBR 8451/8452)
-- POST /api/v1/pole-load/batch      — Calcula esforços em lote (até 20 postes)
+- POST /api/v1/pole-load/batch      — Calcula esforços em lote (cálculo vetorizado de toda a rede)
+- POST /api/v1/pole-load/sweep      — Resultante em todas as condições de carga e a determinante
 - GET  /api/v1/pole-load/suggest    — Sugere postes por força resultante (sem cálculo)
 """
 
@@ -14,6 +15,7 @@ from typing import List
 from fastapi import APIRouter, HTTPException, Query
 
 from api.schemas import (
+    POLE_LOAD_BATCH_MAX_ITEMS,
     PoleLoadBatchRequest,
     PoleLoadBatchResponse,
     PoleLoadBatchResponseItem,
@@ -23,6 +25,7 @@ from api.schemas import (
     PoleLoadResponse,
     PoleSuggestResponse,
 )
+from api.schemas_pole_load import PoleLoadConditionOut, PoleLoadSweepRequest, PoleLoadSweepResponse
 from modules.pole_load.logic import PoleLoadLogic
 from modules.pole_load.report import generate_report_to_buffer
 from utils.logger import get_logger
@@ -86,6 +89,39 @@ def calculate_pole_load(request: PoleLoadRequest) -> PoleLoadResponse:
     )
 
 
+@router.post(
+    "/sweep",
+    response_model=PoleLoadSweepResponse,
+    summary="Calcula a resultante em todas as condições de carga",
+    description=(
+        "Resolve as trações dos condutores uma única vez e aplica o fator de segurança de cada "
+        "condição (Normal, Vento Forte, Gelo ou as informadas em 'condicoes'), retornando a "
+        "resultante de cada uma, a condição determinante (maior resultante) e os postes "
+        "sugeridos para ela. Substitui uma chamada a /resultant por condição."
+    ),
+)
+def calculate_pole_load_sweep(request: PoleLoadSweepRequest) -> PoleLoadSweepResponse:
+    """Calcula a resultante por condição e sugere o poste para a condição determinante."""
+    try:
+        result = _logic.calculate_condition_sweep(
+            concessionaria=request.concessionaria,
+            cabos_input=[c.model_dump() for c in request.cabos],
+            condicoes=request.condicoes,
+        )
+    except KeyError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+    governing = result["governing"]
+    suggested = _logic.suggest_pole(governing["resultant_force"])
+    return PoleLoadSweepResponse(
+        conditions=[PoleLoadConditionOut(**c) for c in result["conditions"]],
+        governing_condition=governing["condicao"],
+        governing_force=governing["resultant_force"],
+        vectors=result["vectors"],
+        suggested_poles=suggested,
+    )
+
+
 @router.post(
     "/report",
     response_model=PoleLoadReportResponse,
@@ -133,54 +169,58 @@ def generate_pole_load_report(request: PoleLoadReportRequest) -> PoleLoadReportR
     response_model=PoleLoadBatchResponse,
     summary="Calcula esforços em lote (múltiplos postes)",
     description=(
-        "Processa até 20 postes em uma única chamada API, calculando a resultante de esforços "
-        "para cada um conforme metodologias Light (flecha) e Enel (tabela). "
+        f"Processa até {POLE_LOAD_BATCH_MAX_ITEMS} postes em uma única chamada API, calculando a resultante "
+        "de esforços para cada um conforme metodologias Light (flecha) e Enel (tabela). "
+        "Os cabos de todos os postes são resolvidos de uma vez (trações pelo catálogo em memória "
+        "e somas vetoriais por poste com NumPy), e os postes sugeridos vêm de uma busca binária "
+        "vetorizada no catálogo de postes. "
         "Falhas individuais (concessionária inválida, dados ausentes) retornam 'success=False' "
         "para o item sem abortar os demais postes do lote. "
-        "Ideal para integração BIM com múltiplos postes de uma rede de distribuição."
+        "Ideal para integração BIM com todos os postes de uma rede de distribuição."
     ),
 )
 def calculate_pole_load_batch(request: PoleLoadBatchRequest) -> PoleLoadBatchResponse:
-    """Calcula resultante de esforços para múltiplos postes em lote (máximo 20)."""
-    response_items: List[PoleLoadBatchResponseItem] = []
+    """Calcula resultante de esforços para todos os postes do lote em um único passe vetorizado."""
+    cables = [(idx, c) for idx, item in enumerate(request.items) for c in item.cabos]
+    try:
+        result = _logic.calculate_batch(
+            pole=[idx for idx, _ in cables],
+            conductor=[c.condutor for _, c in cables],
+            span=[c.vao for _, c in cables],
+            angle=[c.angulo for _, c in cables],
+            sag=[c.flecha for _, c in cables],
+            concessionaires=[item.concessionaria for item in request.items],
+            conditions=[item.condicao for item in request.items],
+        )
+    except KeyError as exc:
+        logger.error("Erro no lote de postes: %s", exc)
+        raise HTTPException(status_code=500, detail="Erro ao consultar catálogo de esforços.") from exc
 
+    forces = result.resultant_force.tolist()
+    angles = result.resultant_angle.tolist()
+    try:
+        suggestions = _logic.suggest_poles(result.resultant_force)
+    except Exception as exc:
+        logger.error("Erro ao sugerir postes para o lote: %s", exc)
+        raise HTTPException(status_code=500, detail="Erro ao consultar catálogo de postes.") from exc
+
+    response_items: List[PoleLoadBatchResponseItem] = []
     for idx, item in enumerate(request.items):
-        try:
-            result = _logic.calculate_resultant(
-                concessionaria=item.concessionaria,
-                condicao=item.condicao,
-                cabos_input=[c.model_dump() for c in item.cabos],
-            )
-            suggested = _logic.suggest_pole(result["resultant_force"])
+        if idx in result.errors:
             response_items.append(
-                PoleLoadBatchResponseItem(
-                    index=idx,
-                    label=item.label,
-                    success=True,
-                    resultant_force=result["resultant_force"],
-                    resultant_angle=result["resultant_angle"],
-                    suggested_poles=suggested,
-                )
+                PoleLoadBatchResponseItem(index=idx, label=item.label, success=False, error=result.errors[idx])
             )
-        except KeyError as exc:
-            response_items.append(
-                PoleLoadBatchResponseItem(
-                    index=idx,
-                    label=item.label,
-                    success=False,
-                    error=str(exc),
-                )
-            )
-        except Exception as exc:
-            logger.warning("Erro no item %d do lote de postes: %s", idx, exc)
-            response_items.append(
-                PoleLoadBatchResponseItem(
-                    index=idx,
-                    label=item.label,
-                    success=False,
-                    error=str(exc),
-                )
+            continue
+        response_items.append(
+            PoleLoadBatchResponseItem(
+                index=idx,
+                label=item.label,
+                success=True,
+                resultant_force=forces[idx],
+                resultant_angle=angles[idx],
+                suggested_poles=suggestions[idx],
             )
+        )
 
     success_count = sum(1 for r in response_items if r.success)
     return PoleLoadBatchResponse(
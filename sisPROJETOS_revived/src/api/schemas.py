@@ -4,8 +4,10 @@ Schemas Pydantic para a API REST do sisPROJETOS.
 Define modelos de entrada e saída para cada endpoint,
 garantindo validação automática e documentação OpenAPI.
 
-Schemas BIM (KML/UTM/DXF/Projetos) estão em ``api.schemas_bim`` e
-são re-exportados aqui para compatibilidade com os arquivos de rota.
+Schemas BIM (KML/UTM/DXF/Projetos) estão em ``api.schemas_bim``, os de
+CQT em ``api.schemas_cqt`` e os de seções de catenária em
+``api.schemas_catenary``; todos são re-exportados aqui para compatibilidade
+com os arquivos de rota.
 """
 
 from typing import Any, Dict, List, Optional
@@ -36,6 +38,32 @@ from api.schemas_bim import (  # noqa: F401
     VoltageBatchRequest,
     VoltageBatchResponse,
     VoltageBatchResponseItem,
+    curve_points_field,
+    curve_tolerance_field,
+)
+from api.schemas_catenary import (  # noqa: F401
+    CatenaryInverseItem,
+    CatenaryInverseRequest,
+    CatenaryInverseResponse,
+    CatenaryInverseResponseItem,
+    CatenarySectionRequest,
+    CatenarySectionResponse,
+    TerrainClearanceRequest,
+    TerrainClearanceResponse,
+    TerrainSpanIn,
+    TerrainSpanOut,
+    TerrainViolationOut,
+)
+from api.schemas_cqt import (  # noqa: F401
+    CQT_BATCH_MAX_ITEMS,
+    CQTBatchItem,
+    CQTBatchRequest,
+    CQTBatchResponse,
+    CQTBatchResponseItem,
+    CQTColumnarResults,
+    CQTRequest,
+    CQTResponse,
+    CQTSegment,
 )
 
 # ── Infraestrutura ────────────────────────────────────────────────────────────
@@ -131,80 +159,6 @@ class StandardOut(BaseModel):
     )
 
 
-# ── CQT ───────────────────────────────────────────────────────────────────────
-
-
-class CQTSegment(BaseModel):
-    """Trecho de rede para cálculo CQT."""
-
-    ponto: str = Field(..., description="Identificador do ponto (ex: 'P1', 'TRAFO')")
-    montante: str = Field(default="", description="Ponto montante (vazio para TRAFO)")
-    metros: float = Field(default=0.0, ge=0, description="Comprimento do trecho em metros")
-    cabo: str = Field(default="", description="Tipo de cabo (ex: '3x35+54.6mm² Al')")
-    mono: int = Field(default=0, ge=0, description="Unidades consumidoras monofásicas")
-    bi: int = Field(default=0, ge=0, description="Unidades consumidoras bifásicas")
-    tri: int = Field(default=0, ge=0, description="Unidades consumidoras trifásicas")
-    tri_esp: int = Field(default=0, ge=0, description="UCs trifásicas especiais")
-    carga_esp: float = Field(default=0.0, ge=0, description="Carga pontual especial em kVA")
-
-
-class CQTRequest(BaseModel):
-    """Dados de entrada para cálculo CQT (Metodologia Enel)."""
-
-    segments: List[CQTSegment] = Field(..., min_length=1, description="Trechos de rede")
-    trafo_kva: float = Field(..., gt=0, description="Potência do transformador em kVA")
-    social_class: str = Field(default="B", description="Classe social dominante (A, B, C, D)")
-
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "segments": [
-                    {
-                        "ponto": "TRAFO",
-                        "montante": "",
-                        "metros": 0,
-                        "cabo": "",
-                        "mono": 0,
-                        "bi": 0,
-                        "tri": 0,
-                        "tri_esp": 0,
-                        "carga_esp": 0,
-                    },
-                    {
-                        "ponto": "P1",
-                        "montante": "TRAFO",
-                        "metros": 50,
-                        "cabo": "3x35+54.6mm² Al",
-                        "mono": 5,
-                        "bi": 0,
-                        "tri": 0,
-                        "tri_esp": 0,
-                        "carga_esp": 0,
-                    },
-                ],
-                "trafo_kva": 112.5,
-                "social_class": "B",
-            }
-        }
-    }
-
-
-class CQTResponse(BaseModel):
-    """Resultado do cálculo CQT."""
-
-    success: bool
-    results: Optional[Dict[str, Any]] = None
-    summary: Optional[Dict[str, Any]] = None
-    error: Optional[str] = None
-    segments_over_limit: Optional[List[str]] = Field(
-        default=None,
-        description=(
-            "Identificadores dos trechos com CQT acumulado acima do limite de projeto "
-            "(CNS-OMBR-MAT-19-0285). Lista vazia indica rede dentro do critério Enel."
-        ),
-    )
-
-
 # ── Catenária ─────────────────────────────────────────────────────────────────
 
 
@@ -232,6 +186,8 @@ class CatenaryRequest(BaseModel):
             "Útil para integração BIM e renderização de curvas em ferramentas externas."
         ),
     )
+    curve_points: Optional[int] = curve_points_field()
+    curve_tolerance_m: Optional[float] = curve_tolerance_field()
 
     model_config = {
         "json_schema_extra": {
@@ -291,6 +247,8 @@ class CatenaryDxfRequest(BaseModel):
         max_length=100,
         description="Nome sugerido para o arquivo DXF (ex: 'trecho_01.dxf')",
     )
+    curve_points: Optional[int] = curve_points_field()
+    curve_tolerance_m: Optional[float] = curve_tolerance_field()
 
     model_config = {
         "json_schema_extra": {
@@ -407,6 +365,9 @@ class PoleLoadReportResponse(BaseModel):
 
 # ── Esforços em Postes em Lote (Batch) ───────────────────────────────────────
 
+# Postes por requisição: todos os postes de uma rede (mesmo teto do lote de catenária).
+POLE_LOAD_BATCH_MAX_ITEMS = 10_000
+
 
 class PoleLoadBatchItem(BaseModel):
     """Parâmetros de um poste individual para cálculo de esforços em lote.
@@ -453,13 +414,19 @@ class PoleLoadBatchResponseItem(BaseModel):
 class PoleLoadBatchRequest(BaseModel):
     """Dados de entrada para cálculo de esforços em lote (múltiplos postes).
 
-    Permite calcular a resultante de esforços para até 20 postes em uma única chamada.
+    Permite calcular a resultante de esforços para até ``POLE_LOAD_BATCH_MAX_ITEMS``
+    postes em uma única chamada (cálculo vetorizado sobre todos os cabos).
     Falhas individuais (concessionária inválida, dados de cabo ausentes) retornam
     ``success=False`` para o item sem abortar os demais postes do lote.
     Ideal para integração BIM com múltiplos postes de uma rede de distribuição.
     """
 
-    items: List[PoleLoadBatchItem] = Field(..., min_length=1, max_length=20, description="Lista de postes (1–20)")
+    items: List[PoleLoadBatchItem] = Field(
+        ...,
+        min_length=1,
+        max_length=POLE_LOAD_BATCH_MAX_ITEMS,
+        description=f"Lista de postes (1–{POLE_LOAD_BATCH_MAX_ITEMS})",
+    )
 
     model_config = {
         "json_schema_extra": {
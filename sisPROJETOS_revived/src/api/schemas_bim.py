@@ -14,7 +14,7 @@ Importado e re-exportado por ``api.schemas`` para manter compatibilidade
 com todos os arquivos de rota existentes.
 """
 
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -202,6 +202,35 @@ class ClearancesResponse(BaseModel):
 
 # ── Catenária em Lote (Batch) ─────────────────────────────────────────────────
 
+# Vãos por requisição: uma rota completa de linha (ex: 1 000 km com vãos de 100 m).
+CATENARY_BATCH_MAX_ITEMS = 10_000
+
+# Amostragem da curva: mesmo teto de ``modules.catenaria.batch.MAX_CURVE_POINTS``.
+CURVE_POINTS_MAX = 2000
+
+
+def curve_points_field() -> Any:
+    """Campo ``curve_points``: número fixo de pontos da curva por vão."""
+    return Field(
+        default=None,
+        ge=2,
+        le=CURVE_POINTS_MAX,
+        description="Número fixo de pontos da curva por vão (padrão 100; ignorado com 'curve_tolerance_m')",
+    )
+
+
+def curve_tolerance_field() -> Any:
+    """Campo ``curve_tolerance_m``: erro de corda máximo da curva."""
+    return Field(
+        default=None,
+        gt=0,
+        le=10,
+        description=(
+            "Erro de corda máximo da curva em metros: o número de pontos de cada vão é o mínimo que "
+            "mantém a poligonal a essa distância da catenária (vãos curtos → menos pontos)"
+        ),
+    )
+
 
 class CatenaryBatchItem(BaseModel):
     """Parâmetros de um vão individual para cálculo de catenária em lote.
@@ -262,17 +291,35 @@ class CatenaryBatchResponseItem(BaseModel):
         default=None,
         description="Resultado da verificação de folga mínima NBR 5422 (None se não solicitado)",
     )
+    curve_x: Optional[List[float]] = Field(
+        default=None, description="Coordenadas X da curva (apenas com include_curve=true)"
+    )
+    curve_y: Optional[List[float]] = Field(
+        default=None, description="Coordenadas Y da curva (apenas com include_curve=true)"
+    )
 
 
 class CatenaryBatchRequest(BaseModel):
     """Dados de entrada para cálculo de catenária em lote (múltiplos vãos).
 
-    Permite calcular sag/tensão/constante para até 20 vãos em uma única chamada,
-    evitando N chamadas ao endpoint POST /api/v1/catenary/calculate.
-    Ideal para integração BIM com múltiplos vãos de uma linha de distribuição.
+    Permite calcular sag/tensão/constante para até ``CATENARY_BATCH_MAX_ITEMS``
+    vãos em uma única chamada (um passe vetorizado), evitando N chamadas ao
+    endpoint POST /api/v1/catenary/calculate. Ideal para integração BIM com
+    todos os vãos de uma rota de linha de distribuição.
     """
 
-    items: List[CatenaryBatchItem] = Field(..., min_length=1, max_length=20, description="Lista de vãos (1–20)")
+    items: List[CatenaryBatchItem] = Field(
+        ...,
+        min_length=1,
+        max_length=CATENARY_BATCH_MAX_ITEMS,
+        description=f"Lista de vãos (1–{CATENARY_BATCH_MAX_ITEMS})",
+    )
+    include_curve: bool = Field(
+        default=False,
+        description="Se True, inclui os pontos (curve_x, curve_y) da curva de cada vão",
+    )
+    curve_points: Optional[int] = curve_points_field()
+    curve_tolerance_m: Optional[float] = curve_tolerance_field()
 
     model_config = {
         "json_schema_extra": {
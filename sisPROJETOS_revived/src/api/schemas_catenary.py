@@ -0,0 +1,255 @@
+"""
+Schemas Pydantic de seções de catenária para a API REST do sisPROJETOS.
+
+Separados de ``api.schemas`` (regra de 500 linhas) e re-exportados por ele.
+"""
+
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from api.schemas_bim import CATENARY_BATCH_MAX_ITEMS, curve_points_field, curve_tolerance_field
+
+# ── Seção de tensionamento (vão regulador) ────────────────────────────────────
+
+
+class CatenarySectionRequest(BaseModel):
+    """Seção de tensionamento entre ancoragens: vãos consecutivos com tração comum.
+
+    ``support_heights`` tem um elemento a mais que ``spans`` (apoio inicial,
+    intermediários e final). Informe ``weight_kg_m`` ou ``conductor``; com
+    ``temperature``, ``tension_daN`` é a tração do vão regulador na
+    ``reference_temperature`` e a tração da seção é recalculada pela equação
+    de mudança de estado.
+    """
+
+    spans: List[float] = Field(
+        ...,
+        min_length=1,
+        max_length=CATENARY_BATCH_MAX_ITEMS,
+        description=f"Vãos horizontais consecutivos em metros (1–{CATENARY_BATCH_MAX_ITEMS}, > 0)",
+    )
+    support_heights: List[float] = Field(
+        ...,
+        min_length=2,
+        max_length=CATENARY_BATCH_MAX_ITEMS + 1,
+        description="Alturas dos pontos de fixação em metros (uma a mais que os vãos)",
+    )
+    tension_daN: float = Field(..., gt=0, description="Tração horizontal da seção em daN (> 0)")
+    weight_kg_m: Optional[float] = Field(
+        default=None, gt=0, description="Peso linear do condutor em kg/m (ignorado se 'conductor' for informado)"
+    )
+    conductor: Optional[str] = Field(default=None, max_length=120, description="Nome do condutor no catálogo")
+    temperature: Optional[float] = Field(
+        default=None, ge=-50, le=250, description="Temperatura do estado calculado em °C (requer 'conductor')"
+    )
+    reference_temperature: float = Field(
+        default=20.0, ge=-50, le=250, description="Temperatura em que 'tension_daN' foi definida em °C"
+    )
+    min_clearance_m: Optional[float] = Field(
+        default=None, gt=0, description="Folga mínima para verificação NBR 5422 em todos os vãos (opcional)"
+    )
+    include_curve: bool = Field(
+        default=False, description="Se True, inclui os pontos (curve_x, curve_y) da curva de cada vão"
+    )
+    curve_points: Optional[int] = curve_points_field()
+    curve_tolerance_m: Optional[float] = curve_tolerance_field()
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "spans": [80.0, 120.0, 95.0, 150.0],
+                "support_heights": [10.0, 11.0, 10.5, 12.0, 10.0],
+                "tension_daN": 1270.0,
+                "conductor": "556MCM-CA, Nu",
+                "temperature": 75.0,
+                "min_clearance_m": 6.0,
+            }
+        }
+    }
+
+
+class CatenarySectionResponse(BaseModel):
+    """Resultado de uma seção de tensionamento, com arrays paralelos por vão."""
+
+    count: int = Field(..., description="Número de vãos da seção")
+    ruling_span: float = Field(..., description="Vão regulador em metros")
+    ruling_sag: float = Field(..., description="Flecha do vão regulador nivelado em metros")
+    tension: float = Field(..., description="Tração horizontal comum aos vãos em daN")
+    weight_kg_m: float = Field(..., description="Peso linear usado no cálculo em kg/m")
+    sag: List[float] = Field(..., description="Flecha de cada vão em metros")
+    catenary_constant: List[float] = Field(..., description="Constante de catenária de cada vão (a = T/w)")
+    max_tension: List[float] = Field(..., description="Tração no apoio mais alto de cada vão em daN")
+    within_clearance: Optional[List[bool]] = Field(
+        default=None, description="Verificação de folga por vão (None se não solicitada)"
+    )
+    curve_x: Optional[List[List[float]]] = Field(
+        default=None, description="Coordenadas X da curva de cada vão (apenas com include_curve=true)"
+    )
+    curve_y: Optional[List[List[float]]] = Field(
+        default=None, description="Coordenadas Y da curva de cada vão (apenas com include_curve=true)"
+    )
+
+
+# ── Distância ao solo sobre o perfil do terreno ───────────────────────────────
+
+# Pontos de perfil por requisição (ex: 10 000 vãos com 20 estacas cada).
+TERRAIN_MAX_PROFILE_POINTS = 200_000
+
+
+class TerrainSpanIn(BaseModel):
+    """Vão com o perfil do terreno sob o condutor.
+
+    As estacas são distâncias horizontais a partir do apoio A (0 a ``span``) e
+    ``ha``/``hb`` são cotas de fixação no mesmo referencial das cotas do terreno.
+    """
+
+    label: Optional[str] = Field(default=None, max_length=80, description="Rótulo opcional do vão")
+    span: float = Field(..., gt=0, description="Vão horizontal em metros")
+    ha: float = Field(..., description="Cota de fixação no apoio A em metros")
+    hb: float = Field(..., description="Cota de fixação no apoio B em metros")
+    tension_daN: float = Field(..., gt=0, description="Tração horizontal em daN")
+    weight_kg_m: float = Field(..., gt=0, description="Peso linear do condutor em kg/m")
+    min_clearance_m: float = Field(..., gt=0, description="Distância mínima ao solo exigida em metros")
+    stations: List[float] = Field(..., description="Estacas do perfil em metros a partir do apoio A (crescentes)")
+    elevations: List[float] = Field(..., description="Cotas do terreno em cada estaca em metros")
+
+
+class TerrainClearanceRequest(BaseModel):
+    """Rota ou trecho com o perfil do terreno de cada vão."""
+
+    spans: List[TerrainSpanIn] = Field(
+        ...,
+        min_length=1,
+        max_length=CATENARY_BATCH_MAX_ITEMS,
+        description=f"Vãos com perfil do terreno (1–{CATENARY_BATCH_MAX_ITEMS})",
+    )
+    max_violations: int = Field(
+        default=1000, ge=0, le=TERRAIN_MAX_PROFILE_POINTS, description="Máximo de estacas em violação listadas"
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "spans": [
+                    {
+                        "label": "Vão P1-P2",
+                        "span": 100.0,
+                        "ha": 112.0,
+                        "hb": 113.5,
+                        "tension_daN": 1500.0,
+                        "weight_kg_m": 0.779,
+                        "min_clearance_m": 6.0,
+                        "stations": [0.0, 35.0, 60.0, 100.0],
+                        "elevations": [100.0, 101.2, 104.8, 101.5],
+                    }
+                ]
+            }
+        }
+    }
+
+
+class TerrainSpanOut(BaseModel):
+    """Menor distância ao solo de um vão."""
+
+    index: int = Field(..., description="Índice do vão (base 0)")
+    label: Optional[str] = Field(default=None, description="Rótulo fornecido na entrada")
+    min_clearance: float = Field(..., description="Menor distância vertical condutor–solo em metros")
+    min_station: float = Field(..., description="Estaca (a partir do apoio A) da menor distância em metros")
+    within_clearance: bool = Field(..., description="True se a menor distância respeita 'min_clearance_m'")
+
+
+class TerrainViolationOut(BaseModel):
+    """Estaca do perfil com distância ao solo abaixo do mínimo."""
+
+    span_index: int = Field(..., description="Índice do vão (base 0)")
+    station: float = Field(..., description="Estaca em metros a partir do apoio A")
+    clearance: float = Field(..., description="Distância condutor–solo na estaca em metros")
+
+
+class TerrainClearanceResponse(BaseModel):
+    """Resultado da verificação de distância ao solo de todos os vãos."""
+
+    count: int = Field(..., description="Número de vãos verificados")
+    violation_span_count: int = Field(..., description="Vãos com distância abaixo do mínimo")
+    worst_span: int = Field(..., description="Índice do vão com a menor distância ao solo")
+    min_clearance: float = Field(..., description="Menor distância ao solo de toda a rota em metros")
+    spans: List[TerrainSpanOut] = Field(..., description="Resultado por vão")
+    violations: List[TerrainViolationOut] = Field(..., description="Estacas em violação (até 'max_violations')")
+    violation_count: int = Field(..., description="Total de estacas em violação (inclusive as não listadas)")
+
+
+# ── Cálculo inverso (tração ou vão para flecha/folga alvo) ────────────────────
+
+
+class CatenaryInverseItem(BaseModel):
+    """Item do cálculo inverso; os campos exigidos dependem de 'solve_for' e 'target'."""
+
+    label: Optional[str] = Field(default=None, max_length=80, description="Rótulo opcional do item")
+    weight_kg_m: float = Field(..., gt=0, description="Peso linear do condutor em kg/m")
+    span: Optional[float] = Field(default=None, gt=0, description="Vão em metros (solve_for='tension')")
+    tension_daN: Optional[float] = Field(default=None, gt=0, description="Tração horizontal em daN (solve_for='span')")
+    sag_m: Optional[float] = Field(default=None, gt=0, description="Flecha alvo em metros (target='sag')")
+    clearance_m: Optional[float] = Field(
+        default=None, ge=0, description="Folga alvo ao solo em metros (target='clearance')"
+    )
+    ha: float = Field(default=0.0, description="Altura de fixação no apoio A em metros (target='clearance')")
+    hb: float = Field(default=0.0, description="Altura de fixação no apoio B em metros (target='clearance')")
+
+
+class CatenaryInverseRequest(BaseModel):
+    """Cálculo inverso em lote: tração ou vão máximo para uma flecha ou folga alvo."""
+
+    solve_for: Literal["tension", "span"] = Field(
+        ..., description="'tension' (tração para o vão informado) ou 'span' (vão máximo para a tração informada)"
+    )
+    target: Literal["sag", "clearance"] = Field(
+        ..., description="'sag' (flecha alvo) ou 'clearance' (folga mínima ao solo com alturas ha/hb)"
+    )
+    items: List[CatenaryInverseItem] = Field(
+        ...,
+        min_length=1,
+        max_length=CATENARY_BATCH_MAX_ITEMS,
+        description=f"Itens a resolver (1–{CATENARY_BATCH_MAX_ITEMS})",
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "solve_for": "tension",
+                "target": "clearance",
+                "items": [
+                    {
+                        "label": "Vão P1-P2",
+                        "span": 120.0,
+                        "ha": 10.5,
+                        "hb": 11.0,
+                        "clearance_m": 6.0,
+                        "weight_kg_m": 0.779,
+                    }
+                ],
+            }
+        }
+    }
+
+
+class CatenaryInverseResponseItem(BaseModel):
+    """Resultado do cálculo inverso de um item."""
+
+    index: int = Field(..., description="Índice do item (base 0)")
+    label: Optional[str] = Field(default=None, description="Rótulo fornecido na entrada")
+    success: bool = Field(..., description="True se o item foi resolvido")
+    error: Optional[str] = Field(default=None, description="Mensagem de erro caso success=False")
+    tension: Optional[float] = Field(default=None, description="Tração horizontal em daN")
+    span: Optional[float] = Field(default=None, description="Vão em metros")
+    sag: Optional[float] = Field(default=None, description="Flecha de vão nivelado resultante em metros")
+    catenary_constant: Optional[float] = Field(default=None, description="Constante catenária (a = T/w)")
+
+
+class CatenaryInverseResponse(BaseModel):
+    """Resposta do cálculo inverso em lote."""
+
+    count: int = Field(..., description="Número de itens processados")
+    success_count: int = Field(..., description="Itens resolvidos")
+    error_count: int = Field(..., description="Itens com erro")
+    items: List[CatenaryInverseResponseItem] = Field(..., description="Resultados por item")
@@ -0,0 +1,209 @@
+"""
+Schemas Pydantic de CQT para a API REST do sisPROJETOS.
+
+Separados de ``api.schemas`` (regra de 500 linhas) e re-exportados por ele.
+"""
+
+from typing import Any, Dict, List, Literal, Optional, Union
+
+from pydantic import BaseModel, Field
+
+# ── CQT ───────────────────────────────────────────────────────────────────────
+
+CQTResultFormat = Literal["dict", "columnar", "base64"]
+_RESULT_FORMAT_DESCRIPTION = (
+    "Formato dos resultados por ponto: 'dict' (padrão, campo 'results'), 'columnar' "
+    "(campo 'columns' com arrays paralelos) ou 'base64' (colunas como float64 little-endian em base64)"
+)
+
+
+class CQTSegment(BaseModel):
+    """Trecho de rede para cálculo CQT."""
+
+    ponto: str = Field(..., description="Identificador do ponto (ex: 'P1', 'TRAFO')")
+    montante: str = Field(default="", description="Ponto montante (vazio para TRAFO)")
+    metros: float = Field(default=0.0, ge=0, description="Comprimento do trecho em metros")
+    cabo: str = Field(default="", description="Tipo de cabo (ex: '3x35+54.6mm² Al')")
+    mono: int = Field(default=0, ge=0, description="Unidades consumidoras monofásicas")
+    bi: int = Field(default=0, ge=0, description="Unidades consumidoras bifásicas")
+    tri: int = Field(default=0, ge=0, description="Unidades consumidoras trifásicas")
+    tri_esp: int = Field(default=0, ge=0, description="UCs trifásicas especiais")
+    carga_esp: float = Field(default=0.0, ge=0, description="Carga pontual especial em kVA")
+
+
+class CQTRequest(BaseModel):
+    """Dados de entrada para cálculo CQT (Metodologia Enel)."""
+
+    segments: List[CQTSegment] = Field(..., min_length=1, description="Trechos de rede")
+    trafo_kva: float = Field(..., gt=0, description="Potência do transformador em kVA")
+    social_class: str = Field(default="B", description="Classe social dominante (A, B, C, D)")
+    result_format: CQTResultFormat = Field(default="dict", description=_RESULT_FORMAT_DESCRIPTION)
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "segments": [
+                    {
+                        "ponto": "TRAFO",
+                        "montante": "",
+                        "metros": 0,
+                        "cabo": "",
+                        "mono": 0,
+                        "bi": 0,
+                        "tri": 0,
+                        "tri_esp": 0,
+                        "carga_esp": 0,
+                    },
+                    {
+                        "ponto": "P1",
+                        "montante": "TRAFO",
+                        "metros": 50,
+                        "cabo": "3x35+54.6mm² Al",
+                        "mono": 5,
+                        "bi": 0,
+                        "tri": 0,
+                        "tri_esp": 0,
+                        "carga_esp": 0,
+                    },
+                ],
+                "trafo_kva": 112.5,
+                "social_class": "B",
+            }
+        }
+    }
+
+
+class CQTColumnarResults(BaseModel):
+    """Resultados por ponto em arrays paralelos (ordem topológica de 'points').
+
+    Com ``encoding='base64'`` cada coluna é uma string base64 de float64
+    little-endian (``numpy.frombuffer(base64.b64decode(col), '<f8')``).
+    """
+
+    encoding: Literal["json", "base64"] = Field(..., description="Codificação das colunas numéricas")
+    dtype: Optional[str] = Field(default=None, description="Tipo binário das colunas base64 ('<f8')")
+    points: List[str] = Field(..., description="Identificadores dos pontos (TRAFO primeiro)")
+    local_dist: Union[List[float], str] = Field(..., description="Carga distribuída local (kVA)")
+    local_pontual: Union[List[float], str] = Field(..., description="Carga pontual especial local (kVA)")
+    total_local: Union[List[float], str] = Field(..., description="Carga local total (kVA)")
+    accumulated: Union[List[float], str] = Field(..., description="Carga acumulada a jusante (kVA)")
+    cqt_trecho: Union[List[float], str] = Field(..., description="CQT do trecho (%)")
+    cqt_accumulated: Union[List[float], str] = Field(..., description="CQT acumulado desde o TRAFO (%)")
+
+
+class CQTResponse(BaseModel):
+    """Resultado do cálculo CQT."""
+
+    success: bool
+    results: Optional[Dict[str, Any]] = None
+    columns: Optional[CQTColumnarResults] = Field(
+        default=None, description="Resultados colunares (apenas com result_format 'columnar' ou 'base64')"
+    )
+    summary: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    segments_over_limit: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "Identificadores dos trechos com CQT acumulado acima do limite de projeto "
+            "(CNS-OMBR-MAT-19-0285). Lista vazia indica rede dentro do critério Enel."
+        ),
+    )
+
+
+# ── CQT em Lote (Batch) ───────────────────────────────────────────────────────
+
+# Redes por requisição (mesmo teto dos lotes de catenária e de postes).
+CQT_BATCH_MAX_ITEMS = 10_000
+
+
+class CQTBatchItem(BaseModel):
+    """Uma rede independente (um TRAFO e seus trechos) no cálculo CQT em lote."""
+
+    label: Optional[str] = Field(
+        default=None,
+        max_length=80,
+        description="Rótulo opcional para identificar a rede na resposta (ex: 'TR-0457')",
+    )
+    segments: List[CQTSegment] = Field(..., min_length=1, description="Trechos da rede")
+    trafo_kva: float = Field(..., gt=0, description="Potência do transformador em kVA")
+    social_class: str = Field(default="B", description="Classe social dominante (A, B, C, D)")
+
+
+class CQTBatchRequest(BaseModel):
+    """Dados de entrada para cálculo CQT de várias redes (regiões de alimentador — BIM).
+
+    Até ``CQT_BATCH_MAX_ITEMS`` redes, distribuídas em um pool de processos.
+    """
+
+    items: List[CQTBatchItem] = Field(
+        ...,
+        min_length=1,
+        max_length=CQT_BATCH_MAX_ITEMS,
+        description=f"Redes independentes (1–{CQT_BATCH_MAX_ITEMS})",
+    )
+    workers: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=64,
+        description="Blocos simultâneos no pool compartilhado (padrão e teto: SISPROJETOS_CQT_WORKERS ou nº de CPUs)",
+    )
+    include_results: bool = Field(
+        default=False,
+        description="Incluir resultados por ponto ('results') de cada rede além do resumo",
+    )
+    result_format: CQTResultFormat = Field(default="dict", description=_RESULT_FORMAT_DESCRIPTION)
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "items": [
+                    {
+                        "label": "TR-0001",
+                        "segments": [
+                            {"ponto": "TRAFO", "montante": ""},
+                            {"ponto": "P1", "montante": "TRAFO", "metros": 50, "cabo": "3x35+54.6mm² Al", "mono": 5},
+                        ],
+                        "trafo_kva": 75.0,
+                        "social_class": "B",
+                    },
+                    {
+                        "label": "TR-0002",
+                        "segments": [
+                            {"ponto": "TRAFO", "montante": ""},
+                            {"ponto": "P1", "montante": "TRAFO", "metros": 80, "cabo": "3x70+54.6mm² Al", "mono": 12},
+                        ],
+                        "trafo_kva": 112.5,
+                    },
+                ],
+                "include_results": False,
+            }
+        }
+    }
+
+
+class CQTBatchResponseItem(BaseModel):
+    """Resultado do cálculo CQT de uma rede do lote."""
+
+    index: int = Field(..., description="Índice do item (base 0) na lista de entrada")
+    label: Optional[str] = Field(default=None, description="Rótulo fornecido na entrada")
+    success: bool = Field(..., description="True se o cálculo foi concluído com sucesso")
+    error: Optional[str] = Field(default=None, description="Mensagem de erro caso success=False")
+    summary: Optional[Dict[str, Any]] = Field(default=None, description="Resumo da rede (mesmo formato de /calculate)")
+    results: Optional[Dict[str, Any]] = Field(
+        default=None, description="Resultados por ponto (apenas com include_results=true)"
+    )
+    columns: Optional[CQTColumnarResults] = Field(
+        default=None, description="Resultados colunares (include_results=true e result_format colunar)"
+    )
+    segments_over_limit: Optional[List[str]] = Field(
+        default=None, description="Trechos com CQT acumulado acima do limite de projeto"
+    )
+
+
+class CQTBatchResponse(BaseModel):
+    """Resposta do cálculo CQT em lote."""
+
+    count: int = Field(..., description="Número de redes processadas")
+    success_count: int = Field(..., description="Número de redes calculadas com sucesso")
+    error_count: int = Field(..., description="Número de redes com erro")
+    items: List[CQTBatchResponseItem] = Field(..., description="Resultados individuais por rede")
@@ -0,0 +1,57 @@
+"""
+Schemas Pydantic da varredura de condições de carga em postes.
+
+Separados de ``api.schemas`` (regra de 500 linhas). Importam ``CaboInput``
+de lá e por isso não são re-exportados por ele: as rotas importam daqui.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from api.schemas import CaboInput
+
+
+class PoleLoadSweepRequest(BaseModel):
+    """Poste a avaliar em várias condições de carga numa única chamada."""
+
+    concessionaria: str = Field(..., description="Nome da concessionária (Light, Enel)")
+    cabos: List[CaboInput] = Field(..., min_length=1, description="Lista de condutores")
+    condicoes: Optional[List[str]] = Field(
+        default=None,
+        min_length=1,
+        max_length=20,
+        description="Condições a avaliar (padrão: Normal, Vento Forte e Gelo)",
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "concessionaria": "Light",
+                "cabos": [{"condutor": "556MCM-CA, Nu", "vao": 80, "angulo": 30, "flecha": 1.5}],
+            }
+        }
+    }
+
+
+class PoleLoadConditionOut(BaseModel):
+    """Resultante do poste em uma condição de carga."""
+
+    condicao: str = Field(..., description="Condição de carga")
+    fator_seguranca: float = Field(..., description="Fator de segurança aplicado")
+    resultant_force: float = Field(..., description="Força resultante em daN")
+    resultant_angle: float = Field(..., description="Ângulo da resultante em graus")
+    total_x: float = Field(..., description="Componente X total em daN")
+    total_y: float = Field(..., description="Componente Y total em daN")
+
+
+class PoleLoadSweepResponse(BaseModel):
+    """Resultantes por condição, a condição determinante e o poste sugerido para ela."""
+
+    conditions: List[PoleLoadConditionOut] = Field(..., description="Resultado por condição, na ordem pedida")
+    governing_condition: str = Field(..., description="Condição de maior resultante")
+    governing_force: float = Field(..., description="Força resultante da condição determinante em daN")
+    vectors: List[Dict[str, Any]] = Field(..., description="Detalhes de cada condutor (sem fator de segurança)")
+    suggested_poles: List[Dict[str, Any]] = Field(
+        default_factory=list, description="Postes sugeridos para a condição determinante"
+    )
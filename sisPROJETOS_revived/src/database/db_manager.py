@@ -3,11 +3,24 @@ import shutil
 import sqlite3
 from typing import Any, Dict, List, Optional, Tuple
 
+from database.seed_data import (
+    CABLE_TECHNICAL_DATA,
+    CONCESSIONAIRES,
+    DEFAULT_SETTINGS,
+    ENEL_LOAD_TABLE,
+    LIGHT_CONDUCTORS,
+    POLES,
+)
 from utils import resource_path
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Tabelas de catálogo técnico cuja revisão é mantida por triggers em
+# ``catalog_revisions`` — permite que caches em memória detectem alterações
+# sem reler a tabela inteira.
+CATALOG_TABLES: Tuple[str, ...] = ("conductors", "poles", "concessionaires", "cable_technical_data", "load_tables")
+
 
 class DatabaseManager:
     """Gerenciador centralizado de banco de dados SQLite.
@@ -135,97 +148,94 @@ class DatabaseManager:
             )
         """)
 
+        # Revision counters for catalog tables (cache invalidation)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS catalog_revisions (
+                table_name TEXT PRIMARY KEY,
+                revision INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        self._ensure_revision_triggers(cursor)
+
+        # Persistent cache of sag × tension tables (modules.catenaria.sag_tension)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS sag_tension_tables (
+                conductor_name TEXT NOT NULL,
+                params_key TEXT NOT NULL,
+                conductor_fingerprint TEXT NOT NULL,
+                params_json TEXT NOT NULL,
+                reference_tension_daN REAL NOT NULL,
+                tension BLOB NOT NULL,
+                sag BLOB NOT NULL,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (conductor_name, params_key)
+            )
+        """)
+
         self.pre_populate_data(cursor)
         self._ensure_default_settings(cursor)
 
         conn.commit()
         conn.close()
 
+    def _ensure_revision_triggers(self, cursor: sqlite3.Cursor) -> None:
+        """Cria triggers que incrementam a revisão de cada tabela de catálogo."""
+        cursor.executemany(
+            "INSERT OR IGNORE INTO catalog_revisions (table_name, revision) VALUES (?, 0)",
+            [(t,) for t in CATALOG_TABLES],
+        )
+        for table in CATALOG_TABLES:
+            for op in ("INSERT", "UPDATE", "DELETE"):
+                cursor.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS trg_rev_{table}_{op.lower()}
+                    AFTER {op} ON {table}
+                    BEGIN
+                        UPDATE catalog_revisions SET revision = revision + 1 WHERE table_name = '{table}';
+                    END
+                """)
+
+    def get_catalog_revision(self, table: str) -> int:
+        """Retorna o contador de revisão de uma tabela de catálogo.
+
+        O contador é incrementado por triggers a cada INSERT/UPDATE/DELETE,
+        inclusive quando a alteração é feita por outro processo ou conexão.
+
+        Args:
+            table: Nome da tabela (um de ``CATALOG_TABLES``).
+
+        Returns:
+            Revisão atual (0 se a tabela não for rastreada).
+        """
+        conn = self.get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT revision FROM catalog_revisions WHERE table_name = ?", (table,))
+            row = cursor.fetchone()
+            return int(row[0]) if row else 0
+        finally:
+            conn.close()
+
     def _ensure_default_settings(self, cursor: sqlite3.Cursor) -> None:
-        default_settings = [
-            ("updates_enabled", "true"),
-            ("update_channel", "stable"),
-            ("update_last_checked", ""),
-            ("update_check_interval_days", "1"),
-            ("dark_mode", "false"),
-        ]
-        cursor.executemany("INSERT OR IGNORE INTO app_settings (key, value) VALUES (?, ?)", default_settings)
+        cursor.executemany("INSERT OR IGNORE INTO app_settings (key, value) VALUES (?, ?)", DEFAULT_SETTINGS)
 
     def pre_populate_data(self, cursor: sqlite3.Cursor) -> None:
-        """Pré-popula o banco com parâmetros técnicos iniciais de engenharia."""
-        # 1. Concessionaires
-        concessionaires = [("Light", "flecha"), ("Enel", "tabela")]
-        cursor.executemany("INSERT OR IGNORE INTO concessionaires (name, method) VALUES (?, ?)", concessionaires)
-
-        # 2. Resistivity & K Coefficients (Migrated from logic modules)
-        # 3. Conductors (Light catalog — ABNT NBR 7271:2004 / NBR 7270:2004)
-        # Columns: name, type, weight_kg_m, breaking_load_daN, modulus_elasticity,
-        #          coeff_thermal_expansion, section_mm2, diameter_mm
-        light_conductors = [
-            ("556MCM-CA, Nu", "CA", 0.779, 7080.0, 56900.0, 23.0e-6, 281.7, 22.01),
-            ("397MCM-CA, Nu", "CA", 0.558, 5050.0, 56900.0, 23.0e-6, 201.4, 18.62),
-            ("1/0AWG-CAA, Nu", "CAA", 0.217, 5430.0, 76000.0, 19.3e-6, 53.5, 10.52),
-            ("4 AWG-CAA, Nu", "CAA", 0.085, 2655.0, 76000.0, 19.3e-6, 21.2, 6.62),
-        ]
+        """Pré-popula o banco com parâmetros técnicos iniciais de engenharia (``database.seed_data``)."""
+        cursor.executemany("INSERT OR IGNORE INTO concessionaires (name, method) VALUES (?, ?)", CONCESSIONAIRES)
         cursor.executemany(
             "INSERT OR IGNORE INTO conductors (name, type, weight_kg_m, breaking_load_daN, modulus_elasticity, coeff_thermal_expansion, section_mm2, diameter_mm) VALUES (?,?,?,?,?,?,?,?)",
-            light_conductors,
+            LIGHT_CONDUCTORS,
         )
-
-        # 4. Load Tables (Enel)
-        enel_data = [
-            ("Enel", "1/0 CA", 20, 110),
-            ("Enel", "1/0 CA", 30, 120),
-            ("Enel", "1/0 CA", 40, 125),
-            ("Enel", "1/0 CA", 50, 140),
-            ("Enel", "1/0 CA", 60, 156),
-            ("Enel", "1/0 CA", 70, 171),
-            ("Enel", "1/0 CA", 80, 186),
-            ("Enel", "BT 3x35+54.6", 0, 136),  # Tração fixa
-        ]
         cursor.executemany(
             "INSERT OR IGNORE INTO load_tables (concessionaire, conductor_name, span_m, load_daN) VALUES (?, ?, ?, ?)",
-            enel_data,
+            ENEL_LOAD_TABLE,
         )
-
-        # 5. Cable Technical Data (CQT K Coefficients + Resistivity)
-        cable_coefs = [
-            ("cqt_k_coef", "2#16(25)mm² Al", 0.7779, "CQT coefficient for 2#16(25)mm² Al"),
-            ("cqt_k_coef", "3x35+54.6mm² Al", 0.2416, "CQT coefficient for 3x35+54.6mm² Al"),
-            ("cqt_k_coef", "3x50+54.6mm² Al", 0.1784, "CQT coefficient for 3x50+54.6mm² Al"),
-            ("cqt_k_coef", "3x70+54.6mm² Al", 0.1248, "CQT coefficient for 3x70+54.6mm² Al"),
-            ("cqt_k_coef", "3x95+54.6mm² Al", 0.0891, "CQT coefficient for 3x95+54.6mm² Al"),
-            ("cqt_k_coef", "3x150+70mm² Al", 0.0573, "CQT coefficient for 3x150+70mm² Al"),
-            # Resistivity values (ohm.mm²/m @ 20°C) — NBR 5410 / ABNT
-            ("resistivity", "Alumínio", 0.0282, "Resistividade do alumínio (ohm.mm²/m)"),
-            ("resistivity", "Cobre", 0.0175, "Resistividade do cobre (ohm.mm²/m)"),
-        ]
         cursor.executemany(
             "INSERT OR IGNORE INTO cable_technical_data (category, key_name, value, description) VALUES (?, ?, ?, ?)",
-            cable_coefs,
+            CABLE_TECHNICAL_DATA,
         )
-
-        # 6. Poles (Catálogo básico de postes — ABNT NBR 8451 / 8452)
-        # Descriptions include material name to satisfy UNIQUE constraint across all materials.
-        poles = [
-            # (material, format, description, height_m, nominal_load_daN)
-            ("Concreto", "Circular", "Concreto Circ. 11 m / 200 daN", 11.0, 200.0),
-            ("Concreto", "Circular", "Concreto Circ. 11 m / 400 daN", 11.0, 400.0),
-            ("Concreto", "Circular", "Concreto Circ. 11 m / 600 daN", 11.0, 600.0),
-            ("Concreto", "Circular", "Concreto Circ. 12 m / 300 daN", 12.0, 300.0),
-            ("Concreto", "Circular", "Concreto Circ. 12 m / 600 daN", 12.0, 600.0),
-            ("Concreto", "Circular", "Concreto Circ. 13 m / 600 daN", 13.0, 600.0),
-            ("Concreto", "Duplo T", "Concreto DT 11 m / 1000 daN", 11.0, 1000.0),
-            ("Concreto", "Duplo T", "Concreto DT 13 m / 1000 daN", 13.0, 1000.0),
-            ("Fibra de Vidro", "Circular", "Fibra de Vidro Circ. 11 m / 200 daN", 11.0, 200.0),
-            ("Fibra de Vidro", "Circular", "Fibra de Vidro Circ. 11 m / 400 daN", 11.0, 400.0),
-            ("Fibra de Vidro", "Circular", "Fibra de Vidro Circ. 11 m / 600 daN", 11.0, 600.0),
-            ("Madeira", "Roliço", "Madeira Rol. 11 m / 300 daN", 11.0, 300.0),
-            ("Madeira", "Roliço", "Madeira Rol. 11 m / 600 daN", 11.0, 600.0),
-        ]
         cursor.executemany(
             "INSERT OR IGNORE INTO poles (material, format, description, height_m, nominal_load_daN) VALUES (?, ?, ?, ?, ?)",
-            poles,
+            POLES,
         )
 
     def add_pole(self, data: Dict[str, Any]) -> Tuple[bool, str]:
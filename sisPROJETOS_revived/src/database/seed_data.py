@@ -0,0 +1,75 @@
+"""
+Dados técnicos iniciais do banco do sisPROJETOS.
+
+Separados de ``database.db_manager`` (regra de 500 linhas); inseridos por
+``DatabaseManager.pre_populate_data`` com ``INSERT OR IGNORE``.
+"""
+
+from typing import List, Tuple
+
+# Configurações padrão da aplicação: (key, value)
+DEFAULT_SETTINGS: List[Tuple[str, str]] = [
+    ("updates_enabled", "true"),
+    ("update_channel", "stable"),
+    ("update_last_checked", ""),
+    ("update_check_interval_days", "1"),
+    ("dark_mode", "false"),
+]
+
+# 1. Concessionaires
+CONCESSIONAIRES: List[Tuple[str, str]] = [("Light", "flecha"), ("Enel", "tabela")]
+
+# 2. Resistivity & K Coefficients (Migrated from logic modules)
+# 3. Conductors (Light catalog — ABNT NBR 7271:2004 / NBR 7270:2004)
+# Columns: name, type, weight_kg_m, breaking_load_daN, modulus_elasticity,
+#          coeff_thermal_expansion, section_mm2, diameter_mm
+LIGHT_CONDUCTORS: List[Tuple[str, str, float, float, float, float, float, float]] = [
+    ("556MCM-CA, Nu", "CA", 0.779, 7080.0, 56900.0, 23.0e-6, 281.7, 22.01),
+    ("397MCM-CA, Nu", "CA", 0.558, 5050.0, 56900.0, 23.0e-6, 201.4, 18.62),
+    ("1/0AWG-CAA, Nu", "CAA", 0.217, 5430.0, 76000.0, 19.3e-6, 53.5, 10.52),
+    ("4 AWG-CAA, Nu", "CAA", 0.085, 2655.0, 76000.0, 19.3e-6, 21.2, 6.62),
+]
+
+# 4. Load Tables (Enel): (concessionaire, conductor_name, span_m, load_daN)
+ENEL_LOAD_TABLE: List[Tuple[str, str, int, int]] = [
+    ("Enel", "1/0 CA", 20, 110),
+    ("Enel", "1/0 CA", 30, 120),
+    ("Enel", "1/0 CA", 40, 125),
+    ("Enel", "1/0 CA", 50, 140),
+    ("Enel", "1/0 CA", 60, 156),
+    ("Enel", "1/0 CA", 70, 171),
+    ("Enel", "1/0 CA", 80, 186),
+    ("Enel", "BT 3x35+54.6", 0, 136),  # Tração fixa
+]
+
+# 5. Cable Technical Data (CQT K Coefficients + Resistivity)
+CABLE_TECHNICAL_DATA: List[Tuple[str, str, float, str]] = [
+    ("cqt_k_coef", "2#16(25)mm² Al", 0.7779, "CQT coefficient for 2#16(25)mm² Al"),
+    ("cqt_k_coef", "3x35+54.6mm² Al", 0.2416, "CQT coefficient for 3x35+54.6mm² Al"),
+    ("cqt_k_coef", "3x50+54.6mm² Al", 0.1784, "CQT coefficient for 3x50+54.6mm² Al"),
+    ("cqt_k_coef", "3x70+54.6mm² Al", 0.1248, "CQT coefficient for 3x70+54.6mm² Al"),
+    ("cqt_k_coef", "3x95+54.6mm² Al", 0.0891, "CQT coefficient for 3x95+54.6mm² Al"),
+    ("cqt_k_coef", "3x150+70mm² Al", 0.0573, "CQT coefficient for 3x150+70mm² Al"),
+    # Resistivity values (ohm.mm²/m @ 20°C) — NBR 5410 / ABNT
+    ("resistivity", "Alumínio", 0.0282, "Resistividade do alumínio (ohm.mm²/m)"),
+    ("resistivity", "Cobre", 0.0175, "Resistividade do cobre (ohm.mm²/m)"),
+]
+
+# 6. Poles (Catálogo básico de postes — ABNT NBR 8451 / 8452)
+# Descriptions include material name to satisfy UNIQUE constraint across all materials.
+# (material, format, description, height_m, nominal_load_daN)
+POLES: List[Tuple[str, str, str, float, float]] = [
+    ("Concreto", "Circular", "Concreto Circ. 11 m / 200 daN", 11.0, 200.0),
+    ("Concreto", "Circular", "Concreto Circ. 11 m / 400 daN", 11.0, 400.0),
+    ("Concreto", "Circular", "Concreto Circ. 11 m / 600 daN", 11.0, 600.0),
+    ("Concreto", "Circular", "Concreto Circ. 12 m / 300 daN", 12.0, 300.0),
+    ("Concreto", "Circular", "Concreto Circ. 12 m / 600 daN", 12.0, 600.0),
+    ("Concreto", "Circular", "Concreto Circ. 13 m / 600 daN", 13.0, 600.0),
+    ("Concreto", "Duplo T", "Concreto DT 11 m / 1000 daN", 11.0, 1000.0),
+    ("Concreto", "Duplo T", "Concreto DT 13 m / 1000 daN", 13.0, 1000.0),
+    ("Fibra de Vidro", "Circular", "Fibra de Vidro Circ. 11 m / 200 daN", 11.0, 200.0),
+    ("Fibra de Vidro", "Circular", "Fibra de Vidro Circ. 11 m / 400 daN", 11.0, 400.0),
+    ("Fibra de Vidro", "Circular", "Fibra de Vidro Circ. 11 m / 600 daN", 11.0, 600.0),
+    ("Madeira", "Roliço", "Madeira Rol. 11 m / 300 daN", 11.0, 300.0),
+    ("Madeira", "Roliço", "Madeira Rol. 11 m / 600 daN", 11.0, 600.0),
+]
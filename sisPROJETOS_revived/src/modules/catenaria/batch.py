@@ -0,0 +1,209 @@
+"""
+Cálculo vetorizado de catenária para muitos vãos (NBR 5422).
+
+``calculate_spans`` resolve flecha, constante catenária e verificação de folga
+de milhares de vãos em um único passe NumPy sobre arrays de vão, tensão, peso
+e alturas — mesmas fórmulas de ``CatenaryLogic.calculate_catenary``. A curva
+(x, y) só é gerada quando ``curve_points > 0``.
+
+Vãos inválidos não interrompem o lote: ficam com ``valid=False``, valores NaN
+e a mensagem correspondente em ``errors``.
+
+Amostragem da curva: ``curve_points`` fixa o número de pontos por vão;
+``curve_tolerance_m`` escolhe o número de cada vão pelo erro de corda. Para
+um passo ``h`` o afastamento máximo entre a poligonal e a curva é
+``≈ κ·h²/8``; a curvatura da catenária é máxima no vértice (``κ = 1/a``),
+logo ``h = √(8·a·tol)`` garante a tolerância no vão inteiro.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+# 1 kgf = 9.80665 N = 0.980665 daN
+KGF_TO_DAN = 0.980665
+
+INVALID_INPUT_ERROR = "Peso linear zero ou dados inválidos para o cálculo."
+OVERFLOW_ERROR = "Vão muito longo para a tensão informada (flecha fora do domínio numérico)."
+
+# Limites da amostragem adaptativa: apoios + vértice, e teto por vão.
+MIN_CURVE_POINTS = 3
+MAX_CURVE_POINTS = 2000
+
+CurveArrays = Union[NDArray[np.float64], List[NDArray[np.float64]]]
+
+
+def curve_point_count(span: ArrayLike, catenary_constant: ArrayLike, tolerance_m: float) -> NDArray[np.int64]:
+    """Número de pontos por vão para um erro de corda máximo.
+
+    Args:
+        span: Vãos em metros.
+        catenary_constant: Constante catenária ``a`` de cada vão em metros.
+        tolerance_m: Afastamento máximo entre a poligonal e a curva em metros (> 0).
+
+    Returns:
+        Pontos por vão, entre ``MIN_CURVE_POINTS`` e ``MAX_CURVE_POINTS``
+        (``MIN_CURVE_POINTS`` para vãos inválidos).
+
+    Raises:
+        ValueError: Se a tolerância não for positiva.
+    """
+    if not tolerance_m > 0:
+        raise ValueError("Tolerância de erro de corda deve ser positiva.")
+    L = np.asarray(span, dtype=np.float64)
+    a = np.asarray(catenary_constant, dtype=np.float64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        segments = np.ceil(L / np.sqrt(8.0 * a * tolerance_m))
+    segments = np.nan_to_num(segments, nan=0.0, posinf=MAX_CURVE_POINTS, neginf=0.0)
+    return np.clip(segments + 1, MIN_CURVE_POINTS, MAX_CURVE_POINTS).astype(np.int64)
+
+
+@dataclass
+class SpanBatchResult:
+    """Resultado do cálculo de catenária em lote (um elemento por vão).
+
+    Attributes:
+        valid: True para os vãos calculados com sucesso.
+        sag: Flecha de vão nivelado em metros (NaN se inválido).
+        catenary_constant: Constante catenária ``a = T / w`` em metros.
+        tension: Tensão horizontal em daN.
+        clearance_checked: True onde ``min_clearance_m`` foi informado.
+        within_clearance: Resultado da verificação de folga (válido apenas onde
+            ``clearance_checked``), mesmo critério de
+            ``CatenaryDomainService.is_within_clearance``.
+        x_vals: Coordenadas X da curva, forma ``(n, curve_points)``; com
+            ``curve_tolerance_m``, lista de ``n`` arrays (ou None).
+        y_vals: Coordenadas Y da curva, no mesmo formato de ``x_vals``.
+        errors: Índice do vão → mensagem de erro.
+    """
+
+    valid: NDArray[np.bool_]
+    sag: NDArray[np.float64]
+    catenary_constant: NDArray[np.float64]
+    tension: NDArray[np.float64]
+    clearance_checked: NDArray[np.bool_]
+    within_clearance: NDArray[np.bool_]
+    x_vals: Optional[CurveArrays] = None
+    y_vals: Optional[CurveArrays] = None
+    errors: Dict[int, str] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        """Número de vãos do lote."""
+        return int(self.valid.size)
+
+
+def calculate_spans(
+    span: ArrayLike,
+    ha: ArrayLike,
+    hb: ArrayLike,
+    tension_daN: ArrayLike,
+    weight_kg_m: ArrayLike,
+    min_clearance_m: Optional[ArrayLike] = None,
+    curve_points: int = 0,
+    curve_tolerance_m: Optional[float] = None,
+) -> SpanBatchResult:
+    """Calcula a catenária de ``n`` vãos de uma vez.
+
+    Os argumentos são arrays (ou escalares, com broadcast) de mesmo comprimento.
+
+    Args:
+        span: Distância horizontal entre apoios em metros (> 0).
+        ha: Altura do apoio A em metros.
+        hb: Altura do apoio B em metros.
+        tension_daN: Tensão horizontal em daN (> 0).
+        weight_kg_m: Peso linear do condutor em kg/m (> 0).
+        min_clearance_m: Folga mínima por vão (NaN = não verificar). None
+            dispensa a verificação em todos os vãos.
+        curve_points: Pontos da curva por vão (0 = não gerar a curva).
+        curve_tolerance_m: Erro de corda máximo da curva em metros; se
+            informado, tem precedência sobre ``curve_points`` e cada vão
+            recebe o número de pontos necessário (``curve_point_count``).
+
+    Returns:
+        ``SpanBatchResult`` com os arrays por vão.
+
+    Raises:
+        ValueError: Se ``curve_tolerance_m`` não for positiva.
+    """
+    L, h_a, h_b, T, p = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(v, dtype=np.float64)) for v in (span, ha, hb, tension_daN, weight_kg_m))
+    )
+    n = L.size
+    w = p * KGF_TO_DAN
+    valid = np.isfinite(L + h_a + h_b + T + w) & (L > 0) & (T > 0) & (w > 0)
+
+    a = np.full(n, np.nan)
+    np.divide(T, w, out=a, where=valid)
+    half = np.full(n, np.nan)
+    np.divide(L, 2 * a, out=half, where=valid)
+    with np.errstate(over="ignore", invalid="ignore"):
+        cosh_half = np.cosh(half)
+        sag = a * (cosh_half - 1)
+    overflow = valid & ~np.isfinite(sag)
+    valid &= ~overflow
+
+    errors = {int(i): INVALID_INPUT_ERROR for i in np.flatnonzero(~valid & ~overflow)}
+    errors.update({int(i): OVERFLOW_ERROR for i in np.flatnonzero(overflow)})
+    sag[~valid] = np.nan
+    a[~valid] = np.nan
+
+    if min_clearance_m is None:
+        clearance = np.full(n, np.nan)
+    else:
+        clearance = np.broadcast_to(np.asarray(min_clearance_m, dtype=np.float64), (n,))
+    clearance_checked = valid & np.isfinite(clearance)
+    within = np.zeros(n, dtype=bool)
+    within[clearance_checked] = sag[clearance_checked] <= clearance[clearance_checked]
+
+    x_vals: Optional[CurveArrays] = None
+    y_vals: Optional[CurveArrays] = None
+    if curve_tolerance_m is not None:
+        counts = curve_point_count(L, a, curve_tolerance_m)
+        x_vals, y_vals = _sample_ragged(L, h_a, h_b, a, cosh_half, counts, valid)
+    elif curve_points > 0:
+        t = np.linspace(0.0, 1.0, int(curve_points))
+        x_vals = L[:, np.newaxis] * t
+        y_chord = h_a[:, np.newaxis] + (h_b - h_a)[:, np.newaxis] * t
+        with np.errstate(over="ignore", invalid="ignore"):
+            a_col = a[:, np.newaxis]
+            y_vals = y_chord + a_col * (np.cosh((x_vals - L[:, np.newaxis] / 2) / a_col) - cosh_half[:, np.newaxis])
+        x_vals[~valid] = np.nan
+        y_vals[~valid] = np.nan
+
+    return SpanBatchResult(
+        valid=valid,
+        sag=sag,
+        catenary_constant=a,
+        tension=np.where(valid, T, np.nan),
+        clearance_checked=clearance_checked,
+        within_clearance=within,
+        x_vals=x_vals,
+        y_vals=y_vals,
+        errors=errors,
+    )
+
+
+def _sample_ragged(
+    L: NDArray[np.float64],
+    h_a: NDArray[np.float64],
+    h_b: NDArray[np.float64],
+    a: NDArray[np.float64],
+    cosh_half: NDArray[np.float64],
+    counts: NDArray[np.int64],
+    valid: NDArray[np.bool_],
+) -> Tuple[List[NDArray[np.float64]], List[NDArray[np.float64]]]:
+    """Curvas com número de pontos variável por vão, calculadas num único array plano."""
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+    span_idx = np.repeat(np.arange(L.size), counts)
+    t = (np.arange(offsets[-1]) - offsets[span_idx]) / (counts[span_idx] - 1)
+    Lk, ak = L[span_idx], a[span_idx]
+    x = Lk * t
+    with np.errstate(over="ignore", invalid="ignore"):
+        y = h_a[span_idx] + (h_b - h_a)[span_idx] * t + ak * (np.cosh((x - Lk / 2) / ak) - cosh_half[span_idx])
+    invalid = ~valid[span_idx]
+    x[invalid] = np.nan
+    y[invalid] = np.nan
+    return np.split(x, offsets[1:-1]), np.split(y, offsets[1:-1])
@@ -0,0 +1,222 @@
+"""
+Equação de mudança de estado do condutor (NBR 5422) resolvida de forma vetorizada.
+
+A partir de um estado de referência (tração horizontal ``T1`` sob temperatura
+``θ1`` e pressão de vento ``q1``), a tração ``T2`` em outro estado (``θ2``,
+``q2``) satisfaz, na aproximação parabólica usual:
+
+    T2² · [T2 − T1 + E·S·w1²·L² / (24·T1²) + E·S·α·(θ2 − θ1)] = E·S·w2²·L² / 24
+
+com ``E·S`` em daN, ``w`` o peso aparente em daN/m (peso próprio e vento
+combinados vetorialmente), ``L`` o vão em metros e ``α`` o coeficiente de
+dilatação térmica em 1/°C.
+
+A cúbica ``f(T) = T³ + A·T² − B`` tem uma única raiz positiva. A iteração de
+Newton parte de ``max(−A, 0) + ∛B``, à direita da raiz e na região convexa, e
+converge monotonicamente — em passes NumPy sobre todos os elementos de uma
+grade vãos × temperaturas × ventos de uma vez.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .batch import KGF_TO_DAN
+
+# Pressão de vento q0 = ½·ρ·V² com ρ = 1,225 kg/m³ → 0,06125·V² daN/m² (V em m/s).
+WIND_PRESSURE_COEF = 0.06125
+
+
+@dataclass(frozen=True)
+class ConductorMechanics:
+    """Propriedades mecânicas do condutor usadas na mudança de estado.
+
+    Attributes:
+        weight_kg_m: Peso linear em kg/m.
+        modulus_mpa: Módulo de elasticidade final em MPa (N/mm²).
+        alpha_per_c: Coeficiente de dilatação térmica linear em 1/°C.
+        section_mm2: Seção transversal em mm².
+        diameter_mm: Diâmetro externo em mm (área exposta ao vento).
+        breaking_load_daN: Carga de ruptura em daN (0 = desconhecida).
+        name: Nome do condutor no catálogo.
+    """
+
+    weight_kg_m: float
+    modulus_mpa: float
+    alpha_per_c: float
+    section_mm2: float
+    diameter_mm: float = 0.0
+    breaking_load_daN: float = 0.0
+    name: str = ""
+
+    def __post_init__(self) -> None:
+        if not (self.weight_kg_m > 0 and self.modulus_mpa > 0 and self.section_mm2 > 0):
+            raise ValueError(
+                f"Condutor '{self.name}' sem dados mecânicos completos "
+                "(peso, módulo de elasticidade e seção devem ser positivos)."
+            )
+        if self.alpha_per_c < 0 or self.diameter_mm < 0:
+            raise ValueError(f"Condutor '{self.name}': dilatação térmica e diâmetro não podem ser negativos.")
+
+    @classmethod
+    def from_catalog(cls, data: Dict[str, Any]) -> "ConductorMechanics":
+        """Cria a partir de um condutor de ``CatenaryLogic.get_conductor_by_name``.
+
+        Raises:
+            ValueError: Se faltar algum dado mecânico no cadastro.
+        """
+        return cls(
+            weight_kg_m=float(data.get("P_kg_m") or 0.0),
+            modulus_mpa=float(data.get("E_MPa") or 0.0),
+            alpha_per_c=float(data.get("alfa_1_C") or 0.0),
+            section_mm2=float(data.get("S_mm2") or 0.0),
+            diameter_mm=float(data.get("D_mm") or 0.0),
+            breaking_load_daN=float(data.get("T0_daN") or 0.0),
+            name=str(data.get("nome_cadastro", "")),
+        )
+
+    @property
+    def axial_stiffness_daN(self) -> float:
+        """Rigidez axial ``E·S`` em daN (MPa·mm² = N → /10)."""
+        return self.modulus_mpa * self.section_mm2 / 10.0
+
+    def apparent_weight(self, wind_pressure_daN_m2: ArrayLike = 0.0) -> NDArray[np.float64]:
+        """Peso aparente em daN/m: peso próprio e força de vento combinados.
+
+        Args:
+            wind_pressure_daN_m2: Pressão de vento sobre o condutor em daN/m².
+        """
+        wind = np.asarray(wind_pressure_daN_m2, dtype=np.float64) * self.diameter_mm / 1000.0
+        return np.hypot(self.weight_kg_m * KGF_TO_DAN, wind)
+
+
+def wind_pressure(speed_m_s: ArrayLike) -> NDArray[np.float64]:
+    """Pressão dinâmica do vento em daN/m² para velocidades em m/s."""
+    return WIND_PRESSURE_COEF * np.square(np.asarray(speed_m_s, dtype=np.float64))
+
+
+@dataclass
+class ChangeOfStateResult:
+    """Trações e flechas de uma grade vãos × temperaturas × pressões de vento.
+
+    Attributes:
+        spans: Vãos em metros, forma ``(S,)``.
+        temperatures: Temperaturas em °C, forma ``(T,)``.
+        wind_pressures: Pressões de vento em daN/m², forma ``(W,)``.
+        tension: Tração horizontal em daN, forma ``(S, T, W)``.
+        sag: Flecha de vão nivelado em metros, forma ``(S, T, W)``.
+    """
+
+    spans: NDArray[np.float64]
+    temperatures: NDArray[np.float64]
+    wind_pressures: NDArray[np.float64]
+    tension: NDArray[np.float64]
+    sag: NDArray[np.float64]
+
+
+class ChangeOfStateSolver:
+    """Resolve a equação de mudança de estado para um condutor."""
+
+    def __init__(self, conductor: ConductorMechanics, tol: float = 1e-10, max_iter: int = 60) -> None:
+        """Inicializa o solver.
+
+        Args:
+            conductor: Propriedades mecânicas do condutor.
+            tol: Tolerância relativa de convergência da tração.
+            max_iter: Máximo de iterações de Newton.
+        """
+        self.conductor = conductor
+        self.tol = tol
+        self.max_iter = max_iter
+
+    def solve(
+        self,
+        span: ArrayLike,
+        reference_tension_daN: ArrayLike,
+        reference_temperature: ArrayLike,
+        temperature: ArrayLike,
+        reference_wind_pressure: ArrayLike = 0.0,
+        wind_pressure_daN_m2: ArrayLike = 0.0,
+    ) -> NDArray[np.float64]:
+        """Tração no estado final para arrays com broadcast NumPy.
+
+        Args:
+            span: Vão em metros (> 0).
+            reference_tension_daN: Tração horizontal no estado de referência (> 0).
+            reference_temperature: Temperatura do estado de referência em °C.
+            temperature: Temperatura do estado final em °C.
+            reference_wind_pressure: Pressão de vento no estado de referência.
+            wind_pressure_daN_m2: Pressão de vento no estado final.
+
+        Returns:
+            Tração horizontal final em daN, na forma do broadcast dos argumentos.
+
+        Raises:
+            ValueError: Se algum vão ou tração de referência não for positivo, ou
+                se a iteração não convergir.
+        """
+        L = np.asarray(span, dtype=np.float64)
+        T1 = np.asarray(reference_tension_daN, dtype=np.float64)
+        if np.any(~(L > 0)) or np.any(~(T1 > 0)):
+            raise ValueError("Vãos e trações de referência devem ser positivos.")
+        es = self.conductor.axial_stiffness_daN
+        w1 = self.conductor.apparent_weight(reference_wind_pressure)
+        w2 = self.conductor.apparent_weight(wind_pressure_daN_m2)
+        dtheta = np.asarray(temperature, dtype=np.float64) - np.asarray(reference_temperature, dtype=np.float64)
+
+        L2 = L * L
+        A = es * w1 * w1 * L2 / (24.0 * T1 * T1) + es * self.conductor.alpha_per_c * dtheta - T1
+        B = es * w2 * w2 * L2 / 24.0
+        A, B = np.broadcast_arrays(A, B)
+        return self._newton(A, B)
+
+    def solve_grid(
+        self,
+        spans: ArrayLike,
+        reference_tension_daN: ArrayLike,
+        reference_temperature: float,
+        temperatures: ArrayLike,
+        wind_pressures: ArrayLike = (0.0,),
+        reference_wind_pressure: float = 0.0,
+    ) -> ChangeOfStateResult:
+        """Resolve a grade completa vãos × temperaturas × pressões de vento.
+
+        Args:
+            spans: Vãos em metros, forma ``(S,)``.
+            reference_tension_daN: Tração de referência (escalar ou uma por vão).
+            reference_temperature: Temperatura do estado de referência em °C.
+            temperatures: Temperaturas finais em °C, forma ``(T,)``.
+            wind_pressures: Pressões de vento finais em daN/m², forma ``(W,)``.
+            reference_wind_pressure: Pressão de vento no estado de referência.
+
+        Returns:
+            ``ChangeOfStateResult`` com trações e flechas ``(S, T, W)``.
+        """
+        L = np.atleast_1d(np.asarray(spans, dtype=np.float64))
+        temps = np.atleast_1d(np.asarray(temperatures, dtype=np.float64))
+        winds = np.atleast_1d(np.asarray(wind_pressures, dtype=np.float64))
+        T1 = np.broadcast_to(np.asarray(reference_tension_daN, dtype=np.float64), L.shape)
+
+        tension = self.solve(
+            L[:, None, None],
+            T1[:, None, None],
+            reference_temperature,
+            temps[None, :, None],
+            reference_wind_pressure,
+            winds[None, None, :],
+        )
+        a = tension / self.conductor.apparent_weight(winds)[None, None, :]
+        sag = a * (np.cosh(L[:, None, None] / (2.0 * a)) - 1.0)
+        return ChangeOfStateResult(L, temps, winds, tension, sag)
+
+    def _newton(self, A: NDArray[np.float64], B: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Raiz positiva de ``T³ + A·T² − B`` por Newton vetorizado."""
+        T = np.maximum(-A, 0.0) + np.cbrt(B)
+        for _ in range(self.max_iter):
+            step = (T * T * (T + A) - B) / (T * (3.0 * T + 2.0 * A))
+            T = T - step
+            if np.all(np.abs(step) <= self.tol * T):
+                return T
+        raise ValueError("Equação de mudança de estado não convergiu.")
@@ -0,0 +1,246 @@
+"""
+Verificação de distância ao solo ao longo de toda a curva do condutor.
+
+Cada vão recebe um perfil do terreno (estaca local ``x`` a partir do apoio A,
+cota ``z``) no mesmo referencial das cotas de fixação ``ha``/``hb``. O terreno
+é linear entre estacas e o condutor segue a curva de ``calculate_spans``:
+
+    y(x) = ha + (hb − ha)·x/L + a·(cosh((x − L/2)/a) − cosh(L/2a))
+
+Em cada segmento do perfil a distância ``y − z`` é convexa, e seu mínimo está
+no ponto em que a inclinação do condutor iguala a do terreno:
+
+    x* = L/2 + a·asinh(m_terreno − (hb − ha)/L)
+
+limitado ao segmento. Avaliar a distância nas estacas e nesses pontos dá o
+mínimo exato do modelo linear por partes — sem amostrar a curva — em passes
+NumPy sobre os perfis de todos os vãos concatenados.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .batch import calculate_spans
+
+
+@dataclass
+class TerrainProfile:
+    """Perfis do terreno de ``n`` vãos concatenados (formato CSR).
+
+    Attributes:
+        offsets: Início do perfil de cada vão em ``station``/``elevation``, forma ``(n + 1,)``.
+        station: Estacas locais em metros a partir do apoio A de cada vão (crescentes por vão).
+        elevation: Cotas do terreno em metros.
+    """
+
+    offsets: NDArray[np.int64]
+    station: NDArray[np.float64]
+    elevation: NDArray[np.float64]
+
+    @property
+    def n_spans(self) -> int:
+        """Número de vãos."""
+        return int(self.offsets.size - 1)
+
+    @property
+    def span_index(self) -> NDArray[np.int64]:
+        """Vão de cada ponto do perfil."""
+        return np.repeat(np.arange(self.n_spans), np.diff(self.offsets))
+
+    @classmethod
+    def from_spans(cls, profiles: Sequence[Tuple[ArrayLike, ArrayLike]]) -> "TerrainProfile":
+        """Cria a partir de um par ``(estacas, cotas)`` por vão (listas vazias = sem perfil)."""
+        stations = [np.asarray(s, dtype=np.float64).ravel() for s, _ in profiles]
+        elevations = [np.asarray(z, dtype=np.float64).ravel() for _, z in profiles]
+        for i, (s, z) in enumerate(zip(stations, elevations)):
+            if s.size != z.size:
+                raise ValueError(f"Vão {i + 1}: estacas e cotas com tamanhos diferentes.")
+        counts = np.array([s.size for s in stations], dtype=np.int64)
+        return cls(
+            offsets=np.concatenate(([0], np.cumsum(counts))).astype(np.int64),
+            station=np.concatenate(stations) if stations else np.empty(0),
+            elevation=np.concatenate(elevations) if elevations else np.empty(0),
+        )
+
+    @classmethod
+    def from_route(cls, spans: ArrayLike, chainage: ArrayLike, elevation: ArrayLike) -> "TerrainProfile":
+        """Divide o perfil contínuo de uma rota (estaqueamento acumulado) pelos vãos.
+
+        Os pontos de divisa entre vãos aparecem nos dois vãos; as cotas nos
+        apoios são interpoladas para que cada vão cubra ``[0, L]``.
+
+        Args:
+            spans: Vãos consecutivos em metros.
+            chainage: Estaca acumulada desde o primeiro apoio, crescente.
+            elevation: Cota do terreno em cada estaca.
+        """
+        L = np.asarray(spans, dtype=np.float64).ravel()
+        ch = np.asarray(chainage, dtype=np.float64).ravel()
+        z = np.asarray(elevation, dtype=np.float64).ravel()
+        if ch.size != z.size or ch.size < 2 or np.any(np.diff(ch) < 0):
+            raise ValueError("Perfil da rota deve ter estacas crescentes e uma cota por estaca.")
+        bounds = np.concatenate(([0.0], np.cumsum(L)))
+        # Pontos internos de cada vão + apoios (cota interpolada)
+        first = np.searchsorted(ch, bounds[:-1], side="right")
+        last = np.searchsorted(ch, bounds[1:], side="left")
+        counts = np.maximum(last - first, 0) + 2
+        offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        span_idx = np.repeat(np.arange(L.size), counts)
+        pos = np.arange(offsets[-1]) - offsets[span_idx]
+        src = np.clip(first[span_idx] + pos - 1, 0, ch.size - 1)
+        station = ch[src] - bounds[span_idx]
+        station[offsets[:-1]] = 0.0
+        station[offsets[1:] - 1] = L
+        return cls(offsets=offsets, station=station, elevation=np.interp(station + bounds[span_idx], ch, z))
+
+
+@dataclass
+class ClearanceResult:
+    """Distâncias condutor–solo de ``n`` vãos.
+
+    Attributes:
+        checked: True para vãos válidos com ao menos um ponto de perfil.
+        min_clearance: Menor distância vertical condutor–solo por vão em metros (NaN se não verificado).
+        min_station: Estaca local onde ocorre a menor distância.
+        within_clearance: True se ``min_clearance ≥ min_clearance_m`` (válido onde ``checked``).
+        station_clearance: Distância em cada ponto do perfil (NaN em vãos inválidos).
+        violation_points: Índices dos pontos do perfil abaixo da distância mínima.
+        profile: Perfil usado no cálculo.
+        errors: Índice do vão → mensagem de erro do cálculo da catenária.
+    """
+
+    checked: NDArray[np.bool_]
+    min_clearance: NDArray[np.float64]
+    min_station: NDArray[np.float64]
+    within_clearance: NDArray[np.bool_]
+    station_clearance: NDArray[np.float64]
+    violation_points: NDArray[np.int64]
+    profile: TerrainProfile
+    errors: Dict[int, str]
+
+    @property
+    def worst_span(self) -> Optional[int]:
+        """Vão com a menor distância ao solo (None se nenhum foi verificado)."""
+        if not self.checked.any():
+            return None
+        return int(np.nanargmin(np.where(self.checked, self.min_clearance, np.nan)))
+
+    def violations(self) -> List[Tuple[int, float, float]]:
+        """Pontos do perfil em violação como ``(vão, estaca, distância)``."""
+        idx = self.violation_points
+        return list(
+            zip(
+                self.profile.span_index[idx].tolist(),
+                self.profile.station[idx].tolist(),
+                self.station_clearance[idx].tolist(),
+            )
+        )
+
+
+def check_terrain_clearance(
+    span: ArrayLike,
+    ha: ArrayLike,
+    hb: ArrayLike,
+    tension_daN: ArrayLike,
+    weight_kg_m: ArrayLike,
+    profile: TerrainProfile,
+    min_clearance_m: ArrayLike,
+) -> ClearanceResult:
+    """Calcula a distância ao solo ao longo da curva de todos os vãos.
+
+    Args:
+        span: Vãos horizontais em metros.
+        ha: Cota de fixação no apoio A (mesmo referencial do terreno).
+        hb: Cota de fixação no apoio B.
+        tension_daN: Tração horizontal em daN.
+        weight_kg_m: Peso linear em kg/m.
+        profile: Perfis do terreno, um por vão.
+        min_clearance_m: Distância mínima exigida (escalar ou por vão).
+
+    Returns:
+        ``ClearanceResult`` com o mínimo por vão e os pontos em violação.
+
+    Raises:
+        ValueError: Se o perfil não corresponder aos vãos ou tiver estacas fora de ``[0, L]``.
+    """
+    spans = calculate_spans(span, ha, hb, tension_daN, weight_kg_m)
+    n = spans.size
+    if profile.n_spans != n:
+        raise ValueError(f"Perfil com {profile.n_spans} vãos para {n} vãos informados.")
+    L = np.broadcast_to(np.asarray(span, dtype=np.float64), (n,))
+    h_a = np.broadcast_to(np.asarray(ha, dtype=np.float64), (n,))
+    h_b = np.broadcast_to(np.asarray(hb, dtype=np.float64), (n,))
+    required = np.broadcast_to(np.asarray(min_clearance_m, dtype=np.float64), (n,))
+
+    idx = profile.span_index
+    x, z = profile.station, profile.elevation
+    _validate_profile(x, z, idx, L)
+
+    a = spans.catenary_constant
+    with np.errstate(invalid="ignore", divide="ignore"):
+        chord = np.where(spans.valid, (h_b - h_a) / L, np.nan)
+
+    def conductor(xq: NDArray[np.float64], s: NDArray[np.int64]) -> NDArray[np.float64]:
+        with np.errstate(over="ignore", invalid="ignore"):
+            return h_a[s] + chord[s] * xq + a[s] * (np.cosh((xq - L[s] / 2) / a[s]) - np.cosh(L[s] / (2 * a[s])))
+
+    station_clearance = conductor(x, idx) - z
+
+    # Mínimo no interior de cada segmento do perfil (pares consecutivos do mesmo vão)
+    seg = np.flatnonzero(idx[:-1] == idx[1:]) if x.size > 1 else np.empty(0, dtype=np.int64)
+    s_idx = idx[seg]
+    dx = x[seg + 1] - x[seg]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        slope = np.where(dx > 0, (z[seg + 1] - z[seg]) / dx, 0.0)
+        x_star = np.clip(L[s_idx] / 2 + a[s_idx] * np.arcsinh(slope - chord[s_idx]), x[seg], x[seg + 1])
+    seg_clearance = conductor(x_star, s_idx) - (z[seg] + slope * (x_star - x[seg]))
+
+    cand_span = np.concatenate((idx, s_idx))
+    cand_x = np.concatenate((x, x_star))
+    cand_c = np.concatenate((station_clearance, seg_clearance))
+    checked = spans.valid & (np.diff(profile.offsets) > 0)
+    keep = checked[cand_span]
+    cand_span, cand_x, cand_c = cand_span[keep], cand_x[keep], cand_c[keep]
+
+    min_clearance = np.full(n, np.nan)
+    min_station = np.full(n, np.nan)
+    if cand_span.size:
+        order = np.lexsort((cand_c, cand_span))
+        starts = np.flatnonzero(np.r_[True, cand_span[order][1:] != cand_span[order][:-1]])
+        best = order[starts]
+        min_clearance[cand_span[best]] = cand_c[best]
+        min_station[cand_span[best]] = cand_x[best]
+
+    within = np.zeros(n, dtype=bool)
+    within[checked] = min_clearance[checked] >= required[checked]
+    station_clearance[~spans.valid[idx]] = np.nan
+    violation_points = np.flatnonzero(checked[idx] & (station_clearance < required[idx]))
+
+    return ClearanceResult(
+        checked=checked,
+        min_clearance=min_clearance,
+        min_station=min_station,
+        within_clearance=within,
+        station_clearance=station_clearance,
+        violation_points=violation_points,
+        profile=profile,
+        errors=spans.errors,
+    )
+
+
+def _validate_profile(
+    x: NDArray[np.float64], z: NDArray[np.float64], idx: NDArray[np.int64], L: NDArray[np.float64]
+) -> None:
+    if not (np.all(np.isfinite(x)) and np.all(np.isfinite(z))):
+        raise ValueError("Estacas e cotas do perfil devem ser números finitos.")
+    tol = 1e-6 * np.maximum(L[idx], 1.0)
+    outside = np.flatnonzero((x < -tol) | (x > L[idx] + tol))
+    if outside.size:
+        k = outside[0]
+        raise ValueError(f"Vão {idx[k] + 1}: estaca {x[k]:g} m fora do vão (0 a {L[idx[k]]:g} m).")
+    descending = np.flatnonzero((np.diff(x) < 0) & (idx[:-1] == idx[1:]))
+    if descending.size:
+        raise ValueError(f"Vão {idx[descending[0]] + 1}: estacas do perfil devem ser crescentes.")
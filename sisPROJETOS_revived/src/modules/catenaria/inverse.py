@@ -0,0 +1,272 @@
+"""
+Cálculo inverso da catenária: tração ou vão máximo para uma flecha ou folga alvo.
+
+Mesma curva de ``calculate_spans`` (constante ``a = T/w``, catenária centrada
+no vão e deslocada pela corda entre os apoios), resolvida ao contrário para
+muitos vãos de uma vez:
+
+- **Tração para uma flecha** — com ``u = L/2a`` a flecha é
+  ``f = (L/2)·(cosh u − 1)/u``, função convexa e crescente de ``u``. Newton
+  parte da estimativa parabólica ``u₀ = 4f/L`` (sempre à direita da raiz) e
+  converge monotonicamente.
+- **Vão máximo para uma flecha** — forma fechada ``L = 2a·acosh(1 + f/a)``.
+- **Tração ou vão máximo para uma folga** — o ponto mais baixo da curva,
+  ``y_min``, cresce com a tração e diminui com o vão; a raiz de
+  ``y_min = folga`` é obtida por bisseção vetorizada (em ``log a`` ou em ``L``).
+
+Itens inválidos ou com alvo inatingível não interrompem o lote: ficam com
+``valid=False``, NaN e a mensagem em ``errors``.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Literal, Optional, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .batch import INVALID_INPUT_ERROR, KGF_TO_DAN
+
+InverseUnknown = Literal["tension", "span"]
+InverseTarget = Literal["sag", "clearance"]
+
+UNREACHABLE_CLEARANCE_ERROR = "Folga alvo inatingível: deve ser menor que a altura do apoio mais baixo."
+
+_NEWTON_MAX_ITER = 50
+_NEWTON_TOL = 1e-13
+_BISECTION_ITER = 100
+# Faixa de busca de u = L/2a na bisseção da tração (flecha ≈ 0 até catenária muito frouxa).
+_U_MIN, _U_MAX = 1e-9, 50.0
+
+
+@dataclass
+class InverseResult:
+    """Resultado do cálculo inverso (um elemento por item).
+
+    Attributes:
+        valid: True para os itens resolvidos.
+        tension: Tração horizontal em daN (calculada ou informada).
+        span: Vão em metros (calculado ou informado).
+        sag: Flecha de vão nivelado resultante em metros.
+        catenary_constant: Constante catenária ``a = T/w`` em metros.
+        errors: Índice do item → mensagem de erro.
+    """
+
+    valid: NDArray[np.bool_]
+    tension: NDArray[np.float64]
+    span: NDArray[np.float64]
+    sag: NDArray[np.float64]
+    catenary_constant: NDArray[np.float64]
+    errors: Dict[int, str] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        """Número de itens do lote."""
+        return int(self.valid.size)
+
+
+def tension_for_sag(span: ArrayLike, sag_m: ArrayLike, weight_kg_m: ArrayLike) -> InverseResult:
+    """Tração horizontal que produz a flecha alvo em cada vão.
+
+    Args:
+        span: Vãos em metros (> 0).
+        sag_m: Flecha alvo de vão nivelado em metros (> 0).
+        weight_kg_m: Peso linear em kg/m (> 0).
+    """
+    L, f, p = _arrays(span, sag_m, weight_kg_m)
+    w = p * KGF_TO_DAN
+    valid = _positive(L, f, w)
+    target = np.where(valid, 2.0 * f / L, 1.0)
+
+    u = 2.0 * target  # estimativa parabólica, à direita da raiz
+    for _ in range(_NEWTON_MAX_ITER):
+        with np.errstate(over="ignore", invalid="ignore"):
+            # cosh u − 1 = 2·sinh²(u/2), sem cancelamento para u pequeno
+            half = 2.0 * np.sinh(0.5 * u) ** 2
+            g = half / u - target
+            dg = (u * np.sinh(u) - half) / (u * u)
+            step = np.where(valid, g / dg, 0.0)
+        u = u - step
+        if np.all(np.abs(step) <= _NEWTON_TOL * u):
+            break
+
+    a = L / (2.0 * u)
+    return _result(valid, w * a, L, a, {})
+
+
+def span_for_sag(tension_daN: ArrayLike, sag_m: ArrayLike, weight_kg_m: ArrayLike) -> InverseResult:
+    """Maior vão cuja flecha não excede a alvo, para a tração dada.
+
+    Args:
+        tension_daN: Tração horizontal em daN (> 0).
+        sag_m: Flecha máxima admitida em metros (> 0).
+        weight_kg_m: Peso linear em kg/m (> 0).
+    """
+    T, f, p = _arrays(tension_daN, sag_m, weight_kg_m)
+    w = p * KGF_TO_DAN
+    valid = _positive(T, f, w)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        a = T / w
+        L = 2.0 * a * _acosh1p(f / a)
+    return _result(valid, T, L, a, {})
+
+
+def tension_for_clearance(
+    span: ArrayLike, ha: ArrayLike, hb: ArrayLike, clearance_m: ArrayLike, weight_kg_m: ArrayLike
+) -> InverseResult:
+    """Menor tração que mantém o ponto mais baixo da curva na folga alvo.
+
+    Alturas e folga medidas a partir do mesmo plano (solo nivelado).
+
+    Args:
+        span: Vãos em metros (> 0).
+        ha: Altura de fixação no apoio A em metros.
+        hb: Altura de fixação no apoio B em metros.
+        clearance_m: Folga mínima ao solo em metros.
+        weight_kg_m: Peso linear em kg/m (> 0).
+    """
+    L, h_a, h_b, c, p = _arrays(span, ha, hb, clearance_m, weight_kg_m)
+    w = p * KGF_TO_DAN
+    valid = _positive(L, w) & np.isfinite(h_a + h_b + c)
+    unreachable = valid & ~(c < np.minimum(h_a, h_b))
+    valid &= ~unreachable
+
+    # Bisseção em log(a): y_min cresce com a
+    lo = np.log(np.where(valid, L / (2.0 * _U_MAX), 1.0))
+    hi = np.log(np.where(valid, L / (2.0 * _U_MIN), 1.0))
+    for _ in range(_BISECTION_ITER):
+        mid = 0.5 * (lo + hi)
+        ok = _lowest_point(L, h_a, h_b, np.exp(mid)) >= c
+        hi = np.where(ok, mid, hi)
+        lo = np.where(ok, lo, mid)
+    a = np.exp(hi)
+    return _result(valid, w * a, L, a, _unreachable(unreachable))
+
+
+def span_for_clearance(
+    tension_daN: ArrayLike, ha: ArrayLike, hb: ArrayLike, clearance_m: ArrayLike, weight_kg_m: ArrayLike
+) -> InverseResult:
+    """Maior vão que mantém o ponto mais baixo da curva na folga alvo.
+
+    Args:
+        tension_daN: Tração horizontal em daN (> 0).
+        ha: Altura de fixação no apoio A em metros.
+        hb: Altura de fixação no apoio B em metros.
+        clearance_m: Folga mínima ao solo em metros.
+        weight_kg_m: Peso linear em kg/m (> 0).
+    """
+    T, h_a, h_b, c, p = _arrays(tension_daN, ha, hb, clearance_m, weight_kg_m)
+    w = p * KGF_TO_DAN
+    valid = _positive(T, w) & np.isfinite(h_a + h_b + c)
+    unreachable = valid & ~(c < np.minimum(h_a, h_b))
+    valid &= ~unreachable
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        a = T / w
+        # Flecha de vão nivelado ≤ max(ha, hb) − folga limita o vão
+        hi = np.where(valid, 2.0 * a * _acosh1p((np.maximum(h_a, h_b) - c) / a), 1.0)
+    lo = np.zeros_like(hi)
+    a_safe = np.where(valid, a, 1.0)
+    for _ in range(_BISECTION_ITER):
+        mid = 0.5 * (lo + hi)
+        ok = _lowest_point(mid, h_a, h_b, a_safe) >= c
+        lo = np.where(ok, mid, lo)
+        hi = np.where(ok, hi, mid)
+    return _result(valid, T, lo, a, _unreachable(unreachable))
+
+
+def solve_inverse(
+    solve_for: InverseUnknown,
+    target: InverseTarget,
+    weight_kg_m: ArrayLike,
+    span: Optional[ArrayLike] = None,
+    tension_daN: Optional[ArrayLike] = None,
+    sag_m: Optional[ArrayLike] = None,
+    clearance_m: Optional[ArrayLike] = None,
+    ha: ArrayLike = 0.0,
+    hb: ArrayLike = 0.0,
+) -> InverseResult:
+    """Despacha para o solver de ``solve_for`` × ``target``.
+
+    Args:
+        solve_for: ``"tension"`` (requer ``span``) ou ``"span"`` (requer ``tension_daN``).
+        target: ``"sag"`` (requer ``sag_m``) ou ``"clearance"`` (requer ``clearance_m``, ``ha`` e ``hb``).
+        weight_kg_m: Peso linear em kg/m.
+        span: Vãos em metros.
+        tension_daN: Trações horizontais em daN.
+        sag_m: Flechas alvo em metros.
+        clearance_m: Folgas alvo ao solo em metros.
+        ha: Alturas de fixação no apoio A em metros.
+        hb: Alturas de fixação no apoio B em metros.
+
+    Raises:
+        ValueError: Se a combinação for desconhecida ou faltar um argumento obrigatório.
+    """
+    known = span if solve_for == "tension" else tension_daN if solve_for == "span" else None
+    goal = sag_m if target == "sag" else clearance_m if target == "clearance" else None
+    if solve_for not in ("tension", "span") or target not in ("sag", "clearance"):
+        raise ValueError(f"Cálculo inverso desconhecido: {solve_for} para {target}.")
+    if known is None or goal is None:
+        raise ValueError(
+            f"Cálculo de {solve_for} para {target} requer "
+            f"'{'span' if solve_for == 'tension' else 'tension_daN'}' e "
+            f"'{'sag_m' if target == 'sag' else 'clearance_m'}'."
+        )
+    if target == "sag":
+        solver = tension_for_sag if solve_for == "tension" else span_for_sag
+        return solver(known, goal, weight_kg_m)
+    solver = tension_for_clearance if solve_for == "tension" else span_for_clearance
+    return solver(known, ha, hb, goal, weight_kg_m)
+
+
+def _lowest_point(
+    L: NDArray[np.float64], h_a: NDArray[np.float64], h_b: NDArray[np.float64], a: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    """Cota do ponto mais baixo da curva de ``calculate_spans`` (incluindo os apoios)."""
+    with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        chord = np.where(L > 0, (h_b - h_a) / L, 0.0)
+        x = np.clip(L / 2.0 - a * np.arcsinh(chord), 0.0, L)
+        y = h_a + chord * x + a * (np.cosh((x - L / 2.0) / a) - np.cosh(L / (2.0 * a)))
+    return np.where(np.isnan(y), -np.inf, y)
+
+
+def _acosh1p(x: NDArray[np.float64]) -> NDArray[np.float64]:
+    """``acosh(1 + x)`` sem perda de precisão para ``x`` pequeno."""
+    return np.log1p(x + np.sqrt(x * (2.0 + x)))
+
+
+def _arrays(*values: ArrayLike) -> Tuple[NDArray[np.float64], ...]:
+    return np.broadcast_arrays(*(np.atleast_1d(np.asarray(v, dtype=np.float64)) for v in values))
+
+
+def _positive(*arrays: NDArray[np.float64]) -> NDArray[np.bool_]:
+    valid = np.ones(arrays[0].shape, dtype=bool)
+    for arr in arrays:
+        valid &= np.isfinite(arr) & (arr > 0)
+    return valid
+
+
+def _unreachable(mask: NDArray[np.bool_]) -> Dict[int, str]:
+    return {int(i): UNREACHABLE_CLEARANCE_ERROR for i in np.flatnonzero(mask)}
+
+
+def _result(
+    valid: NDArray[np.bool_],
+    tension: NDArray[np.float64],
+    span: NDArray[np.float64],
+    a: NDArray[np.float64],
+    errors: Dict[int, str],
+) -> InverseResult:
+    with np.errstate(over="ignore", invalid="ignore"):
+        sag = 2.0 * a * np.sinh(span / (4.0 * a)) ** 2
+    valid = valid & np.isfinite(tension) & np.isfinite(span) & np.isfinite(sag)
+    for i in np.flatnonzero(~valid):
+        errors.setdefault(int(i), INVALID_INPUT_ERROR)
+    nan = ~valid
+    return InverseResult(
+        valid=valid,
+        tension=np.where(nan, np.nan, tension),
+        span=np.where(nan, np.nan, span),
+        sag=np.where(nan, np.nan, sag),
+        catenary_constant=np.where(nan, np.nan, a),
+        errors=dict(sorted(errors.items())),
+    )
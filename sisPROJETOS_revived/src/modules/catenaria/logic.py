@@ -1,14 +1,27 @@
 from typing import Any, Dict, List, Optional
 
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import ArrayLike, NDArray
 
 from database.db_manager import DatabaseManager
 from utils.logger import get_logger
+from utils.memo import CacheStats, LRUCache
 from utils.sanitizer import sanitize_numeric, sanitize_positive
 
+from .batch import SpanBatchResult, calculate_spans, curve_point_count
+from .change_of_state import ChangeOfStateSolver, ConductorMechanics
+from .clearance import ClearanceResult, TerrainProfile, check_terrain_clearance
+from .inverse import InverseResult, InverseTarget, InverseUnknown, solve_inverse
+from .section import SectionResult, calculate_section, ruling_span
+
 logger = get_logger(__name__)
 
+# Pontos da curva quando nem número nem tolerância são informados.
+DEFAULT_CURVE_POINTS = 100
+
+# Resultados de ``calculate_catenary`` memorizados por instância (entradas normalizadas).
+CATENARY_CACHE_SIZE = 512
+
 
 class CatenaryLogic:
     """Lógica para cálculos de catenária de condutores.
@@ -17,9 +30,15 @@ class CatenaryLogic:
     de linhas aéreas de distribuição elétrica conforme NBR 5422.
     """
 
-    def __init__(self) -> None:
-        """Inicializa a lógica de catenária e carrega condutores do banco."""
-        self.db = DatabaseManager()
+    def __init__(self, db: Optional[DatabaseManager] = None, cache_size: int = CATENARY_CACHE_SIZE) -> None:
+        """Inicializa a lógica de catenária e carrega condutores do banco.
+
+        Args:
+            db: Banco do catálogo de condutores (padrão: banco do usuário).
+            cache_size: Máximo de resultados de ``calculate_catenary`` memorizados (0 = sem cache).
+        """
+        self.db = db or DatabaseManager()
+        self._curve_cache: LRUCache[Dict[str, Any]] = LRUCache(cache_size)
         self.conductors: List[Dict[str, Any]] = []
         self.load_conductors()
 
@@ -29,9 +48,23 @@ class CatenaryLogic:
             # We want full details for calculation
             conn = self.db.get_connection()
             cursor = conn.cursor()
-            cursor.execute("SELECT name, weight_kg_m, breaking_load_daN FROM conductors")
+            cursor.execute(
+                "SELECT name, weight_kg_m, breaking_load_daN, modulus_elasticity, coeff_thermal_expansion, "
+                "section_mm2, diameter_mm FROM conductors"
+            )
             rows = cursor.fetchall()
-            self.conductors = [{"nome_cadastro": r[0], "P_kg_m": r[1], "T0_daN": r[2]} for r in rows]
+            self.conductors = [
+                {
+                    "nome_cadastro": r[0],
+                    "P_kg_m": r[1],
+                    "T0_daN": r[2],
+                    "E_MPa": r[3],
+                    "alfa_1_C": r[4],
+                    "S_mm2": r[5],
+                    "D_mm": r[6],
+                }
+                for r in rows
+            ]
             conn.close()
         except Exception as e:
             logger.exception(f"Error loading conductors from DB: {e}")
@@ -59,6 +92,24 @@ class CatenaryLogic:
                 return c
         return None
 
+    def get_conductor_mechanics(self, name: str) -> ConductorMechanics:
+        """Propriedades mecânicas do condutor para a equação de mudança de estado.
+
+        Args:
+            name: Nome do condutor.
+
+        Returns:
+            ``ConductorMechanics`` com peso, módulo de elasticidade, dilatação,
+            seção e diâmetro do cadastro.
+
+        Raises:
+            ValueError: Se o condutor não existir ou não tiver dados mecânicos.
+        """
+        conductor = self.get_conductor_by_name(name)
+        if conductor is None:
+            raise ValueError(f"Condutor '{name}' não encontrado.")
+        return ConductorMechanics.from_catalog(conductor)
+
     def calculate_catenary(
         self,
         span: float,
@@ -66,6 +117,8 @@ class CatenaryLogic:
         hb: float,
         tension_daN: float,
         weight_kg_m: float,
+        curve_points: int = DEFAULT_CURVE_POINTS,
+        curve_tolerance_m: Optional[float] = None,
     ) -> Optional[Dict[str, Any]]:
         """Calcula a curva catenária e parâmetros do condutor (NBR 5422).
 
@@ -75,6 +128,10 @@ class CatenaryLogic:
             hb: Altura do apoio B em metros.
             tension_daN: Tensão horizontal em daN (deve ser > 0).
             weight_kg_m: Peso linear do condutor em kg/m (deve ser ≥ 0).
+            curve_points: Número fixo de pontos da curva (≥ 2).
+            curve_tolerance_m: Erro de corda máximo em metros; se informado, o
+                número de pontos é escolhido por ``curve_point_count`` e
+                ``curve_points`` é ignorado.
 
         Returns:
             Dicionário com:
@@ -84,6 +141,11 @@ class CatenaryLogic:
                 - ``tension``: Tensão horizontal em daN (float)
                 - ``catenary_constant``: Constante catenária 'a' em metros (float)
             Retorna None se os dados forem inválidos ou o peso linear for zero.
+            Resultados são memorizados por entradas normalizadas; ``x_vals`` e
+            ``y_vals`` são somente leitura (copie antes de alterar).
+
+        Raises:
+            ValueError: Se ``curve_tolerance_m`` não for positiva.
         """
         try:
             span = sanitize_positive(span)
@@ -104,8 +166,32 @@ class CatenaryLogic:
         # Constante catenária: a = T / w (NBR 5422)
         a = tension_daN / w_daN_m
 
-        # Define x range
-        x: NDArray = np.linspace(0, span, 100)
+        # Define x range (número fixo de pontos ou pelo erro de corda)
+        if curve_tolerance_m is not None:
+            curve_points = int(curve_point_count(span, a, curve_tolerance_m))
+        n_points = max(int(curve_points), 2)
+
+        # Chave com as entradas já sanitizadas e a tolerância convertida em pontos
+        key = (float(span), float(ha), float(hb), float(tension_daN), float(weight_kg_m), n_points)
+        result = self._curve_cache.get_or_compute(
+            key, lambda: self._compute_curve(span, ha, hb, tension_daN, a, n_points)
+        )
+        # Cópia rasa: o chamador pode alterar o dicionário sem afetar o cache
+        return dict(result)
+
+    def cache_stats(self) -> CacheStats:
+        """Acertos, falhas e ocupação do cache de ``calculate_catenary``."""
+        return self._curve_cache.stats()
+
+    def clear_cache(self) -> None:
+        """Descarta os resultados memorizados de ``calculate_catenary``."""
+        self._curve_cache.clear()
+
+    @staticmethod
+    def _compute_curve(
+        span: float, ha: float, hb: float, tension_daN: float, a: float, n_points: int
+    ) -> Dict[str, Any]:
+        x: NDArray = np.linspace(0, span, n_points)
 
         # Flecha de vão nivelado: f = a * (cosh(L/2a) - 1)
         sag_level: float = float(a * (np.cosh(span / (2 * a)) - 1))
@@ -118,6 +204,9 @@ class CatenaryLogic:
 
         y_final = y_chord + sag_curve
 
+        # Arrays compartilhados entre chamadas: somente leitura protege o cache
+        x.flags.writeable = False
+        y_final.flags.writeable = False
         return {
             "sag": sag_level,
             "x_vals": x,
@@ -126,6 +215,167 @@ class CatenaryLogic:
             "catenary_constant": a,
         }
 
+    def calculate_batch(
+        self,
+        span: ArrayLike,
+        ha: ArrayLike,
+        hb: ArrayLike,
+        tension_daN: ArrayLike,
+        weight_kg_m: ArrayLike,
+        min_clearance_m: Optional[ArrayLike] = None,
+        curve_points: int = 0,
+        curve_tolerance_m: Optional[float] = None,
+    ) -> SpanBatchResult:
+        """Calcula a catenária de vários vãos em um único passe vetorizado.
+
+        Mesmas fórmulas de ``calculate_catenary``, aplicadas a arrays; a curva
+        só é gerada se ``curve_points > 0`` ou com ``curve_tolerance_m``. Ver
+        ``modules.catenaria.batch``.
+
+        Args:
+            span: Vãos em metros.
+            ha: Alturas do apoio A em metros.
+            hb: Alturas do apoio B em metros.
+            tension_daN: Tensões horizontais em daN.
+            weight_kg_m: Pesos lineares em kg/m.
+            min_clearance_m: Folga mínima por vão (NaN = não verificar) ou None.
+            curve_points: Pontos da curva por vão (0 = sem curva).
+            curve_tolerance_m: Erro de corda máximo (pontos escolhidos por vão).
+
+        Returns:
+            ``SpanBatchResult`` com os arrays por vão e os erros por índice.
+        """
+        return calculate_spans(
+            span, ha, hb, tension_daN, weight_kg_m, min_clearance_m, curve_points, curve_tolerance_m
+        )
+
+    def calculate_section(
+        self,
+        spans: ArrayLike,
+        support_heights: ArrayLike,
+        tension_daN: float,
+        weight_kg_m: Optional[float] = None,
+        conductor: Optional[str] = None,
+        temperature: Optional[float] = None,
+        reference_temperature: float = 20.0,
+        min_clearance_m: Optional[ArrayLike] = None,
+        curve_points: int = 0,
+        curve_tolerance_m: Optional[float] = None,
+    ) -> SectionResult:
+        """Calcula uma seção de tensionamento (vão regulador e todos os vãos).
+
+        Com ``conductor`` o peso vem do catálogo. Com ``temperature``,
+        ``tension_daN`` é a tração do vão regulador na ``reference_temperature``
+        e a tração da seção na temperatura pedida é obtida pela equação de
+        mudança de estado. Ver ``modules.catenaria.section``.
+
+        Args:
+            spans: Vãos horizontais em metros.
+            support_heights: Alturas dos apoios em metros (um a mais que os vãos).
+            tension_daN: Tração horizontal da seção em daN.
+            weight_kg_m: Peso linear em kg/m (obrigatório sem ``conductor``).
+            conductor: Nome do condutor no catálogo.
+            temperature: Temperatura do estado calculado em °C (requer ``conductor``).
+            reference_temperature: Temperatura em que ``tension_daN`` foi definida.
+            min_clearance_m: Folga mínima (escalar ou por vão) ou None.
+            curve_points: Pontos da curva por vão (0 = sem curva).
+            curve_tolerance_m: Erro de corda máximo (pontos escolhidos por vão).
+
+        Returns:
+            ``SectionResult`` com vão regulador, tração e arrays por vão.
+
+        Raises:
+            ValueError: Se os dados forem inválidos ou o condutor não existir.
+        """
+        mechanics = self.get_conductor_mechanics(conductor) if conductor else None
+        if mechanics is not None:
+            weight_kg_m = mechanics.weight_kg_m
+        elif weight_kg_m is None:
+            raise ValueError("Informe o peso linear ou o condutor do catálogo.")
+        if temperature is not None:
+            if mechanics is None:
+                raise ValueError("Mudança de temperatura requer o condutor do catálogo.")
+            if not tension_daN > 0:
+                raise ValueError("Tração e peso linear devem ser positivos.")
+            lr = ruling_span(spans, support_heights)
+            tension_daN = float(
+                ChangeOfStateSolver(mechanics).solve(lr, tension_daN, reference_temperature, temperature)
+            )
+        return calculate_section(
+            spans, support_heights, tension_daN, weight_kg_m, min_clearance_m, curve_points, curve_tolerance_m
+        )
+
+    def check_terrain_clearance(
+        self,
+        span: ArrayLike,
+        ha: ArrayLike,
+        hb: ArrayLike,
+        tension_daN: ArrayLike,
+        weight_kg_m: ArrayLike,
+        profile: TerrainProfile,
+        min_clearance_m: ArrayLike,
+    ) -> ClearanceResult:
+        """Distância ao solo ao longo da curva de cada vão, sobre o perfil do terreno.
+
+        Diferente de ``CatenaryDomainService.is_within_clearance`` (flecha ×
+        folga), considera a cota do terreno sob todo o condutor. ``ha``/``hb``
+        são cotas de fixação no referencial do perfil. Ver
+        ``modules.catenaria.clearance``.
+
+        Args:
+            span: Vãos em metros.
+            ha: Cotas de fixação no apoio A em metros.
+            hb: Cotas de fixação no apoio B em metros.
+            tension_daN: Trações horizontais em daN.
+            weight_kg_m: Pesos lineares em kg/m.
+            profile: Perfil do terreno de cada vão.
+            min_clearance_m: Distância mínima ao solo (escalar ou por vão).
+
+        Returns:
+            ``ClearanceResult`` com mínimo e estaca por vão e pontos em violação.
+
+        Raises:
+            ValueError: Se o perfil não corresponder aos vãos.
+        """
+        return check_terrain_clearance(span, ha, hb, tension_daN, weight_kg_m, profile, min_clearance_m)
+
+    def solve_inverse(
+        self,
+        solve_for: InverseUnknown,
+        target: InverseTarget,
+        weight_kg_m: ArrayLike,
+        span: Optional[ArrayLike] = None,
+        tension_daN: Optional[ArrayLike] = None,
+        sag_m: Optional[ArrayLike] = None,
+        clearance_m: Optional[ArrayLike] = None,
+        ha: ArrayLike = 0.0,
+        hb: ArrayLike = 0.0,
+    ) -> InverseResult:
+        """Cálculo inverso em lote: tração ou vão máximo para uma flecha ou folga alvo.
+
+        Substitui a busca manual com chamadas repetidas a ``calculate_catenary``;
+        resolve todos os itens em passes vetorizados. Ver
+        ``modules.catenaria.inverse``.
+
+        Args:
+            solve_for: ``"tension"`` ou ``"span"``.
+            target: ``"sag"`` ou ``"clearance"``.
+            weight_kg_m: Pesos lineares em kg/m.
+            span: Vãos em metros (para ``solve_for="tension"``).
+            tension_daN: Trações em daN (para ``solve_for="span"``).
+            sag_m: Flechas alvo em metros (para ``target="sag"``).
+            clearance_m: Folgas alvo ao solo em metros (para ``target="clearance"``).
+            ha: Alturas de fixação no apoio A em metros.
+            hb: Alturas de fixação no apoio B em metros.
+
+        Returns:
+            ``InverseResult`` com tração, vão e flecha por item.
+
+        Raises:
+            ValueError: Se a combinação for inválida ou faltar um argumento.
+        """
+        return solve_inverse(solve_for, target, weight_kg_m, span, tension_daN, sag_m, clearance_m, ha, hb)
+
     def export_dxf(self, filepath: str, x_vals: NDArray, y_vals: NDArray, sag: float) -> None:
         """Exporta curva catenária para arquivo DXF.
 
@@ -0,0 +1,285 @@
+"""
+Tabelas de flecha × tração por condutor com cache persistente em SQLite.
+
+``SagTensionTableGenerator`` monta a tabela completa vãos × temperaturas ×
+pressões de vento de um condutor do catálogo com um único
+``ChangeOfStateSolver.solve_grid`` e grava tração e flecha na tabela
+``sag_tension_tables`` do mesmo banco (criada em ``DatabaseManager.init_db``),
+com a chave (condutor, hash dos parâmetros). Pedidos repetidos são servidos
+do cache.
+
+Cada entrada guarda a impressão digital dos dados mecânicos do condutor
+usados no cálculo. Quando a linha do condutor muda em ``conductors``
+(detectado pela revisão da tabela), o catálogo é relido e entradas com
+impressão digital diferente são descartadas e recalculadas.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from database.db_manager import DatabaseManager
+from utils.logger import get_logger
+
+from .change_of_state import ChangeOfStateSolver, ConductorMechanics
+from .logic import CatenaryLogic
+
+logger = get_logger(__name__)
+
+# Arrays gravados como float64 little-endian, forma (vãos, temperaturas, ventos).
+_BLOB_DTYPE = "<f8"
+
+
+@dataclass(frozen=True)
+class SagTensionParams:
+    """Parâmetros de uma tabela de flecha × tração.
+
+    O estado de referência é a tração de trabalho (EDS) na temperatura de
+    referência, sem vento: ``reference_tension_daN`` se informado, senão
+    ``reference_tension_pct`` % da carga de ruptura do condutor.
+
+    Attributes:
+        spans: Vãos em metros.
+        temperatures: Temperaturas em °C.
+        wind_pressures: Pressões de vento em daN/m².
+        reference_temperature: Temperatura do estado de referência em °C.
+        reference_tension_pct: Tração de referência em % da carga de ruptura.
+        reference_tension_daN: Tração de referência explícita em daN.
+    """
+
+    spans: Tuple[float, ...]
+    temperatures: Tuple[float, ...]
+    wind_pressures: Tuple[float, ...] = (0.0,)
+    reference_temperature: float = 20.0
+    reference_tension_pct: float = 18.0
+    reference_tension_daN: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        for name in ("spans", "temperatures", "wind_pressures"):
+            values = tuple(float(v) for v in np.atleast_1d(getattr(self, name)))
+            if not values or not all(np.isfinite(values)):
+                raise ValueError(f"'{name}' deve conter ao menos um valor finito.")
+            object.__setattr__(self, name, values)
+        if any(s <= 0 for s in self.spans):
+            raise ValueError("Vãos devem ser positivos.")
+        if self.reference_tension_daN is None and not self.reference_tension_pct > 0:
+            raise ValueError("Percentual da carga de ruptura deve ser positivo.")
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        """Forma ``(vãos, temperaturas, ventos)`` da tabela."""
+        return len(self.spans), len(self.temperatures), len(self.wind_pressures)
+
+    def reference_tension(self, conductor: ConductorMechanics) -> float:
+        """Tração de referência em daN para o condutor.
+
+        Raises:
+            ValueError: Se a tração depender de uma carga de ruptura desconhecida.
+        """
+        if self.reference_tension_daN is not None:
+            return float(self.reference_tension_daN)
+        if conductor.breaking_load_daN <= 0:
+            raise ValueError(f"Condutor '{conductor.name}' sem carga de ruptura cadastrada.")
+        return conductor.breaking_load_daN * self.reference_tension_pct / 100.0
+
+    def key(self) -> str:
+        """Hash estável dos parâmetros (chave do cache)."""
+        payload = json.dumps(asdict(self), sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class SagTensionTable:
+    """Tabela de flecha × tração de um condutor.
+
+    Attributes:
+        conductor: Nome do condutor no catálogo.
+        params: Parâmetros usados no cálculo.
+        reference_tension_daN: Tração de referência efetiva em daN.
+        tension: Tração horizontal em daN, forma ``params.shape``.
+        sag: Flecha de vão nivelado em metros, forma ``params.shape``.
+        from_cache: True se a tabela foi lida do cache.
+    """
+
+    conductor: str
+    params: SagTensionParams
+    reference_tension_daN: float
+    tension: NDArray[np.float64]
+    sag: NDArray[np.float64]
+    from_cache: bool = field(default=False, compare=False)
+
+    def rows(self) -> List[Dict[str, float]]:
+        """Linhas planas (vão, temperatura, vento, tração, flecha) para exibição/exportação."""
+        s, t, w = np.meshgrid(self.params.spans, self.params.temperatures, self.params.wind_pressures, indexing="ij")
+        return [
+            {"span_m": a, "temperature_c": b, "wind_pressure_daN_m2": c, "tension_daN": d, "sag_m": e}
+            for a, b, c, d, e in zip(
+                s.ravel().tolist(),
+                t.ravel().tolist(),
+                w.ravel().tolist(),
+                self.tension.ravel().tolist(),
+                self.sag.ravel().tolist(),
+            )
+        ]
+
+
+def conductor_fingerprint(conductor: ConductorMechanics) -> str:
+    """Impressão digital dos dados mecânicos que afetam a tabela."""
+    payload = json.dumps(asdict(conductor), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SagTensionTableGenerator:
+    """Gera tabelas de flecha × tração a partir do catálogo, com cache em SQLite."""
+
+    def __init__(self, logic: Optional[CatenaryLogic] = None, db: Optional[DatabaseManager] = None) -> None:
+        """Inicializa o gerador.
+
+        Args:
+            logic: Lógica de catenária com o catálogo de condutores.
+            db: Banco do cache e do catálogo (padrão: ``logic.db``).
+        """
+        self.logic = logic or CatenaryLogic(db)
+        self.db = db or self.logic.db
+        self._lock = threading.Lock()
+        self._conductors_revision = self.db.get_catalog_revision("conductors")
+
+    def generate(self, conductor: str, params: SagTensionParams, use_cache: bool = True) -> SagTensionTable:
+        """Tabela de um condutor, do cache quando possível.
+
+        Args:
+            conductor: Nome do condutor no catálogo.
+            params: Vãos, temperaturas, ventos e estado de referência.
+            use_cache: False força o recálculo (o resultado ainda é gravado).
+
+        Returns:
+            ``SagTensionTable`` com ``from_cache`` indicando a origem.
+
+        Raises:
+            ValueError: Se o condutor não existir ou não tiver dados mecânicos.
+        """
+        mechanics = self._mechanics(conductor)
+        fingerprint = conductor_fingerprint(mechanics)
+        key = params.key()
+
+        if use_cache:
+            cached = self._load(conductor, key, fingerprint, params)
+            if cached is not None:
+                return cached
+
+        reference = params.reference_tension(mechanics)
+        result = ChangeOfStateSolver(mechanics).solve_grid(
+            params.spans, reference, params.reference_temperature, params.temperatures, params.wind_pressures
+        )
+        table = SagTensionTable(conductor, params, reference, result.tension, result.sag)
+        self._store(table, key, fingerprint)
+        return table
+
+    def generate_many(
+        self, params: SagTensionParams, conductors: Optional[Sequence[str]] = None
+    ) -> Dict[str, SagTensionTable]:
+        """Tabelas de vários condutores (padrão: todo o catálogo) com os mesmos parâmetros.
+
+        Condutores sem dados mecânicos completos são ignorados com aviso no log.
+        """
+        self._refresh_catalog()
+        names = list(conductors) if conductors is not None else self.logic.get_conductor_names()
+        tables: Dict[str, SagTensionTable] = {}
+        for name in names:
+            try:
+                tables[name] = self.generate(name, params)
+            except ValueError as e:
+                logger.warning("Tabela de flecha × tração não gerada para '%s': %s", name, e)
+        return tables
+
+    def clear(self, conductor: Optional[str] = None) -> int:
+        """Remove entradas do cache.
+
+        Args:
+            conductor: Condutor a limpar. Se None, limpa o cache inteiro.
+
+        Returns:
+            Número de entradas removidas.
+        """
+        conn = self._connect()
+        try:
+            if conductor is None:
+                cur = conn.execute("DELETE FROM sag_tension_tables")
+            else:
+                cur = conn.execute("DELETE FROM sag_tension_tables WHERE conductor_name = ?", (conductor,))
+            return cur.rowcount
+        finally:
+            conn.close()
+
+    def _mechanics(self, conductor: str) -> ConductorMechanics:
+        self._refresh_catalog()
+        return self.logic.get_conductor_mechanics(conductor)
+
+    def _refresh_catalog(self) -> None:
+        """Relê os condutores se a tabela ``conductors`` mudou desde a última leitura."""
+        revision = self.db.get_catalog_revision("conductors")
+        with self._lock:
+            if revision == self._conductors_revision:
+                return
+            self._conductors_revision = revision
+        logger.debug("Catálogo de condutores alterado (revisão %d); recarregando", revision)
+        self.logic.load_conductors()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = self.db.get_connection()
+        conn.isolation_level = None  # autocommit: cada instrução é sua própria transação
+        return conn
+
+    def _load(self, conductor: str, key: str, fingerprint: str, params: SagTensionParams) -> Optional[SagTensionTable]:
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT conductor_fingerprint, reference_tension_daN, tension, sag FROM sag_tension_tables "
+                "WHERE conductor_name = ? AND params_key = ?",
+                (conductor, key),
+            ).fetchone()
+            if row is None:
+                return None
+            if row[0] != fingerprint:
+                # Dados mecânicos mudaram: descarta todas as tabelas antigas do condutor
+                conn.execute(
+                    "DELETE FROM sag_tension_tables WHERE conductor_name = ? AND conductor_fingerprint != ?",
+                    (conductor, fingerprint),
+                )
+                logger.info("Cache de flecha × tração invalidado para '%s' (condutor alterado)", conductor)
+                return None
+        finally:
+            conn.close()
+
+        shape = params.shape
+        tension = np.frombuffer(row[2], dtype=_BLOB_DTYPE).reshape(shape).astype(np.float64)
+        sag = np.frombuffer(row[3], dtype=_BLOB_DTYPE).reshape(shape).astype(np.float64)
+        return SagTensionTable(conductor, params, float(row[1]), tension, sag, from_cache=True)
+
+    def _store(self, table: SagTensionTable, key: str, fingerprint: str) -> None:
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO sag_tension_tables (conductor_name, params_key, conductor_fingerprint, "
+                "params_json, reference_tension_daN, tension, sag) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    table.conductor,
+                    key,
+                    fingerprint,
+                    json.dumps(asdict(table.params), sort_keys=True),
+                    table.reference_tension_daN,
+                    np.ascontiguousarray(table.tension, dtype=_BLOB_DTYPE).tobytes(),
+                    np.ascontiguousarray(table.sag, dtype=_BLOB_DTYPE).tobytes(),
+                ),
+            )
+        except sqlite3.Error as e:
+            # Falha de gravação não impede o uso da tabela recém-calculada
+            logger.warning("Não foi possível gravar a tabela de flecha × tração no cache: %s", e)
+        finally:
+            conn.close()
@@ -0,0 +1,167 @@
+"""
+Seção de tensionamento: vão regulador e flechas de todos os vãos de uma vez.
+
+Numa seção entre ancoragens a tração horizontal é igual em todos os vãos
+(cadeias de suspensão equalizam a tração), e o comportamento da seção sob
+mudança de estado é o de um único vão equivalente — o vão regulador:
+
+    Lr = √( Σ (Lᵢ⁴ / cᵢ) / Σ (cᵢ² / Lᵢ) ),   cᵢ = √(Lᵢ² + Δhᵢ²)
+
+que se reduz a ``√(Σ L³ / Σ L)`` em seções niveladas. ``calculate_section``
+calcula o vão regulador e, com a tração comum, flecha, constante catenária e
+tração máxima de cada vão via ``calculate_spans`` — um passe NumPy para
+centenas de vãos.
+
+A tração máxima fica no apoio mais alto: ``T + w·(h_alto − y_vértice)``, com
+o vértice da curva desnivelada (mesma forma de ``calculate_spans``) em
+
+    x₀ = L/2 − a·asinh(Δh/L)
+
+Em vãos nivelados ``h − y_vértice`` é a flecha; em vãos inclinados é maior.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .batch import KGF_TO_DAN, SpanBatchResult, calculate_spans
+
+
+@dataclass
+class SectionResult:
+    """Resultado do cálculo de uma seção de tensionamento.
+
+    Attributes:
+        ruling_span: Vão regulador em metros.
+        tension_daN: Tração horizontal comum aos vãos em daN.
+        weight_kg_m: Peso linear do condutor em kg/m.
+        spans: Resultado por vão (flecha, constante, folga e curva).
+        max_tension: Tração no apoio mais alto de cada vão,
+            ``T + w·(h_alto − y_vértice)``, em daN.
+    """
+
+    ruling_span: float
+    tension_daN: float
+    weight_kg_m: float
+    spans: SpanBatchResult
+    max_tension: NDArray[np.float64]
+
+    @property
+    def ruling_sag(self) -> float:
+        """Flecha do vão regulador nivelado em metros."""
+        a = self.tension_daN / (self.weight_kg_m * KGF_TO_DAN)
+        return float(a * (np.cosh(self.ruling_span / (2.0 * a)) - 1.0))
+
+
+def ruling_span(spans: ArrayLike, support_heights: Optional[ArrayLike] = None) -> float:
+    """Vão regulador de uma seção.
+
+    Args:
+        spans: Vãos horizontais em metros, forma ``(n,)``.
+        support_heights: Alturas dos ``n + 1`` apoios em metros (None = seção nivelada).
+
+    Returns:
+        Vão regulador em metros.
+
+    Raises:
+        ValueError: Se algum vão não for positivo ou as alturas não corresponderem aos vãos.
+    """
+    L = _as_spans(spans)
+    if support_heights is None:
+        return float(np.sqrt(np.sum(L**3) / np.sum(L)))
+    dh = np.diff(_as_heights(support_heights, L.size))
+    c = np.hypot(L, dh)
+    return float(np.sqrt(np.sum(L**4 / c) / np.sum(c * c / L)))
+
+
+def calculate_section(
+    spans: ArrayLike,
+    support_heights: ArrayLike,
+    tension_daN: float,
+    weight_kg_m: float,
+    min_clearance_m: Optional[ArrayLike] = None,
+    curve_points: int = 0,
+    curve_tolerance_m: Optional[float] = None,
+) -> SectionResult:
+    """Calcula o vão regulador e todos os vãos de uma seção.
+
+    Args:
+        spans: Vãos horizontais em metros, forma ``(n,)``.
+        support_heights: Alturas dos ``n + 1`` apoios em metros.
+        tension_daN: Tração horizontal da seção em daN (> 0).
+        weight_kg_m: Peso linear do condutor em kg/m (> 0).
+        min_clearance_m: Folga mínima (escalar ou por vão; NaN = não verificar).
+        curve_points: Pontos da curva por vão (0 = não gerar a curva).
+        curve_tolerance_m: Erro de corda máximo da curva (pontos escolhidos por vão).
+
+    Returns:
+        ``SectionResult`` com o vão regulador e os arrays por vão.
+
+    Raises:
+        ValueError: Se os dados forem inválidos ou algum vão não puder ser calculado.
+    """
+    L = _as_spans(spans)
+    heights = _as_heights(support_heights, L.size)
+    if not (tension_daN > 0 and weight_kg_m > 0):
+        raise ValueError("Tração e peso linear devem ser positivos.")
+
+    result = calculate_spans(
+        L, heights[:-1], heights[1:], tension_daN, weight_kg_m, min_clearance_m, curve_points, curve_tolerance_m
+    )
+    if result.errors:
+        idx, message = next(iter(result.errors.items()))
+        raise ValueError(f"Vão {idx + 1} ({L[idx]:g} m): {message}")
+
+    return SectionResult(
+        ruling_span=ruling_span(L, heights),
+        tension_daN=float(tension_daN),
+        weight_kg_m=float(weight_kg_m),
+        spans=result,
+        max_tension=support_tension(L, heights[:-1], heights[1:], tension_daN, weight_kg_m),
+    )
+
+
+def support_tension(
+    spans: ArrayLike, h_a: ArrayLike, h_b: ArrayLike, tension_daN: float, weight_kg_m: float
+) -> NDArray[np.float64]:
+    """Tração no apoio mais alto de cada vão em daN.
+
+    Args:
+        spans: Vãos horizontais em metros.
+        h_a: Alturas dos apoios A em metros.
+        h_b: Alturas dos apoios B em metros.
+        tension_daN: Tração horizontal em daN.
+        weight_kg_m: Peso linear do condutor em kg/m.
+
+    Returns:
+        ``T + w·(max(h_a, h_b) − y_vértice)`` por vão; o vértice pode ficar fora
+        do vão (virtual) em vãos muito inclinados.
+    """
+    L = np.asarray(spans, dtype=np.float64)
+    h_a = np.asarray(h_a, dtype=np.float64)
+    h_b = np.asarray(h_b, dtype=np.float64)
+    w = weight_kg_m * KGF_TO_DAN
+    a = tension_daN / w
+    dh = h_b - h_a
+    # Vértice de y(x) = h_a + Δh·x/L + a·(cosh((x − L/2)/a) − cosh(L/2a))
+    u = -np.arcsinh(dh / L)  # (x₀ − L/2) / a
+    y_vertex = h_a + dh * (0.5 + a * u / L) + a * (np.cosh(u) - np.cosh(L / (2.0 * a)))
+    return tension_daN + w * (np.maximum(h_a, h_b) - y_vertex)
+
+
+def _as_spans(spans: ArrayLike) -> NDArray[np.float64]:
+    L = np.atleast_1d(np.asarray(spans, dtype=np.float64))
+    if L.ndim != 1 or L.size == 0 or not np.all(np.isfinite(L) & (L > 0)):
+        raise ValueError("A seção deve ter ao menos um vão e todos os vãos devem ser positivos.")
+    return L
+
+
+def _as_heights(support_heights: ArrayLike, n_spans: int) -> NDArray[np.float64]:
+    heights = np.atleast_1d(np.asarray(support_heights, dtype=np.float64))
+    if heights.shape != (n_spans + 1,):
+        raise ValueError(f"Informe {n_spans + 1} alturas de apoio para {n_spans} vãos (recebidas {heights.size}).")
+    if not np.all(np.isfinite(heights)):
+        raise ValueError("Alturas de apoio devem ser números finitos.")
+    return heights
@@ -0,0 +1,190 @@
+"""
+Cálculo CQT de várias redes independentes em um pool de processos.
+
+Cada rede (um TRAFO e seus trechos) é calculada por ``CQTLogic.calculate`` em
+um processo do pool; falhas são isoladas por rede — uma rede inválida ou uma
+exceção inesperada gera ``success=False`` apenas para ela.
+
+O pool é único no processo, criado na primeira chamada paralela e reutilizado
+pelas seguintes (cada processo mantém seu ``CQTLogic``); o tamanho vem da
+variável de ambiente ``SISPROJETOS_CQT_WORKERS`` (padrão: número de CPUs,
+até 8). Chamadas concorrentes dividem os mesmos processos, e ``workers``
+limita quantos blocos de uma chamada ficam em execução ao mesmo tempo.
+``shutdown_pool`` encerra o pool (ex: no desligamento da API). Outros
+analisadores CQT (ex: Monte Carlo) usam o mesmo pool via ``map_pooled``.
+"""
+
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from utils.logger import get_logger
+
+from .logic import CQTLogic
+
+logger = get_logger(__name__)
+
+WORKERS_ENV = "SISPROJETOS_CQT_WORKERS"
+
+# Instância de CQTLogic de cada processo do pool (criada sob demanda).
+_process_logic: Optional[CQTLogic] = None
+
+# Pool compartilhado do processo principal (criado sob demanda).
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def default_workers() -> int:
+    """Número padrão de processos do pool (``SISPROJETOS_CQT_WORKERS``)."""
+    try:
+        configured = int(os.getenv(WORKERS_ENV, "0"))
+    except ValueError:
+        logger.warning("%s inválido; usando o número de CPUs", WORKERS_ENV)
+        configured = 0
+    return configured if configured > 0 else min(os.cpu_count() or 1, 8)
+
+
+def calculate_networks(
+    jobs: List[Dict[str, Any]],
+    workers: Optional[int] = None,
+    include_results: bool = True,
+    logic: Optional[CQTLogic] = None,
+) -> List[Dict[str, Any]]:
+    """Calcula várias redes CQT, em paralelo quando ``workers > 1``.
+
+    Args:
+        jobs: Lista de redes, cada uma com 'segments', 'trafo_kva' e, opcionais,
+            'social_class' (padrão 'B') e 'result_format' (padrão 'dict').
+        workers: Blocos em execução simultânea no pool compartilhado (limitado
+            ao tamanho do pool). None usa ``default_workers()``; 1 calcula no
+            processo atual.
+        include_results: Se False, omite 'results'/'columns' (por ponto) e
+            mantém apenas o 'summary' de cada rede.
+        logic: Instância usada no cálculo sequencial (no pool, cada processo
+            cria a sua).
+
+    Returns:
+        Um dicionário por rede, na ordem de ``jobs``, no formato de
+        ``CQTLogic.calculate``.
+    """
+    workers = default_workers() if workers is None else max(1, int(workers))
+    tasks = [(job, include_results) for job in jobs]
+    if workers > 1 and len(tasks) > 1:
+        size = max(1, len(tasks) // (min(workers, len(tasks)) * 4))
+        chunks = map_pooled(_calculate_chunk, [tasks[i : i + size] for i in range(0, len(tasks), size)], workers)
+        if chunks is not None:
+            return [result for chunk in chunks for result in chunk]
+
+    logic = logic or CQTLogic()
+    return [_calculate(logic, t) for t in tasks]
+
+
+def get_pool() -> ProcessPoolExecutor:
+    """Pool de processos compartilhado, criado na primeira chamada com ``default_workers()`` processos.
+
+    Raises:
+        OSError: Se o sistema não permitir criar processos.
+    """
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None:
+            _pool_workers = default_workers()
+            _pool = ProcessPoolExecutor(max_workers=_pool_workers)
+            logger.debug("Pool de processos CQT criado com %d processo(s)", _pool_workers)
+        return _pool
+
+
+def shutdown_pool() -> None:
+    """Encerra o pool compartilhado (a próxima chamada paralela cria outro)."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _discard_pool(pool: Optional[ProcessPoolExecutor]) -> None:
+    """Descarta um pool quebrado, se ainda for o compartilhado, sem esperar seus processos."""
+    global _pool
+    if pool is None:
+        return
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False)
+
+
+def map_pooled(fn: Callable[[Any], Any], items: List[Any], workers: int) -> Optional[List[Any]]:
+    """Aplica ``fn`` a cada item no pool compartilhado.
+
+    ``fn`` deve ser uma função de módulo e os itens serializáveis (pickle). Se
+    o pool não puder ser criado ou quebrar, ele é descartado e o chamador
+    deve calcular no processo atual.
+
+    Args:
+        fn: Função executada nos processos do pool.
+        items: Argumentos de cada chamada.
+        workers: Máximo de itens em execução ao mesmo tempo (limitado ao
+            tamanho do pool).
+
+    Returns:
+        Resultados na ordem de ``items`` ou None se o pool estiver indisponível.
+    """
+    pool = None
+    try:
+        pool = get_pool()
+        return _run_pooled(pool, fn, items, min(workers, _pool_workers))
+    except (BrokenProcessPool, OSError) as e:
+        logger.warning("Pool de processos CQT indisponível (%s); calculando sequencialmente", e)
+        _discard_pool(pool)
+        return None
+
+
+def _run_pooled(pool: ProcessPoolExecutor, fn: Callable[[Any], Any], items: List[Any], workers: int) -> List[Any]:
+    """Envia os itens ao pool com no máximo ``workers`` em execução."""
+    workers = max(1, min(workers, len(items)))
+    results: List[Any] = [None] * len(items)
+    pending: Dict[Future, int] = {}
+    running: Set[Future] = set()
+    for index, item in enumerate(items):
+        if len(running) >= workers:
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+            _collect(done, pending, results)
+        future = pool.submit(fn, item)
+        pending[future] = index
+        running.add(future)
+    _collect(wait(running).done, pending, results)
+    return results
+
+
+def _collect(done: Set[Future], pending: Dict[Future, int], results: List[Any]) -> None:
+    """Copia os resultados concluídos para as posições dos itens."""
+    for future in done:
+        results[pending.pop(future)] = future.result()
+
+
+def _calculate_chunk(tasks: List[Tuple[Any, bool]]) -> List[Dict[str, Any]]:
+    """Ponto de entrada dos processos do pool (reutiliza um CQTLogic por processo)."""
+    global _process_logic
+    if _process_logic is None:
+        _process_logic = CQTLogic()
+    return [_calculate(_process_logic, task) for task in tasks]
+
+
+def _calculate(logic: CQTLogic, task: Any) -> Dict[str, Any]:
+    """Calcula uma rede isolando qualquer falha."""
+    job, include_results = task
+    try:
+        result = logic.calculate(
+            job["segments"], job["trafo_kva"], job.get("social_class", "B"), job.get("result_format", "dict")
+        )
+    except Exception as e:
+        logger.warning("Erro no cálculo CQT em lote: %s", e)
+        return {"success": False, "error": str(e)}
+    if not include_results:
+        result.pop("results", None)
+        result.pop("columns", None)
+    return result
@@ -0,0 +1,77 @@
+"""
+Cache em processo dos coeficientes K de cabos para o cálculo CQT.
+
+Os coeficientes da tabela ``cable_technical_data`` (categoria ``cqt_k_coef``)
+são lidos uma única vez por banco e compartilhados entre todas as instâncias
+de ``CQTLogic`` do processo (GUI e API). A cada consulta o cache compara a
+revisão da tabela (``DatabaseManager.get_catalog_revision``, mantida por
+triggers) e só relê os coeficientes quando a tabela realmente mudou.
+"""
+
+import threading
+from typing import Dict, Optional, Tuple
+
+from database.db_manager import DatabaseManager
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_TABLE = "cable_technical_data"
+
+
+class CableCoefCache:
+    """Cache thread-safe de coeficientes K por caminho de banco de dados."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[int, Dict[str, float]]] = {}
+
+    def get(self, db: DatabaseManager) -> Dict[str, float]:
+        """Retorna os coeficientes K do banco, relendo-os apenas se a tabela mudou.
+
+        Args:
+            db: Gerenciador do banco de onde os coeficientes são lidos.
+
+        Returns:
+            Dicionário {nome_cabo: coeficiente_k} compartilhado (não modificar).
+
+        Raises:
+            Exception: Propaga erros de acesso ao banco para o chamador decidir o fallback.
+        """
+        revision = db.get_catalog_revision(_TABLE)
+        with self._lock:
+            entry = self._entries.get(db.db_path)
+        if entry is not None and entry[0] == revision:
+            return entry[1]
+
+        coefs = self._load(db)
+        with self._lock:
+            self._entries[db.db_path] = (revision, coefs)
+        logger.debug("Coeficientes CQT carregados de %s (revisão %d)", db.db_path, revision)
+        return coefs
+
+    def invalidate(self, db_path: Optional[str] = None) -> None:
+        """Descarta os coeficientes em cache.
+
+        Args:
+            db_path: Banco a invalidar. Se None, limpa o cache inteiro.
+        """
+        with self._lock:
+            if db_path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(db_path, None)
+
+    @staticmethod
+    def _load(db: DatabaseManager) -> Dict[str, float]:
+        conn = db.get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT key_name, value FROM cable_technical_data WHERE category='cqt_k_coef'")
+            return {r[0]: r[1] for r in cursor.fetchall()}
+        finally:
+            conn.close()
+
+
+# Instância compartilhada por todo o processo.
+CABLE_COEF_CACHE = CableCoefCache()
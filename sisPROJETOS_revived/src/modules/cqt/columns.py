@@ -0,0 +1,192 @@
+"""
+Reconhecimento de colunas e leitura de células de planilhas CQT.
+
+Localiza o cabeçalho pelos títulos aceitos em ``COLUMN_ALIASES`` (sem
+diferenciar maiúsculas e acentos) e converte as células de ponto, comprimento,
+UCs e cargas usadas por ``CQTImporter``. Inclui a leitura da aba de cargas do
+modelo ``cqt.xlsx`` (ex: "ATUAL"), associada às abas "CQT" pelo ponto.
+"""
+
+import math
+import re
+import unicodedata
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from utils.sanitizer import sanitize_numeric
+
+# Títulos aceitos para cada campo do trecho (normalizados por ``normalize_title``).
+COLUMN_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "ponto": ("PONTO", "TRECHO"),
+    "montante": ("MONTANTE", "TRECHO MONTANTE", "PONTO MONTANTE"),
+    "metros": ("METROS", "COMPRIMENTO (M)", "DISTANCIA (M)", "COMPRIMENTO"),
+    "cabo": ("CABO", "CONDUTOR"),
+    "mono": ("MONO",),
+    "bi": ("BI",),
+    "tri": ("TRI",),
+    "tri_esp": ("TRI ESP", "TRI ESPECIAL"),
+    "carga_esp": ("CARGA ESP", "CARGA ESPECIAL", "CARGA", "CARGA (KVA)"),
+}
+REQUIRED_COLUMNS = ("ponto", "montante")
+CLIENT_COLUMNS = ("mono", "bi", "tri", "tri_esp")
+LOAD_COLUMNS = CLIENT_COLUMNS + ("carga_esp",)
+
+# Títulos de comprimento em centenas de metros (modelo cqt.xlsx, "B - 100").
+LENGTH_SCALES: Dict[str, float] = {"COMPRIMENTO": 100.0}
+
+# Prefixo das abas de cálculo do modelo; a aba de cargas tem o mesmo nome sem ele.
+CQT_SHEET_PREFIX = "CQT "
+
+# Linha de legenda do modelo sob o cabeçalho ("B - 100", "C - kVA", ...).
+LEGEND_PATTERN = re.compile(r"^[A-Z] - ")
+
+HEADER_SCAN_ROWS = 20
+
+
+def find_header(rows: Iterator[Sequence[Any]]) -> Optional[Tuple[Dict[str, int], Dict[str, str], int]]:
+    """Procura o cabeçalho nas primeiras linhas e consome o iterador até ele.
+
+    Returns:
+        (campo → coluna, campo → título, número da linha) ou None.
+    """
+    lookup = alias_lookup()
+    previous: Sequence[Any] = ()
+    for line, row in enumerate(rows, start=1):
+        columns, titles = match_titles(row, lookup)
+        if all(k in columns for k in REQUIRED_COLUMNS):
+            fill_titles(previous, lookup, columns, titles)
+            return columns, titles, line
+        if line >= HEADER_SCAN_ROWS:
+            break
+        previous = row or ()
+    return None
+
+
+def alias_lookup() -> Dict[str, str]:
+    """Título normalizado → campo do trecho."""
+    return {normalize_title(alias): key for key, aliases in COLUMN_ALIASES.items() for alias in aliases}
+
+
+def match_titles(row: Optional[Sequence[Any]], lookup: Dict[str, str]) -> Tuple[Dict[str, int], Dict[str, str]]:
+    """Campos reconhecidos em uma linha: (campo → coluna, campo → título)."""
+    columns: Dict[str, int] = {}
+    titles: Dict[str, str] = {}
+    fill_titles(row, lookup, columns, titles)
+    return columns, titles
+
+
+def fill_titles(
+    row: Optional[Sequence[Any]], lookup: Dict[str, str], columns: Dict[str, int], titles: Dict[str, str]
+) -> None:
+    """Acrescenta os campos da linha ainda ausentes, sem reutilizar colunas já mapeadas."""
+    used = set(columns.values())
+    for col, value in enumerate(row or ()):
+        key = lookup.get(normalize_title(value)) if value is not None else None
+        if key and key not in columns and col not in used:
+            columns[key] = col
+            titles[key] = str(value).strip()
+            used.add(col)
+
+
+def read_loads(rows: Iterable[Sequence[Any]]) -> Optional[Dict[str, Tuple[int, float]]]:
+    """Lê a aba de cargas do modelo: ponto → (UCs, carga especial).
+
+    O cabeçalho é a primeira linha com TRECHO e alguma coluna de carga; títulos
+    da linha seguinte (ex: CARGA, sob TRI ESPECIAL no modelo) completam as
+    colunas ausentes. Linhas com valores inválidos são ignoradas — a aba de
+    cálculo continua sendo a referência para os erros por linha.
+
+    Returns:
+        Cargas por ponto, ou None se a aba não tiver cabeçalho de cargas.
+    """
+    iterator = iter(rows)
+    lookup = alias_lookup()
+    for line, row in enumerate(iterator, start=1):
+        columns, titles = match_titles(row, lookup)
+        if "ponto" in columns and any(k in columns for k in LOAD_COLUMNS):
+            break
+        if line >= HEADER_SCAN_ROWS:
+            return None
+    else:
+        return None
+
+    loads: Dict[str, Tuple[int, float]] = {}
+    for i, row in enumerate(iterator):
+        if i == 0:
+            fill_titles(row, lookup, columns, titles)
+        ponto = cell_text(cell_value(row, columns["ponto"]))
+        if not ponto:
+            continue
+        try:
+            loads[ponto] = row_loads(row, columns)
+        except ValueError:
+            continue
+    return loads
+
+
+def row_loads(row: Sequence[Any], columns: Dict[str, int]) -> Tuple[int, float]:
+    """(UCs, carga especial) de uma linha; UCs devem ser inteiras."""
+    clients = 0
+    for key in CLIENT_COLUMNS:
+        value = cell_number(row, columns, key)
+        if not value.is_integer():
+            raise ValueError(f"{key} deve ser inteiro ({value:g})")
+        clients += int(value)
+    return clients, cell_number(row, columns, "carga_esp")
+
+
+def missing_column_warnings(columns: Dict[str, int], joined_loads: bool) -> List[str]:
+    """Avisos para colunas ausentes que deixariam os trechos zerados sem erro."""
+    warnings = []
+    if "metros" not in columns:
+        warnings.append("Coluna de comprimento (METROS/COMPRIMENTO) não encontrada: trechos com 0 m.")
+    if "cabo" not in columns:
+        warnings.append("Coluna de condutor (CABO/CONDUTOR) não encontrada: trechos sem coeficiente de queda.")
+    if not joined_loads and not any(k in columns for k in LOAD_COLUMNS):
+        warnings.append("Colunas de carga (MONO, BI, TRI, TRI ESPECIAL, CARGA) não encontradas: trechos sem carga.")
+    return warnings
+
+
+def is_legend(row: Sequence[Any], columns: Dict[str, int]) -> bool:
+    """True para a linha de legenda do modelo ("B - 100" na coluna de comprimento)."""
+    value = cell_value(row, columns.get("metros"))
+    return isinstance(value, str) and bool(LEGEND_PATTERN.match(value.strip()))
+
+
+def normalize_title(value: Any) -> str:
+    """Título sem acentos, em maiúsculas, com '_' como espaço e espaços simples."""
+    text = unicodedata.normalize("NFKD", str(value)).encode("ascii", "ignore").decode()
+    return " ".join(text.replace("_", " ").upper().split())
+
+
+def has_row_data(row: Sequence[Any], columns: Dict[str, int]) -> bool:
+    """True se alguma coluna além do ponto estiver preenchida."""
+    return any(cell_value(row, col) not in (None, "") for key, col in columns.items() if key != "ponto")
+
+
+def cell_value(row: Sequence[Any], col: Optional[int]) -> Any:
+    return row[col] if col is not None and col < len(row) else None
+
+
+def cell_text(value: Any) -> str:
+    """Identificador de ponto em maiúsculas (números inteiros do Excel sem '.0')."""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return "" if value is None else str(value).strip().upper()
+
+
+def cell_number(row: Sequence[Any], columns: Dict[str, int], key: str) -> float:
+    """Valor numérico não negativo da coluna (vazio = 0; aceita vírgula decimal)."""
+    value = cell_value(row, columns.get(key))
+    if isinstance(value, str):
+        value = value.strip()
+        if "," in value:
+            value = value.replace(".", "").replace(",", ".")
+    if value is None or value == "":
+        return 0.0
+    try:
+        result = sanitize_numeric(value, min_val=0.0)
+    except ValueError:
+        raise ValueError(f"{key} inválido ('{value}')") from None
+    if not math.isfinite(result):
+        raise ValueError(f"{key} inválido ('{value}')")
+    return result
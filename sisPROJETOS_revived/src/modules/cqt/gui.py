@@ -6,6 +6,7 @@ import pandas as pd
 from styles import DesignSystem
 
 from .logic import CQTLogic
+from .session import CQTSession
 
 
 class CQTGUI(ctk.CTkFrame):
@@ -13,6 +14,8 @@ class CQTGUI(ctk.CTkFrame):
         super().__init__(parent, **DesignSystem.get_frame_style())
         self.controller = controller
         self.logic = CQTLogic()
+        # Sessão incremental: recalcula só o caminho/subárvore do trecho editado
+        self.session = CQTSession(self.logic)
         self.rows = []
 
         self.create_widgets()
@@ -190,7 +193,7 @@ class CQTGUI(ctk.CTkFrame):
         trafo_kva = float(self.ent_trafo_kva.get() or 0)
         social_class = self.cmb_class.get()
 
-        res = self.logic.calculate(segments, trafo_kva, social_class)
+        res = self.session.calculate(segments, trafo_kva, social_class)
 
         if res["success"]:
             summary = res["summary"]
@@ -0,0 +1,396 @@
+"""
+Importação em streaming de trechos CQT a partir de planilhas XLSX/CSV grandes.
+
+Lê as linhas em blocos (openpyxl em modo somente leitura ou ``csv.reader``),
+valida cada linha e converte os valores diretamente para os arrays da
+``CompiledNetwork`` — sem montar um dicionário por trecho. A memória fica
+limitada ao bloco em leitura mais os arrays finais da rede.
+
+As colunas são localizadas pelo cabeçalho (nas primeiras linhas da planilha),
+aceitando os nomes dos trechos de ``CQTLogic.calculate`` e os títulos usados no
+modelo ``cqt.xlsx`` (TRECHO, TRECHO MONTANTE, CONDUTOR, MONO, BI, TRI,
+TRI ESPECIAL, CARGA), sem diferenciar maiúsculas e acentos. Títulos na linha
+acima do cabeçalho (ex: CONDUTOR, agrupado sobre as colunas do modelo) também
+são aceitos. Apenas as colunas de ponto e montante são obrigatórias; as demais
+valem zero/vazio, com um aviso em ``warnings`` quando o comprimento, o condutor
+ou todas as cargas estão ausentes. Linhas só com o ponto preenchido (numeração
+pré-impressa do modelo) e a linha de legenda ("A", "B - 100", ...) são ignoradas.
+
+METROS e "COMPRIMENTO (M)" estão em metros; a coluna COMPRIMENTO das abas
+"CQT" do modelo está em centenas de metros e é convertida (×100).
+
+No modelo, as cargas de cada trecho ficam na aba de mesmo nome sem o prefixo
+"CQT " (ex: "CQT ATUAL" → "ATUAL"), inclusive as do TRAFO, que não tem linha
+própria na aba "CQT". Se a aba lida não tiver colunas de carga e essa aba
+existir, as cargas são lidas dela e associadas pelo ponto.
+"""
+
+import csv
+import os
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+from openpyxl import load_workbook
+
+from utils.logger import get_logger
+from utils.sanitizer import sanitize_filepath
+
+from .columns import (
+    CQT_SHEET_PREFIX,
+    LENGTH_SCALES,
+    LOAD_COLUMNS,
+    cell_number,
+    cell_text,
+    cell_value,
+    find_header,
+    has_row_data,
+    is_legend,
+    missing_column_warnings,
+    normalize_title,
+    read_loads,
+    row_loads,
+)
+from .logic import CQTLogic
+from .network import CompiledNetwork
+from .validator import ROOT, TopologyReport, validate_topology
+
+logger = get_logger(__name__)
+
+SUPPORTED_EXTENSIONS = [".xlsx", ".xlsm", ".csv", ".txt"]
+MAX_REPORTED_ERRORS = 100
+
+ProgressCallback = Callable[[int], None]
+
+
+@dataclass
+class CQTImportResult:
+    """Resultado da importação de uma planilha CQT.
+
+    Attributes:
+        network: Rede compilada (None se houver erros).
+        rows: Número de trechos lidos (linhas não vazias).
+        errors: Mensagens de erro, no máximo ``MAX_REPORTED_ERRORS``.
+        error_count: Total de erros encontrados.
+        sheet: Aba lida (XLSX) ou None (CSV).
+        columns: Campo do trecho → título da coluna encontrada.
+        topology: Diagnóstico de topologia, quando a rede foi reprovada ou
+            precisou da validação completa (pontos repetidos).
+        warnings: Avisos que não impedem a importação (ex: cabos fora do
+            catálogo, que entram no cálculo com coeficiente 0, ou colunas de
+            comprimento, condutor e carga ausentes).
+        load_sheet: Aba de onde as cargas foram lidas, quando diferente de ``sheet``.
+    """
+
+    network: Optional[CompiledNetwork]
+    rows: int
+    errors: List[str] = field(default_factory=list)
+    error_count: int = 0
+    sheet: Optional[str] = None
+    columns: Dict[str, str] = field(default_factory=dict)
+    topology: Optional[TopologyReport] = None
+    warnings: List[str] = field(default_factory=list)
+    load_sheet: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        """True se a rede foi importada sem erros."""
+        return self.network is not None and self.error_count == 0
+
+
+class CQTImporter:
+    """Importa trechos CQT de planilhas XLSX/CSV em blocos de linhas."""
+
+    def __init__(self, logic: Optional[CQTLogic] = None) -> None:
+        """Inicializa o importador.
+
+        Args:
+            logic: Instância de ``CQTLogic`` a reutilizar. Se None, cria uma nova.
+        """
+        self.logic = logic or CQTLogic()
+
+    def import_file(
+        self,
+        filepath: str,
+        sheet: Optional[str] = None,
+        chunk_size: int = 10_000,
+        progress: Optional[ProgressCallback] = None,
+    ) -> CQTImportResult:
+        """Lê a planilha e compila a rede CQT.
+
+        A rede resultante é usada com ``CQTLogic.calculate_compiled`` (ou
+        ``solve_compiled``) e nos demais analisadores que aceitam
+        ``CompiledNetwork``.
+
+        Args:
+            filepath: Caminho do arquivo ``.xlsx``/``.xlsm`` ou ``.csv``/``.txt``
+                (separador ``;``, ``,`` ou tabulação; vírgula decimal aceita).
+            sheet: Aba do XLSX. Se None, usa a primeira aba com cabeçalho
+                reconhecido.
+            chunk_size: Linhas convertidas por bloco.
+            progress: Função chamada com o total de linhas lidas após cada bloco.
+
+        Returns:
+            ``CQTImportResult`` com a rede ou a lista de erros por linha.
+
+        Raises:
+            ValueError: Se o arquivo for inválido ou não houver cabeçalho
+                reconhecível.
+        """
+        path = sanitize_filepath(filepath, SUPPORTED_EXTENSIONS)
+        if not os.path.isfile(path):
+            raise ValueError(f"Arquivo não encontrado: {path}")
+
+        if os.path.splitext(path)[1].lower() in (".csv", ".txt"):
+            with open(path, newline="", encoding="utf-8-sig") as f:
+                sample = f.read(4096)
+                f.seek(0)
+                try:
+                    dialect: Any = csv.Sniffer().sniff(sample, delimiters=";,\t")
+                except csv.Error:
+                    dialect = "excel"
+                return self.import_rows(csv.reader(f, dialect), chunk_size=chunk_size, progress=progress)
+
+        wb = load_workbook(path, read_only=True, data_only=True)
+        try:
+            names = [sheet] if sheet is not None else wb.sheetnames
+            for name in names:
+                if name not in wb.sheetnames:
+                    raise ValueError(f"Aba '{name}' não encontrada. Abas disponíveis: {wb.sheetnames}")
+                rows = wb[name].iter_rows(values_only=True)
+                header = find_header(rows)
+                if header is None:
+                    continue
+                loads = None
+                load_sheet = name[len(CQT_SHEET_PREFIX) :] if name.upper().startswith(CQT_SHEET_PREFIX) else None
+                if load_sheet in wb.sheetnames and not any(k in header[0] for k in LOAD_COLUMNS):
+                    loads = read_loads(wb[load_sheet].iter_rows(values_only=True))
+                result = self._read(rows, *header, chunk_size=chunk_size, progress=progress, loads=loads)
+                result.sheet = name
+                if loads is not None:
+                    result.load_sheet = load_sheet
+                return result
+        finally:
+            wb.close()
+        raise ValueError("Cabeçalho CQT não encontrado (colunas de ponto e montante são obrigatórias).")
+
+    def import_rows(
+        self,
+        rows: Iterable[Sequence[Any]],
+        chunk_size: int = 10_000,
+        progress: Optional[ProgressCallback] = None,
+    ) -> CQTImportResult:
+        """Importa trechos de um iterável de linhas com cabeçalho.
+
+        Args:
+            rows: Linhas da planilha (a primeira linha reconhecível é o cabeçalho).
+            chunk_size: Linhas convertidas por bloco.
+            progress: Função chamada com o total de linhas lidas após cada bloco.
+
+        Returns:
+            ``CQTImportResult`` com a rede ou a lista de erros por linha.
+
+        Raises:
+            ValueError: Se não houver cabeçalho reconhecível.
+        """
+        iterator = iter(rows)
+        header = find_header(iterator)
+        if header is None:
+            raise ValueError("Cabeçalho CQT não encontrado (colunas de ponto e montante são obrigatórias).")
+        return self._read(iterator, *header, chunk_size=chunk_size, progress=progress)
+
+    def _read(
+        self,
+        rows: Iterator[Sequence[Any]],
+        columns: Dict[str, int],
+        titles: Dict[str, str],
+        header_line: int,
+        chunk_size: int,
+        progress: Optional[ProgressCallback],
+        loads: Optional[Dict[str, Tuple[int, float]]] = None,
+    ) -> CQTImportResult:
+        """Converte as linhas de dados em blocos e compila a rede.
+
+        Args:
+            loads: Ponto → (UCs, carga especial) lidos de outra aba; substitui as
+                colunas de carga da aba principal.
+        """
+        builder = _ArrayBuilder(columns, LENGTH_SCALES.get(normalize_title(titles.get("metros", "")), 1.0), loads)
+        chunk_size = max(1, int(chunk_size))
+        line = header_line
+        for line, row in enumerate(rows, start=header_line + 1):
+            builder.add(row, line)
+            if builder.pending >= chunk_size:
+                builder.flush()
+                if progress:
+                    progress(builder.rows)
+        if loads is not None and ROOT in loads and builder.rows and ROOT not in builder.points:
+            builder.add_root()
+        if builder.pending:
+            builder.flush()
+            if progress:
+                progress(builder.rows)
+
+        result = CQTImportResult(network=None, rows=builder.rows, columns=titles)
+        result.warnings.extend(missing_column_warnings(columns, loads is not None))
+        if builder.error_count:
+            result.errors, result.error_count = builder.errors, builder.error_count
+        elif builder.rows == 0:
+            result.errors, result.error_count = ["Nenhum trecho encontrado na planilha."], 1
+        else:
+            result.network, result.topology = builder.compile()
+            if result.network is None:
+                result.errors, result.error_count = [result.topology.message()], 1
+            else:
+                coefs = self.logic.get_cable_coefs()
+                unknown = [c for c in result.network.cables if c and c not in coefs]
+                if unknown:
+                    result.warnings.append(f"Cabo(s) fora do catálogo (coeficiente 0): {', '.join(unknown)}")
+        logger.info(
+            "Importação CQT: %d trechos lidos até a linha %d, %d erro(s)", result.rows, line, result.error_count
+        )
+        return result
+
+
+class _ArrayBuilder:
+    """Acumula as linhas validadas em arrays por coluna, bloco a bloco."""
+
+    def __init__(
+        self,
+        columns: Dict[str, int],
+        length_scale: float = 1.0,
+        loads: Optional[Dict[str, Tuple[int, float]]] = None,
+    ) -> None:
+        self.columns = columns
+        self.length_scale = length_scale
+        self.loads = loads
+        self.points: List[str] = []
+        self.montantes: List[str] = []
+        self.cables: List[str] = []
+        self.cable_pos: Dict[str, int] = {}
+        self.errors: List[str] = []
+        self.error_count = 0
+        self.rows = 0
+        # Bloco em leitura: (metros, cabo, UCs, carga_esp) por linha
+        self._pending: List[Tuple[float, int, int, float]] = []
+        self._chunks: List[NDArray[np.float64]] = []
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def add(self, row: Sequence[Any], line: int) -> None:
+        """Valida uma linha e a acrescenta ao bloco (linhas sem dados são ignoradas)."""
+        ponto = cell_text(cell_value(row, self.columns.get("ponto")))
+        if not ponto or (ponto != ROOT and not has_row_data(row, self.columns)) or is_legend(row, self.columns):
+            return
+        try:
+            montante = cell_text(cell_value(row, self.columns.get("montante")))
+            if not montante and ponto != ROOT:
+                raise ValueError("montante não informado")
+            metros = cell_number(row, self.columns, "metros") * self.length_scale
+            if self.loads is None:
+                clients, carga_esp = row_loads(row, self.columns)
+            else:
+                clients, carga_esp = self.loads.get(ponto, (0, 0.0))
+        except ValueError as e:
+            self.error_count += 1
+            if len(self.errors) < MAX_REPORTED_ERRORS:
+                self.errors.append(f"Linha {line} (ponto '{ponto}'): {e}")
+            return
+
+        cabo = str(cell_value(row, self.columns.get("cabo")) or "").strip()
+        if cabo not in self.cable_pos:
+            self.cable_pos[cabo] = len(self.cables)
+            self.cables.append(cabo)
+        self.points.append(ponto)
+        self.montantes.append(montante)
+        self._pending.append((metros, self.cable_pos[cabo], clients, carga_esp))
+        self.rows += 1
+
+    def add_root(self) -> None:
+        """Acrescenta o TRAFO sem linha própria (modelo), com as cargas da aba de cargas."""
+        self.add((ROOT,), 0)
+
+    def flush(self) -> None:
+        """Converte o bloco em leitura para um array ``(linhas, 4)``."""
+        if self._pending:
+            self._chunks.append(np.asarray(self._pending, dtype=np.float64).reshape(-1, 4))
+            self._pending = []
+
+    def compile(self) -> Tuple[Optional[CompiledNetwork], Optional[TopologyReport]]:
+        """Ordena a topologia e monta a ``CompiledNetwork`` (linha = trecho)."""
+        data = np.concatenate(self._chunks)
+        self._chunks = []
+        index = {p: i for i, p in enumerate(self.points)}
+        report = None
+        order: Optional[NDArray[np.intp]] = None
+        if len(index) == len(self.points) and ROOT in index:
+            parent = np.fromiter(
+                (index.get(m, -1) if p != ROOT else -1 for p, m in zip(self.points, self.montantes)),
+                dtype=np.intp,
+                count=len(self.points),
+            )
+            order, depth = _bfs_order(parent, index[ROOT])
+        if order is None:
+            # Pontos repetidos ou topologia inválida: validação completa (mensagens de validate_and_sort)
+            report = validate_topology([{"ponto": p, "montante": m} for p, m in zip(self.points, self.montantes)])
+            if not report.valid:
+                return None, report
+            order = np.array([index[p] for p in report.order], dtype=np.intp)  # último trecho de cada ponto
+            parent = np.full(len(self.points), -1, dtype=np.intp)
+            depth = np.zeros(len(self.points), dtype=np.intp)
+            for i in order[1:]:
+                parent[i] = index[self.montantes[i]]
+                depth[i] = depth[parent[i]] + 1
+
+        position = np.full(len(self.points), -1, dtype=np.intp)
+        position[order] = np.arange(len(order))
+        new_parent = np.where(parent[order] >= 0, position[parent[order]], -1)
+        new_parent[0] = -1
+        points = [self.points[i] for i in order]
+        network = CompiledNetwork(
+            points=points,
+            index={p: i for i, p in enumerate(points)},
+            parent=new_parent.astype(np.intp),
+            depth=depth[order],
+            metros=data[order, 0],
+            cables=list(self.cables),
+            cable_idx=data[order, 1].astype(np.intp),
+            clients=data[order, 2],
+            carga_esp=data[order, 3],
+            total_clients=int(data[:, 2].sum()),
+        )
+        return network, report
+
+
+def _bfs_order(parent: NDArray[np.intp], root: int) -> Tuple[Optional[NDArray[np.intp]], NDArray[np.intp]]:
+    """Ordem BFS (igual à de ``validate_topology``) por níveis, sem laço por nó.
+
+    Cada ponto tem um único montante, então cada nó é alcançado no máximo uma
+    vez; pontos em ciclos ou com montante inexistente (-1) ficam de fora.
+
+    Returns:
+        (ordem, profundidade) — ordem None se algum ponto não for alcançado
+        (montante inexistente ou ciclo).
+    """
+    n = parent.size
+    depth = np.zeros(n, dtype=np.intp)
+    children = np.argsort(parent, kind="stable")  # filhos de cada pai na ordem das linhas
+    ptr = np.searchsorted(parent[children], np.arange(n + 1))
+    frontier = np.array([root], dtype=np.intp)
+    levels = [frontier]
+    d = 0
+    while True:
+        counts = ptr[frontier + 1] - ptr[frontier]
+        total = int(counts.sum())
+        if total == 0:
+            break
+        offsets = np.repeat(ptr[frontier] - np.cumsum(counts) + counts, counts)
+        frontier = children[offsets + np.arange(total)]
+        d += 1
+        depth[frontier] = d
+        levels.append(frontier)
+    order = np.concatenate(levels)
+    return (order if order.size == n else None), depth
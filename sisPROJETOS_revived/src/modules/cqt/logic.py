@@ -1,12 +1,19 @@
-from collections import defaultdict, deque
-from typing import Any, Dict, List, Optional, Set, Tuple
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
 
 from database.db_manager import DatabaseManager
 from utils.logger import get_logger
 from utils.sanitizer import sanitize_positive, sanitize_string
 
+from .catalog import CABLE_COEF_CACHE
+from .network import CompiledNetwork, CompiledResult, compile_network, solve_network
+from .validator import validate_topology
+
 logger = get_logger(__name__)
 
+# Formatos de resultado de ``calculate_compiled``: por ponto ou colunar (JSON/base64).
+RESULT_FORMATS = ("dict", "columnar", "base64")
+
 
 class CQTLogic:
     """Lógica para cálculos de CQT (Custo de Qualidade Total) e BDI.
@@ -20,6 +27,16 @@ class CQTLogic:
     # PRODIST Módulo 8 (8%), garantindo margem operacional adequada em BT residencial.
     CQT_LIMIT_PERCENT: float = 5.0
 
+    # Coeficientes K usados quando o banco de dados não está acessível.
+    _FALLBACK_COEFS: Dict[str, float] = {
+        "2#16(25)mm² Al": 0.7779,
+        "3x35+54.6mm² Al": 0.2416,
+        "3x50+54.6mm² Al": 0.1784,
+        "3x70+54.6mm² Al": 0.1248,
+        "3x95+54.6mm² Al": 0.0891,
+        "3x150+70mm² Al": 0.0573,
+    }
+
     def __init__(self) -> None:
         """Inicializa a lógica de CQT e carrega coeficientes do banco."""
         self.db = DatabaseManager()
@@ -41,28 +58,19 @@ class CQTLogic:
         self.CABOS_COEFS: Dict[str, float] = self.get_cable_coefs()
 
     def get_cable_coefs(self) -> Dict[str, float]:
-        """Busca coeficientes de cabo no banco de dados.
+        """Busca coeficientes de cabo no cache compartilhado do processo.
+
+        O banco só é relido quando a tabela ``cable_technical_data`` muda
+        (ver ``modules.cqt.catalog.CableCoefCache``).
 
         Returns:
             Dicionário {nome_cabo: coeficiente_k}.
         """
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT key_name, value FROM cable_technical_data WHERE category='cqt_k_coef'")
-            rows = cursor.fetchall()
-            conn.close()
-            return {r[0]: r[1] for r in rows}
+            return dict(CABLE_COEF_CACHE.get(self.db))
         except Exception:
             # Fallback
-            return {
-                "2#16(25)mm² Al": 0.7779,
-                "3x35+54.6mm² Al": 0.2416,
-                "3x50+54.6mm² Al": 0.1784,
-                "3x70+54.6mm² Al": 0.1248,
-                "3x95+54.6mm² Al": 0.0891,
-                "3x150+70mm² Al": 0.0573,
-            }
+            return dict(self._FALLBACK_COEFS)
 
     def get_fator_demanda(self, client_count: int, social_class: str) -> float:
         """Retorna o fator de demanda DMDI conforme contagem e classe social.
@@ -80,6 +88,28 @@ class CQTLogic:
                 return v[idx]
         return [0.5, 0.8, 1.3, 2.0][idx]
 
+    def sanitize_params(self, trafo_kva: float, social_class: str) -> Tuple[float, str]:
+        """Sanitiza potência do transformador e classe social.
+
+        Raises:
+            ValueError: Se a potência não for positiva ou a classe for inválida.
+        """
+        return sanitize_positive(trafo_kva), self.sanitize_social_class(social_class)
+
+    def sanitize_social_class(self, social_class: str) -> str:
+        """Classe social em maiúsculas (A, B, C ou D).
+
+        ``get_fator_demanda`` trata classes desconhecidas como A; os
+        analisadores que o chamam diretamente validam a classe por aqui.
+
+        Raises:
+            ValueError: Se a classe for inválida.
+        """
+        social_class = sanitize_string(social_class, max_length=1, allow_empty=False).upper()
+        if social_class not in ("A", "B", "C", "D"):
+            raise ValueError(f"Classe social inválida: '{social_class}'. Use A, B, C ou D.")
+        return social_class
+
     def validate_and_sort(self, segments: List[Dict[str, Any]]) -> Tuple[bool, str, List[str]]:
         """Valida a topologia da rede e ordena os segmentos topologicamente.
 
@@ -88,47 +118,19 @@ class CQTLogic:
 
         Returns:
             Tupla (válido, mensagem_de_erro, lista_ordenada_de_pontos).
+            O diagnóstico completo está em ``modules.cqt.validator.validate_topology``.
         """
-        if not segments:
-            return False, "Nenhum dado fornecido.", []
-
-        nodes: Set[str] = set()
-        adj: Dict[str, List[str]] = defaultdict(list)
-        in_degree: Dict[str, int] = defaultdict(int)
-
-        for s in segments:
-            p, m = str(s["ponto"]).upper(), str(s["montante"]).upper()
-            nodes.add(p)
-            if p != "TRAFO":
-                if not m:
-                    return False, f"Ponto '{p}' sem montante definido.", []
-                adj[m].append(p)
-                in_degree[p] += 1
-
-        if "TRAFO" not in nodes:
-            return False, "Ponto de origem 'TRAFO' não encontrado.", []
-
-        # Topological sort (BFS)
-        queue: deque[str] = deque(["TRAFO"])
-        sorted_points: List[str] = []
-        while queue:
-            u = queue.popleft()
-            sorted_points.append(u)
-            for v in adj[u]:
-                in_degree[v] -= 1
-                if in_degree[v] == 0:
-                    queue.append(v)
-
-        if len(sorted_points) != len(nodes):
-            return False, "Ciclo detectado ou pontos isolados na rede.", []
-
-        return True, "", sorted_points
+        report = validate_topology(segments)
+        if not report.valid:
+            return False, report.message(), []
+        return True, "", report.order
 
     def calculate(
         self,
         segments: List[Dict[str, Any]],
         trafo_kva: float,
         social_class: str = "B",
+        result_format: str = "dict",
     ) -> Dict[str, Any]:
         """Orquestra o cálculo CQT/BDI para toda a rede.
 
@@ -137,19 +139,25 @@ class CQTLogic:
                       cabo, mono, bi, tri, tri_esp, carga_esp).
             trafo_kva: Potência do transformador em kVA (deve ser > 0).
             social_class: Classe social dominante (A, B, C ou D; padrão: B).
+            result_format: ``"dict"`` (padrão), ``"columnar"`` ou ``"base64"``
+                (ver ``calculate_compiled``).
 
         Returns:
-            Dicionário com 'success', 'results', 'summary' ou 'error'.
+            Dicionário com 'success', 'results' (ou 'columns'), 'summary' ou 'error'.
         """
         try:
-            trafo_kva = sanitize_positive(trafo_kva)
-            social_class = sanitize_string(social_class, max_length=1, allow_empty=False).upper()
-            if social_class not in ("A", "B", "C", "D"):
-                raise ValueError(f"Classe social inválida: '{social_class}'. Use A, B, C ou D.")
+            trafo_kva, social_class = self.sanitize_params(trafo_kva, social_class)
         except ValueError as e:
             logger.warning("Valor inválido em calculate (CQT): %s", e)
             return {"success": False, "error": str(e)}
 
+        if result_format != "dict":
+            try:
+                network = self.compile_network(segments)
+            except ValueError as e:
+                return {"success": False, "error": str(e)}
+            return self.calculate_compiled(network, trafo_kva, social_class, result_format)
+
         valid, msg, order = self.validate_and_sort(segments)
         if not valid:
             return {"success": False, "error": msg}
@@ -193,6 +201,7 @@ class CQTLogic:
             results[p]["accumulated"] = accum[p]
 
         # 3. Accumulated CQT (Top-Down)
+        coefs = self.get_cable_coefs()
         cqt_accum: Dict[str, float] = {"TRAFO": 0.0}
         for p in order:
             if p == "TRAFO":
@@ -206,7 +215,6 @@ class CQTLogic:
             momento = (results[p]["local_dist"] / 2) + results[p]["local_pontual"] + carga_jusante
 
             cabo = s.get("cabo", "")
-            coefs = self.get_cable_coefs()
             coef = coefs.get(cabo, 0.0)
             dist_hm = s.get("metros", 0.0) / self.UNIT_DIVISOR
 
@@ -221,13 +229,108 @@ class CQTLogic:
         return {
             "success": True,
             "results": results,
-            "summary": {
-                "fd": fd,
-                "total_clients": total_clients,
-                "max_cqt": max_cqt,
-                "total_kva": results["TRAFO"]["accumulated"],
-                "cqt_limit_percent": self.CQT_LIMIT_PERCENT,
-                "within_enel_limit": max_cqt <= self.CQT_LIMIT_PERCENT,
-                "segments_over_limit": segments_over_limit,
-            },
+            "summary": self._build_summary(
+                fd, total_clients, max_cqt, results["TRAFO"]["accumulated"], segments_over_limit
+            ),
+        }
+
+    def _build_summary(
+        self,
+        fd: float,
+        total_clients: int,
+        max_cqt: float,
+        total_kva: float,
+        segments_over_limit: List[str],
+    ) -> Dict[str, Any]:
+        """Monta o dicionário 'summary' comum a todos os modos de cálculo."""
+        return {
+            "fd": fd,
+            "total_clients": total_clients,
+            "max_cqt": max_cqt,
+            "total_kva": total_kva,
+            "cqt_limit_percent": self.CQT_LIMIT_PERCENT,
+            "within_enel_limit": max_cqt <= self.CQT_LIMIT_PERCENT,
+            "segments_over_limit": segments_over_limit,
+        }
+
+    # ── Modo rede compilada (arrays NumPy) ────────────────────────────────────
+
+    def compile_network(self, segments: List[Dict[str, Any]]) -> CompiledNetwork:
+        """Valida a topologia e compila os trechos em arrays NumPy.
+
+        A rede compilada pode ser reutilizada em vários cálculos
+        (``solve_compiled``/``calculate_compiled``) sem repetir a validação.
+
+        Args:
+            segments: Lista de trechos no mesmo formato de ``calculate``.
+
+        Returns:
+            ``CompiledNetwork`` com índices de pai, ordem topológica e cargas.
+
+        Raises:
+            ValueError: Se a topologia for inválida (mesma mensagem de ``validate_and_sort``).
+        """
+        valid, msg, order = self.validate_and_sort(segments)
+        if not valid:
+            raise ValueError(msg)
+        return compile_network(segments, order)
+
+    def solve_compiled(self, network: CompiledNetwork, social_class: str = "B") -> CompiledResult:
+        """Executa o cálculo CQT vetorizado sobre uma rede compilada.
+
+        Args:
+            network: Rede retornada por ``compile_network``.
+            social_class: Classe social dominante (A, B, C ou D).
+
+        Returns:
+            ``CompiledResult`` com os arrays por ponto.
+        """
+        fd = self.get_fator_demanda(network.total_clients, social_class)
+        return solve_network(network, fd, self.get_cable_coefs(), self.UNIT_DIVISOR)
+
+    def calculate_compiled(
+        self,
+        network: CompiledNetwork,
+        trafo_kva: float,
+        social_class: str = "B",
+        result_format: str = "dict",
+    ) -> Dict[str, Any]:
+        """Equivalente a ``calculate`` para uma rede já compilada.
+
+        Args:
+            network: Rede retornada por ``compile_network``.
+            trafo_kva: Potência do transformador em kVA (deve ser > 0).
+            social_class: Classe social dominante (A, B, C ou D; padrão: B).
+            result_format: ``"dict"`` (padrão) devolve 'results' por ponto;
+                ``"columnar"`` ou ``"base64"`` devolvem 'columns' com arrays
+                paralelos (``CompiledResult.to_columns``).
+
+        Returns:
+            Dicionário com 'success', 'results' (ou 'columns'), 'summary' ou
+            'error', no mesmo formato de ``calculate``.
+        """
+        try:
+            trafo_kva, social_class = self.sanitize_params(trafo_kva, social_class)
+        except ValueError as e:
+            logger.warning("Valor inválido em calculate_compiled (CQT): %s", e)
+            return {"success": False, "error": str(e)}
+
+        if result_format not in RESULT_FORMATS:
+            return {"success": False, "error": f"Formato de resultado inválido: '{result_format}'."}
+
+        res = self.solve_compiled(network, social_class)
+        if result_format == "dict":
+            output: Dict[str, Any] = {"results": res.to_results()}
+        else:
+            output = {"columns": res.to_columns("base64" if result_format == "base64" else "json")}
+        return {
+            "success": True,
+            **output,
+            "summary": self._build_summary(
+                res.fd,
+                network.total_clients,
+                res.max_cqt,
+                res.total_kva,
+                res.over_limit(self.CQT_LIMIT_PERCENT),
+            ),
         }
@@ -0,0 +1,212 @@
+"""
+Análise probabilística (Monte Carlo) do CQT sob incerteza de carga.
+
+Sorteia, para cada ensaio, o número de UCs e a carga especial de cada ponto e
+resolve a rede fixa (topologia de ``validate_and_sort``) para todos os ensaios
+de um lote em um único passe ``(n, lote)`` dos kernels de ``network``. Os lotes
+podem ser distribuídos no pool de processos compartilhado de ``batch``.
+
+Modelos de incerteza:
+
+- UCs: Poisson com média igual à contagem do trecho ou, se ``client_cv`` for
+  informado, Normal(base, cv·base) arredondada e truncada em zero;
+- carga especial: Normal(base, cv·base) truncada em zero.
+
+Cada lote recebe um gerador derivado de ``SeedSequence(seed)``, de modo que o
+resultado não depende do número de processos.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from utils.logger import get_logger
+
+from .batch import map_pooled
+from .logic import CQTLogic
+from .network import CompiledNetwork, accumulate_loads, cqt_trecho_from_loads, propagate_cqt
+from .scenarios import demand_factors
+
+logger = get_logger(__name__)
+
+DEFAULT_PERCENTILES: Tuple[float, ...] = (50.0, 90.0, 95.0, 99.0)
+
+
+@dataclass
+class MonteCarloResult:
+    """Resultado da análise Monte Carlo.
+
+    Attributes:
+        network: Rede compilada avaliada.
+        trials: Número de ensaios.
+        limit: Limite de CQT (%).
+        percentiles: {percentil: CQT acumulado por ponto, forma ``(n,)``}.
+        exceed_probability: Probabilidade de cada ponto exceder o limite.
+        mean_cqt: CQT acumulado médio por ponto.
+        max_cqt: CQT máximo da rede em cada ensaio, forma ``(trials,)``.
+    """
+
+    network: CompiledNetwork
+    trials: int
+    limit: float
+    percentiles: Dict[float, NDArray[np.float64]]
+    exceed_probability: NDArray[np.float64]
+    mean_cqt: NDArray[np.float64]
+    max_cqt: NDArray[np.float64]
+
+    @property
+    def network_exceed_probability(self) -> float:
+        """Probabilidade de algum ponto da rede exceder o limite."""
+        return float(np.mean(self.max_cqt > self.limit)) if self.trials else 0.0
+
+    def summary(self, top: int = 10) -> Dict[str, Any]:
+        """Resumo serializável com os pontos de maior risco.
+
+        Args:
+            top: Número de pontos listados em 'critical_points'.
+        """
+        order = np.lexsort((np.arange(self.network.size), -self.exceed_probability))[:top]
+        return {
+            "trials": self.trials,
+            "cqt_limit_percent": self.limit,
+            "network_exceed_probability": self.network_exceed_probability,
+            "max_cqt_percentiles": {p: float(np.percentile(self.max_cqt, p)) for p in self.percentiles},
+            "critical_points": [
+                {
+                    "ponto": self.network.points[i],
+                    "exceed_probability": float(self.exceed_probability[i]),
+                    "mean_cqt": float(self.mean_cqt[i]),
+                }
+                for i in order
+                if self.exceed_probability[i] > 0
+            ],
+        }
+
+
+class MonteCarloCQT:
+    """Executa ensaios Monte Carlo de carga sobre uma rede CQT fixa."""
+
+    def __init__(self, logic: Optional[CQTLogic] = None) -> None:
+        """Inicializa o analisador.
+
+        Args:
+            logic: Instância de ``CQTLogic`` a reutilizar. Se None, cria uma nova.
+        """
+        self.logic = logic or CQTLogic()
+
+    def run(
+        self,
+        segments: List[Dict[str, Any]],
+        trials: int = 1000,
+        social_class: str = "B",
+        client_cv: Optional[float] = None,
+        carga_esp_cv: float = 0.2,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+        batch_size: int = 256,
+        workers: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> MonteCarloResult:
+        """Executa ``trials`` ensaios e agrega os resultados por ponto.
+
+        Os CQTs acumulados de todos os ensaios são mantidos em ``float32``
+        (``trials × n × 4`` bytes) para o cálculo exato dos percentis.
+
+        Args:
+            segments: Trechos no formato de ``CQTLogic.calculate`` (valores base).
+            trials: Número de ensaios.
+            social_class: Classe social dominante (A, B, C ou D).
+            client_cv: Coeficiente de variação das UCs (None = Poisson).
+            carga_esp_cv: Coeficiente de variação das cargas especiais.
+            percentiles: Percentis de CQT reportados por ponto.
+            batch_size: Ensaios resolvidos por passe vetorizado.
+            workers: Lotes em execução simultânea no pool compartilhado
+                (limitado ao tamanho do pool; None ou 1 = processo atual).
+            seed: Semente para reprodutibilidade.
+
+        Returns:
+            ``MonteCarloResult`` com percentis e probabilidades de violação.
+
+        Raises:
+            ValueError: Se a topologia, a classe social ou algum parâmetro for
+                inválido.
+        """
+        if trials < 1 or batch_size < 1:
+            raise ValueError("O número de ensaios e o tamanho do lote devem ser positivos.")
+        if (client_cv is not None and client_cv < 0) or carga_esp_cv < 0:
+            raise ValueError("Os coeficientes de variação não podem ser negativos.")
+        social_class = self.logic.sanitize_social_class(social_class)
+        network = self.logic.compile_network(segments)
+
+        # Fator DMDI tabelado por total de UCs (evita acessar CQTLogic nos processos filhos)
+        max_count = max(row[1] for row in self.logic.TABELA_DEMANDA) + 1
+        fd_lookup = demand_factors(self.logic, np.arange(max_count + 1), social_class)
+        coef = network.cable_coefs(self.logic.get_cable_coefs())
+        # UCs de pontos duplicados nos trechos entram no total do DMDI sem variar
+        extra_clients = network.total_clients - network.clients.sum()
+
+        sizes = [min(batch_size, trials - start) for start in range(0, trials, batch_size)]
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+        tasks = [
+            _BatchTask(
+                network, coef, fd_lookup, extra_clients, self.logic.UNIT_DIVISOR, client_cv, carga_esp_cv, s, ss
+            )
+            for s, ss in zip(sizes, seeds)
+        ]
+
+        chunks = None
+        if workers is not None and workers > 1 and len(tasks) > 1:
+            chunks = map_pooled(_simulate_batch, tasks, workers)
+        if chunks is None:
+            chunks = [_simulate_batch(t) for t in tasks]
+        samples = np.concatenate(chunks, axis=0)  # (trials, n)
+
+        limit = self.logic.CQT_LIMIT_PERCENT
+        logger.debug("Monte Carlo CQT: %d ensaios × %d pontos em %d lotes", trials, network.size, len(tasks))
+        return MonteCarloResult(
+            network=network,
+            trials=trials,
+            limit=limit,
+            percentiles={float(p): np.percentile(samples, p, axis=0).astype(np.float64) for p in percentiles},
+            exceed_probability=(samples > limit).mean(axis=0),
+            mean_cqt=samples.mean(axis=0, dtype=np.float64),
+            max_cqt=samples.max(axis=1).astype(np.float64),
+        )
+
+
+@dataclass
+class _BatchTask:
+    """Dados de um lote de ensaios (serializável para o pool de processos)."""
+
+    network: CompiledNetwork
+    coef: NDArray[np.float64]
+    fd_lookup: NDArray[np.float64]
+    extra_clients: float
+    unit_divisor: float
+    client_cv: Optional[float]
+    carga_esp_cv: float
+    size: int
+    seed: np.random.SeedSequence
+
+
+def _simulate_batch(task: _BatchTask) -> NDArray[np.float32]:
+    """Sorteia e resolve um lote de ensaios; retorna o CQT acumulado ``(lote, n)``."""
+    rng = np.random.default_rng(task.seed)
+    network, k = task.network, task.size
+    base = network.clients[:, np.newaxis]
+
+    if task.client_cv is None:
+        clients = rng.poisson(np.broadcast_to(base, (network.size, k))).astype(np.float64)
+    else:
+        clients = np.rint(rng.normal(base, task.client_cv * base, size=(network.size, k)))
+    clients = np.maximum(clients, 0.0)
+    esp = network.carga_esp[:, np.newaxis]
+    carga_esp = np.maximum(rng.normal(esp, task.carga_esp_cv * np.abs(esp), size=(network.size, k)), 0.0)
+
+    totals = (clients.sum(axis=0) + task.extra_clients).astype(np.int64)
+    fd = task.fd_lookup[np.clip(totals, 0, len(task.fd_lookup) - 1)]
+    local_dist = clients * fd
+    accumulated = accumulate_loads(network, local_dist + carga_esp)
+    q = cqt_trecho_from_loads(network, local_dist, carga_esp, accumulated, task.coef, task.unit_divisor)
+    return propagate_cqt(network, q).T.astype(np.float32)
@@ -0,0 +1,396 @@
+"""
+Rede CQT compilada em arrays NumPy (modo "compiled network").
+
+Converte a lista de trechos (ponto/montante) em arrays contíguos uma única vez
+— índice do pai, ordem topológica, comprimento, índice do coeficiente de cabo e
+carga local — para que o acúmulo de cargas (bottom-up) e a propagação do CQT
+(top-down) rodem como passes vetorizados por nível de profundidade, em vez de
+percorrer dicionários Python ponto a ponto.
+
+Os nós são renumerados na ordem topológica de ``CQTLogic.validate_and_sort``:
+o índice 0 é sempre o TRAFO e ``parent[i] < i`` para todo nó ``i > 0``.
+
+Os kernels aceitam arrays com os nós no eixo 0 — forma ``(n,)`` para um único
+cálculo ou ``(n, k)`` para ``k`` cenários/instantes avaliados em lote.
+"""
+
+import base64
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+# Colunas por ponto de ``CompiledResult`` (mesmas chaves de ``CQTLogic.calculate``).
+RESULT_COLUMNS = ("local_dist", "local_pontual", "total_local", "accumulated", "cqt_trecho", "cqt_accumulated")
+
+# Formato binário das colunas em base64: float64 little-endian.
+COLUMN_DTYPE = "<f8"
+
+
+class _Level(NamedTuple):
+    """Nós de um mesmo nível de profundidade, agrupados por pai."""
+
+    nodes: NDArray[np.intp]  # nós do nível, ordenados pelo índice do pai
+    parents: NDArray[np.intp]  # pai de cada nó em ``nodes``
+    starts: NDArray[np.intp]  # início de cada grupo de irmãos em ``nodes``
+    group_parents: NDArray[np.intp]  # pai (único) de cada grupo
+
+
+@dataclass
+class CompiledNetwork:
+    """Topologia e dados de trechos de uma rede CQT em forma de arrays.
+
+    Attributes:
+        points: Identificadores dos pontos (maiúsculos) na ordem topológica.
+        index: Mapa ponto → índice nos arrays.
+        parent: Índice do ponto montante (-1 para o TRAFO).
+        depth: Profundidade de cada ponto (TRAFO = 0).
+        metros: Comprimento do trecho em metros.
+        cables: Nomes de cabo distintos presentes na rede.
+        cable_idx: Índice em ``cables`` do cabo de cada trecho.
+        clients: Total de UCs por ponto (mono + bi + tri + tri_esp).
+        carga_esp: Carga pontual especial por ponto em kVA.
+        total_clients: Total de UCs de todos os trechos (base do fator DMDI).
+    """
+
+    points: List[str]
+    index: Dict[str, int]
+    parent: NDArray[np.intp]
+    depth: NDArray[np.intp]
+    metros: NDArray[np.float64]
+    cables: List[str]
+    cable_idx: NDArray[np.intp]
+    clients: NDArray[np.float64]
+    carga_esp: NDArray[np.float64]
+    total_clients: int
+    levels: List[_Level] = field(default_factory=list, repr=False)
+
+    def __post_init__(self) -> None:
+        if not self.levels:
+            self.levels = _build_levels(self.parent, self.depth)
+
+    @property
+    def size(self) -> int:
+        """Número de pontos da rede (incluindo o TRAFO)."""
+        return len(self.points)
+
+    def cable_coefs(self, coefs: Mapping[str, float]) -> NDArray[np.float64]:
+        """Resolve o coeficiente K de cada trecho a partir do catálogo de cabos.
+
+        Args:
+            coefs: Dicionário {nome_cabo: coeficiente_k}. Cabos ausentes valem 0.
+
+        Returns:
+            Array ``(n,)`` com o coeficiente de cada trecho.
+        """
+        by_cable = np.array([float(coefs.get(c, 0.0)) for c in self.cables], dtype=np.float64)
+        return by_cable[self.cable_idx]
+
+
+def compile_network(segments: List[Dict[str, Any]], order: List[str]) -> CompiledNetwork:
+    """Compila trechos já validados em uma ``CompiledNetwork``.
+
+    Segue as mesmas convenções de ``CQTLogic.calculate``: pontos e montantes em
+    maiúsculas e, para pontos repetidos, vale o último trecho informado.
+
+    Args:
+        segments: Lista de trechos (ponto, montante, metros, cabo, mono, bi,
+                  tri, tri_esp, carga_esp).
+        order: Ordem topológica retornada por ``CQTLogic.validate_and_sort``.
+
+    Returns:
+        Rede compilada pronta para ``solve_network``.
+    """
+    pmap = {str(s["ponto"]).upper(): s for s in segments}
+    index = {p: i for i, p in enumerate(order)}
+    n = len(order)
+
+    parent = np.full(n, -1, dtype=np.intp)
+    depth = np.zeros(n, dtype=np.intp)
+    metros = np.zeros(n, dtype=np.float64)
+    clients = np.zeros(n, dtype=np.float64)
+    carga_esp = np.zeros(n, dtype=np.float64)
+    cable_idx = np.zeros(n, dtype=np.intp)
+    cables: List[str] = []
+    cable_pos: Dict[str, int] = {}
+
+    for i, p in enumerate(order):
+        s = pmap[p]
+        if i > 0:
+            parent[i] = index[str(s["montante"]).upper()]
+            depth[i] = depth[parent[i]] + 1
+        metros[i] = s.get("metros", 0.0)
+        clients[i] = s.get("mono", 0) + s.get("bi", 0) + s.get("tri", 0) + s.get("tri_esp", 0)
+        carga_esp[i] = s.get("carga_esp", 0.0)
+        cabo = s.get("cabo", "")
+        if cabo not in cable_pos:
+            cable_pos[cabo] = len(cables)
+            cables.append(cabo)
+        cable_idx[i] = cable_pos[cabo]
+
+    total_clients = sum(s.get("mono", 0) + s.get("bi", 0) + s.get("tri", 0) + s.get("tri_esp", 0) for s in segments)
+
+    return CompiledNetwork(
+        points=list(order),
+        index=index,
+        parent=parent,
+        depth=depth,
+        metros=metros,
+        cables=cables,
+        cable_idx=cable_idx,
+        clients=clients,
+        carga_esp=carga_esp,
+        total_clients=total_clients,
+    )
+
+
+def _build_levels(parent: NDArray[np.intp], depth: NDArray[np.intp]) -> List[_Level]:
+    """Agrupa os nós por profundidade e, dentro de cada nível, por pai."""
+    levels: List[_Level] = []
+    if depth.size == 0:
+        return levels
+    # Uma única ordenação global por (profundidade, pai); cada nível vira uma fatia.
+    ordered = np.lexsort((parent, depth))
+    depths = depth[ordered]
+    parents_all = parent[ordered]
+    bounds = np.searchsorted(depths, np.arange(int(depth.max()) + 2))
+    new_group = np.r_[True, (parents_all[1:] != parents_all[:-1]) | (depths[1:] != depths[:-1])]
+    group_pos = np.flatnonzero(new_group)
+    group_bounds = np.searchsorted(group_pos, bounds)
+    for d in range(1, len(bounds) - 1):
+        lo, hi = bounds[d], bounds[d + 1]
+        starts = group_pos[group_bounds[d] : group_bounds[d + 1]] - lo
+        parents = parents_all[lo:hi]
+        levels.append(_Level(ordered[lo:hi], parents, starts, parents[starts]))
+    return levels
+
+
+def accumulate_loads(network: CompiledNetwork, local: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Acumula cargas de jusante para montante (passe bottom-up vetorizado).
+
+    Args:
+        network: Rede compilada.
+        local: Carga local por ponto, forma ``(n,)`` ou ``(n, k)``.
+
+    Returns:
+        Carga acumulada por ponto, mesma forma de ``local``.
+    """
+    acc = np.array(local, dtype=np.float64, copy=True)
+    for lvl in reversed(network.levels):
+        acc[lvl.group_parents] += np.add.reduceat(acc[lvl.nodes], lvl.starts, axis=0)
+    return acc
+
+
+def propagate_cqt(network: CompiledNetwork, cqt_trecho: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Propaga o CQT do TRAFO para as pontas (passe top-down vetorizado).
+
+    Args:
+        network: Rede compilada.
+        cqt_trecho: CQT de cada trecho, forma ``(n,)`` ou ``(n, k)``.
+
+    Returns:
+        CQT acumulado por ponto, mesma forma de ``cqt_trecho``.
+    """
+    acc = np.array(cqt_trecho, dtype=np.float64, copy=True)
+    for lvl in network.levels:
+        acc[lvl.nodes] += acc[lvl.parents]
+    return acc
+
+
+def subtree_layout(network: CompiledNetwork) -> Tuple[NDArray[np.intp], NDArray[np.intp]]:
+    """Calcula a posição em pré-ordem (DFS) e o tamanho da subárvore de cada nó.
+
+    Em pré-ordem, a subárvore de ``v`` ocupa o intervalo contíguo
+    ``[tin[v], tin[v] + size[v])``.
+
+    Args:
+        network: Rede compilada.
+
+    Returns:
+        Tupla ``(tin, size)``.
+    """
+    n = network.size
+    size = accumulate_loads(network, np.ones(n)).astype(np.intp)
+    parent = network.parent.tolist()
+    sizes = size.tolist()
+    tin = [0] * n
+    next_slot = [1] * n
+    for i in range(1, n):
+        p = parent[i]
+        tin[i] = next_slot[p]
+        next_slot[p] += sizes[i]
+        next_slot[i] = tin[i] + 1
+    return np.array(tin, dtype=np.intp), size
+
+
+def cqt_trecho_from_loads(
+    network: CompiledNetwork,
+    local_dist: NDArray[np.float64],
+    local_pontual: NDArray[np.float64],
+    accumulated: NDArray[np.float64],
+    coef: NDArray[np.float64],
+    unit_divisor: float,
+    nodes: Optional[NDArray[np.intp]] = None,
+) -> NDArray[np.float64]:
+    """Calcula o CQT de cada trecho a partir das cargas (momento elétrico).
+
+    Momento = Distribuída/2 + Pontual + Acumulada_Jusante, multiplicado pelo
+    comprimento em hectômetros e pelo coeficiente K do cabo. O TRAFO tem CQT 0.
+
+    Args:
+        network: Rede compilada.
+        local_dist: Carga distribuída local, ``(n,)`` ou ``(n, k)``.
+        local_pontual: Carga pontual local, mesma forma.
+        accumulated: Carga acumulada (saída de ``accumulate_loads``).
+        coef: Coeficiente K por trecho, forma ``(n,)``.
+        unit_divisor: Divisor metros → hectômetros.
+        nodes: Se fornecido, calcula apenas para estes nós (mesma ordem).
+
+    Returns:
+        CQT de cada trecho (ou de cada nó de ``nodes``), mesma forma das cargas.
+    """
+    metros = network.metros
+    if nodes is not None:
+        local_dist, local_pontual, accumulated = local_dist[nodes], local_pontual[nodes], accumulated[nodes]
+        metros, coef = metros[nodes], coef[nodes]
+    carga_jusante = accumulated - (local_dist + local_pontual)
+    momento = local_dist / 2 + local_pontual + carga_jusante
+    factor = metros / unit_divisor * coef
+    if momento.ndim > 1:
+        factor = factor[:, np.newaxis]
+    q = momento * factor
+    if nodes is None:
+        q[0] = 0.0
+    else:
+        q[nodes == 0] = 0.0
+    return q
+
+
+@dataclass
+class CompiledResult:
+    """Resultado do cálculo CQT sobre uma rede compilada (arrays por ponto).
+
+    ``to_results()`` fornece a visão em dicionário idêntica ao campo
+    ``results`` de ``CQTLogic.calculate``.
+    """
+
+    network: CompiledNetwork
+    fd: float
+    local_dist: NDArray[np.float64]
+    local_pontual: NDArray[np.float64]
+    accumulated: NDArray[np.float64]
+    cqt_trecho: NDArray[np.float64]
+    cqt_accumulated: NDArray[np.float64]
+
+    @property
+    def total_local(self) -> NDArray[np.float64]:
+        """Carga local total (distribuída + pontual) por ponto."""
+        return self.local_dist + self.local_pontual
+
+    @property
+    def max_cqt(self) -> float:
+        """Maior CQT acumulado da rede."""
+        return float(self.cqt_accumulated.max())
+
+    @property
+    def total_kva(self) -> float:
+        """Carga acumulada no TRAFO em kVA."""
+        return float(self.accumulated[0])
+
+    def over_limit(self, limit: float) -> List[str]:
+        """Retorna os pontos com CQT acumulado acima do limite, na ordem topológica."""
+        return [self.network.points[i] for i in np.flatnonzero(self.cqt_accumulated > limit)]
+
+    def to_columns(self, encoding: str = "json") -> Dict[str, Any]:
+        """Visão colunar: arrays paralelos na ordem de ``points``.
+
+        Args:
+            encoding: ``"json"`` (listas de floats) ou ``"base64"`` (cada coluna
+                como bytes ``float64`` little-endian em base64; ver ``decode_column``).
+
+        Returns:
+            Dicionário com 'encoding', 'dtype' (apenas base64), 'points' e uma
+            chave por coluna de ``RESULT_COLUMNS``.
+
+        Raises:
+            ValueError: Se a codificação não for suportada.
+        """
+        if encoding not in ("json", "base64"):
+            raise ValueError(f"Codificação '{encoding}' não suportada. Use 'json' ou 'base64'.")
+        columns: Dict[str, Any] = {"encoding": encoding, "points": list(self.network.points)}
+        if encoding == "base64":
+            columns["dtype"] = COLUMN_DTYPE
+        for name in RESULT_COLUMNS:
+            values = getattr(self, name)
+            columns[name] = encode_column(values) if encoding == "base64" else values.tolist()
+        return columns
+
+    def to_results(self) -> Dict[str, Dict[str, float]]:
+        """Visão em dicionário por ponto, no formato de ``CQTLogic.calculate``."""
+        columns = zip(
+            self.local_dist.tolist(),
+            self.local_pontual.tolist(),
+            self.total_local.tolist(),
+            self.accumulated.tolist(),
+            self.cqt_trecho.tolist(),
+            self.cqt_accumulated.tolist(),
+        )
+        return {
+            p: {
+                "local_dist": ld,
+                "local_pontual": lp,
+                "total_local": tl,
+                "accumulated": acc,
+                "cqt_trecho": qt,
+                "cqt_accumulated": qa,
+            }
+            for p, (ld, lp, tl, acc, qt, qa) in zip(self.network.points, columns)
+        }
+
+
+def encode_column(values: NDArray[np.float64]) -> str:
+    """Codifica um array como bytes ``float64`` little-endian em base64."""
+    return base64.b64encode(np.ascontiguousarray(values, dtype=COLUMN_DTYPE).tobytes()).decode("ascii")
+
+
+def decode_column(data: str) -> NDArray[np.float64]:
+    """Decodifica uma coluna gerada por ``encode_column``."""
+    return np.frombuffer(base64.b64decode(data), dtype=COLUMN_DTYPE).astype(np.float64)
+
+
+def solve_network(
+    network: CompiledNetwork,
+    fd: float,
+    coefs: Mapping[str, float],
+    unit_divisor: float,
+    coef: Optional[NDArray[np.float64]] = None,
+) -> CompiledResult:
+    """Executa o cálculo CQT completo sobre uma rede compilada.
+
+    Args:
+        network: Rede compilada.
+        fd: Fator de demanda DMDI.
+        coefs: Catálogo {nome_cabo: coeficiente_k}.
+        unit_divisor: Divisor metros → hectômetros.
+        coef: Coeficientes por trecho já resolvidos (opcional; evita
+              reconsultar ``coefs`` quando o chamador já os possui).
+
+    Returns:
+        ``CompiledResult`` com os arrays por ponto.
+    """
+    if coef is None:
+        coef = network.cable_coefs(coefs)
+    local_dist = network.clients * fd
+    local_pontual = network.carga_esp.copy()
+    accumulated = accumulate_loads(network, local_dist + local_pontual)
+    cqt_trecho = cqt_trecho_from_loads(network, local_dist, local_pontual, accumulated, coef, unit_divisor)
+    return CompiledResult(
+        network=network,
+        fd=fd,
+        local_dist=local_dist,
+        local_pontual=local_pontual,
+        accumulated=accumulated,
+        cqt_trecho=cqt_trecho,
+        cqt_accumulated=propagate_cqt(network, cqt_trecho),
+    )
@@ -0,0 +1,202 @@
+"""
+Dimensionamento automático de cabos para redes CQT.
+
+Escolhe, para cada trecho, o cabo mais barato de ``CABOS_COEFS`` de modo que o
+CQT acumulado de todos os pontos fique abaixo de ``CQT_LIMIT_PERCENT``.
+
+Como as cargas não dependem do cabo, o CQT de um trecho é
+``q = M · L/100 · K_cabo`` com momento ``M`` fixo, e o problema vira uma
+programação dinâmica em árvore sobre o "orçamento" de queda restante:
+
+    g_v(b) = Σ_filhos f_c(b)
+    f_v(b) = min_cabo [ custo_cabo · L_v + g_v(b − q_v(cabo)) ]
+
+O orçamento é discretizado em ``resolution`` passos e cada queda é
+arredondada para cima, o que garante que a solução encontrada respeita o
+limite (a verificação final usa o cálculo exato). Os níveis da árvore são
+processados em lote com NumPy, do mais profundo para o TRAFO.
+"""
+
+from typing import Any, Dict, List, Mapping, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from utils.logger import get_logger
+
+from .logic import CQTLogic
+from .network import CompiledNetwork, solve_network
+
+logger = get_logger(__name__)
+
+
+def default_cable_costs(coefs: Mapping[str, float]) -> Dict[str, float]:
+    """Custo relativo por metro estimado a partir do coeficiente K.
+
+    Sem tabela de preços, usa ``1/K`` — proporcional à seção do condutor, já
+    que K é proporcional à resistência.
+
+    Args:
+        coefs: Catálogo {nome_cabo: coeficiente_k}.
+
+    Returns:
+        Dicionário {nome_cabo: custo_relativo_por_metro}.
+    """
+    return {c: 1.0 / k for c, k in coefs.items() if k > 0}
+
+
+class CableSizingOptimizer:
+    """Otimizador de bitolas por programação dinâmica em árvore."""
+
+    def __init__(self, logic: Optional[CQTLogic] = None) -> None:
+        """Inicializa o otimizador.
+
+        Args:
+            logic: Instância de ``CQTLogic`` a reutilizar. Se None, cria uma nova.
+        """
+        self.logic = logic or CQTLogic()
+
+    def optimize(
+        self,
+        segments: List[Dict[str, Any]],
+        social_class: str = "B",
+        cable_costs: Optional[Mapping[str, float]] = None,
+        candidates: Optional[List[str]] = None,
+        limit: Optional[float] = None,
+        resolution: int = 500,
+    ) -> Dict[str, Any]:
+        """Atribui o cabo mais barato por trecho respeitando o limite de CQT.
+
+        Args:
+            segments: Lista de trechos no formato de ``CQTLogic.calculate``
+                (o campo ``cabo`` de entrada é ignorado).
+            social_class: Classe social dominante (A, B, C ou D).
+            cable_costs: Custo por metro de cada cabo. Padrão: ``1/K``.
+            candidates: Cabos permitidos. Padrão: todos com custo e K conhecidos.
+            limit: Limite de CQT em %. Padrão: ``CQT_LIMIT_PERCENT``.
+            resolution: Número de passos da discretização do orçamento de queda.
+
+        Returns:
+            Dicionário com 'success' e, em caso de sucesso, 'cables'
+            ({ponto: cabo}), 'total_cost', 'max_cqt', 'segments' (cópia com os
+            cabos atribuídos) e 'changed' (pontos cujo cabo mudou); em caso de
+            falha, 'error'.
+
+        Raises:
+            ValueError: Se a classe social for inválida.
+        """
+        social_class = self.logic.sanitize_social_class(social_class)
+        try:
+            network = self.logic.compile_network(segments)
+        except ValueError as e:
+            return {"success": False, "error": str(e)}
+
+        coefs = self.logic.get_cable_coefs()
+        costs = dict(cable_costs) if cable_costs is not None else default_cable_costs(coefs)
+        names = [c for c in (candidates or list(costs)) if c in costs and c in coefs]
+        if not names:
+            return {"success": False, "error": "Nenhum cabo candidato com coeficiente K e custo conhecidos."}
+        if resolution < 2:
+            return {"success": False, "error": "A resolução deve ser de pelo menos 2 passos."}
+        limit = self.logic.CQT_LIMIT_PERCENT if limit is None else float(limit)
+
+        fd = self.logic.get_fator_demanda(network.total_clients, social_class)
+        # Com K = 1, o CQT de trecho é a queda por unidade de K (momento × hectômetros)
+        unit_drop = solve_network(network, fd, coefs, self.logic.UNIT_DIVISOR, coef=np.ones(network.size)).cqt_trecho
+
+        k = np.array([coefs[c] for c in names])
+        cost = np.array([costs[c] for c in names])
+        choice = _solve_tree_dp(network, unit_drop, k, cost, limit, resolution)
+        if choice is None:
+            return {
+                "success": False,
+                "error": f"Nenhuma combinação de cabos mantém o CQT abaixo de {limit:.2f}% nesta rede.",
+            }
+
+        assigned = {p: names[int(choice[i])] for i, p in enumerate(network.points) if i > 0}
+        new_segments = []
+        changed = []
+        for s in segments:
+            p = str(s["ponto"]).upper()
+            seg = dict(s)
+            if p in assigned:
+                if seg.get("cabo", "") != assigned[p]:
+                    changed.append(p)
+                seg["cabo"] = assigned[p]
+            new_segments.append(seg)
+
+        coef = k[choice]
+        coef[0] = 0.0
+        check = solve_network(network, fd, coefs, self.logic.UNIT_DIVISOR, coef=coef)
+        total_cost = float(np.sum(cost[choice[1:]] * network.metros[1:]))
+        logger.debug(
+            "Dimensionamento CQT: %d trechos, custo %.2f, CQT máx %.3f%%", network.size - 1, total_cost, check.max_cqt
+        )
+        return {
+            "success": True,
+            "cables": assigned,
+            "total_cost": total_cost,
+            "max_cqt": check.max_cqt,
+            "segments": new_segments,
+            "changed": changed,
+        }
+
+
+def _solve_tree_dp(
+    network: CompiledNetwork,
+    unit_drop: NDArray[np.float64],
+    k: NDArray[np.float64],
+    cost: NDArray[np.float64],
+    limit: float,
+    resolution: int,
+) -> Optional[NDArray[np.intp]]:
+    """Resolve a DP em árvore e retorna o índice do cabo escolhido por nó (None se inviável)."""
+    n, m, G = network.size, len(k), resolution
+    if not network.levels:
+        return np.zeros(n, dtype=np.intp)
+    step = limit / (G - 1)
+    # Queda discretizada (arredondada para cima) de cada cabo em cada trecho: (n, m)
+    units = np.ceil(np.outer(unit_drop, k) / step - 1e-9).astype(np.intp)
+    units = np.maximum(units, 0)
+    seg_cost = np.outer(network.metros, cost)  # (n, m)
+
+    choice = np.zeros((n, G), dtype=np.uint8)
+    budget_idx = np.arange(G)
+    pos = np.zeros(n, dtype=np.intp)  # posição do nó dentro do seu nível
+    carry_nodes: Optional[NDArray[np.intp]] = None
+    carry_g: Optional[NDArray[np.float64]] = None
+
+    for lvl in reversed(network.levels):
+        nodes = lvl.nodes
+        pos[nodes] = np.arange(len(nodes))
+        g = np.zeros((len(nodes), G))
+        if carry_nodes is not None and carry_g is not None:
+            g[pos[carry_nodes]] = carry_g
+
+        best = np.full((len(nodes), G), np.inf)
+        best_c = np.zeros((len(nodes), G), dtype=np.uint8)
+        rows = np.arange(len(nodes))[:, np.newaxis]
+        for c in range(m):
+            src = budget_idx[np.newaxis, :] - units[nodes, c][:, np.newaxis]
+            cand = np.where(src >= 0, g[rows, np.clip(src, 0, None)], np.inf) + seg_cost[nodes, c][:, np.newaxis]
+            better = cand < best
+            best = np.where(better, cand, best)
+            best_c = np.where(better, c, best_c)
+        choice[nodes] = best_c
+
+        carry_nodes = lvl.group_parents
+        carry_g = np.add.reduceat(best, lvl.starts, axis=0)
+
+    if carry_g is None or not np.isfinite(carry_g[0, G - 1]):
+        return None
+
+    # Reconstrução top-down do orçamento e do cabo escolhido
+    chosen = np.zeros(n, dtype=np.intp)
+    budget = np.zeros(n, dtype=np.intp)
+    budget[0] = G - 1
+    for lvl in network.levels:
+        b = budget[lvl.parents]
+        c = choice[lvl.nodes, b].astype(np.intp)
+        chosen[lvl.nodes] = c
+        budget[lvl.nodes] = b - units[lvl.nodes, c]
+    return chosen
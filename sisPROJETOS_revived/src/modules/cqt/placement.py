@@ -0,0 +1,163 @@
+"""
+Análise de posicionamento do TRAFO por reenraizamento da árvore CQT.
+
+Para cada ponto candidato ``r``, calcula o CQT máximo que a rede teria se o
+TRAFO fosse instalado em ``r`` — o mesmo valor de ``CQTLogic.calculate`` sobre
+os trechos reorientados a partir de ``r`` — em O(n) para todos os candidatos,
+em vez de O(n²) recalculando a rede uma vez por candidato.
+
+Convenções ao reorientar um trecho (v, pai(v)) para que ``pai(v)`` fique a
+jusante: o trecho mantém comprimento e cabo; cada ponto mantém suas UCs e
+carga especial; e o momento passa a ser o da carga do lado de ``pai(v)``:
+
+    momento_sub(v) = W − acumulada(v) − distribuída(pai(v)) / 2
+
+onde ``W`` é a carga total da rede. O fator DMDI não muda, pois o total de UCs
+é o mesmo para qualquer raiz.
+
+Programação dinâmica em dois passes vetorizados por nível:
+
+- ``down[v]``: maior CQT de ``v`` até uma ponta dentro da sua subárvore;
+- ``up[v]``: maior CQT de ``v`` até uma ponta passando pelo seu montante.
+
+O CQT máximo com o TRAFO em ``v`` é ``max(down[v], up[v])``.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from utils.logger import get_logger
+
+from .logic import CQTLogic
+from .network import CompiledNetwork, CompiledResult, solve_network
+
+logger = get_logger(__name__)
+
+
+class TrafoPlacementAnalyzer:
+    """Classifica os pontos da rede como candidatos a receber o TRAFO."""
+
+    def __init__(self, logic: Optional[CQTLogic] = None) -> None:
+        """Inicializa o analisador.
+
+        Args:
+            logic: Instância de ``CQTLogic`` a reutilizar. Se None, cria uma nova.
+        """
+        self.logic = logic or CQTLogic()
+
+    def analyze(
+        self,
+        segments: List[Dict[str, Any]],
+        social_class: str = "B",
+        candidates: Optional[List[str]] = None,
+        top: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Avalia o CQT máximo da rede para cada posição possível do TRAFO.
+
+        Args:
+            segments: Lista de trechos no formato de ``CQTLogic.calculate``,
+                com o TRAFO na posição atual.
+            social_class: Classe social dominante (A, B, C ou D).
+            candidates: Pontos a considerar. Padrão: todos os pontos da rede.
+            top: Número máximo de candidatos retornados (os melhores).
+
+        Returns:
+            Dicionário com 'success' e, em caso de sucesso, 'candidates' (lista
+            ordenada pelo menor CQT máximo, cada item com 'ponto', 'max_cqt',
+            'total_kva' e 'within_enel_limit') e 'current' (mesma estrutura
+            para o TRAFO atual); em caso de falha, 'error'.
+
+        Raises:
+            ValueError: Se a classe social for inválida.
+        """
+        social_class = self.logic.sanitize_social_class(social_class)
+        try:
+            network = self.logic.compile_network(segments)
+        except ValueError as e:
+            return {"success": False, "error": str(e)}
+
+        if candidates is None:
+            idx = np.arange(network.size)
+        else:
+            wanted = [str(c).upper() for c in candidates]
+            missing = [c for c in wanted if c not in network.index]
+            if missing:
+                return {"success": False, "error": f"Pontos candidatos não encontrados na rede: {missing}"}
+            idx = np.array([network.index[c] for c in dict.fromkeys(wanted)], dtype=np.intp)
+
+        coefs = self.logic.get_cable_coefs()
+        fd = self.logic.get_fator_demanda(network.total_clients, social_class)
+        coef = network.cable_coefs(coefs)
+        result = solve_network(network, fd, coefs, self.logic.UNIT_DIVISOR, coef=coef)
+        ecc = rerooted_max_cqt(network, result, network.metros / self.logic.UNIT_DIVISOR * coef)
+
+        limit = self.logic.CQT_LIMIT_PERCENT
+        total_kva = result.total_kva
+        order = idx[np.lexsort((idx, ecc[idx]))]
+        if top is not None:
+            order = order[: max(0, int(top))]
+
+        def entry(i: int) -> Dict[str, Any]:
+            return {
+                "ponto": network.points[i],
+                "max_cqt": float(ecc[i]),
+                "total_kva": total_kva,
+                "within_enel_limit": bool(ecc[i] <= limit),
+            }
+
+        logger.debug("Posicionamento do TRAFO: %d candidatos avaliados", len(idx))
+        return {
+            "success": True,
+            "candidates": [entry(int(i)) for i in order],
+            "current": entry(0),
+        }
+
+
+def rerooted_max_cqt(
+    network: CompiledNetwork, result: CompiledResult, factor: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    """CQT máximo da rede com o TRAFO em cada ponto (reenraizamento em O(n)).
+
+    Args:
+        network: Rede compilada (TRAFO atual no índice 0).
+        result: Resultado do cálculo com o TRAFO atual.
+        factor: CQT por kVA de momento de cada trecho (comprimento em
+            hectômetros × coeficiente K), forma ``(n,)``.
+
+    Returns:
+        Array ``(n,)`` em que o elemento ``i`` é o CQT máximo com o TRAFO no
+        ponto ``i``. O elemento 0 é igual a ``result.max_cqt``.
+    """
+    n = network.size
+    if not network.levels:
+        return np.zeros(n)
+    q_down = result.cqt_trecho
+    # Trecho percorrido no sentido inverso: o montante original fica a jusante
+    parent = np.maximum(network.parent, 0)
+    q_up = (result.total_kva - result.accumulated - result.local_dist[parent] / 2) * factor
+    q_up[0] = 0.0
+
+    down = np.zeros(n)
+    for lvl in reversed(network.levels):
+        reach = q_down[lvl.nodes] + down[lvl.nodes]
+        down[lvl.group_parents] = np.maximum.reduceat(reach, lvl.starts)
+
+    up = np.zeros(n)
+    for lvl in network.levels:
+        reach = q_down[lvl.nodes] + down[lvl.nodes]
+        best_sibling = _max_excluding_self(reach, lvl.starts)
+        up[lvl.nodes] = q_up[lvl.nodes] + np.maximum(up[lvl.parents], best_sibling)
+
+    return np.maximum(down, up)
+
+
+def _max_excluding_self(values: NDArray[np.float64], starts: NDArray[np.intp]) -> NDArray[np.float64]:
+    """Para cada elemento, o máximo dos demais elementos do seu grupo (0 se sozinho)."""
+    counts = np.diff(np.r_[starts, len(values)])
+    best = np.repeat(np.maximum.reduceat(values, starts), counts)
+    is_best = values == best
+    ties = np.repeat(np.add.reduceat(is_best.astype(np.intp), starts), counts)
+    second = np.repeat(np.maximum.reduceat(np.where(is_best, 0.0, values), starts), counts)
+    return np.where(is_best & (ties == 1), second, best)
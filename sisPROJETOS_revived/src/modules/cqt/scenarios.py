@@ -0,0 +1,220 @@
+"""
+Avaliação CQT vetorizada de múltiplos cenários de carga.
+
+Estudos de planejamento avaliam a mesma rede sob vários cenários — anos de
+crescimento, mudança de classe social, novas cargas especiais. Em vez de
+chamar ``CQTLogic.calculate`` uma vez por cenário, ``ScenarioEvaluator``
+compila a topologia uma única vez e resolve todos os cenários em um único
+passe NumPy sobre matrizes ``(cenários × pontos)``.
+
+O fator DMDI de cada cenário é obtido da ``TABELA_DEMANDA`` a partir do total
+de UCs do cenário (arredondado para o inteiro mais próximo).
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from utils.logger import get_logger
+
+from .logic import CQTLogic
+from .network import CompiledNetwork, accumulate_loads, cqt_trecho_from_loads, propagate_cqt
+
+logger = get_logger(__name__)
+
+_CLASS_INDEX = {"A": 0, "B": 1, "C": 2, "D": 3}
+
+
+def demand_factors(
+    logic: CQTLogic, client_counts: ArrayLike, social_class: Union[str, Sequence[str]]
+) -> NDArray[np.float64]:
+    """Versão vetorizada de ``CQTLogic.get_fator_demanda``.
+
+    Args:
+        logic: Instância de ``CQTLogic`` (fonte da ``TABELA_DEMANDA``).
+        client_counts: Total de UCs por cenário, forma ``(k,)``.
+        social_class: Classe social única ou uma por cenário.
+
+    Returns:
+        Fator de demanda DMDI por cenário, forma ``(k,)``.
+
+    Raises:
+        ValueError: Se alguma classe não for A, B, C ou D ou se o número de
+            classes não corresponder ao de cenários.
+    """
+    counts = np.rint(np.asarray(client_counts, dtype=np.float64)).astype(np.int64)
+    classes = [social_class] * counts.size if isinstance(social_class, str) else list(social_class)
+    if len(classes) != counts.size:
+        raise ValueError(f"Esperadas {counts.size} classes sociais, recebidas {len(classes)}.")
+    cls = np.array([_CLASS_INDEX[logic.sanitize_social_class(str(c))] for c in classes], dtype=np.intp)
+
+    table = np.array([row[2:] for row in logic.TABELA_DEMANDA], dtype=np.float64)
+    mins = np.array([row[0] for row in logic.TABELA_DEMANDA])
+    maxs = np.array([row[1] for row in logic.TABELA_DEMANDA])
+    fallback = np.array([0.5, 0.8, 1.3, 2.0])
+
+    row = np.minimum(np.searchsorted(maxs, counts), len(maxs) - 1)
+    in_table = (counts >= mins[row]) & (counts <= maxs[row])
+    return np.where(in_table, table[row, cls], fallback[cls])
+
+
+@dataclass
+class ScenarioResult:
+    """Resultado de ``k`` cenários sobre a mesma rede (arrays ``(k, n)``).
+
+    As colunas seguem ``network.points`` (ordem topológica, TRAFO primeiro).
+
+    Attributes:
+        network: Rede compilada avaliada.
+        fd: Fator DMDI por cenário, forma ``(k,)``.
+        total_clients: Total de UCs por cenário, forma ``(k,)``.
+        accumulated: Carga acumulada por cenário e ponto (kVA).
+        cqt_trecho: CQT de cada trecho por cenário.
+        cqt_accumulated: CQT acumulado por cenário e ponto.
+        limit: Limite de CQT usado em ``over_limit``/``summaries``.
+    """
+
+    network: CompiledNetwork
+    fd: NDArray[np.float64]
+    total_clients: NDArray[np.float64]
+    accumulated: NDArray[np.float64]
+    cqt_trecho: NDArray[np.float64]
+    cqt_accumulated: NDArray[np.float64]
+    limit: float
+
+    @property
+    def points(self) -> List[str]:
+        """Identificadores dos pontos (colunas)."""
+        return self.network.points
+
+    @property
+    def max_cqt(self) -> NDArray[np.float64]:
+        """Maior CQT acumulado por cenário."""
+        return self.cqt_accumulated.max(axis=1)
+
+    @property
+    def total_kva(self) -> NDArray[np.float64]:
+        """Carga no TRAFO por cenário."""
+        return self.accumulated[:, 0]
+
+    @property
+    def over_limit(self) -> NDArray[np.bool_]:
+        """Máscara ``(k, n)`` dos pontos acima do limite."""
+        return self.cqt_accumulated > self.limit
+
+    def summaries(self) -> List[Dict[str, Any]]:
+        """Resumo por cenário no formato do 'summary' de ``CQTLogic.calculate``."""
+        points = self.network.points
+        mask = self.over_limit
+        return [
+            {
+                "fd": float(self.fd[s]),
+                "total_clients": float(self.total_clients[s]),
+                "max_cqt": float(self.max_cqt[s]),
+                "total_kva": float(self.total_kva[s]),
+                "cqt_limit_percent": self.limit,
+                "within_enel_limit": bool(self.max_cqt[s] <= self.limit),
+                "segments_over_limit": [points[i] for i in np.flatnonzero(mask[s])],
+            }
+            for s in range(len(self.fd))
+        ]
+
+
+class ScenarioEvaluator:
+    """Resolve vários cenários de carga sobre uma topologia fixa."""
+
+    def __init__(self, logic: Optional[CQTLogic] = None) -> None:
+        """Inicializa o avaliador.
+
+        Args:
+            logic: Instância de ``CQTLogic`` a reutilizar. Se None, cria uma nova.
+        """
+        self.logic = logic or CQTLogic()
+
+    def evaluate(
+        self,
+        segments: Union[List[Dict[str, Any]], CompiledNetwork],
+        clients: Optional[ArrayLike] = None,
+        carga_esp: Optional[ArrayLike] = None,
+        social_class: Union[str, Sequence[str]] = "B",
+        points: Optional[List[str]] = None,
+    ) -> ScenarioResult:
+        """Calcula todos os cenários em um único passe vetorizado.
+
+        Args:
+            segments: Trechos no formato de ``CQTLogic.calculate`` ou rede já
+                compilada (topologia, comprimentos, cabos e cargas base).
+            clients: UCs por cenário e ponto, forma ``(k, m)``. Padrão: UCs base.
+            carga_esp: Carga especial (kVA) por cenário e ponto, forma ``(k, m)``.
+                Padrão: cargas especiais base.
+            social_class: Classe social única ou uma por cenário.
+            points: Pontos correspondentes às ``m`` colunas das matrizes.
+                Padrão: ``network.points``. Pontos não listados mantêm a
+                carga base em todos os cenários.
+
+        Returns:
+            ``ScenarioResult`` com arrays ``(k, n)``.
+
+        Raises:
+            ValueError: Se a topologia for inválida, se um ponto não existir,
+                se as dimensões das matrizes forem incompatíveis ou se alguma
+                classe social for inválida.
+        """
+        network = segments if isinstance(segments, CompiledNetwork) else self.logic.compile_network(segments)
+        n = network.size
+        if points is None:
+            cols = np.arange(n)
+        else:
+            missing = [p for p in points if str(p).upper() not in network.index]
+            if missing:
+                raise ValueError(f"Pontos não encontrados na rede: {missing}")
+            cols = np.array([network.index[str(p).upper()] for p in points], dtype=np.intp)
+
+        k = self._scenario_count(clients, carga_esp, social_class)
+        loads_clients = self._expand(network.clients, clients, cols, k, "clients")
+        loads_esp = self._expand(network.carga_esp, carga_esp, cols, k, "carga_esp")
+
+        # Ajuste de total_clients: pontos duplicados nos trechos também contam no DMDI
+        total_clients = loads_clients.sum(axis=0) + (network.total_clients - network.clients.sum())
+        fd = demand_factors(self.logic, total_clients, social_class)
+
+        coef = network.cable_coefs(self.logic.get_cable_coefs())
+        local_dist = loads_clients * fd
+        accumulated = accumulate_loads(network, local_dist + loads_esp)
+        cqt_trecho = cqt_trecho_from_loads(network, local_dist, loads_esp, accumulated, coef, self.logic.UNIT_DIVISOR)
+        cqt_accumulated = propagate_cqt(network, cqt_trecho)
+        logger.debug("CQT multi-cenário: %d cenários × %d pontos", k, n)
+        return ScenarioResult(
+            network=network,
+            fd=fd,
+            total_clients=total_clients,
+            accumulated=accumulated.T,
+            cqt_trecho=cqt_trecho.T,
+            cqt_accumulated=cqt_accumulated.T,
+            limit=self.logic.CQT_LIMIT_PERCENT,
+        )
+
+    @staticmethod
+    def _scenario_count(
+        clients: Optional[ArrayLike], carga_esp: Optional[ArrayLike], social_class: Union[str, Sequence[str]]
+    ) -> int:
+        for matrix in (clients, carga_esp):
+            if matrix is not None:
+                return int(np.atleast_2d(np.asarray(matrix)).shape[0])
+        return 1 if isinstance(social_class, str) else len(social_class)
+
+    @staticmethod
+    def _expand(
+        base: NDArray[np.float64], matrix: Optional[ArrayLike], cols: NDArray[np.intp], k: int, name: str
+    ) -> NDArray[np.float64]:
+        """Monta a matriz ``(n, k)`` de cargas a partir da base e das colunas informadas."""
+        out = np.repeat(base[:, np.newaxis], k, axis=1)
+        if matrix is None:
+            return out
+        values = np.atleast_2d(np.asarray(matrix, dtype=np.float64))
+        if values.shape != (k, len(cols)):
+            raise ValueError(f"'{name}' deve ter forma ({k}, {len(cols)}), recebido {values.shape}.")
+        out[cols] = values.T
+        return out
@@ -0,0 +1,286 @@
+"""
+Sessão CQT incremental para edições trecho a trecho.
+
+``CQTSession`` mantém a última rede resolvida (``CompiledNetwork`` +
+``CompiledResult``). Quando apenas os dados de um trecho mudam — comprimento,
+cabo, UCs ou carga especial — a sessão atualiza:
+
+- a carga acumulada somente no caminho do ponto até o TRAFO (O(profundidade));
+- o CQT acumulado somente na subárvore cujo momento elétrico mudou, que ocupa
+  um intervalo contíguo na pré-ordem DFS.
+
+Alterações de comprimento/cabo afetam apenas a subárvore do próprio ponto.
+Alterações de carga mudam o momento de todos os trechos do caminho e, portanto,
+o CQT das subárvores penduradas nesse caminho. Se a mudança no total de UCs
+alterar o fator de demanda DMDI, todas as cargas locais mudam e a sessão
+recalcula a rede inteira (passe vetorizado). Alterações de topologia
+(ponto/montante) também recompilam a rede.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from utils.logger import get_logger
+
+from .logic import CQTLogic
+from .network import CompiledNetwork, CompiledResult, cqt_trecho_from_loads, solve_network, subtree_layout
+
+logger = get_logger(__name__)
+
+_LOAD_FIELDS = ("mono", "bi", "tri", "tri_esp")
+_EDITABLE_FIELDS = ("metros", "cabo", "carga_esp") + _LOAD_FIELDS
+# Valor de cada campo ausente no trecho (mesmos padrões de ``compile_network``).
+_FIELD_DEFAULTS: Dict[str, Any] = {"metros": 0.0, "cabo": "", "carga_esp": 0.0, **{f: 0 for f in _LOAD_FIELDS}}
+
+
+class CQTSession:
+    """Mantém a última rede CQT resolvida e aplica edições de forma incremental.
+
+    Example:
+        >>> session = CQTSession()
+        >>> res = session.calculate(segments, trafo_kva=75.0, social_class="B")
+        >>> session.update_segment("P7", metros=42.0, cabo="3x70+54.6mm² Al")
+        >>> session.calculate_summary()["max_cqt"]
+    """
+
+    def __init__(self, logic: Optional[CQTLogic] = None) -> None:
+        """Inicializa a sessão (sem rede carregada).
+
+        Args:
+            logic: Instância de ``CQTLogic`` a reutilizar. Se None, cria uma nova.
+        """
+        self.logic = logic or CQTLogic()
+        self.social_class: str = "B"
+        self.network: Optional[CompiledNetwork] = None
+        self.result: Optional[CompiledResult] = None
+        self._segments: Dict[str, Dict[str, Any]] = {}
+        self._coefs: Dict[str, float] = {}
+        self._coef: NDArray[np.float64] = np.zeros(0)
+        self._tin: NDArray[np.intp] = np.zeros(0, dtype=np.intp)
+        self._size: NDArray[np.intp] = np.zeros(0, dtype=np.intp)
+        self._preorder: NDArray[np.intp] = np.zeros(0, dtype=np.intp)
+        self._parent: List[int] = []
+
+    # ── Carga completa ────────────────────────────────────────────────────────
+
+    def load(self, segments: List[Dict[str, Any]], social_class: str = "B") -> CompiledResult:
+        """Compila e resolve a rede inteira, descartando o estado anterior.
+
+        Args:
+            segments: Lista de trechos no formato de ``CQTLogic.calculate``.
+            social_class: Classe social dominante (A, B, C ou D).
+
+        Returns:
+            Resultado completo da rede.
+
+        Raises:
+            ValueError: Se a topologia for inválida.
+        """
+        network = self.logic.compile_network(segments)
+        self.network = network
+        self.social_class = social_class
+        self._segments = {str(s["ponto"]).upper(): dict(s) for s in segments}
+        self._tin, self._size = subtree_layout(network)
+        self._preorder = np.empty_like(self._tin)
+        self._preorder[self._tin] = np.arange(network.size)
+        self._parent = network.parent.tolist()
+        self._coefs = self.logic.get_cable_coefs()
+        return self.refresh()
+
+    def refresh(self) -> CompiledResult:
+        """Recalcula a rede carregada por inteiro (descarta acúmulo de arredondamentos)."""
+        network = self._require_network()
+        self._coef = network.cable_coefs(self._coefs)
+        fd = self.logic.get_fator_demanda(network.total_clients, self.social_class)
+        self.result = solve_network(network, fd, self._coefs, self.logic.UNIT_DIVISOR, coef=self._coef)
+        return self.result
+
+    # ── Edição incremental ────────────────────────────────────────────────────
+
+    def update_segment(self, ponto: str, **changes: Any) -> CompiledResult:
+        """Aplica a edição de um trecho e atualiza apenas os pontos afetados.
+
+        Args:
+            ponto: Identificador do ponto editado.
+            **changes: Novos valores para qualquer de ``metros``, ``cabo``,
+                ``mono``, ``bi``, ``tri``, ``tri_esp`` e ``carga_esp``.
+
+        Returns:
+            Resultado atualizado da rede.
+
+        Raises:
+            KeyError: Se o ponto não existir na rede carregada.
+            ValueError: Se um campo não editável (ex: ``montante``) for informado.
+        """
+        network = self._require_network()
+        result = self.result
+        assert result is not None
+        unknown = set(changes) - set(_EDITABLE_FIELDS)
+        if unknown:
+            raise ValueError(f"Campos não editáveis incrementalmente: {sorted(unknown)}. Use load().")
+
+        p = str(ponto).upper()
+        if p not in network.index:
+            raise KeyError(f"Ponto '{p}' não encontrado na rede carregada")
+        i = network.index[p]
+        seg = self._segments[p]
+
+        d_clients = sum(changes.get(f, seg.get(f, 0)) - seg.get(f, 0) for f in _LOAD_FIELDS)
+        d_carga = changes.get("carga_esp", seg.get("carga_esp", 0.0)) - seg.get("carga_esp", 0.0)
+        seg.update(changes)
+
+        if "metros" in changes:
+            network.metros[i] = seg.get("metros", 0.0)
+        if "cabo" in changes:
+            self._set_cable(i, seg.get("cabo", ""))
+
+        network.carga_esp[i] += d_carga
+        if d_clients:
+            network.clients[i] += d_clients
+            network.total_clients += d_clients
+            fd = self.logic.get_fator_demanda(network.total_clients, self.social_class)
+            if fd != result.fd:
+                logger.debug("Fator DMDI mudou (%.2f → %.2f); recalculando rede inteira", result.fd, fd)
+                return self.refresh()
+
+        # 1. Cargas: somente o caminho ponto → TRAFO
+        path = self._path_to_root(i)
+        d_dist = d_clients * result.fd
+        result.local_dist[i] += d_dist
+        result.local_pontual[i] += d_carga
+        result.accumulated[path] += d_dist + d_carga
+
+        # 2. CQT de trecho dos nós do caminho (o momento de todos eles pode ter mudado)
+        new_q = cqt_trecho_from_loads(
+            network,
+            result.local_dist,
+            result.local_pontual,
+            result.accumulated,
+            self._coef,
+            self.logic.UNIT_DIVISOR,
+            nodes=path,
+        )
+        dq = new_q - result.cqt_trecho[path]
+        result.cqt_trecho[path] = new_q
+
+        # 3. CQT acumulado: soma de Δq nas subárvores (intervalos aninhados em pré-ordem)
+        changed = np.flatnonzero(dq)
+        if changed.size:
+            self._propagate_delta(path[changed], dq[changed])
+        return result
+
+    def apply(self, segments: List[Dict[str, Any]], social_class: str = "B") -> CompiledResult:
+        """Sincroniza a sessão com uma nova lista de trechos.
+
+        Usa ``update_segment`` para cada trecho alterado quando a topologia, a
+        classe social e o catálogo de cabos não mudaram; caso contrário, ou se
+        muitos trechos mudaram, recalcula tudo com ``load``.
+
+        Args:
+            segments: Lista completa de trechos.
+            social_class: Classe social dominante.
+
+        Returns:
+            Resultado atualizado da rede.
+        """
+        incoming = {str(s["ponto"]).upper(): s for s in segments}
+        if (
+            self.network is None
+            or social_class != self.social_class
+            or len(incoming) != len(segments)
+            or incoming.keys() != self._segments.keys()
+            or self.logic.get_cable_coefs() != self._coefs
+            or any(
+                str(s.get("montante", "")).upper() != str(self._segments[p].get("montante", "")).upper()
+                for p, s in incoming.items()
+            )
+        ):
+            return self.load(segments, social_class)
+
+        edits = []
+        for p, s in incoming.items():
+            old = self._segments[p]
+            # Campo omitido volta ao padrão (ex: carga_esp removida = 0), como num load()
+            changes = {f: s.get(f, d) for f, d in _FIELD_DEFAULTS.items() if s.get(f, d) != old.get(f, d)}
+            if changes:
+                edits.append((p, changes))
+
+        if len(edits) > max(1, self._require_network().size // 16):
+            return self.load(segments, social_class)
+        for p, changes in edits:
+            self.update_segment(p, **changes)
+        assert self.result is not None
+        return self.result
+
+    # ── Saída no formato de CQTLogic.calculate ────────────────────────────────
+
+    def calculate(
+        self,
+        segments: List[Dict[str, Any]],
+        trafo_kva: float,
+        social_class: str = "B",
+    ) -> Dict[str, Any]:
+        """Equivalente a ``CQTLogic.calculate`` reaproveitando o último cálculo.
+
+        Args:
+            segments: Lista completa de trechos.
+            trafo_kva: Potência do transformador em kVA (deve ser > 0).
+            social_class: Classe social dominante (A, B, C ou D).
+
+        Returns:
+            Dicionário com 'success', 'results', 'summary' ou 'error'.
+        """
+        try:
+            trafo_kva, social_class = self.logic.sanitize_params(trafo_kva, social_class)
+            result = self.apply(segments, social_class)
+        except ValueError as e:
+            logger.warning("Valor inválido em CQTSession.calculate: %s", e)
+            return {"success": False, "error": str(e)}
+        return {"success": True, "results": result.to_results(), "summary": self.calculate_summary()}
+
+    def calculate_summary(self) -> Dict[str, Any]:
+        """Resumo ('summary') da rede atual, no formato de ``CQTLogic.calculate``."""
+        network = self._require_network()
+        result = self.result
+        assert result is not None
+        return self.logic._build_summary(
+            result.fd,
+            network.total_clients,
+            result.max_cqt,
+            result.total_kva,
+            result.over_limit(self.logic.CQT_LIMIT_PERCENT),
+        )
+
+    # ── Auxiliares ────────────────────────────────────────────────────────────
+
+    def _require_network(self) -> CompiledNetwork:
+        if self.network is None:
+            raise ValueError("Nenhuma rede carregada na sessão CQT. Use load() primeiro.")
+        return self.network
+
+    def _set_cable(self, i: int, cabo: str) -> None:
+        network = self._require_network()
+        if cabo not in network.cables:
+            network.cables.append(cabo)
+        network.cable_idx[i] = network.cables.index(cabo)
+        self._coef[i] = float(self._coefs.get(cabo, 0.0))
+
+    def _path_to_root(self, i: int) -> NDArray[np.intp]:
+        parent = self._parent
+        path = [i]
+        while parent[path[-1]] >= 0:
+            path.append(parent[path[-1]])
+        return np.array(path, dtype=np.intp)
+
+    def _propagate_delta(self, nodes: NDArray[np.intp], dq: NDArray[np.float64]) -> None:
+        """Soma ``dq[j]`` ao CQT acumulado de toda a subárvore de ``nodes[j]``."""
+        assert self.result is not None
+        tin, size = self._tin[nodes], self._size[nodes]
+        top = int(np.argmin(tin))
+        lo, hi = int(tin[top]), int(tin[top] + size[top])
+        diff = np.zeros(hi - lo + 1)
+        np.add.at(diff, tin - lo, dq)
+        np.add.at(diff, tin + size - lo, -dq)
+        self.result.cqt_accumulated[self._preorder[lo:hi]] += np.cumsum(diff[:-1])
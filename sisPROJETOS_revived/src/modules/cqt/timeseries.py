@@ -0,0 +1,217 @@
+"""
+Simulação CQT com curvas de carga horárias (ex.: 8760 h de um ano).
+
+``CQTLogic.calculate`` avalia um único instante — a demanda DMDI de
+``TABELA_DEMANDA``. Aqui cada carga é multiplicada por um perfil horário
+adimensional (1.0 = demanda DMDI) conforme a classe do ponto.
+
+Como o CQT é linear nas cargas, a rede é resolvida uma única vez por grupo de
+perfil (classe social de cada ponto + cargas especiais) em um passe ``(n, G)``;
+o CQT de cada hora é a combinação linear desses resultados, calculada como um
+produto matricial ``(horas × G) @ (G × pontos)`` em blocos de horas. Não há
+laço Python por hora.
+
+Cada trecho pode informar a chave opcional ``classe`` (A–D); sem ela, ou se não
+houver perfil para a classe informada, vale o perfil da classe social da rede.
+As cargas especiais (``carga_esp``) seguem o perfil ``"ESP"``, se fornecido, ou
+ficam constantes.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from utils.logger import get_logger
+
+from .logic import CQTLogic
+from .network import CompiledNetwork, accumulate_loads, cqt_trecho_from_loads, propagate_cqt
+
+logger = get_logger(__name__)
+
+HORAS_ANO: int = 8760
+
+# Perfil diário residencial típico (p.u. da demanda DMDI), 00h–23h — pico às 19h–20h.
+PERFIL_RESIDENCIAL_24H = (
+    0.38, 0.33, 0.30, 0.29, 0.30, 0.36, 0.48, 0.55, 0.52, 0.50, 0.50, 0.53,
+    0.56, 0.54, 0.52, 0.52, 0.56, 0.68, 0.88, 1.00, 0.97, 0.85, 0.66, 0.48,
+)  # fmt: skip
+
+ESP_PROFILE_KEY = "ESP"
+
+
+def typical_residential_profile(hours: int = HORAS_ANO) -> NDArray[np.float64]:
+    """Perfil horário residencial ilustrativo para ``hours`` horas.
+
+    Repete ``PERFIL_RESIDENCIAL_24H`` com modulação sazonal de ±8% (máximo no
+    verão, início do ano). O pico anual é 1.0 (demanda DMDI).
+
+    Args:
+        hours: Número de horas do perfil.
+
+    Returns:
+        Array ``(hours,)`` em p.u.
+    """
+    t = np.arange(hours)
+    daily = np.resize(np.asarray(PERFIL_RESIDENCIAL_24H), hours)
+    seasonal = 1.0 + 0.08 * np.cos(2.0 * np.pi * t / HORAS_ANO)
+    profile = daily * seasonal
+    return profile / profile.max()
+
+
+@dataclass
+class TimeSeriesResult:
+    """Resultado da simulação horária (reduções por hora e por ponto).
+
+    Attributes:
+        network: Rede compilada simulada.
+        limit: Limite de CQT (%).
+        max_cqt_hourly: Maior CQT da rede em cada hora, forma ``(T,)``.
+        worst_point_hourly: Índice do ponto com maior CQT em cada hora.
+        peak_cqt: Maior CQT de cada ponto no período, forma ``(n,)``.
+        peak_hour: Hora em que ocorre ``peak_cqt`` de cada ponto.
+        hours_over_limit: Número de horas acima do limite por ponto.
+    """
+
+    network: CompiledNetwork
+    limit: float
+    max_cqt_hourly: NDArray[np.float64]
+    worst_point_hourly: NDArray[np.intp]
+    peak_cqt: NDArray[np.float64]
+    peak_hour: NDArray[np.intp]
+    hours_over_limit: NDArray[np.intp]
+
+    @property
+    def violation_hours(self) -> NDArray[np.intp]:
+        """Horas em que algum ponto excede o limite."""
+        return np.flatnonzero(self.max_cqt_hourly > self.limit)
+
+    def points_over_limit(self) -> Dict[str, int]:
+        """Pontos que excedem o limite em ao menos uma hora → número de horas."""
+        idx = np.flatnonzero(self.hours_over_limit)
+        return {self.network.points[i]: int(self.hours_over_limit[i]) for i in idx}
+
+    def summary(self) -> Dict[str, Any]:
+        """Resumo serializável da simulação."""
+        worst = int(np.argmax(self.max_cqt_hourly)) if self.max_cqt_hourly.size else 0
+        return {
+            "hours": int(self.max_cqt_hourly.size),
+            "max_cqt": float(self.max_cqt_hourly.max(initial=0.0)),
+            "max_cqt_hour": worst,
+            "max_cqt_point": (
+                self.network.points[int(self.worst_point_hourly[worst])] if self.max_cqt_hourly.size else ""
+            ),
+            "cqt_limit_percent": self.limit,
+            "hours_over_limit": int(self.violation_hours.size),
+            "points_over_limit": self.points_over_limit(),
+        }
+
+
+class LoadCurveSimulator:
+    """Aplica perfis horários de carga à rede CQT de forma vetorizada."""
+
+    def __init__(self, logic: Optional[CQTLogic] = None) -> None:
+        """Inicializa o simulador.
+
+        Args:
+            logic: Instância de ``CQTLogic`` a reutilizar. Se None, cria uma nova.
+        """
+        self.logic = logic or CQTLogic()
+
+    def simulate(
+        self,
+        segments: List[Dict[str, Any]],
+        profiles: Optional[Mapping[str, ArrayLike]] = None,
+        social_class: str = "B",
+        chunk_hours: int = 1024,
+    ) -> TimeSeriesResult:
+        """Simula o CQT hora a hora sobre todo o período dos perfis.
+
+        Args:
+            segments: Trechos no formato de ``CQTLogic.calculate`` (chave
+                opcional ``classe`` por trecho).
+            profiles: Perfis em p.u. por classe (``"A"``–``"D"``) e, opcionalmente,
+                ``"ESP"`` para cargas especiais; todos com o mesmo comprimento.
+                Padrão: ``typical_residential_profile()`` para todas as classes.
+            social_class: Classe social da rede (fator DMDI e classe padrão).
+            chunk_hours: Horas processadas por bloco (limita a memória a
+                ``chunk_hours × n`` valores).
+
+        Returns:
+            ``TimeSeriesResult`` com as reduções por hora e por ponto.
+
+        Raises:
+            ValueError: Se a topologia for inválida, alguma classe social não
+                for A, B, C ou D, faltar perfil para alguma classe ou os perfis
+                tiverem comprimentos diferentes.
+        """
+        network = self.logic.compile_network(segments)
+        social_class = self.logic.sanitize_social_class(social_class)
+        if profiles is None:
+            profiles = {social_class: typical_residential_profile()}
+        curves = {str(key).upper(): np.asarray(v, dtype=np.float64) for key, v in profiles.items()}
+        lengths = {c.shape for c in curves.values()}
+        if len(lengths) != 1 or len(next(iter(lengths))) != 1:
+            raise ValueError("Todos os perfis horários devem ser vetores de mesmo comprimento.")
+
+        # Grupo de perfil de cada ponto (carga distribuída)
+        by_point = {str(s["ponto"]).upper(): s for s in segments}
+        raw_class = [by_point[p].get("classe") or social_class for p in network.points]
+        valid = {c: self.logic.sanitize_social_class(str(c)) for c in set(raw_class)}
+        point_class = [valid[c] for c in raw_class]
+        keys = list(dict.fromkeys(c if c in curves else social_class for c in point_class))
+        missing = [c for c in keys if c not in curves]
+        if missing:
+            raise ValueError(f"Perfil horário ausente para a(s) classe(s): {missing}")
+        group = np.array([keys.index(c if c in curves else social_class) for c in point_class], dtype=np.intp)
+
+        # Resposta da rede a cada grupo com perfil = 1.0 (passe único (n, G))
+        n, G = network.size, len(keys) + 1
+        fd = self.logic.get_fator_demanda(network.total_clients, social_class)
+        local_dist = np.zeros((n, G))
+        local_dist[np.arange(n), group] = network.clients * fd
+        local_pontual = np.zeros((n, G))
+        local_pontual[:, -1] = network.carga_esp
+        accumulated = accumulate_loads(network, local_dist + local_pontual)
+        coef = network.cable_coefs(self.logic.get_cable_coefs())
+        q = cqt_trecho_from_loads(network, local_dist, local_pontual, accumulated, coef, self.logic.UNIT_DIVISOR)
+        basis = propagate_cqt(network, q).T  # (G, n)
+
+        hours = len(next(iter(curves.values())))
+        esp = curves.get(ESP_PROFILE_KEY, np.ones(hours))
+        weights = np.column_stack([curves[c] for c in keys] + [esp])  # (T, G)
+        return self._reduce(network, weights, basis, max(1, int(chunk_hours)))
+
+    def _reduce(
+        self, network: CompiledNetwork, weights: NDArray[np.float64], basis: NDArray[np.float64], chunk: int
+    ) -> TimeSeriesResult:
+        """Combina os perfis com a resposta da rede, bloco a bloco de horas."""
+        limit = self.logic.CQT_LIMIT_PERCENT
+        hours, n = weights.shape[0], network.size
+        max_hourly = np.zeros(hours)
+        worst_hourly = np.zeros(hours, dtype=np.intp)
+        peak = np.full(n, -np.inf)
+        peak_hour = np.zeros(n, dtype=np.intp)
+        over = np.zeros(n, dtype=np.intp)
+
+        for start in range(0, hours, chunk):
+            cqt = weights[start : start + chunk] @ basis  # (horas do bloco, n)
+            worst_hourly[start : start + len(cqt)] = cqt.argmax(axis=1)
+            max_hourly[start : start + len(cqt)] = cqt.max(axis=1)
+            block_peak = cqt.max(axis=0)
+            better = block_peak > peak
+            peak_hour[better] = start + cqt.argmax(axis=0)[better]
+            peak = np.maximum(peak, block_peak)
+            over += (cqt > limit).sum(axis=0)
+
+        logger.debug("Simulação horária CQT: %d horas × %d pontos", hours, n)
+        return TimeSeriesResult(
+            network=network,
+            limit=limit,
+            max_cqt_hourly=max_hourly,
+            worst_point_hourly=worst_hourly,
+            peak_cqt=np.where(np.isfinite(peak), peak, 0.0),
+            peak_hour=peak_hour,
+            hours_over_limit=over,
+        )
@@ -0,0 +1,184 @@
+"""
+Validação de topologia CQT em tempo linear com diagnóstico estruturado.
+
+``validate_topology`` percorre os trechos uma única vez e reporta todos os
+problemas de uma vez — pontos sem montante, montantes inexistentes, pontos
+duplicados, ciclos (com os pontos que os formam) e pontos inalcançáveis a
+partir do TRAFO — em vez de parar no primeiro erro.
+
+Todos os algoritmos são iterativos (BFS de Kahn para a ordem topológica e
+caminhada em ponteiros de montante para os ciclos), sem limite de recursão,
+e O(n) no número de trechos.
+"""
+
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+ROOT = "TRAFO"
+
+# Itens listados por categoria na mensagem de erro (o relatório completo fica em ``to_dict``).
+_MESSAGE_ITEMS = 5
+
+
+@dataclass
+class TopologyReport:
+    """Diagnóstico completo da topologia de uma rede CQT.
+
+    Attributes:
+        order: Pontos na ordem topológica (BFS a partir do TRAFO).
+        empty: Nenhum trecho fornecido.
+        root_missing: Ponto 'TRAFO' ausente.
+        missing_montante: Pontos (exceto TRAFO) sem montante definido.
+        unknown_montante: Ponto → montante que não existe como ponto.
+        duplicates: Ponto → número de trechos que o definem (apenas repetidos).
+        cycles: Ciclos encontrados, cada um como a lista de pontos na ordem do
+            percurso de montantes.
+        unreachable: Todos os pontos não alcançáveis a partir do TRAFO.
+    """
+
+    order: List[str] = field(default_factory=list)
+    empty: bool = False
+    root_missing: bool = False
+    missing_montante: List[str] = field(default_factory=list)
+    unknown_montante: Dict[str, str] = field(default_factory=dict)
+    duplicates: Dict[str, int] = field(default_factory=dict)
+    cycles: List[List[str]] = field(default_factory=list)
+    unreachable: List[str] = field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        """True se a rede for uma árvore enraizada no TRAFO."""
+        return not (self.empty or self.root_missing or self.missing_montante or self.unreachable)
+
+    def message(self) -> str:
+        """Mensagem de erro resumida (vazia se a topologia for válida).
+
+        Mantém as mensagens de ``CQTLogic.validate_and_sort`` e acrescenta os
+        pontos envolvidos.
+        """
+        if self.empty:
+            return "Nenhum dado fornecido."
+        if self.missing_montante:
+            if len(self.missing_montante) == 1:
+                return f"Ponto '{self.missing_montante[0]}' sem montante definido."
+            return f"{len(self.missing_montante)} pontos sem montante definido: {_preview(self.missing_montante)}."
+        if self.root_missing:
+            return "Ponto de origem 'TRAFO' não encontrado."
+        if not self.unreachable:
+            return ""
+
+        parts = []
+        if self.cycles:
+            cycles = [" → ".join(c + c[:1]) for c in self.cycles]
+            parts.append(f"{len(self.cycles)} ciclo(s): {_preview(cycles, sep='; ')}")
+        if self.unknown_montante:
+            orphans = [f"{p} (montante '{m}')" for p, m in self.unknown_montante.items()]
+            parts.append(f"montante inexistente: {_preview(orphans)}")
+        parts.append(f"{len(self.unreachable)} ponto(s) não alcançável(is) a partir do TRAFO")
+        return "Ciclo detectado ou pontos isolados na rede — " + "; ".join(parts) + "."
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Diagnóstico serializável (ex: resposta de API)."""
+        return {
+            "valid": self.valid,
+            "message": self.message(),
+            "missing_montante": list(self.missing_montante),
+            "unknown_montante": dict(self.unknown_montante),
+            "duplicates": dict(self.duplicates),
+            "cycles": [list(c) for c in self.cycles],
+            "unreachable": list(self.unreachable),
+        }
+
+
+def validate_topology(segments: List[Dict[str, Any]]) -> TopologyReport:
+    """Valida a topologia e calcula a ordem topológica em O(n).
+
+    Segue as convenções de ``CQTLogic``: pontos e montantes em maiúsculas, o
+    montante do TRAFO é ignorado e, para pontos repetidos, todos os trechos
+    precisam ser alcançáveis (o cálculo usa o último).
+
+    Args:
+        segments: Lista de dicionários com 'ponto' e 'montante'.
+
+    Returns:
+        ``TopologyReport`` com a ordem (se válida) e todos os problemas.
+    """
+    report = TopologyReport()
+    if not segments:
+        report.empty = True
+        return report
+
+    nodes: Dict[str, None] = {}  # conjunto ordenado
+    parent: Dict[str, str] = {}  # montante do último trecho de cada ponto
+    adj: Dict[str, List[str]] = defaultdict(list)
+    in_degree: Dict[str, int] = defaultdict(int)
+    count: Dict[str, int] = defaultdict(int)
+
+    for s in segments:
+        p, m = str(s["ponto"]).upper(), str(s["montante"]).upper()
+        nodes[p] = None
+        count[p] += 1
+        if p == ROOT:
+            continue
+        parent[p] = m
+        if not m:
+            report.missing_montante.append(p)
+            continue
+        adj[m].append(p)
+        in_degree[p] += 1
+
+    report.duplicates = {p: c for p, c in count.items() if c > 1}
+    report.unknown_montante = {p: m for p, m in parent.items() if m and m not in nodes}
+    report.root_missing = ROOT not in nodes
+
+    # Ordem topológica (Kahn/BFS): idêntica à de validate_and_sort
+    if not report.root_missing:
+        queue: deque[str] = deque([ROOT])
+        while queue:
+            u = queue.popleft()
+            report.order.append(u)
+            for v in adj[u]:
+                in_degree[v] -= 1
+                if in_degree[v] == 0:
+                    queue.append(v)
+
+    reached = set(report.order)
+    report.unreachable = [p for p in nodes if p not in reached]
+    report.cycles = _find_cycles(report.unreachable, parent, reached)
+    if not report.valid:
+        report.order = []
+    return report
+
+
+def _find_cycles(candidates: List[str], parent: Dict[str, str], reached: set) -> List[List[str]]:
+    """Encontra os ciclos do grafo de montantes entre os pontos não alcançados.
+
+    Cada ponto tem um único montante (o do último trecho), então o grafo é
+    funcional: basta seguir os ponteiros a partir de cada ponto ainda não
+    visitado, marcando o caminho atual. Cada ponto é visitado uma vez.
+    """
+    cycles: List[List[str]] = []
+    state: Dict[str, int] = {}  # 1 = no caminho atual, 2 = concluído
+    for start in candidates:
+        if start in state:
+            continue
+        path: List[str] = []
+        position: Dict[str, int] = {}
+        v = start
+        while v in parent and v not in reached and v not in state:
+            state[v] = 1
+            position[v] = len(path)
+            path.append(v)
+            v = parent[v]
+        if state.get(v) == 1:
+            cycles.append(path[position[v] :])
+        for u in path:
+            state[u] = 2
+    return cycles
+
+
+def _preview(items: List[str], sep: str = ", ") -> str:
+    shown = sep.join(items[:_MESSAGE_ITEMS])
+    extra = len(items) - _MESSAGE_ITEMS
+    return f"{shown} (+{extra})" if extra > 0 else shown
@@ -0,0 +1,190 @@
+"""
+Cálculo vetorizado da resultante de esforços para muitos postes.
+
+``calculate_pole_loads`` recebe os cabos de todos os postes numa tabela plana
+(poste, condutor, vão, ângulo, flecha) e reproduz
+``PoleLoadLogic.calculate_resultant`` em passes NumPy:
+
+1. trações resolvidas em bloco pelo índice do catálogo — método 'flecha'
+   (``p·L² / 8f``) com o peso de cada condutor distinto, método 'tabela'
+   com a tabela compilada de cada par (concessionária, condutor);
+2. componentes ``T·cos θ`` e ``T·sin θ`` de todos os cabos de uma vez;
+3. somas por poste com ``np.bincount`` e fator de segurança da condição.
+
+Postes com concessionária desconhecida ou cabo inválido não interrompem o
+lote: ficam com ``valid=False``, valores NaN e a mensagem em ``errors``.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .catalog import PoleLoadCatalogIndex
+
+# Fatores de segurança por condição de carga (mesmos de ``calculate_resultant``).
+SAFETY_FACTORS: Dict[str, float] = {"Normal": 1.0, "Vento Forte": 1.5, "Gelo": 2.0}
+
+# Peso usado para condutores fora do catálogo no método 'flecha'.
+DEFAULT_WEIGHT = 0.5
+
+# Menor flecha aceita no método 'flecha' em metros.
+MIN_SAG = 0.001
+
+
+@dataclass
+class PoleBatchResult:
+    """Resultado do cálculo de esforços em lote.
+
+    Attributes:
+        valid: True para os postes calculados com sucesso, forma ``(n_postes,)``.
+        resultant_force: Módulo da resultante com fator de segurança em daN.
+        resultant_angle: Ângulo da resultante em graus, em ``[0, 360)``.
+        total_x: Componente X da resultante com fator de segurança em daN.
+        total_y: Componente Y da resultante com fator de segurança em daN.
+        traction: Tração de cada cabo em daN, forma ``(n_cabos,)`` (NaN em postes inválidos).
+        errors: Índice do poste → mensagem de erro.
+    """
+
+    valid: NDArray[np.bool_]
+    resultant_force: NDArray[np.float64]
+    resultant_angle: NDArray[np.float64]
+    total_x: NDArray[np.float64]
+    total_y: NDArray[np.float64]
+    traction: NDArray[np.float64]
+    errors: Dict[int, str]
+
+    @property
+    def size(self) -> int:
+        """Número de postes do lote."""
+        return int(self.valid.size)
+
+
+def calculate_pole_loads(
+    pole: ArrayLike,
+    conductor: Sequence[str],
+    span: ArrayLike,
+    angle: ArrayLike,
+    sag: ArrayLike,
+    concessionaires: Sequence[str],
+    conditions: Sequence[str],
+    catalog: PoleLoadCatalogIndex,
+) -> PoleBatchResult:
+    """Calcula a resultante de esforços de todos os postes.
+
+    Args:
+        pole: Índice do poste (base 0) de cada cabo.
+        conductor: Nome do condutor de cada cabo.
+        span: Vão de cada cabo em metros (≥ 0).
+        angle: Ângulo de cada cabo em graus.
+        sag: Flecha de cada cabo em metros (usada no método 'flecha').
+        concessionaires: Concessionária de cada poste.
+        conditions: Condição de carga de cada poste ('Normal', 'Vento Forte', 'Gelo').
+        catalog: Índice do catálogo com métodos, pesos e tabelas de tração.
+
+    Returns:
+        ``PoleBatchResult`` com arrays paralelos por poste.
+
+    Raises:
+        ValueError: Se as colunas da tabela de cabos tiverem tamanhos diferentes,
+            ou se ``conditions`` não tiver um elemento por poste.
+    """
+    n = len(concessionaires)
+    idx = np.asarray(pole, dtype=np.int64).ravel()
+    L = np.asarray(span, dtype=np.float64).ravel()
+    theta = np.radians(np.asarray(angle, dtype=np.float64).ravel())
+    f = np.asarray(sag, dtype=np.float64).ravel()
+    names = np.asarray(conductor, dtype=object).ravel()
+    if not (idx.size == L.size == theta.size == f.size == names.size):
+        raise ValueError("Colunas da tabela de cabos devem ter o mesmo tamanho.")
+    if len(conditions) != n:
+        raise ValueError(f"Informe uma condição por poste ({n} postes, {len(conditions)} condições).")
+    if idx.size and (idx.min() < 0 or idx.max() >= n):
+        raise ValueError(f"Índice de poste fora do intervalo 0–{n - 1}.")
+
+    errors: Dict[int, str] = {}
+    methods: List[str] = []
+    for i, name in enumerate(concessionaires):
+        try:
+            methods.append(catalog.method(name))
+        except KeyError as e:
+            methods.append("")
+            errors[i] = str(e.args[0])
+    pole_method = np.asarray(methods, dtype=object)
+    by_sag = (pole_method == "flecha")[idx]
+
+    # Cabos inválidos invalidam o poste inteiro
+    bad = ~np.isfinite(L) | (L < 0) | ~np.isfinite(theta) | (by_sag & ~(f >= MIN_SAG))
+    for k in np.flatnonzero(bad):
+        errors.setdefault(int(idx[k]), f"Cabo {k + 1}: vão, ângulo ou flecha inválidos.")
+
+    traction = np.zeros(idx.size)
+    _sag_tractions(traction, by_sag, names, L, f, catalog)
+    _table_tractions(traction, ~by_sag, idx, names, L, np.asarray(concessionaires, dtype=object), catalog)
+
+    valid = np.ones(n, dtype=bool)
+    if errors:
+        valid[list(errors)] = False
+    traction[~valid[idx]] = np.nan
+
+    sum_x = np.bincount(idx, weights=np.nan_to_num(traction * np.cos(theta)), minlength=n)
+    sum_y = np.bincount(idx, weights=np.nan_to_num(traction * np.sin(theta)), minlength=n)
+    factor = np.array([SAFETY_FACTORS.get(c, 1.0) for c in conditions], dtype=np.float64)
+    angle_res = np.degrees(np.arctan2(sum_y, sum_x))
+    angle_res = np.where(angle_res < 0, angle_res + 360.0, angle_res)
+
+    def masked(values: NDArray[np.float64]) -> NDArray[np.float64]:
+        return np.where(valid, values, np.nan)
+
+    return PoleBatchResult(
+        valid=valid,
+        resultant_force=masked(np.hypot(sum_x, sum_y) * factor),
+        resultant_angle=masked(angle_res),
+        total_x=masked(sum_x * factor),
+        total_y=masked(sum_y * factor),
+        traction=traction,
+        errors=dict(sorted(errors.items())),
+    )
+
+
+def _sag_tractions(
+    out: NDArray[np.float64],
+    mask: NDArray[np.bool_],
+    names: NDArray[np.object_],
+    L: NDArray[np.float64],
+    f: NDArray[np.float64],
+    catalog: PoleLoadCatalogIndex,
+) -> None:
+    """Método 'flecha': ``T = p·L² / 8f`` com o peso de cada condutor distinto."""
+    sel = np.flatnonzero(mask)
+    if not sel.size:
+        return
+    unique, inverse = np.unique(names[sel].astype(str), return_inverse=True)
+    weights = np.array([catalog.weights.get(name, DEFAULT_WEIGHT) for name in unique], dtype=np.float64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        out[sel] = weights[inverse] * L[sel] ** 2 / (8.0 * f[sel])
+
+
+def _table_tractions(
+    out: NDArray[np.float64],
+    mask: NDArray[np.bool_],
+    idx: NDArray[np.int64],
+    names: NDArray[np.object_],
+    L: NDArray[np.float64],
+    concessionaires: NDArray[np.object_],
+    catalog: PoleLoadCatalogIndex,
+) -> None:
+    """Método 'tabela': ``LoadTable.traction`` de todos os vãos de cada par (concessionária, condutor)."""
+    sel = np.flatnonzero(mask)
+    if not sel.size:
+        return
+    conc_names, conc_code = np.unique(concessionaires.astype(str), return_inverse=True)
+    cond_names, cond_code = np.unique(names[sel].astype(str), return_inverse=True)
+    pair_code = conc_code[idx[sel]] * cond_names.size + cond_code
+    unique, inverse = np.unique(pair_code, return_inverse=True)
+    order = np.argsort(inverse, kind="stable")
+    groups = np.split(sel[order], np.cumsum(np.bincount(inverse, minlength=unique.size))[:-1])
+    for code, group in zip(unique, groups):
+        table = catalog.load_table(str(conc_names[code // cond_names.size]), str(cond_names[code % cond_names.size]))
+        out[group] = table.traction(L[group])
@@ -0,0 +1,292 @@
+"""
+Índice em memória do catálogo usado no cálculo de esforços em postes.
+
+``calculate_resultant`` precisa, para cada cabo, do método da concessionária,
+do peso linear do condutor (método 'flecha') ou da tabela vão × tração
+(método 'tabela'). Em vez de uma consulta SQL por cabo, essas três tabelas
+são lidas uma única vez por banco e compartilhadas entre todas as instâncias
+de ``PoleLoadLogic`` do processo (GUI e API): um cálculo de poste não toca o
+SQLite.
+
+Os postes ficam em ``PoleCatalog``: cargas nominais ordenadas por material,
+com uma busca binária por material para sugerir o poste de cada resultante
+(ou de um array de resultantes).
+
+As tabelas vão × tração são compiladas na leitura em ``LoadTable``: arrays
+NumPy ordenados por vão, consultados com ``np.interp`` (um vão ou muitos
+de uma vez).
+
+``PoleLoadLogic.catalog`` usa ``refresh`` a cada cálculo: uma única consulta
+às revisões das tabelas (``catalog_revisions``, mantida por triggers) decide
+se o índice ainda vale, e ele é reconstruído quando o catálogo foi alterado —
+inclusive por outro processo (ex: configurações na GUI com a API em execução).
+``invalidate`` descarta o índice explicitamente.
+"""
+
+import bisect
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from database.db_manager import DatabaseManager
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_TABLES: Tuple[str, ...] = ("concessionaires", "conductors", "load_tables", "poles")
+
+
+@dataclass(frozen=True)
+class LoadTable:
+    """Tabela vão × tração de um condutor, ordenada por vão.
+
+    Attributes:
+        spans: Vãos tabelados em metros, crescentes.
+        loads: Tração em daN de cada vão.
+    """
+
+    spans: NDArray[np.float64]
+    loads: NDArray[np.float64]
+
+    @classmethod
+    def from_mapping(cls, table: Mapping[float, float]) -> "LoadTable":
+        """Compila um dicionário {vão_m: tração_daN}."""
+        items = sorted(table.items())
+        spans = np.array([k for k, _ in items], dtype=np.float64)
+        loads = np.array([v for _, v in items], dtype=np.float64)
+        spans.flags.writeable = False
+        loads.flags.writeable = False
+        return cls(spans=spans, loads=loads)
+
+    @property
+    def fixed_load(self) -> Optional[float]:
+        """Tração fixa (cadastrada no vão 0), independente do vão; None se não houver."""
+        i = int(np.searchsorted(self.spans, 0.0))
+        if i < self.spans.size and self.spans[i] == 0:
+            return float(self.loads[i])
+        return None
+
+    def interpolate(self, span: ArrayLike) -> Union[float, NDArray[np.float64]]:
+        """Interpolação linear; fora da tabela vale a tração do vão extremo (0 se vazia)."""
+        if not self.spans.size:
+            return np.zeros_like(span, dtype=np.float64) if np.ndim(span) else 0.0
+        values = np.interp(span, self.spans, self.loads)
+        return values if np.ndim(values) else float(values)
+
+    def traction(self, span: ArrayLike) -> Union[float, NDArray[np.float64]]:
+        """Tração para o(s) vão(s): a tração fixa se cadastrada, senão ``interpolate``."""
+        fixed = self.fixed_load
+        if fixed is None:
+            return self.interpolate(span)
+        return np.full(np.shape(span), fixed) if np.ndim(span) else fixed
+
+
+EMPTY_LOAD_TABLE = LoadTable(np.empty(0), np.empty(0))
+
+
+@dataclass(frozen=True)
+class PoleCatalog:
+    """Postes por material, ordenados por carga nominal.
+
+    Attributes:
+        materials: Materiais em ordem alfabética.
+        loads: Cargas nominais em daN de cada material, crescentes.
+        descriptions: Descrições dos postes, paralelas a ``loads``.
+    """
+
+    materials: Tuple[str, ...]
+    loads: Tuple[NDArray[np.float64], ...]
+    descriptions: Tuple[Tuple[str, ...], ...]
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Tuple[str, str, Optional[float]]]) -> "PoleCatalog":
+        """Agrupa linhas ``(material, descrição, carga)`` já ordenadas por carga dentro do material."""
+        grouped: Dict[str, List[Tuple[float, str]]] = {}
+        for material, description, load in rows:
+            if load is not None:
+                grouped.setdefault(material, []).append((float(load), description))
+        materials = tuple(sorted(grouped))
+        loads = []
+        for m in materials:
+            arr = np.array([load for load, _ in grouped[m]], dtype=np.float64)
+            arr.flags.writeable = False
+            loads.append(arr)
+        descriptions = tuple(tuple(d for _, d in grouped[m]) for m in materials)
+        return cls(materials, tuple(loads), descriptions)
+
+    def suggest(self, force: float) -> List[Dict[str, Any]]:
+        """Poste de menor carga nominal ≥ ``force`` de cada material, do mais leve ao mais pesado.
+
+        Empates de carga entre materiais seguem a ordem alfabética do material.
+        """
+        chosen: List[Tuple[float, str, str]] = []
+        if np.isnan(force):
+            return []
+        for m, (material, loads) in enumerate(zip(self.materials, self.loads)):
+            i = bisect.bisect_left(loads, force)
+            if i < loads.size:
+                chosen.append((loads[i], material, self.descriptions[m][i]))
+        chosen.sort(key=lambda c: (c[0], c[1]))
+        return [{"material": mat, "description": desc, "load": float(load)} for load, mat, desc in chosen]
+
+    def suggest_many(self, forces: ArrayLike) -> List[List[Dict[str, Any]]]:
+        """``suggest`` para um array de forças: uma busca ``searchsorted`` por material."""
+        f = np.asarray(forces, dtype=np.float64).ravel()
+        if not self.materials:
+            return [[] for _ in range(f.size)]
+        # Carga escolhida por (força, material); inf onde nenhum poste suporta a força
+        pos = np.empty((f.size, len(self.materials)), dtype=np.int64)
+        chosen = np.full(pos.shape, np.inf)
+        for m, loads in enumerate(self.loads):
+            pos[:, m] = np.searchsorted(loads, f, side="left")
+            ok = pos[:, m] < loads.size
+            chosen[ok, m] = loads[pos[ok, m]]
+        # Ordenação estável por carga mantém a ordem alfabética dos materiais nos empates
+        order = np.argsort(chosen, axis=1, kind="stable")
+        out: List[List[Dict[str, Any]]] = []
+        for row_order, row_load, row_pos in zip(order.tolist(), chosen.tolist(), pos.tolist()):
+            out.append(
+                [
+                    {
+                        "material": self.materials[m],
+                        "description": self.descriptions[m][row_pos[m]],
+                        "load": row_load[m],
+                    }
+                    for m in row_order
+                    if row_load[m] != np.inf
+                ]
+            )
+        return out
+
+
+@dataclass(frozen=True)
+class PoleLoadCatalogIndex:
+    """Dados de catálogo de um banco, prontos para consulta sem SQL.
+
+    Attributes:
+        methods: Concessionária → método de cálculo ('flecha' ou 'tabela').
+        weights: Condutor → peso linear (``weight_kg_m``).
+        load_tables: Concessionária → condutor → tabela vão × tração compilada.
+        poles: Postes por material, ordenados por carga nominal.
+        revisions: Revisões das tabelas do catálogo na leitura.
+    """
+
+    methods: Dict[str, str]
+    weights: Dict[str, Optional[float]]
+    load_tables: Dict[str, Dict[str, LoadTable]]
+    poles: PoleCatalog
+    revisions: Tuple[int, ...]
+
+    def method(self, concessionaire: str) -> str:
+        """Método de cálculo da concessionária.
+
+        Raises:
+            KeyError: Se a concessionária não estiver cadastrada.
+        """
+        try:
+            return self.methods[concessionaire]
+        except KeyError:
+            raise KeyError(f"Concessionária '{concessionaire}' não encontrada no banco de dados") from None
+
+    def load_table(self, concessionaire: str, conductor: str) -> LoadTable:
+        """Tabela vão × tração do condutor na concessionária (vazia se não cadastrada)."""
+        return self.load_tables.get(concessionaire, {}).get(conductor, EMPTY_LOAD_TABLE)
+
+
+class PoleLoadCatalogCache:
+    """Cache thread-safe de ``PoleLoadCatalogIndex`` por caminho de banco de dados."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[str, PoleLoadCatalogIndex] = {}
+
+    def get(self, db: DatabaseManager) -> PoleLoadCatalogIndex:
+        """Índice do banco, lido do SQLite apenas na primeira chamada após invalidação.
+
+        Raises:
+            Exception: Propaga erros de acesso ao banco para o chamador decidir o fallback.
+        """
+        with self._lock:
+            index = self._entries.get(db.db_path)
+        if index is None:
+            index = self._build(db)
+            with self._lock:
+                self._entries[db.db_path] = index
+        return index
+
+    def refresh(self, db: DatabaseManager) -> PoleLoadCatalogIndex:
+        """Reconstrói o índice se alguma tabela do catálogo mudou desde a leitura."""
+        with self._lock:
+            index = self._entries.get(db.db_path)
+        if index is not None and index.revisions == self._revisions(db):
+            return index
+        self.invalidate(db.db_path)
+        return self.get(db)
+
+    def invalidate(self, db_path: Optional[str] = None) -> None:
+        """Descarta o índice.
+
+        Args:
+            db_path: Banco a invalidar. Se None, limpa o cache inteiro.
+        """
+        with self._lock:
+            if db_path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(db_path, None)
+
+    @staticmethod
+    def _revisions(db: DatabaseManager) -> Tuple[int, ...]:
+        """Revisões das tabelas do catálogo em uma única consulta (0 se não rastreada)."""
+        placeholders = ", ".join("?" * len(_TABLES))
+        conn = db.get_connection()
+        try:
+            rows = conn.execute(
+                f"SELECT table_name, revision FROM catalog_revisions WHERE table_name IN ({placeholders})", _TABLES
+            ).fetchall()
+        finally:
+            conn.close()
+        found = {name: int(revision) for name, revision in rows}
+        return tuple(found.get(t, 0) for t in _TABLES)
+
+    @classmethod
+    def _build(cls, db: DatabaseManager) -> PoleLoadCatalogIndex:
+        # Revisões lidas antes dos dados: uma alteração concorrente deixa o índice "antigo" para o refresh
+        revisions = cls._revisions(db)
+        conn = db.get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT name, method FROM concessionaires")
+            methods = {r[0]: r[1] for r in cursor.fetchall()}
+            cursor.execute("SELECT name, weight_kg_m FROM conductors")
+            weights = {r[0]: r[1] for r in cursor.fetchall()}
+            cursor.execute("SELECT concessionaire, conductor_name, span_m, load_daN FROM load_tables ORDER BY id")
+            rows = cursor.fetchall()
+            cursor.execute("SELECT material, description, nominal_load_daN FROM poles ORDER BY nominal_load_daN, id")
+            pole_rows = cursor.fetchall()
+        finally:
+            conn.close()
+
+        raw: Dict[str, Dict[str, Dict[float, float]]] = {}
+        for concessionaire, conductor, span, load in rows:
+            raw.setdefault(concessionaire, {}).setdefault(conductor, {})[span] = load
+        tables = {
+            concessionaire: {conductor: LoadTable.from_mapping(table) for conductor, table in by_conductor.items()}
+            for concessionaire, by_conductor in raw.items()
+        }
+
+        logger.debug(
+            "Catálogo de esforços carregado de %s: %d condutores, %d linhas de tabela, %d postes",
+            db.db_path,
+            len(weights),
+            len(rows),
+            len(pole_rows),
+        )
+        return PoleLoadCatalogIndex(methods, weights, tables, PoleCatalog.from_rows(pole_rows), revisions)
+
+
+# Instância compartilhada por todo o processo.
+POLE_LOAD_CATALOG = PoleLoadCatalogCache()
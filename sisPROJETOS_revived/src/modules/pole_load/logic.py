@@ -1,10 +1,13 @@
 import math
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from database.db_manager import DatabaseManager
 from utils.logger import get_logger
 from utils.sanitizer import sanitize_numeric, sanitize_string
 
+from .batch import SAFETY_FACTORS, PoleBatchResult, calculate_pole_loads
+from .catalog import POLE_LOAD_CATALOG, LoadTable, PoleLoadCatalogIndex
+
 logger = get_logger(__name__)
 
 
@@ -16,9 +19,13 @@ class PoleLoadLogic:
     padrões das concessionárias Light e Enel.
     """
 
-    def __init__(self) -> None:
-        """Inicializa a lógica de cálculo de esforços e carrega dados."""
-        self.db = DatabaseManager()
+    def __init__(self, db: Optional[DatabaseManager] = None) -> None:
+        """Inicializa a lógica de cálculo de esforços e carrega dados.
+
+        Args:
+            db: Banco do catálogo (padrão: banco do usuário).
+        """
+        self.db = db or DatabaseManager()
         self.DADOS_POSTES_NOMINAL: Dict[str, Dict[str, float]] = {}
         self.DADOS_CONCESSIONARIAS: Dict[str, Any] = {}
         self.load_poles()
@@ -66,6 +73,18 @@ class PoleLoadLogic:
                 raise
             raise KeyError(f"Erro ao buscar concessionária '{name}': {str(e)}")
 
+    def catalog(self) -> PoleLoadCatalogIndex:
+        """Índice em memória de métodos, pesos, tabelas de tração e postes (compartilhado no processo).
+
+        Confere as revisões do catálogo a cada chamada (uma consulta) e reconstrói
+        o índice se outro processo ou conexão alterou as tabelas.
+        """
+        return POLE_LOAD_CATALOG.refresh(self.db)
+
+    def reload_catalog(self) -> None:
+        """Descarta o índice do catálogo após alterações em condutores ou tabelas de tração."""
+        POLE_LOAD_CATALOG.invalidate(self.db.db_path)
+
     def load_poles(self) -> None:
         """Carrega postes do banco de dados SQLite."""
         try:
@@ -114,27 +133,15 @@ class PoleLoadLogic:
             vao: Vão a interpolar em metros.
 
         Returns:
-            Tração interpolada em daN.
+            Tração interpolada em daN (tração do vão extremo fora da tabela).
+
+        Note:
+            Para consultas repetidas use a tabela compilada do catálogo
+            (``LoadTable``), que não reordena os vãos a cada chamada.
         """
         if not isinstance(tabela, dict):
             return 0
-        vaos_conhecidos = sorted(tabela.keys())
-        if not vaos_conhecidos:
-            return 0
-
-        if vao in vaos_conhecidos:
-            return tabela[vao]
-        if vao < vaos_conhecidos[0]:
-            return tabela[vaos_conhecidos[0]]
-        if vao > vaos_conhecidos[-1]:
-            return tabela[vaos_conhecidos[-1]]
-
-        for i in range(len(vaos_conhecidos) - 1):
-            vao_inf, vao_sup = vaos_conhecidos[i], vaos_conhecidos[i + 1]
-            if vao_inf < vao < vao_sup:
-                tracao_inf, tracao_sup = tabela[vao_inf], tabela[vao_sup]
-                return tracao_inf + (tracao_sup - tracao_inf) * ((vao - vao_inf) / (vao_sup - vao_inf))
-        return 0  # pragma: no cover
+        return LoadTable.from_mapping(tabela).interpolate(vao)
 
     def calculate_resultant(
         self,
@@ -161,15 +168,69 @@ class PoleLoadLogic:
         except ValueError as e:
             raise KeyError(str(e)) from e
 
-        metodo = self.get_concessionaire_method(concessionaria)
-        fator_seguranca = {"Normal": 1.0, "Vento Forte": 1.5, "Gelo": 2.0}.get(condicao, 1.0)
+        soma_vetor_x, soma_vetor_y, details = self._resolve_cables(concessionaria, cabos_input)
+        result = self._apply_condition(soma_vetor_x, soma_vetor_y, condicao)
+        result["vectors"] = details
+        return result
+
+    def calculate_condition_sweep(
+        self,
+        concessionaria: str,
+        cabos_input: List[Dict[str, Any]],
+        condicoes: Optional[Sequence[str]] = None,
+    ) -> Dict[str, Any]:
+        """Calcula a resultante de um poste em várias condições de carga de uma só vez.
+
+        As trações dos cabos não dependem da condição — só o fator de
+        segurança muda —, então são resolvidas uma única vez e cada condição
+        apenas escala a soma vetorial.
+
+        Args:
+            concessionaria: Nome da concessionária (ex: 'Light', 'Enel').
+            cabos_input: Lista de cabos com campos (condutor, vao, angulo, flecha).
+            condicoes: Condições a avaliar (padrão: todas de ``SAFETY_FACTORS``).
+
+        Returns:
+            Dicionário com:
+                - ``conditions``: um item por condição com ``condicao``,
+                  ``fator_seguranca``, ``resultant_force``, ``resultant_angle``,
+                  ``total_x`` e ``total_y``
+                - ``governing``: item da condição de maior resultante (a
+                  primeira em caso de empate)
+                - ``vectors``: detalhes de cada cabo (sem fator de segurança)
+
+        Raises:
+            KeyError: Se a concessionária não for encontrada ou entrada inválida.
+        """
+        try:
+            concessionaria = sanitize_string(concessionaria, max_length=100, allow_empty=False)
+            names = [
+                sanitize_string(c, max_length=50, allow_empty=False)
+                for c in (SAFETY_FACTORS if condicoes is None else condicoes)
+            ]
+        except ValueError as e:
+            raise KeyError(str(e)) from e
+        if not names:
+            raise KeyError("Informe ao menos uma condição de carga.")
+
+        soma_vetor_x, soma_vetor_y, details = self._resolve_cables(concessionaria, cabos_input)
+        conditions = [{"condicao": name, **self._apply_condition(soma_vetor_x, soma_vetor_y, name)} for name in names]
+        governing = max(conditions, key=lambda c: c["resultant_force"])
+        return {"conditions": conditions, "governing": governing, "vectors": details}
+
+    def _resolve_cables(
+        self, concessionaria: str, cabos_input: List[Dict[str, Any]]
+    ) -> Tuple[float, float, List[Dict[str, Any]]]:
+        """Trações e componentes de cada cabo; retorna (soma_x, soma_y, detalhes) sem fator de segurança."""
+        try:
+            catalog = self.catalog()
+        except Exception as e:
+            raise KeyError(f"Erro ao buscar concessionária '{concessionaria}': {str(e)}") from e
+        metodo = catalog.method(concessionaria)
 
         soma_vetor_x, soma_vetor_y = 0.0, 0.0
         details: List[Dict[str, Any]] = []
 
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-
         for cable in cabos_input:
             tracao = 0
             condutor = sanitize_string(str(cable.get("condutor", "")), max_length=100, allow_empty=True)
@@ -178,22 +239,12 @@ class PoleLoadLogic:
 
             if metodo == "flecha":
                 flecha = sanitize_numeric(cable.get("flecha", 1.0), min_val=0.001, default=1.0)
-                # Fetch weight from conductors table
-                cursor.execute("SELECT weight_kg_m FROM conductors WHERE name=?", (condutor,))
-                row = cursor.fetchone()
-                p_daN_m = row[0] if row else 0.5
+                # Peso do condutor no catálogo (0.5 se não cadastrado)
+                p_daN_m = catalog.weights.get(condutor, 0.5)
                 tracao = (p_daN_m * (vao**2)) / (8 * flecha)
             else:
-                # Enel style: table lookup or fixed
-                cursor.execute(
-                    "SELECT span_m, load_daN FROM load_tables WHERE concessionaire=? AND conductor_name=?",
-                    (concessionaria, condutor),
-                )
-                lookup = {r[0]: r[1] for r in cursor.fetchall()}
-                if 0 in lookup:  # Fixed tracion
-                    tracao = lookup[0]
-                else:
-                    tracao = self.interpolar(lookup, vao)
+                # Enel style: tabela compilada (tração fixa no vão 0 ou interpolada)
+                tracao = catalog.load_table(concessionaria, condutor).traction(vao)
 
             rad = math.radians(angulo)
             fx = tracao * math.cos(rad)
@@ -202,26 +253,77 @@ class PoleLoadLogic:
             soma_vetor_y += fy
             details.append({"name": condutor, "tracao": tracao, "angle": angulo, "fx": fx, "fy": fy})
 
-        conn.close()
+        return soma_vetor_x, soma_vetor_y, details
 
+    @staticmethod
+    def _apply_condition(soma_vetor_x: float, soma_vetor_y: float, condicao: str) -> Dict[str, Any]:
+        """Resultante com o fator de segurança da condição (1.0 se desconhecida)."""
+        fator_seguranca = SAFETY_FACTORS.get(condicao, 1.0)
         mag = math.sqrt(soma_vetor_x**2 + soma_vetor_y**2) * fator_seguranca
         angle_res = math.degrees(math.atan2(soma_vetor_y, soma_vetor_x))
         if angle_res < 0:
             angle_res += 360
 
         return {
+            "fator_seguranca": fator_seguranca,
             "resultant_force": mag,
             "resultant_angle": angle_res,
-            "vectors": details,
             "total_x": soma_vetor_x * fator_seguranca,
             "total_y": soma_vetor_y * fator_seguranca,
         }
 
+    def calculate_batch(
+        self,
+        pole: Sequence[int],
+        conductor: Sequence[str],
+        span: Sequence[float],
+        angle: Sequence[float],
+        sag: Sequence[float],
+        concessionaires: Sequence[str],
+        conditions: Sequence[str],
+    ) -> PoleBatchResult:
+        """Calcula a resultante de muitos postes a partir de uma tabela plana de cabos.
+
+        Mesmo resultado de ``calculate_resultant`` por poste, em passes NumPy
+        (ver ``modules.pole_load.batch``).
+
+        Args:
+            pole: Índice do poste (base 0) de cada cabo.
+            conductor: Nome do condutor de cada cabo.
+            span: Vão de cada cabo em metros.
+            angle: Ângulo de cada cabo em graus.
+            sag: Flecha de cada cabo em metros (método 'flecha').
+            concessionaires: Concessionária de cada poste.
+            conditions: Condição de carga de cada poste.
+
+        Returns:
+            ``PoleBatchResult`` com arrays por poste e erros individuais.
+
+        Raises:
+            KeyError: Se o catálogo não puder ser lido.
+            ValueError: Se as colunas tiverem tamanhos incompatíveis.
+        """
+        try:
+            catalog = self.catalog()
+        except Exception as e:
+            raise KeyError(f"Erro ao ler o catálogo de esforços: {str(e)}") from e
+        names = [self._clean_name(c, 100) for c in concessionaires]
+        conds = [self._clean_name(c, 50) for c in conditions]
+        conductors = [sanitize_string(str(c), max_length=100, allow_empty=True) for c in conductor]
+        return calculate_pole_loads(pole, conductors, span, angle, sag, names, conds, catalog)
+
+    @staticmethod
+    def _clean_name(value: Any, max_length: int) -> str:
+        try:
+            return sanitize_string(value, max_length=max_length, allow_empty=False)
+        except ValueError:
+            return ""
+
     def suggest_pole(self, resultant_force: float) -> List[Dict[str, Any]]:
         """Sugere o poste mais adequado para a carga calculada.
 
         Seleciona o poste de menor carga nominal que suporte a resultante,
-        por material, conforme NBR 8451.
+        por material, conforme NBR 8451 (busca binária no catálogo em memória).
 
         Args:
             resultant_force: Força resultante calculada em daN.
@@ -229,25 +331,15 @@ class PoleLoadLogic:
         Returns:
             Lista de postes sugeridos, um por material.
         """
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT material, description, nominal_load_daN
-            FROM poles
-            WHERE nominal_load_daN >= ?
-            ORDER BY nominal_load_daN ASC, material ASC
-        """,
-            (resultant_force,),
-        )
-
-        candidates = cursor.fetchall()
-        conn.close()
-
-        # Pick one per material
-        best_per_material: Dict[str, Dict[str, Any]] = {}
-        for c in candidates:
-            if c[0] not in best_per_material:
-                best_per_material[c[0]] = {"material": c[0], "description": c[1], "load": c[2]}
-
-        return list(best_per_material.values())
+        return self.catalog().poles.suggest(resultant_force)
+
+    def suggest_poles(self, resultant_forces: Sequence[float]) -> List[List[Dict[str, Any]]]:
+        """Sugere postes para várias resultantes de uma vez (dimensionamento de rede).
+
+        Args:
+            resultant_forces: Forças resultantes em daN.
+
+        Returns:
+            Uma lista de sugestões por força, no formato de ``suggest_pole``.
+        """
+        return self.catalog().poles.suggest_many(resultant_forces)
@@ -6,6 +6,7 @@ import customtkinter as ctk
 import styles
 from __version__ import __version__
 from database.db_manager import DatabaseManager
+from modules.pole_load.catalog import POLE_LOAD_CATALOG
 from styles import DesignSystem
 from utils.update_checker import UpdateChecker
 
@@ -271,6 +272,8 @@ class SettingsGUI(ctk.CTkFrame):
             data = {"name": name, "weight": float(weight), "breaking": float(load) if load else 0}
             success, msg = self.db.add_conductor(data)
             if success:
+                # Catálogo do cálculo de esforços (pesos e postes) é mantido em memória
+                POLE_LOAD_CATALOG.invalidate(self.db.db_path)
                 messagebox.showinfo("Sucesso", msg)
                 self.refresh_conductors()
             else:
@@ -298,6 +301,7 @@ class SettingsGUI(ctk.CTkFrame):
             }
             success, msg = self.db.add_pole(data)
             if success:
+                POLE_LOAD_CATALOG.invalidate(self.db.db_path)
                 messagebox.showinfo("Sucesso", msg)
                 self.refresh_poles()
             else:
@@ -1,11 +1,19 @@
+import hashlib
 import io
 import math
 import os
 from typing import Any, Iterable, Tuple
 
 import ezdxf
+import numpy as np
 import pandas as pd
 
+from utils.memo import CacheStats, LRUCache
+
+# In-memory DXFs cached by curve (hash of the points) and rendered sag label.
+DXF_BUFFER_CACHE_SIZE = 64
+_buffer_cache: LRUCache[bytes] = LRUCache(DXF_BUFFER_CACHE_SIZE)
+
 
 def _validate_output_path(filepath: str) -> str:
     """Validates and resolves a DXF output filepath to prevent path traversal.
@@ -31,6 +39,13 @@ def _validate_output_path(filepath: str) -> str:
     return resolved
 
 
+def _as_float_array(values: Iterable[float]) -> np.ndarray:
+    """Contiguous float64 copy of ``values`` (generators are consumed once)."""
+    if not isinstance(values, (np.ndarray, list, tuple)):
+        values = list(values)
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
 class DXFManager:
     @staticmethod
     def create_catenary_dxf(filepath: str, x_vals: Iterable[float], y_vals: Iterable[float], sag: float) -> None:
@@ -84,6 +99,9 @@ class DXFManager:
         suitable for API responses (e.g., Base64 encoding). No filesystem access is
         performed.
 
+        Identical curves (same points and same rendered sag label) are served
+        from an LRU cache instead of being rendered again.
+
         Args:
             x_vals: Iterable of X coordinates (horizontal span, in metres).
             y_vals: Iterable of Y coordinates (height above reference, in metres).
@@ -92,6 +110,27 @@ class DXFManager:
         Returns:
             bytes: Raw DXF file content (UTF-8 encoded text format).
         """
+        x = _as_float_array(x_vals)
+        y = _as_float_array(y_vals)
+        digest = hashlib.sha256()
+        digest.update(x.tobytes())
+        digest.update(y.tobytes())
+        key = (digest.hexdigest(), x.size, f"{sag:.2f}")
+        return _buffer_cache.get_or_compute(key, lambda: DXFManager._render_catenary_buffer(x, y, sag))
+
+    @staticmethod
+    def buffer_cache_stats() -> CacheStats:
+        """Returns hit/miss counters of the in-memory DXF cache."""
+        return _buffer_cache.stats()
+
+    @staticmethod
+    def clear_buffer_cache() -> None:
+        """Discards all cached in-memory DXFs."""
+        _buffer_cache.clear()
+
+    @staticmethod
+    def _render_catenary_buffer(x_vals: Iterable[float], y_vals: Iterable[float], sag: float) -> bytes:
+        """Renders the catenary DXF into memory (uncached)."""
         doc = ezdxf.new("R2010")
 
         doc.layers.new("CATENARY_CURVE", dxfattribs={"color": 3, "lineweight": 35})
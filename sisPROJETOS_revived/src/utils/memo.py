@@ -0,0 +1,119 @@
+"""
+Cache LRU em memória com limite de tamanho e contadores de acerto/falha.
+
+Usado para memorizar cálculos determinísticos repetidos com as mesmas
+entradas (ex: o mesmo vão e condutor reenviados por clientes BIM para
+vários postes ou a cada atualização de pré-visualização).
+
+Responsabilidade Única: armazenamento LRU thread-safe.
+Zero dependências externas (apenas stdlib).
+
+Uso:
+    from utils.memo import LRUCache
+
+    cache = LRUCache(maxsize=256)
+    value = cache.get_or_compute(key, lambda: expensive(*args))
+    cache.stats().hit_rate
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Contadores de um ``LRUCache``.
+
+    Attributes:
+        hits: Consultas atendidas pelo cache.
+        misses: Consultas que exigiram cálculo.
+        size: Entradas armazenadas.
+        maxsize: Limite de entradas (0 = cache desativado).
+    """
+
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fração de consultas atendidas pelo cache (0.0 sem consultas)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class LRUCache(Generic[V]):
+    """Cache LRU thread-safe com número máximo de entradas."""
+
+    def __init__(self, maxsize: int = 256) -> None:
+        """Inicializa o cache.
+
+        Args:
+            maxsize: Máximo de entradas; ao exceder, a menos usada recentemente
+                é descartada. 0 desativa o cache (toda consulta é uma falha).
+
+        Raises:
+            ValueError: Se ``maxsize`` for negativo.
+        """
+        if maxsize < 0:
+            raise ValueError("maxsize não pode ser negativo.")
+        self.maxsize = int(maxsize)
+        self._data: "OrderedDict[Hashable, V]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Valor armazenado para ``key`` (None se ausente), contando acerto ou falha."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return None
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: V) -> None:
+        """Armazena ``value``, descartando as entradas mais antigas acima do limite."""
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], V]) -> V:
+        """Valor do cache ou, em caso de falha, ``compute()`` armazenado.
+
+        O cálculo é feito fora do lock: chamadas concorrentes com a mesma
+        chave podem calcular o valor mais de uma vez, mas nunca bloqueiam
+        outras chaves.
+        """
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Remove todas as entradas e zera os contadores."""
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> CacheStats:
+        """Contadores atuais do cache."""
+        with self._lock:
+            return CacheStats(self._hits, self._misses, len(self._data), self.maxsize)
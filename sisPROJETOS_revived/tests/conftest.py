@@ -5,6 +5,7 @@ This file sets up the Python path to allow proper imports of src modules.
 """
 
 import os
+import random
 import sys
 
 # Add both project root and src directory to Python path
@@ -18,3 +19,47 @@ if project_root not in sys.path:
 
 if src_dir not in sys.path:
     sys.path.insert(0, src_dir)
+
+CQT_CABOS = ("2#16(25)mm² Al", "3x35+54.6mm² Al", "3x70+54.6mm² Al", "3x150+70mm² Al")
+
+
+def make_network(
+    n_points,
+    seed=0,
+    *,
+    window=5,
+    metros=(25, 30, 40),
+    cabos=CQT_CABOS,
+    mono=(0, 3),
+    bi=(0, 0),
+    tri=(0, 0),
+    carga_esp=(0.0, 0.0, 1.5),
+    classes=None,
+):
+    """Random radial CQT network with ``n_points`` points besides the TRAFO.
+
+    Each point hangs from one of the ``window`` previous points (``None`` =
+    any previous point, a random recursive tree of depth ~ log n). ``mono``,
+    ``bi`` and ``tri`` are inclusive ranges; ``metros``, ``cabos``,
+    ``carga_esp`` and ``classes`` are the choices drawn per segment
+    (``classes`` adds the optional ``classe`` key).
+    """
+    rng = random.Random(seed)
+    segments = [{"ponto": "TRAFO", "montante": "", "metros": 0, "cabo": ""}]
+    for i in range(1, n_points + 1):
+        first = 1 if window is None else max(1, i - window)
+        segment = {
+            "ponto": f"P{i}",
+            "montante": "TRAFO" if i == 1 else f"P{rng.randint(first, i - 1)}",
+            "metros": rng.choice(metros),
+            "cabo": rng.choice(cabos),
+            "mono": rng.randint(*mono),
+            "bi": rng.randint(*bi),
+            "tri": rng.randint(*tri),
+            "tri_esp": 0,
+            "carga_esp": rng.choice(carga_esp),
+        }
+        if classes:
+            segment["classe"] = rng.choice(classes)
+        segments.append(segment)
+    return segments
@@ -427,9 +427,9 @@ class TestCatenaryBatchEndpoint:
         assert "catenary_constant" in item
 
     def test_batch_exception_path_via_mock(self, client, mocker):
-        """Erro inesperado (não None) deve produzir success=False sem abortar lote — cobre linhas 257-259."""
+        """Erro inesperado no passe vetorizado deve produzir success=False em todos os itens (HTTP 200)."""
         mocker.patch(
-            "src.api.routes.catenary.CatenaryLogic.calculate_catenary",
+            "src.api.routes.catenary.CatenaryLogic.calculate_batch",
             side_effect=RuntimeError("falha inesperada simulada"),
         )
         resp = client.post(
@@ -443,3 +443,31 @@ class TestCatenaryBatchEndpoint:
         for item in data["items"]:
             assert item["success"] is False
             assert "falha inesperada simulada" in item["error"]
+
+    def test_batch_mais_de_20_vaos(self, client):
+        """Lote de rota completa (além do antigo limite de 20) é aceito e calculado."""
+        items = [{**self._ITEM_100M, "span": 50.0 + i} for i in range(500)]
+        resp = client.post(self._URL, json={"items": items})
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["count"] == 500 and data["success_count"] == 500
+        sags = [item["sag"] for item in data["items"]]
+        assert sags == sorted(sags)
+
+    def test_batch_igual_ao_calculate(self, client):
+        """Valores do lote coincidem com o endpoint individual, inclusive a curva."""
+        item = {**self._ITEM_500M, "min_clearance_m": 6.0}
+        single = client.post(
+            "/api/v1/catenary/calculate",
+            json={**self._ITEM_500M, "min_clearance_m": 6.0, "include_curve": True},
+        ).json()
+        data = client.post(self._URL, json={"items": [item], "include_curve": True}).json()["items"][0]
+        for key in ("sag", "tension", "catenary_constant", "within_clearance"):
+            assert data[key] == pytest.approx(single[key])
+        assert data["curve_x"] == pytest.approx(single["curve_x"])
+        assert data["curve_y"] == pytest.approx(single["curve_y"])
+
+    def test_batch_sem_curva_por_padrao(self, client):
+        """Sem include_curve a curva não é gerada nem retornada."""
+        item = client.post(self._URL, json={"items": [self._ITEM_100M]}).json()["items"][0]
+        assert item["curve_x"] is None and item["curve_y"] is None
@@ -0,0 +1,53 @@
+"""
+Testes do endpoint POST /api/v1/catenary/inverse — cálculo inverso em lote.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+_URL = "/api/v1/catenary/inverse"
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Cliente de testes FastAPI (reutilizado em todos os testes do módulo)."""
+    from src.api.app import create_app
+
+    return TestClient(create_app())
+
+
+class TestCatenaryInverseEndpoint:
+    def test_tension_for_sag_matches_calculate(self, client):
+        resp = client.post(
+            _URL,
+            json={
+                "solve_for": "tension",
+                "target": "sag",
+                "items": [{"span": 80.0, "sag_m": 1.0, "weight_kg_m": 0.779}],
+            },
+        )
+        assert resp.status_code == 200
+        item = resp.json()["items"][0]
+        assert item["success"] is True
+        calc = client.post(
+            "/api/v1/catenary/calculate",
+            json={"span": 80.0, "tension_daN": item["tension"], "weight_kg_m": 0.779},
+        ).json()
+        assert calc["sag"] == pytest.approx(1.0, rel=1e-9)
+
+    def test_span_for_clearance_with_errors_per_item(self, client):
+        items = [
+            {"label": "ok", "tension_daN": 1500.0, "ha": 10.0, "hb": 10.0, "clearance_m": 7.0, "weight_kg_m": 0.779},
+            {"label": "baixo", "tension_daN": 1500.0, "ha": 6.0, "hb": 10.0, "clearance_m": 7.0, "weight_kg_m": 0.779},
+            {"label": "sem tração", "ha": 10.0, "hb": 10.0, "clearance_m": 7.0, "weight_kg_m": 0.779},
+        ]
+        data = client.post(_URL, json={"solve_for": "span", "target": "clearance", "items": items}).json()
+        assert data["count"] == 3 and data["success_count"] == 1 and data["error_count"] == 2
+        ok = data["items"][0]
+        assert ok["sag"] == pytest.approx(3.0, rel=1e-6) and ok["span"] > 100
+        assert "inatingível" in data["items"][1]["error"]
+        assert data["items"][2]["success"] is False
+
+    def test_invalid_combination_returns_422(self, client):
+        resp = client.post(_URL, json={"solve_for": "weight", "target": "sag", "items": [{"weight_kg_m": 1.0}]})
+        assert resp.status_code == 422
@@ -0,0 +1,69 @@
+"""
+Testes da amostragem da curva na API de catenária (curve_points / curve_tolerance_m).
+"""
+
+import base64
+import io
+
+import ezdxf
+import pytest
+from fastapi.testclient import TestClient
+
+_PAYLOAD = {"span": 80.0, "ha": 9.0, "hb": 9.0, "tension_daN": 500.0, "weight_kg_m": 0.779, "include_curve": True}
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Cliente de testes FastAPI (reutilizado em todos os testes do módulo)."""
+    from src.api.app import create_app
+
+    return TestClient(create_app())
+
+
+def _polyline_vertices(dxf_base64: str) -> int:
+    doc = ezdxf.read(io.StringIO(base64.b64decode(dxf_base64).decode("utf-8")))
+    lines = [e for e in doc.modelspace() if e.dxftype() in ("LWPOLYLINE", "POLYLINE")]
+    return max(len(list(e.vertices())) if e.dxftype() == "POLYLINE" else len(e) for e in lines)
+
+
+class TestCatenaryCurveSampling:
+    def test_default_and_fixed_point_count(self, client):
+        assert len(client.post("/api/v1/catenary/calculate", json=_PAYLOAD).json()["curve_x"]) == 100
+        data = client.post("/api/v1/catenary/calculate", json={**_PAYLOAD, "curve_points": 12}).json()
+        assert len(data["curve_x"]) == len(data["curve_y"]) == 12
+
+    def test_tolerance_scales_with_span(self, client):
+        short = client.post("/api/v1/catenary/calculate", json={**_PAYLOAD, "span": 30.0, "curve_tolerance_m": 0.002})
+        long = client.post("/api/v1/catenary/calculate", json={**_PAYLOAD, "span": 400.0, "curve_tolerance_m": 0.002})
+        n_short, n_long = len(short.json()["curve_x"]), len(long.json()["curve_x"])
+        assert n_short < 100 < n_long
+
+    def test_invalid_sampling_returns_422(self, client):
+        assert client.post("/api/v1/catenary/calculate", json={**_PAYLOAD, "curve_points": 1}).status_code == 422
+        assert client.post("/api/v1/catenary/calculate", json={**_PAYLOAD, "curve_tolerance_m": 0}).status_code == 422
+
+    def test_batch_and_section_ragged_curves(self, client):
+        items = [{"span": s, "tension_daN": 1500.0, "ha": 10.0, "hb": 10.0, "weight_kg_m": 0.779} for s in (30, 300)]
+        batch = client.post(
+            "/api/v1/catenary/batch", json={"items": items, "include_curve": True, "curve_tolerance_m": 0.02}
+        ).json()["items"]
+        assert len(batch[0]["curve_x"]) < len(batch[1]["curve_x"])
+        section = client.post(
+            "/api/v1/catenary/section",
+            json={
+                "spans": [30.0, 300.0],
+                "support_heights": [10.0, 10.0, 10.0],
+                "tension_daN": 1500.0,
+                "weight_kg_m": 0.779,
+                "include_curve": True,
+                "curve_tolerance_m": 0.02,
+            },
+        ).json()
+        assert [len(c) for c in section["curve_x"]] == [len(b["curve_x"]) for b in batch]
+
+    def test_dxf_uses_requested_sampling(self, client):
+        payload = {k: v for k, v in _PAYLOAD.items() if k != "include_curve"}
+        fixed = client.post("/api/v1/catenary/dxf", json={**payload, "curve_points": 20}).json()
+        adaptive = client.post("/api/v1/catenary/dxf", json={**payload, "curve_tolerance_m": 0.05}).json()
+        assert _polyline_vertices(fixed["dxf_base64"]) == 20
+        assert _polyline_vertices(adaptive["dxf_base64"]) < 20
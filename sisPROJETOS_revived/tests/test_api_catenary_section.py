@@ -0,0 +1,65 @@
+"""
+Testes do endpoint POST /api/v1/catenary/section — seção de tensionamento.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+_URL = "/api/v1/catenary/section"
+_PAYLOAD = {
+    "spans": [80.0, 120.0, 95.0, 150.0],
+    "support_heights": [10.0, 11.0, 10.5, 12.0, 10.0],
+    "tension_daN": 1270.0,
+    "weight_kg_m": 0.779,
+}
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Cliente de testes FastAPI (reutilizado em todos os testes do módulo)."""
+    from src.api.app import create_app
+
+    return TestClient(create_app())
+
+
+class TestCatenarySectionEndpoint:
+    def test_section_returns_parallel_arrays(self, client):
+        resp = client.post(_URL, json=_PAYLOAD)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["count"] == 4
+        assert len(data["sag"]) == len(data["max_tension"]) == len(data["catenary_constant"]) == 4
+        assert 80.0 < data["ruling_span"] < 150.0
+        assert data["tension"] == 1270.0
+        assert data["within_clearance"] is None and data["curve_x"] is None
+        assert all(t > 1270.0 for t in data["max_tension"])
+
+    def test_hundreds_of_spans_with_curve_and_clearance(self, client):
+        n = 500
+        payload = {
+            "spans": [100.0] * n,
+            "support_heights": [10.0] * (n + 1),
+            "tension_daN": 1500.0,
+            "weight_kg_m": 0.779,
+            "min_clearance_m": 6.0,
+            "include_curve": True,
+        }
+        data = client.post(_URL, json=payload).json()
+        assert data["count"] == n and data["ruling_span"] == pytest.approx(100.0)
+        assert len(data["curve_y"]) == n and len(data["curve_y"][0]) == 100
+        assert data["within_clearance"] == [True] * n
+
+    def test_conductor_and_temperature(self, client):
+        base = client.post(_URL, json={**_PAYLOAD, "conductor": "556MCM-CA, Nu"}).json()
+        hot = client.post(_URL, json={**_PAYLOAD, "conductor": "556MCM-CA, Nu", "temperature": 75.0}).json()
+        assert hot["tension"] < base["tension"]
+        assert all(h > b for h, b in zip(hot["sag"], base["sag"]))
+
+    def test_inconsistent_section_returns_422(self, client):
+        resp = client.post(_URL, json={**_PAYLOAD, "support_heights": [10.0, 10.0]})
+        assert resp.status_code == 422
+        assert "alturas" in resp.json()["detail"]
+        resp = client.post(_URL, json={**_PAYLOAD, "weight_kg_m": None})
+        assert resp.status_code == 422
+        resp = client.post(_URL, json={**_PAYLOAD, "conductor": "INEXISTENTE"})
+        assert resp.status_code == 422
@@ -0,0 +1,69 @@
+"""
+Testes do endpoint POST /api/v1/catenary/terrain-clearance — distância ao solo sobre o perfil.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+_URL = "/api/v1/catenary/terrain-clearance"
+
+
+def _span(**overrides):
+    span = {
+        "span": 100.0,
+        "ha": 112.0,
+        "hb": 112.0,
+        "tension_daN": 1500.0,
+        "weight_kg_m": 0.779,
+        "min_clearance_m": 6.0,
+        "stations": [0.0, 50.0, 100.0],
+        "elevations": [100.0, 100.0, 100.0],
+    }
+    span.update(overrides)
+    return span
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Cliente de testes FastAPI (reutilizado em todos os testes do módulo)."""
+    from src.api.app import create_app
+
+    return TestClient(create_app())
+
+
+class TestTerrainClearanceEndpoint:
+    def test_flat_route_within_clearance(self, client):
+        resp = client.post(
+            _URL,
+            json={
+                "spans": [_span(label="P1-P2"), _span(span=150.0, stations=[0.0, 150.0], elevations=[100.0, 100.0])]
+            },
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["count"] == 2 and data["violation_span_count"] == 0 and data["violations"] == []
+        assert data["worst_span"] == 1
+        assert data["spans"][0]["label"] == "P1-P2"
+        assert data["spans"][0]["min_station"] == pytest.approx(50.0)
+        assert 11.0 < data["spans"][0]["min_clearance"] < 12.0
+
+    def test_terrain_bump_reports_violating_stations(self, client):
+        bump = _span(stations=[0.0, 30.0, 45.0, 55.0, 100.0], elevations=[100.0, 104.0, 106.0, 100.0, 100.0])
+        data = client.post(_URL, json={"spans": [_span(), bump], "max_violations": 1}).json()
+        assert data["violation_span_count"] == 1 and data["worst_span"] == 1
+        assert data["spans"][1]["within_clearance"] is False
+        assert data["violation_count"] == 1 and data["violations"][0]["station"] == 45.0
+        assert data["min_clearance"] == data["spans"][1]["min_clearance"] < 6.0
+
+    def test_thousands_of_spans(self, client):
+        payload = {"spans": [_span() for _ in range(3000)]}
+        data = client.post(_URL, json=payload).json()
+        assert data["count"] == 3000 and data["violation_span_count"] == 0
+
+    def test_invalid_profile_returns_422(self, client):
+        resp = client.post(_URL, json={"spans": [_span(stations=[0.0, 120.0], elevations=[100.0, 100.0])]})
+        assert resp.status_code == 422 and "fora do vão" in resp.json()["detail"]
+        resp = client.post(_URL, json={"spans": [_span(stations=[], elevations=[])]})
+        assert resp.status_code == 422 and "vazio" in resp.json()["detail"]
+        resp = client.post(_URL, json={"spans": [_span(elevations=[100.0])]})
+        assert resp.status_code == 422
@@ -0,0 +1,118 @@
+"""
+Testes das rotas CQT: formato colunar de /calculate e POST /api/v1/cqt/batch
+(lote de redes CQT em pool de processos).
+"""
+
+import base64
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.schemas import CQT_BATCH_MAX_ITEMS
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Cliente de testes FastAPI (reutilizado em todos os testes do módulo)."""
+    from src.api.app import create_app
+
+    return TestClient(create_app())
+
+
+def _network(label, mono=3, kva=75.0):
+    return {
+        "label": label,
+        "segments": [
+            {"ponto": "TRAFO", "montante": ""},
+            {"ponto": "P1", "montante": "TRAFO", "metros": 40, "cabo": "3x35+54.6mm² Al", "mono": mono},
+            {"ponto": "P2", "montante": "P1", "metros": 30, "cabo": "3x35+54.6mm² Al", "mono": mono},
+        ],
+        "trafo_kva": kva,
+        "social_class": "B",
+    }
+
+
+class TestCQTColumnarFormat:
+    _URL = "/api/v1/cqt/calculate"
+
+    def _payload(self, **extra):
+        item = _network("TR-1")
+        return {**{k: item[k] for k in ("segments", "trafo_kva", "social_class")}, **extra}
+
+    def test_columnar_igual_ao_dict(self, client):
+        reference = client.post(self._URL, json=self._payload()).json()
+        data = client.post(self._URL, json=self._payload(result_format="columnar")).json()
+        assert data["success"] and data["results"] is None
+        assert data["summary"] == reference["summary"]
+        columns = data["columns"]
+        assert columns["encoding"] == "json" and columns["points"] == ["TRAFO", "P1", "P2"]
+        assert columns["cqt_accumulated"] == pytest.approx(
+            [reference["results"][p]["cqt_accumulated"] for p in columns["points"]]
+        )
+
+    def test_base64_float64_little_endian(self, client):
+        reference = client.post(self._URL, json=self._payload()).json()
+        columns = client.post(self._URL, json=self._payload(result_format="base64")).json()["columns"]
+        assert columns["encoding"] == "base64" and columns["dtype"] == "<f8"
+        accumulated = np.frombuffer(base64.b64decode(columns["accumulated"]), dtype="<f8")
+        assert accumulated.tolist() == pytest.approx(
+            [reference["results"][p]["accumulated"] for p in columns["points"]]
+        )
+
+    def test_formato_invalido_retorna_422(self, client):
+        assert client.post(self._URL, json=self._payload(result_format="xml")).status_code == 422
+
+    def test_lote_colunar(self, client):
+        data = client.post(
+            "/api/v1/cqt/batch",
+            json={"items": [_network("TR-1")], "include_results": True, "result_format": "base64", "workers": 1},
+        ).json()
+        item = data["items"][0]
+        assert item["results"] is None and item["columns"]["points"] == ["TRAFO", "P1", "P2"]
+
+
+class TestCQTBatchEndpoint:
+    _URL = "/api/v1/cqt/batch"
+
+    def test_lote_valido(self, client):
+        resp = client.post(self._URL, json={"items": [_network("TR-1"), _network("TR-2", mono=6)], "workers": 1})
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["count"] == 2 and data["success_count"] == 2 and data["error_count"] == 0
+        assert [i["label"] for i in data["items"]] == ["TR-1", "TR-2"]
+        assert data["items"][0]["summary"]["max_cqt"] < data["items"][1]["summary"]["max_cqt"]
+        assert data["items"][0]["results"] is None
+        assert data["items"][0]["segments_over_limit"] == []
+
+    def test_resultado_igual_ao_calculate(self, client):
+        item = _network("TR-1")
+        single = client.post(
+            "/api/v1/cqt/calculate",
+            json={k: item[k] for k in ("segments", "trafo_kva", "social_class")},
+        ).json()
+        data = client.post(self._URL, json={"items": [item], "include_results": True}).json()
+        assert data["items"][0]["summary"] == single["summary"]
+        assert data["items"][0]["results"] == single["results"]
+
+    def test_erro_isolado_por_rede(self, client):
+        bad = {"label": "RUIM", "segments": [{"ponto": "P1", "montante": "X"}], "trafo_kva": 75.0}
+        data = client.post(self._URL, json={"items": [_network("OK"), bad], "workers": 2}).json()
+        assert data["success_count"] == 1 and data["error_count"] == 1
+        assert data["items"][1]["success"] is False
+        assert "TRAFO" in data["items"][1]["error"]
+
+    def test_sem_limite_de_20_itens(self, client):
+        items = [_network(f"TR-{i}") for i in range(60)]
+        data = client.post(self._URL, json={"items": items}).json()
+        assert data["count"] == 60 and data["success_count"] == 60
+
+    def test_acima_do_limite_retorna_422(self, client):
+        items = [_network(f"TR-{i}") for i in range(CQT_BATCH_MAX_ITEMS + 1)]
+        assert client.post(self._URL, json={"items": items}).status_code == 422
+
+    def test_lote_vazio_retorna_422(self, client):
+        assert client.post(self._URL, json={"items": []}).status_code == 422
+
+    def test_workers_invalido_retorna_422(self, client):
+        assert client.post(self._URL, json={"items": [_network("A")], "workers": 0}).status_code == 422
@@ -278,29 +278,25 @@ class TestPoleLoadBatchEndpoint:
         assert "error" in data["items"][0]
         assert data["items"][1]["success"] is True
 
+    def test_lote_acima_de_20_postes(self, client):
+        """O limite antigo de 20 postes não se aplica mais: rede inteira em uma chamada."""
+        items = [self._ITEM_LIGHT, self._ITEM_ENEL] * 250
+        resp = client.post(self._URL, json={"items": items})
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["count"] == 500 and data["success_count"] == 500
+        assert data["items"][498]["resultant_force"] == pytest.approx(data["items"][0]["resultant_force"])
+
     def test_itens_vazios_retorna_422(self, client):
         """Lista de postes vazia falha na validação Pydantic → 422."""
         resp = client.post(self._URL, json={"items": []})
         assert resp.status_code == 422
 
-    def test_exception_nao_aborta_lote(self, client, mocker):
-        """Exceção inesperada em um item retorna success=False sem abortar os demais."""
-        call_count = [0]
-
-        def side_effect_once(*args, **kwargs):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                raise RuntimeError("Falha simulada")
-            from modules.pole_load.logic import PoleLoadLogic as _PLL
-
-            return _PLL().calculate_resultant(*args, **kwargs)
-
+    def test_erro_catalogo_postes_retorna_500(self, client, mocker):
+        """Falha ao consultar o catálogo de postes (sugestão vetorizada do lote) → HTTP 500."""
         mocker.patch(
-            "api.routes.pole_load.PoleLoadLogic.calculate_resultant",
-            side_effect=side_effect_once,
+            "api.routes.pole_load.PoleLoadLogic.suggest_poles",
+            side_effect=RuntimeError("Falha simulada"),
         )
         resp = client.post(self._URL, json={"items": [self._ITEM_LIGHT, self._ITEM_ENEL]})
-        assert resp.status_code == 200
-        data = resp.json()
-        assert data["items"][0]["success"] is False
-        assert "Falha simulada" in data["items"][0]["error"]
+        assert resp.status_code == 500
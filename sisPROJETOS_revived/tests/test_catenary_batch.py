@@ -0,0 +1,111 @@
+"""
+Testes do cálculo vetorizado de catenária em lote (src/modules/catenaria/batch.py).
+"""
+
+import numpy as np
+import pytest
+
+from src.modules.catenaria.batch import (
+    INVALID_INPUT_ERROR,
+    MAX_CURVE_POINTS,
+    MIN_CURVE_POINTS,
+    OVERFLOW_ERROR,
+    calculate_spans,
+    curve_point_count,
+)
+from src.modules.catenaria.logic import CatenaryLogic
+
+
+@pytest.fixture(scope="module")
+def logic():
+    return CatenaryLogic()
+
+
+def test_batch_matches_scalar_calculation(logic):
+    rng = np.random.default_rng(0)
+    n = 200
+    span = rng.uniform(20, 400, n)
+    ha = rng.uniform(8, 12, n)
+    hb = rng.uniform(8, 12, n)
+    tension = rng.uniform(200, 3000, n)
+    weight = rng.uniform(0.1, 2.0, n)
+    res = logic.calculate_batch(span, ha, hb, tension, weight, curve_points=100)
+    assert res.valid.all() and not res.errors
+    for i in range(0, n, 17):
+        ref = logic.calculate_catenary(span[i], ha[i], hb[i], tension[i], weight[i])
+        assert res.sag[i] == pytest.approx(ref["sag"])
+        assert res.catenary_constant[i] == pytest.approx(ref["catenary_constant"])
+        np.testing.assert_allclose(res.x_vals[i], ref["x_vals"])
+        np.testing.assert_allclose(res.y_vals[i], ref["y_vals"])
+
+
+def test_curve_skipped_by_default():
+    res = calculate_spans([100.0, 200.0], 10.0, 10.0, 1000.0, 0.5)
+    assert res.x_vals is None and res.y_vals is None
+    assert res.size == 2
+
+
+def test_invalid_items_do_not_abort_batch():
+    res = calculate_spans(
+        span=[100.0, -5.0, 100.0, 100.0, np.nan],
+        ha=10.0,
+        hb=10.0,
+        tension_daN=[1000.0, 1000.0, 0.0, 1000.0, 1000.0],
+        weight_kg_m=[0.5, 0.5, 0.5, 0.0, 0.5],
+        curve_points=10,
+    )
+    assert res.valid.tolist() == [True, False, False, False, False]
+    assert res.errors == {i: INVALID_INPUT_ERROR for i in range(1, 5)}
+    assert np.isnan(res.sag[1:]).all()
+    assert np.isfinite(res.y_vals[0]).all() and np.isnan(res.y_vals[1:]).all()
+
+
+def test_overflow_reported_per_span():
+    res = calculate_spans([100.0, 1e6], 10.0, 10.0, 10.0, 2.0)
+    assert res.valid.tolist() == [True, False]
+    assert res.errors == {1: OVERFLOW_ERROR}
+
+
+def test_clearance_only_where_requested():
+    res = calculate_spans([100.0, 1000.0, 100.0], 10.0, 10.0, 2000.0, 1.6, min_clearance_m=[6.0, 6.0, np.nan])
+    assert res.clearance_checked.tolist() == [True, True, False]
+    assert res.within_clearance[:2].tolist() == [True, False]
+
+
+def test_thousands_of_spans_single_pass():
+    n = 50_000
+    span = np.linspace(10, 500, n)
+    res = calculate_spans(span, 10.0, 12.0, 1500.0, 0.8)
+    assert res.valid.all()
+    assert np.all(np.diff(res.sag) > 0)
+
+
+def test_curve_point_count_bounds_chord_error():
+    a = np.array([500.0, 2000.0, 2000.0])
+    L = np.array([40.0, 100.0, 800.0])
+    counts = curve_point_count(L, a, 0.01)
+    assert counts[0] < counts[2] and counts[1] < counts[2]
+    assert counts.min() >= MIN_CURVE_POINTS
+    # Erro de corda real no ponto médio de cada segmento ≤ tolerância
+    for L_i, a_i, n in zip(L, a, counts):
+        x = np.linspace(0.0, L_i, n)
+        y = a_i * np.cosh((x - L_i / 2) / a_i)
+        xm = (x[:-1] + x[1:]) / 2
+        chord = (y[:-1] + y[1:]) / 2
+        assert np.max(chord - a_i * np.cosh((xm - L_i / 2) / a_i)) <= 0.01
+    assert curve_point_count(1e6, 1.0, 1e-3) == MAX_CURVE_POINTS
+    with pytest.raises(ValueError, match="positiva"):
+        curve_point_count(100.0, 1000.0, 0.0)
+
+
+def test_adaptive_curves_per_span(logic):
+    res = calculate_spans(
+        [30.0, 120.0, -1.0, 400.0], [9.0, 10.0, 10.0, 11.0], 10.0, 1500.0, 0.779, curve_tolerance_m=0.005
+    )
+    counts = [x.size for x in res.x_vals]
+    assert counts[0] < counts[1] < counts[3] and counts[2] == MIN_CURVE_POINTS
+    assert np.isnan(res.y_vals[2]).all()
+    ref = logic.calculate_catenary(400.0, 11.0, 10.0, 1500.0, 0.779, curve_tolerance_m=0.005)
+    np.testing.assert_allclose(res.x_vals[3], ref["x_vals"])
+    np.testing.assert_allclose(res.y_vals[3], ref["y_vals"])
+    assert logic.calculate_catenary(400.0, 11.0, 10.0, 1500.0, 0.779, curve_points=7)["x_vals"].size == 7
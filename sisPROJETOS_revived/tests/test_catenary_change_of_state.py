@@ -0,0 +1,102 @@
+"""
+Testes da equação de mudança de estado (src/modules/catenaria/change_of_state.py).
+"""
+
+import numpy as np
+import pytest
+
+from src.modules.catenaria.change_of_state import (
+    ChangeOfStateSolver,
+    ConductorMechanics,
+    wind_pressure,
+)
+from src.modules.catenaria.logic import CatenaryLogic
+
+# 556MCM-CA do catálogo padrão
+CA_556 = ConductorMechanics(
+    weight_kg_m=0.779,
+    modulus_mpa=56900.0,
+    alpha_per_c=2.3e-05,
+    section_mm2=281.7,
+    diameter_mm=22.01,
+    breaking_load_daN=7080.0,
+    name="556MCM-CA, Nu",
+)
+
+
+def residual(c, L, T1, theta1, q1, T2, theta2, q2):
+    """Resíduo da equação de mudança de estado (forma parabólica)."""
+    es = c.axial_stiffness_daN
+    w1, w2 = c.apparent_weight(q1), c.apparent_weight(q2)
+    lhs = T2**2 * (T2 - T1 + es * w1**2 * L**2 / (24 * T1**2) + es * c.alpha_per_c * (theta2 - theta1))
+    return lhs - es * w2**2 * L**2 / 24
+
+
+def reference_root(c, L, T1, theta1, q1, theta2, q2):
+    """Raiz positiva via np.roots (referência escalar)."""
+    es = c.axial_stiffness_daN
+    w1, w2 = float(c.apparent_weight(q1)), float(c.apparent_weight(q2))
+    A = es * w1**2 * L**2 / (24 * T1**2) + es * c.alpha_per_c * (theta2 - theta1) - T1
+    B = es * w2**2 * L**2 / 24
+    roots = np.roots([1.0, A, 0.0, -B])
+    return max(r.real for r in roots if abs(r.imag) < 1e-6 and r.real > 0)
+
+
+@pytest.fixture
+def solver():
+    return ChangeOfStateSolver(CA_556)
+
+
+def test_same_state_returns_reference_tension(solver):
+    assert float(solver.solve(80.0, 1200.0, 20.0, 20.0)) == pytest.approx(1200.0, rel=1e-9)
+
+
+def test_matches_polynomial_roots(solver):
+    rng = np.random.default_rng(1)
+    for _ in range(30):
+        L, T1 = rng.uniform(30, 400), rng.uniform(300, 2500)
+        theta2, q2 = rng.uniform(-5, 75), rng.uniform(0, 60)
+        T2 = float(solver.solve(L, T1, 20.0, theta2, 0.0, q2))
+        assert T2 == pytest.approx(reference_root(CA_556, L, T1, 20.0, 0.0, theta2, q2), rel=1e-8)
+        assert abs(residual(CA_556, L, T1, 20.0, 0.0, T2, theta2, q2)) < 1e-6 * T2**3
+
+
+def test_grid_shape_and_physical_trends(solver):
+    spans = np.array([40.0, 80.0, 150.0, 300.0])
+    temps = np.array([0.0, 20.0, 50.0, 75.0])
+    winds = wind_pressure([0.0, 20.0, 30.0])
+    res = solver.solve_grid(spans, 1000.0, 20.0, temps, winds)
+    assert res.tension.shape == res.sag.shape == (4, 4, 3)
+    # Mais quente → menor tração e maior flecha; mais vento → maior tração
+    assert np.all(np.diff(res.tension, axis=1) < 0)
+    assert np.all(np.diff(res.sag[:, :, 0], axis=1) > 0)
+    assert np.all(np.diff(res.tension, axis=2) > 0)
+    np.testing.assert_allclose(res.tension[:, 1, 0], 1000.0, rtol=1e-9)
+
+
+def test_grid_matches_pointwise_solve(solver):
+    spans = np.linspace(30, 500, 25)
+    temps = np.linspace(-5, 80, 18)
+    winds = np.array([0.0, 25.0, 55.0])
+    tension_ref = np.linspace(500, 2000, spans.size)
+    res = solver.solve_grid(spans, tension_ref, 15.0, temps, winds, reference_wind_pressure=10.0)
+    i, j, k = 7, 11, 2
+    assert res.tension[i, j, k] == pytest.approx(
+        float(solver.solve(spans[i], tension_ref[i], 15.0, temps[j], 10.0, winds[k])), rel=1e-12
+    )
+
+
+def test_invalid_inputs(solver):
+    with pytest.raises(ValueError, match="positivos"):
+        solver.solve([80.0, -1.0], 1000.0, 20.0, 30.0)
+    with pytest.raises(ValueError, match="mecânicos"):
+        ConductorMechanics(weight_kg_m=0.5, modulus_mpa=0.0, alpha_per_c=2e-5, section_mm2=100.0)
+
+
+def test_catalog_conductor_mechanics():
+    logic = CatenaryLogic()
+    name = logic.get_conductor_names()[0]
+    mech = logic.get_conductor_mechanics(name)
+    assert mech.name == name and mech.axial_stiffness_daN > 0 and mech.diameter_mm > 0
+    with pytest.raises(ValueError, match="não encontrado"):
+        logic.get_conductor_mechanics("INEXISTENTE")
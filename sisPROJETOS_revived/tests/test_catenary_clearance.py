@@ -0,0 +1,85 @@
+"""
+Testes da verificação de distância ao solo sobre o perfil do terreno (src/modules/catenaria/clearance.py).
+"""
+
+import numpy as np
+import pytest
+
+from src.modules.catenaria.batch import calculate_spans
+from src.modules.catenaria.clearance import TerrainProfile, check_terrain_clearance
+from src.modules.catenaria.logic import CatenaryLogic
+
+
+def dense_min_clearance(L, ha, hb, T, w, stations, elevations, n=200_001):
+    """Referência por amostragem densa da curva e do terreno."""
+    res = calculate_spans(L, ha, hb, T, w, curve_points=n)
+    ground = np.interp(res.x_vals[0], stations, elevations)
+    c = res.y_vals[0] - ground
+    k = int(np.argmin(c))
+    return c[k], res.x_vals[0][k]
+
+
+def test_flat_ground_matches_sag():
+    L = np.array([80.0, 120.0, 150.0])
+    profile = TerrainProfile.from_spans([([0.0, s], [0.0, 0.0]) for s in L])
+    res = check_terrain_clearance(L, 12.0, 12.0, 1500.0, 0.779, profile, 6.0)
+    sag = calculate_spans(L, 12.0, 12.0, 1500.0, 0.779).sag
+    np.testing.assert_allclose(res.min_clearance, 12.0 - sag)
+    np.testing.assert_allclose(res.min_station, L / 2)
+    assert res.within_clearance.all() and res.violations() == []
+
+
+def test_exact_minimum_between_stations():
+    rng = np.random.default_rng(7)
+    profiles, spans, ha, hb = [], [], [], []
+    for _ in range(5):
+        L = rng.uniform(60, 300)
+        st = np.sort(np.concatenate(([0.0, L], rng.uniform(0, L, 6))))
+        profiles.append((st, rng.uniform(0, 4, st.size)))
+        spans.append(L)
+        ha.append(rng.uniform(10, 14))
+        hb.append(rng.uniform(10, 14))
+    res = check_terrain_clearance(spans, ha, hb, 1200.0, 0.6, TerrainProfile.from_spans(profiles), 6.0)
+    for i, (st, z) in enumerate(profiles):
+        ref_c, ref_x = dense_min_clearance(spans[i], ha[i], hb[i], 1200.0, 0.6, st, z)
+        assert res.min_clearance[i] == pytest.approx(ref_c, abs=1e-4)
+        assert res.min_clearance[i] <= ref_c + 1e-9
+        assert res.min_station[i] == pytest.approx(ref_x, abs=0.01)
+
+
+def test_violating_stations_reported():
+    profile = TerrainProfile.from_spans([([0.0, 40.0, 50.0, 60.0, 100.0], [0.0, 0.0, 6.5, 0.0, 0.0]), ([], [])])
+    res = check_terrain_clearance([100.0, 100.0], 12.0, 12.0, 1500.0, 0.779, profile, 6.0)
+    assert res.checked.tolist() == [True, False]
+    assert not res.within_clearance[0] and np.isnan(res.min_clearance[1])
+    assert res.worst_span == 0
+    ((span, station, clearance),) = res.violations()
+    assert span == 0 and station == 50.0 and clearance < 6.0
+
+
+def test_route_profile_split_thousands_of_spans():
+    n = 5000
+    spans = np.full(n, 100.0)
+    chainage = np.arange(0.0, 100.0 * n + 1, 25.0)
+    elevation = 3.0 * np.sin(chainage / 700.0) + np.where(chainage % 2500 == 50, 1.0, 0.0)
+    profile = TerrainProfile.from_route(spans, chainage, elevation)
+    assert profile.n_spans == n
+    assert np.all(np.diff(profile.offsets) == 5)  # apoios + 3 estacas internas
+    heights = 12.0 + np.interp(np.arange(n + 1) * 100.0, chainage, elevation)
+    res = CatenaryLogic().check_terrain_clearance(spans, heights[:-1], heights[1:], 1500.0, 0.779, profile, 11.0)
+    assert res.checked.all()
+    # Um vão a cada 25 tem um ressalto de 1 m no meio
+    assert np.flatnonzero(~res.within_clearance).tolist() == list(range(0, n, 25))
+    bad = res.violations()
+    assert {s for s, _, _ in bad} <= set(np.flatnonzero(~res.within_clearance).tolist())
+
+
+def test_invalid_profiles():
+    with pytest.raises(ValueError, match="fora do vão"):
+        check_terrain_clearance([50.0], 10.0, 10.0, 1000.0, 0.5, TerrainProfile.from_spans([([0, 60], [0, 0])]), 6.0)
+    with pytest.raises(ValueError, match="crescentes"):
+        check_terrain_clearance([50.0], 10.0, 10.0, 1000.0, 0.5, TerrainProfile.from_spans([([30, 10], [0, 0])]), 6.0)
+    with pytest.raises(ValueError, match="2 vãos"):
+        check_terrain_clearance([50.0], 10.0, 10.0, 1000.0, 0.5, TerrainProfile.from_spans([([], [])] * 2), 6.0)
+    res = check_terrain_clearance([50.0], 10.0, 10.0, 1000.0, 0.0, TerrainProfile.from_spans([([0, 50], [0, 0])]), 6.0)
+    assert not res.checked[0] and 0 in res.errors
@@ -0,0 +1,70 @@
+"""
+Testes do cálculo inverso da catenária (src/modules/catenaria/inverse.py).
+"""
+
+import numpy as np
+import pytest
+
+from src.modules.catenaria.batch import calculate_spans
+from src.modules.catenaria.clearance import TerrainProfile, check_terrain_clearance
+from src.modules.catenaria.inverse import (
+    UNREACHABLE_CLEARANCE_ERROR,
+    span_for_clearance,
+    span_for_sag,
+    tension_for_clearance,
+    tension_for_sag,
+)
+from src.modules.catenaria.logic import CatenaryLogic
+
+
+def test_tension_for_sag_roundtrip():
+    rng = np.random.default_rng(5)
+    span = rng.uniform(20, 800, 2000)
+    sag = rng.uniform(0.05, 40, 2000)
+    weight = rng.uniform(0.1, 2.0, 2000)
+    res = tension_for_sag(span, sag, weight)
+    assert res.valid.all() and not res.errors
+    np.testing.assert_allclose(calculate_spans(span, 0, 0, res.tension, weight).sag, sag, rtol=1e-9)
+    np.testing.assert_allclose(res.sag, sag, rtol=1e-12)
+
+
+def test_span_for_sag_inverts_tension_for_sag():
+    tension = tension_for_sag([60.0, 250.0, 50.0], [0.8, 6.0, 1e-6], 0.779).tension
+    np.testing.assert_allclose(span_for_sag(tension, [0.8, 6.0, 1e-6], 0.779).span, [60.0, 250.0, 50.0], rtol=1e-9)
+
+
+def test_tension_for_clearance_matches_forward_check():
+    span = np.array([80.0, 150.0, 300.0])
+    ha, hb = np.array([10.0, 11.0, 14.0]), np.array([10.0, 12.0, 10.5])
+    res = tension_for_clearance(span, ha, hb, 7.0, 0.779)
+    assert res.valid.all()
+    profile = TerrainProfile.from_spans([([0.0, L], [0.0, 0.0]) for L in span])
+    forward = check_terrain_clearance(span, ha, hb, res.tension, 0.779, profile, 7.0)
+    np.testing.assert_allclose(forward.min_clearance, 7.0, atol=1e-8)
+    # Menos tração → abaixo da folga
+    lower = check_terrain_clearance(span, ha, hb, res.tension * 0.99, 0.779, profile, 7.0)
+    assert not lower.within_clearance.any()
+
+
+def test_span_for_clearance_is_maximal():
+    res = span_for_clearance([1500.0, 1500.0], [10.0, 12.0], [10.0, 9.0], 7.0, 0.779)
+    assert res.valid.all()
+    back = tension_for_clearance(res.span, [10.0, 12.0], [10.0, 9.0], 7.0, 0.779)
+    np.testing.assert_allclose(back.tension, 1500.0, rtol=1e-8)
+
+
+def test_invalid_and_unreachable_items_do_not_abort():
+    res = tension_for_clearance([100.0, 100.0, -1.0, 100.0], [10.0, 6.0, 10.0, 10.0], 10.0, 7.0, [0.8, 0.8, 0.8, 0.0])
+    assert res.valid.tolist() == [True, False, False, False]
+    assert res.errors[1] == UNREACHABLE_CLEARANCE_ERROR
+    assert set(res.errors) == {1, 2, 3} and np.isnan(res.tension[1:]).all()
+
+
+def test_logic_dispatch():
+    logic = CatenaryLogic()
+    res = logic.solve_inverse("tension", "sag", weight_kg_m=0.779, span=[80.0], sag_m=[1.2])
+    assert res.sag[0] == pytest.approx(1.2)
+    with pytest.raises(ValueError, match="requer"):
+        logic.solve_inverse("span", "clearance", weight_kg_m=0.779, span=[80.0], clearance_m=[6.0])
+    with pytest.raises(ValueError, match="desconhecido"):
+        logic.solve_inverse("weight", "sag", weight_kg_m=0.779, span=[80.0], sag_m=[1.0])
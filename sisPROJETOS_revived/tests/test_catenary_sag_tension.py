@@ -0,0 +1,98 @@
+"""
+Testes das tabelas de flecha × tração com cache (src/modules/catenaria/sag_tension.py).
+"""
+
+import numpy as np
+import pytest
+
+from src.database.db_manager import DatabaseManager
+from src.modules.catenaria.change_of_state import ChangeOfStateSolver
+from src.modules.catenaria.sag_tension import SagTensionParams, SagTensionTableGenerator
+
+CONDUCTOR = "556MCM-CA, Nu"
+PARAMS = SagTensionParams(
+    spans=tuple(range(20, 101, 10)),
+    temperatures=(0.0, 20.0, 50.0, 75.0),
+    wind_pressures=(0.0, 35.0),
+)
+
+
+@pytest.fixture
+def db(tmp_path):
+    return DatabaseManager(str(tmp_path / "sag.db"))
+
+
+@pytest.fixture
+def generator(db):
+    return SagTensionTableGenerator(db=db)
+
+
+def test_table_matches_solver(generator):
+    table = generator.generate(CONDUCTOR, PARAMS)
+    mech = generator.logic.get_conductor_mechanics(CONDUCTOR)
+    assert not table.from_cache
+    assert table.reference_tension_daN == pytest.approx(0.18 * 7080.0)
+    expected = ChangeOfStateSolver(mech).solve_grid(
+        PARAMS.spans, table.reference_tension_daN, 20.0, PARAMS.temperatures, PARAMS.wind_pressures
+    )
+    assert table.tension.shape == PARAMS.shape == (9, 4, 2)
+    np.testing.assert_allclose(table.tension, expected.tension)
+    np.testing.assert_allclose(table.sag, expected.sag)
+    rows = table.rows()
+    assert len(rows) == 72
+    # Linha 2: vão 20 m, 20 °C (estado de referência), sem vento
+    assert rows[2]["span_m"] == 20.0 and rows[2]["temperature_c"] == 20.0
+    assert rows[2]["tension_daN"] == pytest.approx(1274.4)
+    assert rows[2]["sag_m"] == pytest.approx(table.sag[0, 1, 0])
+
+
+def test_second_request_served_from_cache(generator, db):
+    first = generator.generate(CONDUCTOR, PARAMS)
+    # Nova instância (outro processo): lê do mesmo banco
+    second = SagTensionTableGenerator(db=db).generate(CONDUCTOR, PARAMS)
+    assert second.from_cache
+    np.testing.assert_array_equal(second.tension, first.tension)
+    np.testing.assert_array_equal(second.sag, first.sag)
+    other = generator.generate(
+        CONDUCTOR, SagTensionParams(PARAMS.spans, PARAMS.temperatures, reference_tension_daN=900)
+    )
+    assert not other.from_cache and other.reference_tension_daN == 900
+
+
+def test_conductor_change_invalidates_entry(generator, db):
+    before = generator.generate(CONDUCTOR, PARAMS)
+    conn = db.get_connection()
+    conn.execute("UPDATE conductors SET weight_kg_m = 0.9 WHERE name = ?", (CONDUCTOR,))
+    conn.commit()
+    conn.close()
+
+    after = generator.generate(CONDUCTOR, PARAMS)
+    assert not after.from_cache
+    assert np.all(after.sag[:, 0, 0] > before.sag[:, 0, 0])
+    assert generator.generate(CONDUCTOR, PARAMS).from_cache
+    # Alteração de outro condutor não invalida a tabela
+    conn = db.get_connection()
+    conn.execute("UPDATE conductors SET weight_kg_m = 0.3 WHERE name = '4 AWG-CAA, Nu'")
+    conn.commit()
+    conn.close()
+    assert generator.generate(CONDUCTOR, PARAMS).from_cache
+
+
+def test_generate_many_and_clear(generator):
+    tables = generator.generate_many(PARAMS)
+    assert set(tables) == set(generator.logic.get_conductor_names())
+    assert generator.clear(CONDUCTOR) == 1
+    assert generator.clear() == len(tables) - 1
+    with pytest.raises(ValueError, match="não encontrado"):
+        generator.generate("INEXISTENTE", PARAMS)
+    with pytest.raises(ValueError, match="positivos"):
+        SagTensionParams(spans=(0.0, 10.0), temperatures=(20.0,))
+
+
+def test_cache_table_created_by_init_db(db):
+    conn = db.get_connection()
+    try:
+        row = conn.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'sag_tension_tables'")
+        assert row.fetchone() is not None
+    finally:
+        conn.close()
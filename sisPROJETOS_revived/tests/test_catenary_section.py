@@ -0,0 +1,82 @@
+"""
+Testes da seção de tensionamento e vão regulador (src/modules/catenaria/section.py).
+"""
+
+import numpy as np
+import pytest
+
+from src.modules.catenaria.batch import KGF_TO_DAN
+from src.modules.catenaria.change_of_state import ChangeOfStateSolver
+from src.modules.catenaria.logic import CatenaryLogic
+from src.modules.catenaria.section import calculate_section, ruling_span
+
+
+@pytest.fixture(scope="module")
+def logic():
+    return CatenaryLogic()
+
+
+def test_ruling_span_level_section():
+    spans = [80.0, 120.0, 100.0]
+    assert ruling_span(spans) == pytest.approx(np.sqrt((80**3 + 120**3 + 100**3) / 300.0))
+    assert ruling_span([150.0]) == pytest.approx(150.0)
+    # Alturas iguais reproduzem a fórmula nivelada; desnível altera o vão regulador
+    assert ruling_span(spans, [10.0] * 4) == pytest.approx(ruling_span(spans))
+    assert ruling_span(spans, [10.0, 30.0, 5.0, 25.0]) != pytest.approx(ruling_span(spans))
+
+
+def test_section_matches_scalar_spans(logic):
+    rng = np.random.default_rng(3)
+    spans = rng.uniform(40, 250, 300)
+    heights = rng.uniform(9, 13, 301)
+    res = calculate_section(spans, heights, 1500.0, 0.779, min_clearance_m=6.0, curve_points=100)
+    assert res.spans.size == 300 and res.spans.clearance_checked.all()
+    for i in (0, 150, 299):
+        ref = logic.calculate_catenary(spans[i], heights[i], heights[i + 1], 1500.0, 0.779)
+        assert res.spans.sag[i] == pytest.approx(ref["sag"])
+        np.testing.assert_allclose(res.spans.y_vals[i], ref["y_vals"])
+    # Desnível aumenta a tração no apoio mais alto em relação ao vão nivelado
+    assert np.all(res.max_tension >= 1500.0 * np.cosh(spans / (2 * res.spans.catenary_constant)) - 1e-9)
+    assert res.ruling_sag == pytest.approx(logic.calculate_catenary(res.ruling_span, 10.0, 10.0, 1500.0, 0.779)["sag"])
+
+
+def test_max_tension_level_and_inclined_spans():
+    spans = np.array([80.0, 150.0])
+    level = calculate_section(spans, [10.0, 10.0, 10.0], 1500.0, 0.779)
+    np.testing.assert_allclose(level.max_tension, 1500.0 * np.cosh(spans / (2 * level.spans.catenary_constant)))
+
+    # 200 m de 10 m a 40 m: vértice perto do apoio baixo, tração no apoio alto
+    res = calculate_section([200.0], [10.0, 40.0], 500.0, 0.779, curve_points=20001)
+    w = 0.779 * KGF_TO_DAN
+    y_min = res.spans.y_vals[0].min()
+    assert res.max_tension[0] == pytest.approx(500.0 + w * (40.0 - y_min), rel=1e-6)
+    assert res.max_tension[0] == pytest.approx(522.92, abs=0.01)
+    assert res.max_tension[0] > 500.0 + w * res.spans.sag[0]
+    # Simétrico: inverter o desnível não muda a tração máxima
+    flipped = calculate_section([200.0], [40.0, 10.0], 500.0, 0.779)
+    assert flipped.max_tension[0] == pytest.approx(res.max_tension[0])
+
+
+def test_temperature_uses_change_of_state_on_ruling_span(logic):
+    spans, heights = [80.0, 120.0, 95.0, 150.0], [10.0, 11.0, 10.5, 12.0, 10.0]
+    name = logic.get_conductor_names()[0]
+    hot = logic.calculate_section(spans, heights, 1200.0, conductor=name, temperature=75.0)
+    mech = logic.get_conductor_mechanics(name)
+    expected = ChangeOfStateSolver(mech).solve(hot.ruling_span, 1200.0, 20.0, 75.0)
+    assert hot.tension_daN == pytest.approx(float(expected))
+    assert hot.weight_kg_m == mech.weight_kg_m
+    cold = logic.calculate_section(spans, heights, 1200.0, conductor=name)
+    assert np.all(hot.spans.sag > cold.spans.sag)
+
+
+def test_invalid_sections(logic):
+    with pytest.raises(ValueError, match="alturas"):
+        calculate_section([80.0, 90.0], [10.0, 10.0], 1000.0, 0.5)
+    with pytest.raises(ValueError, match="positivos"):
+        calculate_section([80.0, -1.0], [10.0, 10.0, 10.0], 1000.0, 0.5)
+    with pytest.raises(ValueError, match="Vão 2"):
+        calculate_section([80.0, 1e6], [10.0, 10.0, 10.0], 10.0, 2.0)
+    with pytest.raises(ValueError, match="peso linear ou o condutor"):
+        logic.calculate_section([80.0], [10.0, 10.0], 1000.0)
+    with pytest.raises(ValueError, match="requer o condutor"):
+        logic.calculate_section([80.0], [10.0, 10.0], 1000.0, weight_kg_m=0.5, temperature=50.0)
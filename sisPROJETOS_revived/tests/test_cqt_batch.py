@@ -0,0 +1,95 @@
+"""
+Testes do cálculo CQT de várias redes em pool de processos (src/modules/cqt/batch.py).
+"""
+
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from src.modules.cqt import batch
+from src.modules.cqt.batch import calculate_networks, default_workers
+from src.modules.cqt.logic import CQTLogic
+
+
+def network(n_points, mono=3, kva=75.0):
+    segments = [{"ponto": "TRAFO", "montante": ""}]
+    for i in range(1, n_points + 1):
+        segments.append(
+            {
+                "ponto": f"P{i}",
+                "montante": "TRAFO" if i == 1 else f"P{i - 1}",
+                "metros": 30,
+                "cabo": "3x70+54.6mm² Al",
+                "mono": mono,
+            }
+        )
+    return {"segments": segments, "trafo_kva": kva, "social_class": "B"}
+
+
+class TestCalculateNetworks:
+    def test_sequential_matches_calculate(self):
+        logic = CQTLogic()
+        jobs = [network(n) for n in (2, 5, 8)]
+        results = calculate_networks(jobs, workers=1, logic=logic)
+        for job, res in zip(jobs, results):
+            assert res == logic.calculate(job["segments"], job["trafo_kva"], "B")
+
+    def test_process_pool_preserves_order_and_values(self):
+        jobs = [network(n) for n in range(1, 13)]
+        pooled = calculate_networks(jobs, workers=3)
+        serial = calculate_networks(jobs, workers=1)
+        assert [r["summary"]["max_cqt"] for r in pooled] == pytest.approx([r["summary"]["max_cqt"] for r in serial])
+
+    def test_failures_are_isolated(self):
+        bad_topology = {"segments": [{"ponto": "P1", "montante": "X"}], "trafo_kva": 75.0}
+        bad_kva = dict(network(2), trafo_kva=-1)
+        results = calculate_networks([network(2), bad_topology, bad_kva, {"segments": []}], workers=2)
+        assert [r["success"] for r in results] == [True, False, False, False]
+        assert "TRAFO" in results[1]["error"]
+        assert results[3]["error"]
+
+    def test_include_results_false_keeps_only_summary(self):
+        (res,) = calculate_networks([network(3)], workers=1, include_results=False)
+        assert "results" not in res
+        assert res["summary"]["max_cqt"] > 0
+
+    def test_unavailable_pool_falls_back_to_sequential(self, mocker):
+        batch.shutdown_pool()
+        mocker.patch.object(batch, "ProcessPoolExecutor", side_effect=OSError("sem fork"))
+        results = calculate_networks([network(2), network(3)], workers=4)
+        assert all(r["success"] for r in results)
+
+    def test_broken_pool_is_discarded(self, mocker):
+        pool = batch.get_pool()
+        mocker.patch.object(batch, "_run_pooled", side_effect=BrokenProcessPool("processo encerrado"))
+        results = calculate_networks([network(2), network(3)], workers=2)
+        assert all(r["success"] for r in results)
+        assert batch._pool is None
+        mocker.stopall()
+        assert batch.get_pool() is not pool
+        batch.shutdown_pool()
+
+
+class TestSharedPool:
+    def test_pool_reused_across_calls_and_shut_down(self, monkeypatch):
+        batch.shutdown_pool()
+        monkeypatch.setenv("SISPROJETOS_CQT_WORKERS", "2")
+        jobs = [network(n) for n in range(1, 9)]
+        first = calculate_networks(jobs, workers=8)
+        pool = batch._pool
+        assert pool is not None
+        second = calculate_networks(jobs, workers=2)
+        assert batch._pool is pool
+        assert first == second == calculate_networks(jobs, workers=1)
+        batch.shutdown_pool()
+        assert batch._pool is None
+
+
+class TestDefaultWorkers:
+    def test_env_variable(self, monkeypatch):
+        monkeypatch.setenv("SISPROJETOS_CQT_WORKERS", "3")
+        assert default_workers() == 3
+
+    def test_invalid_env_falls_back_to_cpus(self, monkeypatch):
+        monkeypatch.setenv("SISPROJETOS_CQT_WORKERS", "muitos")
+        assert 1 <= default_workers() <= 8
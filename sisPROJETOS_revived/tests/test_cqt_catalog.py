@@ -0,0 +1,103 @@
+"""
+Testes do cache de coeficientes K do CQT (src/modules/cqt/catalog.py) e dos
+contadores de revisão de catálogo do DatabaseManager.
+"""
+
+import sqlite3
+
+import pytest
+
+from src.database.db_manager import DatabaseManager
+from src.modules.cqt.catalog import CableCoefCache
+from src.modules.cqt.logic import CQTLogic
+
+
+@pytest.fixture
+def db(tmp_path):
+    return DatabaseManager(db_path=str(tmp_path / "catalog.db"))
+
+
+def _update_coef(db_path, cabo, value):
+    conn = sqlite3.connect(db_path)
+    conn.execute("UPDATE cable_technical_data SET value=? WHERE key_name=?", (value, cabo))
+    conn.commit()
+    conn.close()
+
+
+class TestCatalogRevision:
+    """Contadores de revisão mantidos por triggers."""
+
+    def test_revision_increments_on_external_update(self, db):
+        before = db.get_catalog_revision("cable_technical_data")
+        _update_coef(db.db_path, "3x35+54.6mm² Al", 0.25)
+        assert db.get_catalog_revision("cable_technical_data") == before + 1
+
+    def test_revision_increments_on_add_conductor(self, db):
+        before = db.get_catalog_revision("conductors")
+        db.add_conductor({"name": "Condutor Teste", "weight": 0.3})
+        assert db.get_catalog_revision("conductors") == before + 1
+
+    def test_reinit_does_not_bump_revision(self, db):
+        before = db.get_catalog_revision("cable_technical_data")
+        DatabaseManager(db_path=db.db_path)
+        assert db.get_catalog_revision("cable_technical_data") == before
+
+    def test_untracked_table_returns_zero(self, db):
+        assert db.get_catalog_revision("app_settings") == 0
+
+
+class TestCableCoefCache:
+    """Cache compartilhado de coeficientes K."""
+
+    def test_second_get_does_not_reload(self, db, mocker):
+        cache = CableCoefCache()
+        spy = mocker.spy(CableCoefCache, "_load")
+        first = cache.get(db)
+        second = cache.get(db)
+        assert first is second
+        assert spy.call_count == 1
+
+    def test_reload_after_table_change(self, db):
+        cache = CableCoefCache()
+        assert cache.get(db)["3x35+54.6mm² Al"] == pytest.approx(0.2416)
+        _update_coef(db.db_path, "3x35+54.6mm² Al", 0.3)
+        assert cache.get(db)["3x35+54.6mm² Al"] == pytest.approx(0.3)
+
+    def test_invalidate_forces_reload(self, db, mocker):
+        cache = CableCoefCache()
+        spy = mocker.spy(CableCoefCache, "_load")
+        cache.get(db)
+        cache.invalidate(db.db_path)
+        cache.get(db)
+        cache.invalidate()
+        cache.get(db)
+        assert spy.call_count == 3
+
+
+class TestCQTLogicUsesCache:
+    """``CQTLogic.calculate`` não consulta o banco por trecho."""
+
+    def test_calculate_opens_at_most_one_connection(self, db, mocker):
+        cqt = CQTLogic()
+        cqt.db = db
+        cqt.get_cable_coefs()  # aquece o cache
+        segments = [{"ponto": "TRAFO", "montante": ""}] + [
+            {"ponto": f"P{i}", "montante": "TRAFO" if i == 1 else f"P{i - 1}", "metros": 30, "mono": 1}
+            for i in range(1, 201)
+        ]
+        spy = mocker.spy(db, "get_connection")
+        result = cqt.calculate(segments, trafo_kva=75, social_class="B")
+        assert result["success"] is True
+        assert spy.call_count <= 1
+
+    def test_calculate_sees_updated_coefficient(self, db):
+        cqt = CQTLogic()
+        cqt.db = db
+        segments = [
+            {"ponto": "TRAFO", "montante": ""},
+            {"ponto": "P1", "montante": "TRAFO", "metros": 100, "cabo": "3x35+54.6mm² Al", "mono": 1},
+        ]
+        before = cqt.calculate(segments, trafo_kva=75)["results"]["P1"]["cqt_trecho"]
+        _update_coef(db.db_path, "3x35+54.6mm² Al", 2 * 0.2416)
+        after = cqt.calculate(segments, trafo_kva=75)["results"]["P1"]["cqt_trecho"]
+        assert after == pytest.approx(2 * before)
@@ -0,0 +1,238 @@
+"""
+Testes da importação em streaming de planilhas CQT (src/modules/cqt/importer.py).
+"""
+
+import csv
+import os
+import random
+
+import numpy as np
+import pytest
+from openpyxl import Workbook, load_workbook
+
+from src.modules.cqt.importer import CQTImporter
+from src.modules.cqt.logic import CQTLogic
+
+TEMPLATE = os.path.join(os.path.dirname(__file__), "..", "src", "resources", "templates", "cqt.xlsx")
+FIELDS = ["ponto", "montante", "metros", "cabo", "mono", "bi", "tri", "tri_esp", "carga_esp"]
+CABLES = ["3x35+54.6mm² Al", "3x70+54.6mm² Al", "3x95+54.6mm² Al"]
+
+
+def make_segments(n, seed=0):
+    rng = random.Random(seed)
+    segments = [{"ponto": "TRAFO", "montante": "", "metros": 0, "cabo": "", "mono": 0, "bi": 0, "tri": 0}]
+    for i in range(1, n):
+        segments.append(
+            {
+                "ponto": f"P{i}",
+                "montante": "TRAFO" if i == 1 else f"P{rng.randrange(1, i)}",
+                "metros": rng.choice([20.0, 35.5, 40.0]),
+                "cabo": rng.choice(CABLES),
+                "mono": rng.randrange(0, 4),
+                "bi": rng.randrange(0, 2),
+                "tri": 0,
+                "tri_esp": 0,
+                "carga_esp": rng.choice([0.0, 0.0, 2.5]),
+            }
+        )
+    return segments
+
+
+def write_csv(path, segments, delimiter=";", header=FIELDS):
+    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f, delimiter=delimiter)
+        writer.writerow(header)
+        for s in segments:
+            writer.writerow([s.get(k, "") for k in FIELDS])
+    return str(path)
+
+
+def write_xlsx(path, segments, header=FIELDS, title_rows=0, sheet="REDE"):
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "CAPA"
+    ws.append(["Projeto de teste"])
+    ws = wb.create_sheet(sheet)
+    for _ in range(title_rows):
+        ws.append(["CÁLCULO DE QUEDA DE TENSÃO"])
+    ws.append(header)
+    for s in segments:
+        ws.append([s.get(k) for k in FIELDS])
+    wb.save(path)
+    return str(path)
+
+
+@pytest.fixture
+def importer():
+    return CQTImporter(CQTLogic())
+
+
+def assert_same_results(importer, result, segments):
+    logic = importer.logic
+    expected = logic.calculate(segments, 150.0, "B")
+    actual = logic.calculate_compiled(result.network, 150.0, "B")
+    assert actual["summary"] == pytest.approx(expected["summary"])
+    assert actual["results"].keys() == expected["results"].keys()
+    for ponto, row in expected["results"].items():
+        assert actual["results"][ponto] == pytest.approx(row)
+
+
+class TestCSVImport:
+    def test_matches_calculate(self, importer, tmp_path):
+        segments = make_segments(300)
+        result = importer.import_file(write_csv(tmp_path / "rede.csv", segments))
+        assert result.success and result.rows == 300
+        assert result.network.points[0] == "TRAFO"
+        assert_same_results(importer, result, segments)
+
+    def test_comma_delimiter_and_decimal_comma(self, importer, tmp_path):
+        path = tmp_path / "rede.csv"
+        path.write_text(
+            "PONTO;MONTANTE;METROS;CABO;MONO\nTRAFO;;;;\nP1;TRAFO;35,5;3x70+54.6mm² Al;2\n", encoding="utf-8"
+        )
+        result = importer.import_file(str(path))
+        assert result.success
+        assert result.network.metros[result.network.index["P1"]] == pytest.approx(35.5)
+
+        segments = make_segments(20)
+        result = importer.import_file(write_csv(tmp_path / "virgula.csv", segments, delimiter=","))
+        assert_same_results(importer, result, segments)
+
+    def test_progress_reported_per_chunk(self, importer, tmp_path):
+        calls = []
+        importer.import_file(
+            write_csv(tmp_path / "rede.csv", make_segments(250)), chunk_size=100, progress=calls.append
+        )
+        assert calls == [100, 200, 250]
+
+    def test_row_errors_collected_with_line_numbers(self, importer, tmp_path):
+        segments = make_segments(10)
+        segments[3]["metros"] = "abc"
+        segments[5]["mono"] = -1
+        segments[7]["montante"] = ""
+        segments.append({"ponto": "P99"})  # numeração pré-impressa, sem dados: ignorada
+        result = importer.import_file(write_csv(tmp_path / "rede.csv", segments))
+        assert not result.success and result.network is None
+        assert result.error_count == 3 and result.rows == 7
+        assert result.errors[0].startswith("Linha 5 (ponto 'P3'): metros")
+        assert "montante não informado" in result.errors[2]
+
+    def test_topology_errors_use_validator_message(self, importer, tmp_path):
+        segments = make_segments(10)
+        segments[4]["montante"] = "INEXISTENTE"
+        result = importer.import_file(write_csv(tmp_path / "rede.csv", segments))
+        assert not result.success
+        assert result.topology is not None and "P4" in result.topology.unknown_montante
+        assert "montante inexistente" in result.errors[0]
+
+    def test_duplicate_points_follow_calculate(self, importer, tmp_path):
+        segments = make_segments(30)
+        segments.append(dict(segments[10], mono=7))
+        result = importer.import_file(write_csv(tmp_path / "rede.csv", segments))
+        assert result.success and result.topology.duplicates == {"P10": 2}
+        assert_same_results(importer, result, segments)
+
+    def test_unknown_cable_is_a_warning(self, importer, tmp_path):
+        segments = make_segments(5)
+        segments[2]["cabo"] = "CABO XYZ"
+        result = importer.import_file(write_csv(tmp_path / "rede.csv", segments))
+        assert result.success
+        assert "CABO XYZ" in result.warnings[0]
+
+    def test_missing_header_and_invalid_path(self, importer, tmp_path):
+        path = tmp_path / "rede.csv"
+        path.write_text("a;b\n1;2\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="Cabeçalho"):
+            importer.import_file(str(path))
+        with pytest.raises(ValueError, match="não encontrado"):
+            importer.import_file(str(tmp_path / "nada.csv"))
+        with pytest.raises(ValueError, match="Extensão"):
+            importer.import_file(str(tmp_path / "rede.pdf"))
+
+
+class TestXLSXImport:
+    def test_template_headers_after_title_rows(self, importer, tmp_path):
+        header = [
+            "TRECHO",
+            "TRECHO MONTANTE",
+            "COMPRIMENTO (M)",
+            "CONDUTOR",
+            "MONO",
+            "BI",
+            "TRI",
+            "TRI ESPECIAL",
+            "CARGA",
+        ]
+        segments = make_segments(200)
+        # Pontos numéricos como no modelo (2, 3, ...) chegam como int/float do Excel
+        for s in segments[1:]:
+            s["ponto"] = int(s["ponto"][1:]) + 1
+            if s["montante"] != "TRAFO":
+                s["montante"] = float(int(s["montante"][1:]) + 1)
+        path = write_xlsx(tmp_path / "cqt.xlsx", segments, header=header, title_rows=7)
+        result = importer.import_file(path)
+        assert result.success and result.sheet == "REDE"
+        assert result.columns["ponto"] == "TRECHO"
+        assert "2" in result.network.index
+        textual = [dict(s, ponto=str(s["ponto"]), montante=str(s["montante"]).replace(".0", "")) for s in segments]
+        assert_same_results(importer, result, textual)
+
+    def test_repo_template_lengths_and_loads(self, importer, tmp_path):
+        # Modelo real: comprimento em centenas de metros, CONDUTOR acima do cabeçalho,
+        # cargas na aba "ATUAL" (inclusive as do TRAFO, sem linha própria em "CQT ATUAL")
+        wb = load_workbook(TEMPLATE)
+        cqt, cargas = wb["CQT ATUAL"], wb["ATUAL"]
+        for row, (montante, hm, cabo) in zip(
+            (11, 12, 13), (("TRAFO", 0.35, CABLES[1]), (2, 0.4, CABLES[0]), (2, 0.25, CABLES[0]))
+        ):
+            cqt.cell(row, 2, montante)
+            cqt.cell(row, 3, hm)
+            cqt.cell(row, 9, cabo)
+        cargas["L3"], cargas["L4"], cargas["M5"], cargas["L6"], cargas["P6"] = 1, 3, 1, 2, 2.5
+        path = tmp_path / "cqt.xlsx"
+        wb.save(path)
+
+        result = importer.import_file(str(path))
+        assert result.success and not result.warnings
+        assert result.sheet == "CQT ATUAL" and result.load_sheet == "ATUAL"
+        assert result.columns["metros"] == "COMPRIMENTO" and result.columns["cabo"] == "CONDUTOR"
+        segments = [
+            {"ponto": "TRAFO", "montante": "", "metros": 0, "cabo": "", "mono": 1},
+            {"ponto": "2", "montante": "TRAFO", "metros": 35.0, "cabo": CABLES[1], "mono": 3},
+            {"ponto": "3", "montante": "2", "metros": 40.0, "cabo": CABLES[0], "bi": 1},
+            {"ponto": "4", "montante": "2", "metros": 25.0, "cabo": CABLES[0], "mono": 2, "carga_esp": 2.5},
+        ]
+        assert result.network.size == 4
+        assert result.network.metros[result.network.index["3"]] == pytest.approx(40.0)
+        assert_same_results(importer, result, segments)
+
+    def test_missing_columns_are_warnings(self, importer, tmp_path):
+        path = tmp_path / "rede.csv"
+        path.write_text("PONTO;MONTANTE\nTRAFO;\nP1;TRAFO\n", encoding="utf-8")
+        result = importer.import_file(str(path))
+        assert result.success and len(result.warnings) == 3
+        assert "comprimento" in result.warnings[0] and "carga" in result.warnings[2]
+
+    def test_explicit_missing_sheet(self, importer, tmp_path):
+        path = write_xlsx(tmp_path / "cqt.xlsx", make_segments(5))
+        with pytest.raises(ValueError, match="Aba 'X'"):
+            importer.import_file(path, sheet="X")
+
+
+class TestLargeImport:
+    def test_100k_rows_streamed_in_chunks(self, importer, tmp_path):
+        n = 100_000
+        path = tmp_path / "grande.csv"
+        with open(path, "w", newline="") as f:
+            f.write("ponto;montante;metros;cabo;mono\nTRAFO;;0;;0\n")
+            for i in range(1, n):
+                f.write(f"P{i};{'TRAFO' if i < 4 else f'P{(i - 1) // 3}'};25;3x70+54.6mm² Al;1\n")
+        calls = []
+        result = importer.import_file(str(path), chunk_size=25_000, progress=calls.append)
+        network = result.network
+        assert result.success and network.size == n
+        assert calls == [25_000, 50_000, 75_000, 100_000]
+        assert np.all(network.parent[1:] < np.arange(1, n))
+        assert network.total_clients == n - 1
+        res = importer.logic.solve_compiled(network, "B")
+        assert np.isfinite(res.cqt_accumulated).all()
@@ -0,0 +1,108 @@
+"""
+Testes da análise Monte Carlo do CQT (src/modules/cqt/montecarlo.py).
+"""
+
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pytest
+from conftest import make_network
+
+from src.modules.cqt import batch
+from src.modules.cqt.logic import CQTLogic
+from src.modules.cqt.montecarlo import MonteCarloCQT
+
+
+@pytest.fixture
+def logic():
+    return CQTLogic()
+
+
+@pytest.fixture
+def mc(logic):
+    return MonteCarloCQT(logic)
+
+
+class TestMonteCarloCQT:
+    def test_zero_variance_reproduces_calculate(self, logic, mc):
+        segments = make_network(40, seed=1)
+        res = mc.run(segments, trials=20, client_cv=0.0, carga_esp_cv=0.0, batch_size=7, seed=0)
+        ref = logic.calculate(segments, trafo_kva=112.5, social_class="B")
+        for i, p in enumerate(res.network.points):
+            expected = ref["results"][p]["cqt_accumulated"]
+            assert res.mean_cqt[i] == pytest.approx(expected, rel=1e-5)
+            assert res.percentiles[95.0][i] == pytest.approx(expected, rel=1e-5)
+            assert res.exceed_probability[i] == float(expected > logic.CQT_LIMIT_PERCENT)
+        assert np.allclose(res.max_cqt, ref["summary"]["max_cqt"], rtol=1e-5)
+
+    def test_same_seed_is_reproducible(self, mc):
+        segments = make_network(30, seed=2)
+        a = mc.run(segments, trials=100, batch_size=16, seed=42)
+        b = mc.run(segments, trials=100, batch_size=16, seed=42)
+        assert np.array_equal(a.max_cqt, b.max_cqt)
+
+    def test_process_pool_matches_single_process(self, mc):
+        segments = make_network(30, seed=3)
+        serial = mc.run(segments, trials=120, batch_size=30, seed=7)
+        pooled = mc.run(segments, trials=120, batch_size=30, seed=7, workers=2)
+        assert np.array_equal(serial.max_cqt, pooled.max_cqt)
+        assert np.array_equal(serial.exceed_probability, pooled.exceed_probability)
+
+    def test_reuses_shared_pool(self, mc, monkeypatch):
+        batch.shutdown_pool()
+        monkeypatch.setenv("SISPROJETOS_CQT_WORKERS", "2")
+        segments = make_network(20, seed=3)
+        mc.run(segments, trials=60, batch_size=20, seed=7, workers=2)
+        pool = batch._pool
+        assert pool is not None
+        mc.run(segments, trials=60, batch_size=20, seed=8, workers=2)
+        assert batch._pool is pool
+        batch.shutdown_pool()
+
+    def test_broken_pool_falls_back_to_single_process(self, mc, mocker):
+        segments = make_network(20, seed=3)
+        serial = mc.run(segments, trials=60, batch_size=20, seed=7)
+        mocker.patch.object(batch, "_run_pooled", side_effect=BrokenProcessPool("processo encerrado"))
+        pooled = mc.run(segments, trials=60, batch_size=20, seed=7, workers=2)
+        assert np.array_equal(serial.max_cqt, pooled.max_cqt)
+        assert batch._pool is None
+
+    def test_percentiles_are_ordered(self, mc):
+        res = mc.run(make_network(30, seed=4), trials=300, seed=1, percentiles=(5, 50, 95))
+        assert np.all(res.percentiles[5.0] <= res.percentiles[50.0])
+        assert np.all(res.percentiles[50.0] <= res.percentiles[95.0])
+
+    def test_exceed_probability_tracks_load_level(self, logic, mc):
+        segments = make_network(60, seed=5)
+        base = logic.calculate(segments, trafo_kva=112.5, social_class="B")["summary"]["max_cqt"]
+        # Rede escalada para que o CQT base fique exatamente no limite
+        scale = logic.CQT_LIMIT_PERCENT / base
+        scaled = [dict(s, metros=s["metros"] * scale) for s in segments]
+        res = mc.run(scaled, trials=400, client_cv=0.3, carga_esp_cv=0.3, seed=3)
+        assert 0.05 < res.network_exceed_probability < 0.95
+        assert np.all((res.exceed_probability >= 0) & (res.exceed_probability <= 1))
+
+    def test_summary_lists_critical_points(self, logic, mc):
+        segments = [dict(s, metros=s["metros"] * 10) for s in make_network(20, seed=6)]
+        summary = mc.run(segments, trials=50, seed=0).summary(top=3)
+        assert summary["trials"] == 50
+        assert set(summary["max_cqt_percentiles"]) == {50.0, 90.0, 95.0, 99.0}
+        probs = [c["exceed_probability"] for c in summary["critical_points"]]
+        assert 0 < len(probs) <= 3 and probs == sorted(probs, reverse=True)
+
+    def test_invalid_parameters_raise(self, mc):
+        with pytest.raises(ValueError, match="positivos"):
+            mc.run(make_network(5), trials=0)
+        with pytest.raises(ValueError, match="negativos"):
+            mc.run(make_network(5), client_cv=-0.1)
+        with pytest.raises(ValueError, match="TRAFO"):
+            mc.run([{"ponto": "P1", "montante": "P0"}])
+
+    def test_invalid_social_class_raises(self, mc):
+        with pytest.raises(ValueError, match="Classe social inválida"):
+            mc.run(make_network(5), trials=10, social_class="X")
+
+    def test_thousands_of_trials_on_large_network(self, mc):
+        segments = make_network(2000, seed=7)
+        res = mc.run(segments, trials=2000, batch_size=500, seed=0)
+        assert res.max_cqt.shape == (2000,)
@@ -0,0 +1,151 @@
+"""
+Testes do modo rede compilada do CQT (src/modules/cqt/network.py).
+
+Verifica que o cálculo vetorizado sobre arrays NumPy reproduz exatamente o
+resultado de ``CQTLogic.calculate`` e que os kernels aceitam lotes ``(n, k)``.
+"""
+
+import base64
+from functools import partial
+
+import numpy as np
+import pytest
+from conftest import make_network
+
+from src.modules.cqt.logic import CQTLogic
+from src.modules.cqt.network import RESULT_COLUMNS, accumulate_loads, decode_column, propagate_cqt
+
+make_random_network = partial(make_network, metros=(20, 30, 35, 40), bi=(0, 1), tri=(0, 1), carga_esp=(0.0, 0.0, 2.5))
+
+
+@pytest.fixture
+def cqt():
+    return CQTLogic()
+
+
+class TestCompileNetwork:
+    """Testes de compilação da topologia em arrays."""
+
+    def test_trafo_is_index_zero_and_parents_precede_children(self, cqt):
+        net = cqt.compile_network(make_random_network(50))
+        assert net.points[0] == "TRAFO"
+        assert net.parent[0] == -1
+        assert np.all(net.parent[1:] < np.arange(1, net.size))
+
+    def test_depth_matches_parent_chain(self, cqt):
+        net = cqt.compile_network(make_random_network(30, seed=3))
+        for i in range(1, net.size):
+            assert net.depth[i] == net.depth[net.parent[i]] + 1
+
+    def test_points_are_uppercased(self, cqt):
+        segments = [{"ponto": "trafo", "montante": ""}, {"ponto": "p1", "montante": "trafo", "mono": 2}]
+        net = cqt.compile_network(segments)
+        assert net.points == ["TRAFO", "P1"]
+        assert net.index["P1"] == 1
+
+    def test_invalid_topology_raises_value_error(self, cqt):
+        with pytest.raises(ValueError, match="TRAFO"):
+            cqt.compile_network([{"ponto": "P1", "montante": "P2"}])
+
+    def test_cable_coefs_unknown_cable_is_zero(self, cqt):
+        segments = [
+            {"ponto": "TRAFO", "montante": ""},
+            {"ponto": "P1", "montante": "TRAFO", "cabo": "CABO_INEXISTENTE"},
+        ]
+        net = cqt.compile_network(segments)
+        coef = net.cable_coefs(cqt.CABOS_COEFS)
+        assert coef[1] == 0.0
+
+
+class TestCalculateCompiled:
+    """Equivalência entre o modo compilado e ``CQTLogic.calculate``."""
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    @pytest.mark.parametrize("social_class", ["A", "C"])
+    def test_matches_reference_calculation(self, cqt, seed, social_class):
+        segments = make_random_network(120, seed=seed)
+        ref = cqt.calculate(segments, trafo_kva=112.5, social_class=social_class)
+        res = cqt.calculate_compiled(cqt.compile_network(segments), trafo_kva=112.5, social_class=social_class)
+
+        assert res["success"] is True
+        assert list(res["results"]) == list(ref["results"])
+        for p, row in ref["results"].items():
+            for key, value in row.items():
+                assert res["results"][p][key] == pytest.approx(value, rel=1e-12, abs=1e-12)
+        assert res["summary"]["max_cqt"] == pytest.approx(ref["summary"]["max_cqt"])
+        assert res["summary"]["total_kva"] == pytest.approx(ref["summary"]["total_kva"])
+        assert res["summary"]["segments_over_limit"] == ref["summary"]["segments_over_limit"]
+        assert res["summary"]["within_enel_limit"] == ref["summary"]["within_enel_limit"]
+
+    def test_invalid_social_class_returns_error(self, cqt):
+        net = cqt.compile_network(make_random_network(5))
+        res = cqt.calculate_compiled(net, trafo_kva=75, social_class="X")
+        assert res["success"] is False
+        assert "Classe social" in res["error"]
+
+    def test_invalid_trafo_kva_returns_error(self, cqt):
+        net = cqt.compile_network(make_random_network(5))
+        res = cqt.calculate_compiled(net, trafo_kva=-1, social_class="B")
+        assert res["success"] is False
+
+    def test_solve_compiled_reuses_network(self, cqt):
+        net = cqt.compile_network(make_random_network(40))
+        first = cqt.solve_compiled(net, "B")
+        second = cqt.solve_compiled(net, "D")
+        assert second.total_kva > first.total_kva
+        assert first.network is second.network
+
+
+class TestKernels:
+    """Kernels vetorizados aceitam lotes com os nós no eixo 0."""
+
+    def test_batched_accumulation_equals_column_by_column(self, cqt):
+        net = cqt.compile_network(make_random_network(60, seed=7))
+        local = np.random.default_rng(0).random((net.size, 4))
+        batched = accumulate_loads(net, local)
+        for k in range(local.shape[1]):
+            np.testing.assert_allclose(batched[:, k], accumulate_loads(net, local[:, k]))
+
+    def test_accumulation_total_at_trafo(self, cqt):
+        net = cqt.compile_network(make_random_network(60, seed=8))
+        local = np.ones(net.size)
+        assert accumulate_loads(net, local)[0] == pytest.approx(net.size)
+
+    def test_propagate_sums_path_to_trafo(self, cqt):
+        net = cqt.compile_network(make_random_network(25, seed=9))
+        trecho = np.ones(net.size)
+        trecho[0] = 0.0
+        np.testing.assert_allclose(propagate_cqt(net, trecho), net.depth.astype(float))
+
+
+class TestColumnarResults:
+    """Formato colunar (listas ou base64) equivalente ao 'results' por ponto."""
+
+    @pytest.mark.parametrize("result_format", ["columnar", "base64"])
+    def test_columns_match_dict_results(self, cqt, result_format):
+        segments = make_random_network(80, seed=11)
+        expected = cqt.calculate(segments, trafo_kva=112.5, social_class="C")
+        res = cqt.calculate(segments, trafo_kva=112.5, social_class="C", result_format=result_format)
+        assert "results" not in res and res["summary"] == expected["summary"]
+        columns = res["columns"]
+        assert columns["points"] == list(expected["results"])
+        for name in RESULT_COLUMNS:
+            values = decode_column(columns[name]) if result_format == "base64" else columns[name]
+            np.testing.assert_allclose(values, [r[name] for r in expected["results"].values()])
+
+    def test_base64_is_little_endian_float64(self, cqt):
+        net = cqt.compile_network(make_random_network(10))
+        columns = cqt.solve_compiled(net).to_columns("base64")
+        assert columns["dtype"] == "<f8"
+        raw = np.frombuffer(base64.b64decode(columns["cqt_accumulated"]), dtype="<f8")
+        assert raw.shape == (net.size,)
+
+    def test_invalid_format_returns_error(self, cqt):
+        res = cqt.calculate(make_random_network(3), trafo_kva=75, result_format="xml")
+        assert res["success"] is False
+        with pytest.raises(ValueError):
+            cqt.solve_compiled(cqt.compile_network(make_random_network(3))).to_columns("xml")
+
+    def test_invalid_topology_returns_error(self, cqt):
+        res = cqt.calculate([{"ponto": "P1", "montante": "X"}], trafo_kva=75, result_format="columnar")
+        assert res["success"] is False and "TRAFO" in res["error"]
@@ -0,0 +1,116 @@
+"""
+Testes do dimensionamento automático de cabos CQT (src/modules/cqt/optimizer.py).
+"""
+
+import itertools
+from functools import partial
+
+import pytest
+from conftest import make_network
+
+from src.modules.cqt.logic import CQTLogic
+from src.modules.cqt.optimizer import CableSizingOptimizer, default_cable_costs
+
+# Árvore recursiva aleatória (profundidade ~ log n), sem cabos definidos
+make_unsized_network = partial(make_network, window=None, metros=(20, 30), cabos=("",), mono=(0, 2), carga_esp=(0.0,))
+
+
+@pytest.fixture
+def logic():
+    return CQTLogic()
+
+
+@pytest.fixture
+def optimizer(logic):
+    return CableSizingOptimizer(logic)
+
+
+def _brute_force(logic, segments, names, costs, limit):
+    """Menor custo viável por enumeração exaustiva (redes pequenas)."""
+    best = None
+    points = [s["ponto"] for s in segments[1:]]
+    for combo in itertools.product(names, repeat=len(points)):
+        trial = [dict(segments[0])] + [dict(s, cabo=c) for s, c in zip(segments[1:], combo)]
+        res = logic.calculate(trial, trafo_kva=75, social_class="B")
+        if res["summary"]["max_cqt"] <= limit:
+            cost = sum(costs[c] * s["metros"] for s, c in zip(segments[1:], combo))
+            best = cost if best is None else min(best, cost)
+    return best
+
+
+class TestCableSizingOptimizer:
+    def test_result_respects_limit(self, logic, optimizer):
+        segments = make_unsized_network(60, seed=1)
+        res = optimizer.optimize(segments)
+        assert res["success"] is True
+        check = logic.calculate(res["segments"], trafo_kva=112.5, social_class="B")
+        assert check["summary"]["within_enel_limit"] is True
+        assert res["max_cqt"] == pytest.approx(check["summary"]["max_cqt"])
+
+    def test_every_point_receives_a_catalog_cable(self, logic, optimizer):
+        res = optimizer.optimize(make_unsized_network(20, seed=2))
+        assert set(res["cables"]) == {f"P{i}" for i in range(1, 21)}
+        assert set(res["cables"].values()) <= set(logic.get_cable_coefs())
+
+    @pytest.mark.parametrize("seed", [0, 3, 5])
+    def test_matches_brute_force_optimum(self, logic, optimizer, seed):
+        segments = make_unsized_network(5, seed=seed, metros=(40, 60, 80), mono=(1, 4))
+        names = ["2#16(25)mm² Al", "3x35+54.6mm² Al", "3x95+54.6mm² Al"]
+        costs = default_cable_costs(logic.get_cable_coefs())
+        best = _brute_force(logic, segments, names, costs, logic.CQT_LIMIT_PERCENT)
+        res = optimizer.optimize(segments, candidates=names, resolution=4000)
+        assert res["success"] is True
+        # Discretização conservadora: nunca abaixo do ótimo exato, muito próxima dele
+        assert res["total_cost"] >= best - 1e-9
+        assert res["total_cost"] == pytest.approx(best, rel=0.02)
+
+    def test_custom_costs_prefer_cheaper_cable(self, optimizer):
+        segments = make_unsized_network(10, seed=4, metros=(10,), mono=(1, 1))
+        costs = {"3x150+70mm² Al": 1.0, "2#16(25)mm² Al": 50.0}
+        res = optimizer.optimize(segments, cable_costs=costs)
+        assert set(res["cables"].values()) == {"3x150+70mm² Al"}
+
+    def test_light_network_uses_cheapest_cable(self, optimizer):
+        segments = make_unsized_network(10, seed=4, metros=(10,), mono=(1, 1))
+        res = optimizer.optimize(segments)
+        assert set(res["cables"].values()) == {"2#16(25)mm² Al"}
+
+    def test_changed_lists_points_with_new_cable(self, optimizer):
+        segments = make_unsized_network(4, seed=6, metros=(10,), mono=(1, 1))
+        segments[1]["cabo"] = "2#16(25)mm² Al"
+        res = optimizer.optimize(segments)
+        assert "P1" not in res["changed"]
+        assert {"P2", "P3", "P4"} <= set(res["changed"])
+
+    def test_infeasible_network_returns_error(self, optimizer):
+        segments = make_unsized_network(5, seed=0, metros=(2000,), mono=(40, 40))
+        res = optimizer.optimize(segments)
+        assert res["success"] is False
+        assert "Nenhuma combinação" in res["error"]
+
+    def test_invalid_topology_returns_error(self, optimizer):
+        res = optimizer.optimize([{"ponto": "P1", "montante": "P0"}])
+        assert res["success"] is False
+
+    def test_unknown_candidates_return_error(self, optimizer):
+        res = optimizer.optimize(make_unsized_network(3), candidates=["CABO_X"])
+        assert res["success"] is False
+        assert "candidato" in res["error"]
+
+    def test_social_class_validated_like_calculate(self, optimizer):
+        segments = make_unsized_network(6, seed=2)
+        assert optimizer.optimize(segments, social_class="c") == optimizer.optimize(segments, social_class="C")
+        with pytest.raises(ValueError, match="Classe social inválida"):
+            optimizer.optimize(segments, social_class="X")
+        with pytest.raises(ValueError):
+            optimizer.optimize(segments, social_class="")
+
+    def test_trafo_only_network(self, optimizer):
+        res = optimizer.optimize([{"ponto": "TRAFO", "montante": ""}])
+        assert res["success"] is True
+        assert res["cables"] == {}
+
+    def test_thousand_node_network(self, optimizer):
+        segments = make_unsized_network(1000, seed=9, metros=(5, 8), mono=(0, 1))
+        res = optimizer.optimize(segments)
+        assert res["success"] is True
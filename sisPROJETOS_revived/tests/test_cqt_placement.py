@@ -0,0 +1,129 @@
+"""
+Testes do posicionamento do TRAFO por reenraizamento (src/modules/cqt/placement.py).
+
+A referência é ``CQTLogic.calculate`` sobre os trechos reorientados a partir
+de cada candidato (O(n²) — viável apenas para redes pequenas).
+"""
+
+import pytest
+from conftest import make_network
+
+from src.modules.cqt.logic import CQTLogic
+from src.modules.cqt.placement import TrafoPlacementAnalyzer
+
+
+def make_rootable_network(n_points, seed=0):
+    """Rede aleatória com cargas no próprio TRAFO (viram ponto de carga ao reenraizar)."""
+    segments = make_network(
+        n_points, seed, window=None, metros=(20, 30, 45), mono=(0, 4), tri=(0, 1), carga_esp=(0.0, 0.0, 2.0)
+    )
+    segments[0].update(mono=2, carga_esp=1.5)
+    return segments
+
+
+def reroot(segments, new_root):
+    """Reorienta os trechos para que ``new_root`` seja a origem (renomeada 'TRAFO')."""
+    rows = {s["ponto"]: dict(s) for s in segments}
+    # Caminho do novo TRAFO até a origem atual
+    path = [new_root]
+    while rows[path[-1]]["montante"]:
+        path.append(rows[path[-1]]["montante"])
+    # Cada trecho do caminho passa para o antigo montante, invertendo o sentido
+    edges = {p: (rows[p]["montante"], rows[p]["metros"], rows[p]["cabo"]) for p in path[:-1]}
+    for child in path[:-1]:
+        up, metros, cabo = edges[child]
+        rows[up].update(montante=child, metros=metros, cabo=cabo)
+    rows[new_root].update(montante="", metros=0, cabo="")
+
+    def name(p):
+        if p == new_root:
+            return "TRAFO"
+        return "OLD_TRAFO" if p == "TRAFO" else p
+
+    return [
+        dict(r, ponto=name(r["ponto"]), montante=name(r["montante"]) if r["montante"] else "") for r in rows.values()
+    ]
+
+
+@pytest.fixture
+def logic():
+    return CQTLogic()
+
+
+@pytest.fixture
+def analyzer(logic):
+    return TrafoPlacementAnalyzer(logic)
+
+
+class TestTrafoPlacement:
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_matches_full_recalculation_for_every_root(self, logic, analyzer, seed):
+        segments = make_rootable_network(25, seed=seed)
+        res = analyzer.analyze(segments)
+        assert res["success"] is True
+        by_point = {c["ponto"]: c for c in res["candidates"]}
+        assert len(by_point) == 26
+        for ponto in by_point:
+            ref = logic.calculate(reroot(segments, ponto), trafo_kva=112.5, social_class="B")
+            assert ref["success"] is True
+            assert by_point[ponto]["max_cqt"] == pytest.approx(ref["summary"]["max_cqt"], abs=1e-9), ponto
+            assert by_point[ponto]["total_kva"] == pytest.approx(ref["summary"]["total_kva"])
+
+    def test_candidates_are_ranked_by_max_cqt(self, analyzer):
+        res = analyzer.analyze(make_rootable_network(40, seed=3))
+        values = [c["max_cqt"] for c in res["candidates"]]
+        assert values == sorted(values)
+
+    def test_current_matches_calculate(self, logic, analyzer):
+        segments = make_rootable_network(30, seed=4)
+        res = analyzer.analyze(segments)
+        ref = logic.calculate(segments, trafo_kva=112.5, social_class="B")
+        assert res["current"]["ponto"] == "TRAFO"
+        assert res["current"]["max_cqt"] == pytest.approx(ref["summary"]["max_cqt"])
+
+    def test_central_point_beats_end_of_line(self, analyzer):
+        segments = [{"ponto": "TRAFO", "montante": "", "metros": 0, "cabo": ""}]
+        for i in range(1, 9):
+            segments.append(
+                {
+                    "ponto": f"P{i}",
+                    "montante": "TRAFO" if i == 1 else f"P{i - 1}",
+                    "metros": 30,
+                    "cabo": "3x35+54.6mm² Al",
+                    "mono": 3,
+                }
+            )
+        res = analyzer.analyze(segments)
+        assert res["candidates"][0]["ponto"] in {"P4", "P5"}
+        assert res["candidates"][0]["max_cqt"] < res["current"]["max_cqt"]
+
+    def test_candidate_subset_and_top(self, analyzer):
+        res = analyzer.analyze(make_rootable_network(20, seed=5), candidates=["p3", "P7", "TRAFO"], top=2)
+        assert len(res["candidates"]) == 2
+        assert {c["ponto"] for c in res["candidates"]} <= {"P3", "P7", "TRAFO"}
+
+    def test_unknown_candidate_returns_error(self, analyzer):
+        res = analyzer.analyze(make_rootable_network(5), candidates=["NAO_EXISTE"])
+        assert res["success"] is False
+        assert "NAO_EXISTE" in res["error"]
+
+    def test_invalid_topology_returns_error(self, analyzer):
+        res = analyzer.analyze([{"ponto": "P1", "montante": "P0"}])
+        assert res["success"] is False
+
+    def test_social_class_validated_like_calculate(self, analyzer):
+        segments = make_rootable_network(8, seed=1)
+        assert analyzer.analyze(segments, social_class="d") == analyzer.analyze(segments, social_class="D")
+        with pytest.raises(ValueError, match="Classe social inválida"):
+            analyzer.analyze(segments, social_class="X")
+
+    def test_trafo_only_network(self, analyzer):
+        res = analyzer.analyze([{"ponto": "TRAFO", "montante": ""}])
+        assert res["success"] is True
+        assert res["candidates"][0]["max_cqt"] == 0.0
+
+    def test_large_network(self, analyzer):
+        segments = make_rootable_network(20000, seed=6)
+        res = analyzer.analyze(segments, top=10)
+        assert res["success"] is True
+        assert len(res["candidates"]) == 10
@@ -0,0 +1,126 @@
+"""
+Testes da avaliação CQT multi-cenário (src/modules/cqt/scenarios.py).
+"""
+
+import numpy as np
+import pytest
+from conftest import make_network
+
+from src.modules.cqt.logic import CQTLogic
+from src.modules.cqt.scenarios import ScenarioEvaluator, demand_factors
+
+
+@pytest.fixture
+def logic():
+    return CQTLogic()
+
+
+@pytest.fixture
+def evaluator(logic):
+    return ScenarioEvaluator(logic)
+
+
+class TestDemandFactors:
+    def test_matches_scalar_lookup(self, logic):
+        counts = [0, 1, 5, 6, 10, 11, 20, 21, 30, 31, 50, 51, 9999, 10000]
+        for cls in "ABCD":
+            expected = [logic.get_fator_demanda(c, cls) for c in counts]
+            assert demand_factors(logic, counts, cls).tolist() == expected
+
+    def test_one_class_per_scenario(self, logic):
+        fd = demand_factors(logic, [10, 10], ["A", "D"])
+        assert fd.tolist() == [logic.get_fator_demanda(10, "A"), logic.get_fator_demanda(10, "D")]
+
+    def test_class_count_mismatch_raises(self, logic):
+        with pytest.raises(ValueError, match="classes sociais"):
+            demand_factors(logic, [1, 2, 3], ["A", "B"])
+
+    @pytest.mark.parametrize("cls", ["X", ["A", "E"]])
+    def test_invalid_class_raises(self, logic, cls):
+        with pytest.raises(ValueError, match="Classe social inválida"):
+            demand_factors(logic, [10, 10], cls)
+
+
+class TestScenarioEvaluator:
+    def test_each_scenario_matches_calculate(self, logic, evaluator):
+        segments = make_network(60, seed=1)
+        points = [s["ponto"] for s in segments]
+        rng = np.random.default_rng(0)
+        k = 8
+        clients = rng.integers(0, 5, size=(k, len(points)))
+        carga = rng.choice([0.0, 2.0, 5.0], size=(k, len(points)))
+        classes = ["A", "B", "C", "D", "B", "B", "C", "A"]
+
+        res = evaluator.evaluate(segments, clients=clients, carga_esp=carga, social_class=classes, points=points)
+        summaries = res.summaries()
+        assert res.cqt_accumulated.shape == (k, len(points))
+
+        for s in range(k):
+            trial = [
+                dict(seg, mono=int(clients[s, j]), carga_esp=float(carga[s, j])) for j, seg in enumerate(segments)
+            ]
+            ref = logic.calculate(trial, trafo_kva=112.5, social_class=classes[s])
+            for i, p in enumerate(res.points):
+                assert res.cqt_accumulated[s, i] == pytest.approx(ref["results"][p]["cqt_accumulated"])
+                assert res.accumulated[s, i] == pytest.approx(ref["results"][p]["accumulated"])
+            for key in ("fd", "max_cqt", "total_kva", "within_enel_limit", "total_clients"):
+                assert summaries[s][key] == pytest.approx(ref["summary"][key]), key
+            assert sorted(summaries[s]["segments_over_limit"]) == sorted(ref["summary"]["segments_over_limit"])
+
+    def test_default_matrices_reproduce_base_network(self, logic, evaluator):
+        segments = make_network(30, seed=2)
+        res = evaluator.evaluate(segments)
+        ref = logic.calculate(segments, trafo_kva=75, social_class="B")
+        assert res.max_cqt.shape == (1,)
+        assert res.max_cqt[0] == pytest.approx(ref["summary"]["max_cqt"])
+
+    def test_social_class_only_scenarios(self, logic, evaluator):
+        segments = make_network(30, seed=3)
+        res = evaluator.evaluate(segments, social_class=["A", "B", "C", "D"])
+        assert len(res.fd) == 4
+        assert np.all(np.diff(res.max_cqt) >= 0)
+
+    def test_partial_columns_keep_base_loads(self, logic, evaluator):
+        segments = make_network(20, seed=4)
+        res = evaluator.evaluate(segments, carga_esp=[[0.0], [30.0]], points=["p5"])
+        trial = [dict(s, carga_esp=30.0) if s["ponto"] == "P5" else s for s in segments]
+        ref = logic.calculate(trial, trafo_kva=75, social_class="B")
+        base = logic.calculate(
+            [dict(s, carga_esp=0.0) if s["ponto"] == "P5" else s for s in segments], trafo_kva=75, social_class="B"
+        )
+        assert res.max_cqt[0] == pytest.approx(base["summary"]["max_cqt"])
+        assert res.max_cqt[1] == pytest.approx(ref["summary"]["max_cqt"])
+
+    def test_growth_years(self, evaluator):
+        segments = make_network(40, seed=5)
+        base = np.array([s.get("mono", 0) for s in segments], dtype=float)
+        growth = np.array([1.0, 1.05, 1.10, 1.20, 1.50])
+        res = evaluator.evaluate(segments, clients=np.outer(growth, base), points=[s["ponto"] for s in segments])
+        assert np.all(np.diff(res.total_kva) > 0)
+
+    def test_accepts_compiled_network(self, logic, evaluator):
+        network = logic.compile_network(make_network(10, seed=6))
+        res = evaluator.evaluate(network, social_class=["B", "D"])
+        assert res.network is network
+
+    def test_unknown_point_raises(self, evaluator):
+        with pytest.raises(ValueError, match="não encontrados"):
+            evaluator.evaluate(make_network(5), clients=[[1]], points=["X9"])
+
+    def test_shape_mismatch_raises(self, evaluator):
+        with pytest.raises(ValueError, match="forma"):
+            evaluator.evaluate(make_network(5), clients=np.ones((2, 3)))
+
+    def test_invalid_scenario_class_raises(self, evaluator):
+        with pytest.raises(ValueError, match="Classe social inválida"):
+            evaluator.evaluate(make_network(5), social_class=["B", "X"])
+
+    def test_invalid_topology_raises(self, evaluator):
+        with pytest.raises(ValueError, match="TRAFO"):
+            evaluator.evaluate([{"ponto": "P1", "montante": "P0"}])
+
+    def test_many_scenarios_single_pass(self, evaluator):
+        segments = make_network(2000, seed=7)
+        clients = np.random.default_rng(1).integers(0, 4, size=(500, len(segments)))
+        res = evaluator.evaluate(segments, clients=clients, points=[s["ponto"] for s in segments])
+        assert res.cqt_accumulated.shape == (500, 2001)
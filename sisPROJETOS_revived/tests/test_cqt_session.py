@@ -0,0 +1,170 @@
+"""
+Testes da sessão CQT incremental (src/modules/cqt/session.py).
+
+Cada edição incremental é comparada com um ``CQTLogic.calculate`` completo
+sobre os trechos modificados.
+"""
+
+import copy
+import random
+from functools import partial
+
+import pytest
+from conftest import CQT_CABOS, make_network
+
+from src.modules.cqt.logic import CQTLogic
+from src.modules.cqt.session import CQTSession
+
+# Rede com 60+ UCs (fator DMDI estável para pequenas edições)
+make_loaded_network = partial(make_network, window=4, mono=(1, 3), tri=(0, 1), carga_esp=(0.0,))
+
+
+def assert_matches_reference(logic, session, segments, social_class="B"):
+    ref = logic.calculate(segments, trafo_kva=112.5, social_class=social_class)
+    results = session.result.to_results()
+    for p, row in ref["results"].items():
+        for key, value in row.items():
+            assert results[p][key] == pytest.approx(value, rel=1e-9, abs=1e-9), (p, key)
+    summary = session.calculate_summary()
+    assert summary["max_cqt"] == pytest.approx(ref["summary"]["max_cqt"])
+    assert summary["segments_over_limit"] == ref["summary"]["segments_over_limit"]
+
+
+@pytest.fixture
+def logic():
+    return CQTLogic()
+
+
+@pytest.fixture
+def segments():
+    return make_loaded_network(80)
+
+
+@pytest.fixture
+def session(logic, segments):
+    s = CQTSession(logic)
+    s.load(copy.deepcopy(segments), "B")
+    return s
+
+
+def _edit(segments, ponto, **changes):
+    for s in segments:
+        if s["ponto"] == ponto:
+            s.update(changes)
+
+
+class TestCQTSessionIncremental:
+    """Edições de um trecho produzem o mesmo resultado de um recálculo completo."""
+
+    def test_load_matches_reference(self, logic, session, segments):
+        assert_matches_reference(logic, session, segments)
+
+    def test_update_length(self, logic, session, segments):
+        session.update_segment("P40", metros=120.0)
+        _edit(segments, "P40", metros=120.0)
+        assert_matches_reference(logic, session, segments)
+
+    def test_update_cable_to_cable_not_in_network(self, logic, session, segments):
+        session.update_segment("P10", cabo="3x95+54.6mm² Al")
+        _edit(segments, "P10", cabo="3x95+54.6mm² Al")
+        assert_matches_reference(logic, session, segments)
+
+    def test_update_special_load(self, logic, session, segments):
+        session.update_segment("p55", carga_esp=15.0)
+        _edit(segments, "P55", carga_esp=15.0)
+        assert_matches_reference(logic, session, segments)
+
+    def test_sequence_of_random_edits(self, logic, session, segments):
+        rng = random.Random(42)
+        for _ in range(30):
+            ponto = f"P{rng.randint(1, 80)}"
+            changes = rng.choice(
+                [
+                    {"metros": float(rng.randint(10, 80))},
+                    {"cabo": rng.choice(CQT_CABOS)},
+                    {"mono": rng.randint(1, 3)},
+                    {"carga_esp": rng.choice([0.0, 3.0])},
+                ]
+            )
+            session.update_segment(ponto, **changes)
+            _edit(segments, ponto, **changes)
+        assert_matches_reference(logic, session, segments)
+
+    def test_demand_factor_change_triggers_full_refresh(self, logic, mocker):
+        segments = make_loaded_network(3, seed=1)  # poucas UCs: faixa DMDI sensível
+        session = CQTSession(logic)
+        session.load(copy.deepcopy(segments), "B")
+        spy = mocker.spy(session, "refresh")
+        session.update_segment("P1", mono=40)
+        _edit(segments, "P1", mono=40)
+        assert spy.call_count == 1
+        assert_matches_reference(logic, session, segments)
+
+    def test_update_trafo_loads(self, logic, session, segments):
+        session.update_segment("TRAFO", carga_esp=5.0)
+        _edit(segments, "TRAFO", carga_esp=5.0)
+        assert_matches_reference(logic, session, segments)
+
+
+class TestCQTSessionErrors:
+    def test_unknown_point_raises_key_error(self, session):
+        with pytest.raises(KeyError):
+            session.update_segment("NAO_EXISTE", metros=10)
+
+    def test_topology_field_raises_value_error(self, session):
+        with pytest.raises(ValueError, match="não editáveis"):
+            session.update_segment("P5", montante="P1")
+
+    def test_update_without_network_raises(self, logic):
+        with pytest.raises(ValueError, match="Nenhuma rede"):
+            CQTSession(logic).update_segment("P1", metros=10)
+
+
+class TestCQTSessionApply:
+    """``apply``/``calculate`` sincronizam a sessão com a tabela do GUI."""
+
+    def test_apply_single_edit_is_incremental(self, logic, session, segments, mocker):
+        spy_load = mocker.spy(session, "load")
+        spy_update = mocker.spy(session, "update_segment")
+        _edit(segments, "P20", metros=99.0)
+        session.apply(copy.deepcopy(segments), "B")
+        assert spy_load.call_count == 0
+        assert spy_update.call_count == 1
+        assert_matches_reference(logic, session, segments)
+
+    def test_apply_omitted_field_resets_to_default(self, logic, session, segments, mocker):
+        _edit(segments, "P12", carga_esp=4.0)
+        _edit(segments, "P40", carga_esp=2.5)
+        session.apply(copy.deepcopy(segments), "B")
+        spy_update = mocker.spy(session, "update_segment")
+        for s in segments:
+            if s["ponto"] in ("P12", "P40"):
+                del s["carga_esp"]
+            if s["ponto"] == "P40":
+                del s["tri"]
+        session.apply(copy.deepcopy(segments), "B")
+        assert spy_update.call_count == 2
+        assert_matches_reference(logic, session, segments)
+
+    def test_apply_topology_change_reloads(self, logic, session, segments, mocker):
+        spy_load = mocker.spy(session, "load")
+        _edit(segments, "P30", montante="P1")
+        session.apply(copy.deepcopy(segments), "B")
+        assert spy_load.call_count == 1
+        assert_matches_reference(logic, session, segments)
+
+    def test_apply_social_class_change_reloads(self, logic, session, segments):
+        session.apply(copy.deepcopy(segments), "D")
+        assert_matches_reference(logic, session, segments, social_class="D")
+
+    def test_calculate_returns_calculate_format(self, logic, segments):
+        res = CQTSession(logic).calculate(segments, trafo_kva=112.5, social_class="b")
+        ref = logic.calculate(segments, trafo_kva=112.5, social_class="B")
+        assert res["success"] is True
+        assert set(res["summary"]) == set(ref["summary"])
+        assert list(res["results"]) == list(ref["results"])
+
+    def test_calculate_invalid_topology_returns_error(self, logic):
+        res = CQTSession(logic).calculate([{"ponto": "P1", "montante": "X"}], trafo_kva=75)
+        assert res["success"] is False
+        assert "TRAFO" in res["error"]
@@ -0,0 +1,131 @@
+"""
+Testes da simulação CQT com curvas de carga horárias (src/modules/cqt/timeseries.py).
+"""
+
+from collections import defaultdict
+from functools import partial
+
+import numpy as np
+import pytest
+from conftest import make_network
+
+from src.modules.cqt.logic import CQTLogic
+from src.modules.cqt.timeseries import HORAS_ANO, LoadCurveSimulator, typical_residential_profile
+
+make_classed_network = partial(make_network, classes=("A", "B", "C"))
+
+
+def naive_cqt(logic, segments, dist, pontual):
+    """CQT acumulado por ponto com cargas locais arbitrárias (implementação recursiva direta)."""
+    coefs = logic.get_cable_coefs()
+    children = defaultdict(list)
+    for s in segments[1:]:
+        children[s["montante"]].append(s["ponto"])
+    seg = {s["ponto"]: s for s in segments}
+
+    def load(p):
+        return dist[p] + pontual[p] + sum(load(c) for c in children[p])
+
+    out = {"TRAFO": 0.0}
+
+    def walk(p):
+        for c in children[p]:
+            momento = load(c) - dist[c] / 2
+            out[c] = out[p] + momento * seg[c]["metros"] / 100 * coefs.get(seg[c]["cabo"], 0.0)
+            walk(c)
+
+    walk("TRAFO")
+    return out
+
+
+@pytest.fixture
+def logic():
+    return CQTLogic()
+
+
+@pytest.fixture
+def simulator(logic):
+    return LoadCurveSimulator(logic)
+
+
+class TestTypicalProfile:
+    def test_shape_and_peak(self):
+        profile = typical_residential_profile()
+        assert profile.shape == (HORAS_ANO,)
+        assert profile.max() == pytest.approx(1.0)
+        assert np.argmax(profile[:24]) == 19
+
+
+class TestLoadCurveSimulator:
+    def test_unit_profiles_reproduce_calculate(self, logic, simulator):
+        segments = make_classed_network(50, seed=1)
+        ones = np.ones(48)
+        res = simulator.simulate(segments, profiles={"B": ones}, social_class="B")
+        ref = logic.calculate(segments, trafo_kva=112.5, social_class="B")
+        for i, p in enumerate(res.network.points):
+            assert res.peak_cqt[i] == pytest.approx(ref["results"][p]["cqt_accumulated"])
+        assert np.allclose(res.max_cqt_hourly, ref["summary"]["max_cqt"])
+
+    def test_hourly_values_match_direct_calculation(self, logic, simulator):
+        segments = make_classed_network(40, seed=2)
+        rng = np.random.default_rng(0)
+        profiles = {c: rng.uniform(0.2, 1.2, 30) for c in ("A", "B", "C", "ESP")}
+        res = simulator.simulate(segments, profiles=profiles, social_class="B", chunk_hours=7)
+
+        fd = logic.get_fator_demanda(sum(s.get("mono", 0) for s in segments), "B")
+        for h in (0, 13, 29):
+            dist = {s["ponto"]: s.get("mono", 0) * fd * profiles[s.get("classe", "B")][h] for s in segments}
+            pontual = {s["ponto"]: s.get("carga_esp", 0.0) * profiles["ESP"][h] for s in segments}
+            ref = naive_cqt(logic, segments, dist, pontual)
+            assert res.max_cqt_hourly[h] == pytest.approx(max(ref.values()))
+            assert res.network.points[res.worst_point_hourly[h]] in {
+                p for p, v in ref.items() if v == max(ref.values())
+            }
+
+    def test_violations_are_reported(self, simulator):
+        segments = make_classed_network(60, seed=3)
+        base = simulator.simulate(segments, profiles={"B": np.ones(1)}, social_class="B")
+        curve = np.array([0.1, 0.5, 1.2, 0.2, 1.2]) * base.limit / base.max_cqt_hourly[0]
+        res = simulator.simulate(segments, profiles={"B": curve, "ESP": curve}, social_class="B")
+        assert res.violation_hours.tolist() == [2, 4]
+        over = res.points_over_limit()
+        assert over and set(over.values()) == {2}
+        summary = res.summary()
+        assert summary["hours_over_limit"] == 2
+        assert summary["max_cqt_hour"] in (2, 4)
+
+    def test_chunk_size_does_not_change_result(self, simulator):
+        segments = make_classed_network(30, seed=4)
+        a = simulator.simulate(segments, chunk_hours=5000)
+        b = simulator.simulate(segments, chunk_hours=97)
+        assert np.allclose(a.max_cqt_hourly, b.max_cqt_hourly)
+        assert np.array_equal(a.hours_over_limit, b.hours_over_limit)
+        assert np.array_equal(a.peak_hour, b.peak_hour)
+
+    def test_default_profile_covers_full_year(self, simulator):
+        res = simulator.simulate(make_classed_network(20, seed=5))
+        assert res.max_cqt_hourly.shape == (HORAS_ANO,)
+
+    def test_missing_network_class_profile_raises(self, simulator):
+        with pytest.raises(ValueError, match="Perfil horário ausente"):
+            simulator.simulate(make_classed_network(5), profiles={"A": np.ones(3)}, social_class="D")
+
+    def test_profiles_of_different_lengths_raise(self, simulator):
+        with pytest.raises(ValueError, match="mesmo comprimento"):
+            simulator.simulate(make_classed_network(5), profiles={"B": np.ones(3), "ESP": np.ones(4)})
+
+    def test_invalid_network_class_raises(self, simulator):
+        with pytest.raises(ValueError, match="Classe social inválida"):
+            simulator.simulate(make_classed_network(5), profiles={"X": np.ones(3)}, social_class="X")
+
+    def test_invalid_point_class_raises(self, simulator):
+        segments = make_classed_network(5)
+        segments[3]["classe"] = "X"
+        with pytest.raises(ValueError, match="Classe social inválida"):
+            simulator.simulate(segments, profiles={"B": np.ones(3), "X": np.ones(3)})
+
+    def test_full_year_on_large_network(self, simulator):
+        segments = make_classed_network(10000, seed=6)
+        profiles = {c: typical_residential_profile() for c in ("A", "B", "C")}
+        res = simulator.simulate(segments, profiles=profiles)
+        assert res.max_cqt_hourly.shape == (HORAS_ANO,)
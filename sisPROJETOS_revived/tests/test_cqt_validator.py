@@ -0,0 +1,116 @@
+"""
+Testes do validador de topologia CQT (src/modules/cqt/validator.py).
+"""
+
+import random
+
+import pytest
+
+from src.modules.cqt.logic import CQTLogic
+from src.modules.cqt.validator import validate_topology
+
+
+def chain(n, root="TRAFO"):
+    segments = [{"ponto": root, "montante": ""}]
+    for i in range(1, n + 1):
+        segments.append({"ponto": f"P{i}", "montante": root if i == 1 else f"P{i - 1}"})
+    return segments
+
+
+class TestValidateTopology:
+    def test_valid_network_order_is_topological(self):
+        rng = random.Random(0)
+        segments = [{"ponto": "TRAFO", "montante": ""}]
+        segments += [
+            {"ponto": f"P{i}", "montante": "TRAFO" if i == 1 else f"P{rng.randint(1, i - 1)}"} for i in range(1, 200)
+        ]
+        rng.shuffle(segments)
+        report = validate_topology(segments)
+        assert report.valid
+        pos = {p: i for i, p in enumerate(report.order)}
+        assert report.order[0] == "TRAFO"
+        assert all(pos[s["montante"]] < pos[s["ponto"]] for s in segments if s["montante"])
+
+    def test_reports_every_problem_at_once(self):
+        segments = chain(5) + [
+            {"ponto": "A", "montante": "B"},
+            {"ponto": "B", "montante": "C"},
+            {"ponto": "C", "montante": "A"},
+            {"ponto": "D", "montante": "C"},  # pendurado no ciclo
+            {"ponto": "X", "montante": "NAO_EXISTE"},
+            {"ponto": "Y", "montante": "X"},  # pendurado no órfão
+            {"ponto": "Z", "montante": "Z"},  # laço próprio
+            {"ponto": "P3", "montante": "P2"},  # duplicado
+        ]
+        report = validate_topology(segments)
+        assert not report.valid
+        assert report.order == []
+        assert sorted(sorted(c) for c in report.cycles) == [["A", "B", "C"], ["Z"]]
+        assert report.unknown_montante == {"X": "NAO_EXISTE"}
+        assert report.duplicates == {"P3": 2}
+        assert set(report.unreachable) == {"A", "B", "C", "D", "X", "Y", "Z"}
+
+    def test_cycle_order_follows_montante_pointers(self):
+        report = validate_topology(chain(1) + [{"ponto": "A", "montante": "B"}, {"ponto": "B", "montante": "A"}])
+        (cycle,) = report.cycles
+        assert sorted(cycle) == ["A", "B"]
+        assert "A → B → A" in report.message() or "B → A → B" in report.message()
+
+    def test_all_missing_montantes_are_listed(self):
+        segments = chain(2) + [{"ponto": "Q1", "montante": ""}, {"ponto": "Q2", "montante": ""}]
+        report = validate_topology(segments)
+        assert report.missing_montante == ["Q1", "Q2"]
+        assert "sem montante" in report.message()
+
+    def test_missing_root_still_reports_cycles(self):
+        report = validate_topology([{"ponto": "A", "montante": "B"}, {"ponto": "B", "montante": "A"}])
+        assert report.root_missing
+        assert report.cycles
+        assert "TRAFO" in report.message()
+
+    def test_duplicate_with_same_montante_is_valid(self):
+        report = validate_topology(chain(3) + [{"ponto": "P2", "montante": "P1"}])
+        assert report.valid
+        assert report.duplicates == {"P2": 2}
+
+    def test_duplicate_with_unreachable_montante_is_invalid(self):
+        report = validate_topology(chain(3) + [{"ponto": "P2", "montante": "FANTASMA"}])
+        assert not report.valid
+        assert "P2" in report.unreachable
+
+    def test_message_is_truncated_but_dict_is_complete(self):
+        segments = chain(1) + [{"ponto": f"O{i}", "montante": f"M{i}"} for i in range(50)]
+        report = validate_topology(segments)
+        assert "(+45)" in report.message()
+        assert len(report.to_dict()["unknown_montante"]) == 50
+
+    def test_deep_chain_has_no_recursion_limit(self):
+        segments = chain(200_000)
+        segments += [{"ponto": f"C{i}", "montante": f"C{(i + 1) % 100_000}"} for i in range(100_000)]
+        report = validate_topology(segments)
+        assert len(report.cycles) == 1 and len(report.cycles[0]) == 100_000
+        assert len(report.unreachable) == 100_000
+
+
+class TestValidateAndSortCompatibility:
+    @pytest.fixture
+    def cqt(self):
+        return CQTLogic()
+
+    def test_order_matches_previous_bfs(self, cqt):
+        segments = chain(4) + [{"ponto": "B1", "montante": "P1"}, {"ponto": "B2", "montante": "TRAFO"}]
+        ok, msg, order = cqt.validate_and_sort(segments)
+        assert ok and msg == ""
+        assert order == ["TRAFO", "P1", "B2", "P2", "B1", "P3", "P4"]
+
+    def test_cycle_message_keeps_keyword_and_names_points(self, cqt):
+        ok, msg, order = cqt.validate_and_sort(
+            chain(1) + [{"ponto": "A", "montante": "B"}, {"ponto": "B", "montante": "A"}]
+        )
+        assert not ok and order == []
+        assert "Ciclo" in msg and "A" in msg and "B" in msg
+
+    def test_calculate_returns_detailed_error(self, cqt):
+        res = cqt.calculate(chain(2) + [{"ponto": "X", "montante": "Y"}], trafo_kva=75)
+        assert res["success"] is False
+        assert "X (montante 'Y')" in res["error"]
@@ -0,0 +1,88 @@
+"""
+Testes do cache LRU (src/utils/memo.py) e da memorização de catenária e DXF.
+"""
+
+import threading
+
+import numpy as np
+import pytest
+
+from src.modules.catenaria.logic import CatenaryLogic
+from src.utils.dxf_manager import DXFManager
+from src.utils.memo import LRUCache
+
+
+class TestLRUCache:
+    def test_evicts_least_recently_used_and_counts(self):
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1  # "b" passa a ser o menos usado
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get_or_compute("c", lambda: 99) == 3
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size, stats.maxsize) == (2, 1, 2, 2)
+        assert stats.hit_rate == pytest.approx(2 / 3)
+
+    def test_zero_size_disables_and_negative_raises(self):
+        cache = LRUCache(maxsize=0)
+        assert cache.get_or_compute("k", lambda: 1) == 1
+        assert len(cache) == 0 and cache.stats().misses == 1
+        with pytest.raises(ValueError):
+            LRUCache(maxsize=-1)
+
+    def test_thread_safety_bounds_size(self):
+        cache = LRUCache(maxsize=50)
+
+        def worker(offset):
+            for i in range(2000):
+                cache.get_or_compute((offset + i) % 120, lambda: i)
+
+        threads = [threading.Thread(target=worker, args=(k * 7,)) for k in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        stats = cache.stats()
+        assert stats.size == 50 and stats.hits + stats.misses == 16000
+
+
+class TestCatenaryMemoization:
+    def test_repeated_inputs_hit_cache(self):
+        logic = CatenaryLogic()
+        first = logic.calculate_catenary(100, 10, 12, 1500, 0.779)
+        second = logic.calculate_catenary(100.0, 10.0, 12.0, 1500.0, 0.779)
+        assert second["x_vals"] is first["x_vals"] and second is not first
+        assert logic.cache_stats().hits == 1 and logic.cache_stats().misses == 1
+        with pytest.raises(ValueError):
+            first["y_vals"][0] = 0.0  # arrays compartilhados são somente leitura
+
+    def test_tolerance_normalized_to_point_count(self):
+        logic = CatenaryLogic()
+        a = logic.calculate_catenary(400, 10, 10, 1500, 0.779, curve_tolerance_m=0.01)
+        b = logic.calculate_catenary(400, 10, 10, 1500, 0.779, curve_points=a["x_vals"].size)
+        assert b["y_vals"] is a["y_vals"]
+
+    def test_distinct_inputs_and_disabled_cache(self):
+        logic = CatenaryLogic(cache_size=0)
+        a = logic.calculate_catenary(100, 10, 12, 1500, 0.779)
+        b = logic.calculate_catenary(100, 10, 12, 1500, 0.779)
+        np.testing.assert_array_equal(a["y_vals"], b["y_vals"])
+        assert a["y_vals"] is not b["y_vals"] and logic.cache_stats().hits == 0
+        c = CatenaryLogic().calculate_catenary(100, 10, 12, 1600, 0.779)
+        assert c["sag"] < a["sag"]
+
+
+class TestDxfBufferMemoization:
+    def test_identical_curves_rendered_once(self):
+        DXFManager.clear_buffer_cache()
+        x = np.linspace(0, 100, 50)
+        y = 10 - 0.001 * x * (100 - x)
+        first = DXFManager.create_catenary_dxf_to_buffer(x, y, 2.5)
+        again = DXFManager.create_catenary_dxf_to_buffer(list(x), iter(y.tolist()), 2.501)
+        assert again is first  # mesma curva e mesmo rótulo "Sag: 2.50m"
+        other = DXFManager.create_catenary_dxf_to_buffer(x, y + 1, 2.5)
+        assert other != first
+        stats = DXFManager.buffer_cache_stats()
+        assert (stats.hits, stats.misses) == (1, 2)
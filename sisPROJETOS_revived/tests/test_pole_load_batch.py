@@ -0,0 +1,96 @@
+"""
+Testes do cálculo vetorizado de esforços em lote (src/modules/pole_load/batch.py).
+"""
+
+import numpy as np
+import pytest
+
+from src.modules.pole_load.logic import PoleLoadLogic
+
+_CONDUCTORS = {
+    "Light": ["556MCM-CA, Nu", "397MCM-CA, Nu", "1/0AWG-CAA, Nu", "Fora do catálogo"],
+    "Enel": ["1/0 CA", "BT 3x35+54.6", "Sem tabela"],
+}
+
+
+@pytest.fixture(scope="module")
+def logic():
+    return PoleLoadLogic()
+
+
+def _random_network(n_poles, seed=3):
+    rng = np.random.default_rng(seed)
+    concessionaires = rng.choice(["Light", "Enel"], n_poles).tolist()
+    conditions = rng.choice(["Normal", "Vento Forte", "Gelo"], n_poles).tolist()
+    poles, cables = [], []
+    for p, conc in enumerate(concessionaires):
+        for _ in range(rng.integers(1, 5)):
+            poles.append(p)
+            cables.append(
+                {
+                    "condutor": str(rng.choice(_CONDUCTORS[conc])),
+                    "vao": float(rng.uniform(0, 120)),
+                    "angulo": float(rng.uniform(-180, 360)),
+                    "flecha": float(rng.uniform(0.2, 3.0)),
+                }
+            )
+    return poles, cables, concessionaires, conditions
+
+
+def _batch(logic, poles, cables, concessionaires, conditions):
+    return logic.calculate_batch(
+        poles,
+        [c["condutor"] for c in cables],
+        [c["vao"] for c in cables],
+        [c["angulo"] for c in cables],
+        [c["flecha"] for c in cables],
+        concessionaires,
+        conditions,
+    )
+
+
+def test_matches_scalar_resultant(logic):
+    poles, cables, concessionaires, conditions = _random_network(200)
+    result = _batch(logic, poles, cables, concessionaires, conditions)
+    assert result.valid.all() and not result.errors
+    for p in range(0, 200, 7):
+        own = [c for i, c in zip(poles, cables) if i == p]
+        ref = logic.calculate_resultant(concessionaires[p], conditions[p], own)
+        assert result.resultant_force[p] == pytest.approx(ref["resultant_force"], rel=1e-12, abs=1e-9)
+        assert result.total_x[p] == pytest.approx(ref["total_x"], rel=1e-12, abs=1e-9)
+        if ref["resultant_force"] > 1e-9:
+            assert result.resultant_angle[p] == pytest.approx(ref["resultant_angle"], abs=1e-9)
+
+
+def test_invalid_poles_do_not_abort(logic):
+    cables = [
+        {"condutor": "1/0AWG-CAA, Nu", "vao": 40.0, "angulo": 0.0, "flecha": 1.0},
+        {"condutor": "1/0 CA", "vao": 30.0, "angulo": 0.0, "flecha": 1.0},
+        {"condutor": "1/0AWG-CAA, Nu", "vao": -5.0, "angulo": 0.0, "flecha": 1.0},
+        {"condutor": "1/0AWG-CAA, Nu", "vao": 40.0, "angulo": 0.0, "flecha": 1.0},
+    ]
+    result = _batch(logic, [0, 1, 2, 3], cables, ["Light", "InvalidCorp", "Light", ""], ["Normal"] * 4)
+    assert result.valid.tolist() == [True, False, False, False]
+    assert "não encontrada" in result.errors[1] and "inválidos" in result.errors[2]
+    assert np.isnan(result.resultant_force[1:]).all() and np.isnan(result.traction[1:]).all()
+
+
+def test_fixed_traction_and_pole_without_cables(logic):
+    cables = [{"condutor": "BT 3x35+54.6", "vao": 30.0, "angulo": 90.0, "flecha": 1.0}]
+    result = _batch(logic, [1], cables, ["Light", "Enel"], ["Normal", "Gelo"])
+    assert result.resultant_force.tolist() == pytest.approx([0.0, 272.0])
+    assert result.resultant_angle[1] == pytest.approx(90.0)
+
+
+def test_mismatched_columns_raise(logic):
+    with pytest.raises(ValueError, match="mesmo tamanho"):
+        logic.calculate_batch([0, 0], ["a"], [1.0], [0.0], [1.0], ["Light"], ["Normal"])
+    with pytest.raises(ValueError, match="fora do intervalo"):
+        logic.calculate_batch([1], ["a"], [1.0], [0.0], [1.0], ["Light"], ["Normal"])
+
+
+def test_whole_network(logic):
+    poles, cables, concessionaires, conditions = _random_network(5000, seed=11)
+    result = _batch(logic, poles, cables, concessionaires, conditions)
+    assert result.size == 5000 and result.valid.all()
+    assert np.all((result.resultant_angle >= 0) & (result.resultant_angle < 360))
@@ -0,0 +1,146 @@
+"""
+Testes do índice em memória do catálogo de esforços (src/modules/pole_load/catalog.py).
+"""
+
+import sqlite3
+
+import numpy as np
+import pytest
+
+from src.database.db_manager import DatabaseManager
+from src.modules.pole_load.catalog import POLE_LOAD_CATALOG, LoadTable, PoleCatalog, PoleLoadCatalogCache
+from src.modules.pole_load.logic import PoleLoadLogic
+
+
+@pytest.fixture
+def db(tmp_path):
+    return DatabaseManager(db_path=str(tmp_path / "pole_load.db"))
+
+
+def _cable(condutor, vao, angulo=0.0, flecha=1.0):
+    return {"condutor": condutor, "vao": vao, "angulo": angulo, "flecha": flecha}
+
+
+class TestPoleLoadCatalogIndex:
+    def test_one_revision_query_per_calculation(self, db, mocker):
+        logic = PoleLoadLogic(db)
+        POLE_LOAD_CATALOG.invalidate(db.db_path)
+        warm = logic.calculate_resultant("Light", "Normal", [_cable("1/0AWG-CAA, Nu", 40)])
+        spy = mocker.spy(db, "get_connection")
+        again = logic.calculate_resultant("Light", "Normal", [_cable("1/0AWG-CAA, Nu", 40)])
+        enel = logic.calculate_resultant("Enel", "Normal", [_cable("1/0 CA", 30 + i) for i in range(50)])
+        assert again == warm and enel["resultant_force"] > 0
+        assert spy.call_count == 2  # só a conferência de revisões, independente do número de cabos
+
+    def test_index_matches_tables(self, db):
+        index = PoleLoadCatalogCache().get(db)
+        conn = sqlite3.connect(db.db_path)
+        weight = conn.execute("SELECT weight_kg_m FROM conductors WHERE name='1/0AWG-CAA, Nu'").fetchone()[0]
+        rows = conn.execute(
+            "SELECT span_m, load_daN FROM load_tables WHERE concessionaire='Enel' AND conductor_name='1/0 CA'"
+        ).fetchall()
+        conn.close()
+        assert index.weights["1/0AWG-CAA, Nu"] == weight
+        table = index.load_table("Enel", "1/0 CA")
+        assert list(zip(table.spans.tolist(), table.loads.tolist())) == sorted(rows)
+        assert index.load_table("Enel", "inexistente").spans.size == 0
+        with pytest.raises(KeyError, match="não encontrada"):
+            index.method("InvalidCorp")
+
+    def test_add_conductor_visible_without_reload(self, db):
+        logic = PoleLoadLogic(db)
+        cable = [_cable("Novo Condutor", 40)]
+        before = logic.calculate_resultant("Light", "Normal", cable)["resultant_force"]  # peso padrão 0.5
+        db.add_conductor({"name": "Novo Condutor", "weight": 1.0})
+        assert logic.calculate_resultant("Light", "Normal", cable)["resultant_force"] == pytest.approx(2 * before)
+
+    def test_other_process_edit_reaches_long_lived_instance(self, db):
+        # Mesma situação da API: instância de módulo, alteração feita por outra conexão
+        logic = PoleLoadLogic(db)
+        first = logic.catalog()
+        assert logic.catalog() is first
+        conn = sqlite3.connect(db.db_path)
+        conn.execute("UPDATE conductors SET weight_kg_m = 2.0 WHERE name='1/0AWG-CAA, Nu'")
+        conn.execute(
+            "INSERT INTO poles (material, description, nominal_load_daN) VALUES ('Aço', 'Aço 12m/9999', 9999)"
+        )
+        conn.commit()
+        conn.close()
+        assert logic.catalog().weights["1/0AWG-CAA, Nu"] == 2.0
+        assert logic.suggest_pole(9000.0)[0]["description"] == "Aço 12m/9999"
+
+    def test_refresh_detects_external_change(self, db):
+        cache = PoleLoadCatalogCache()
+        first = cache.get(db)
+        assert cache.refresh(db) is first
+        conn = sqlite3.connect(db.db_path)
+        conn.execute("UPDATE load_tables SET load_daN = 999 WHERE concessionaire='Enel' AND conductor_name='1/0 CA'")
+        conn.commit()
+        conn.close()
+        refreshed = cache.refresh(db)
+        assert refreshed is not first
+        assert set(refreshed.load_table("Enel", "1/0 CA").loads.tolist()) == {999}
+
+
+class TestLoadTable:
+    _TABLE = {60: 300.0, 20: 100.0, 40: 220.0}
+
+    def test_batch_matches_scalar_and_clamps(self):
+        table = LoadTable.from_mapping(self._TABLE)
+        spans = np.array([0.0, 10.0, 20.0, 30.0, 40.0, 55.0, 60.0, 90.0])
+        expected = [100.0, 100.0, 100.0, 160.0, 220.0, 280.0, 300.0, 300.0]
+        np.testing.assert_allclose(table.traction(spans), expected)
+        assert [table.traction(s) for s in spans] == pytest.approx(expected)
+        assert table.fixed_load is None
+
+    def test_fixed_traction_ignores_span(self):
+        table = LoadTable.from_mapping({0: 136.0, 50: 999.0})
+        assert table.fixed_load == 136.0
+        assert table.traction(75.0) == 136.0
+        np.testing.assert_array_equal(table.traction([10.0, 80.0]), [136.0, 136.0])
+        assert table.interpolate(50.0) == 999.0
+
+    def test_empty_table_gives_zero(self):
+        table = LoadTable.from_mapping({})
+        assert table.traction(30.0) == 0.0
+        np.testing.assert_array_equal(table.traction([1.0, 2.0]), [0.0, 0.0])
+
+
+def _sql_suggest(db_path, force):
+    """Consulta original de ``suggest_pole`` (referência)."""
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute(
+        "SELECT material, description, nominal_load_daN FROM poles WHERE nominal_load_daN >= ? "
+        "ORDER BY nominal_load_daN ASC, material ASC",
+        (force,),
+    ).fetchall()
+    conn.close()
+    best = {}
+    for material, description, load in rows:
+        best.setdefault(material, {"material": material, "description": description, "load": load})
+    return list(best.values())
+
+
+class TestPoleCatalog:
+    def test_suggest_matches_sql_query(self, db):
+        logic = PoleLoadLogic(db)
+        forces = [0.0, 1.0, 150.0, 200.0, 300.5, 600.0, 1000.0, 99999.0]
+        for force in forces:
+            assert logic.suggest_pole(force) == _sql_suggest(db.db_path, force)
+        assert logic.suggest_poles(forces) == [_sql_suggest(db.db_path, f) for f in forces]
+
+    def test_vectorized_ties_and_nan(self):
+        rows = [("Madeira", "M1", 300.0), ("Concreto", "C1", 300.0), ("Fibra", "F1", 150.0), ("Concreto", "C2", 600.0)]
+        catalog = PoleCatalog.from_rows(rows)
+        forces = np.array([100.0, 250.0, 400.0, np.nan])
+        many = catalog.suggest_many(forces)
+        assert many == [catalog.suggest(f) for f in forces]
+        assert [p["material"] for p in many[0]] == ["Fibra", "Concreto", "Madeira"]
+        assert [p["description"] for p in many[2]] == ["C2"] and many[3] == []
+
+    def test_add_pole_visible_after_invalidate(self, db):
+        logic = PoleLoadLogic(db)
+        assert logic.suggest_pole(50_000.0) == []
+        db.add_pole({"material": "Aço", "description": "Aço 50 kdaN", "height_m": 15, "nominal_load_daN": 60_000})
+        logic.reload_catalog()
+        assert logic.suggest_pole(50_000.0)[0]["description"] == "Aço 50 kdaN"
@@ -0,0 +1,96 @@
+"""
+Testes da varredura de condições de carga (PoleLoadLogic.calculate_condition_sweep)
+e do endpoint POST /api/v1/pole-load/sweep.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.modules.pole_load.logic import PoleLoadLogic
+
+_LIGHT = [
+    {"condutor": "556MCM-CA, Nu", "vao": 80.0, "angulo": 0.0, "flecha": 1.5},
+    {"condutor": "1/0AWG-CAA, Nu", "vao": 40.0, "angulo": 120.0, "flecha": 1.0},
+]
+_ENEL = [
+    {"condutor": "1/0 CA", "vao": 35.0, "angulo": 0.0},
+    {"condutor": "BT 3x35+54.6", "vao": 50.0, "angulo": 200.0},
+]
+
+
+@pytest.fixture(scope="module")
+def logic():
+    return PoleLoadLogic()
+
+
+@pytest.fixture(scope="module")
+def client():
+    from src.api.app import create_app
+
+    return TestClient(create_app())
+
+
+class TestConditionSweep:
+    @pytest.mark.parametrize("conc,cabos", [("Light", _LIGHT), ("Enel", _ENEL)])
+    def test_matches_resultant_per_condition(self, logic, conc, cabos):
+        sweep = logic.calculate_condition_sweep(conc, cabos)
+        assert [c["condicao"] for c in sweep["conditions"]] == ["Normal", "Vento Forte", "Gelo"]
+        for item in sweep["conditions"]:
+            ref = logic.calculate_resultant(conc, item["condicao"], cabos)
+            for key in ("resultant_force", "resultant_angle", "total_x", "total_y"):
+                assert item[key] == pytest.approx(ref[key], rel=1e-12, abs=1e-9)
+        assert sweep["vectors"] == ref["vectors"]
+
+    def test_governing_is_largest_factor(self, logic):
+        sweep = logic.calculate_condition_sweep("Light", _LIGHT)
+        assert sweep["governing"]["condicao"] == "Gelo"
+        assert sweep["governing"]["fator_seguranca"] == 2.0
+
+    def test_subset_keeps_requested_order(self, logic):
+        sweep = logic.calculate_condition_sweep("Light", _LIGHT, ["Vento Forte", "Normal"])
+        assert [c["condicao"] for c in sweep["conditions"]] == ["Vento Forte", "Normal"]
+        assert sweep["governing"]["condicao"] == "Vento Forte"
+
+    def test_tractions_resolved_once(self, logic):
+        with patch.object(logic, "_resolve_cables", wraps=logic._resolve_cables) as spy:
+            logic.calculate_condition_sweep("Light", _LIGHT)
+        assert spy.call_count == 1
+
+    def test_concessionaria_invalida(self, logic):
+        with pytest.raises(KeyError, match="não encontrada"):
+            logic.calculate_condition_sweep("Inexistente", _LIGHT)
+
+    def test_lista_de_condicoes_vazia(self, logic):
+        with pytest.raises(KeyError):
+            logic.calculate_condition_sweep("Light", _LIGHT, [])
+
+
+class TestPoleLoadSweepEndpoint:
+    _URL = "/api/v1/pole-load/sweep"
+
+    def test_retorna_todas_as_condicoes(self, client, logic):
+        resp = client.post(self._URL, json={"concessionaria": "Light", "cabos": _LIGHT})
+        assert resp.status_code == 200
+        data = resp.json()
+        assert len(data["conditions"]) == 3
+        assert data["governing_condition"] == "Gelo"
+        ref = logic.calculate_resultant("Light", "Gelo", _LIGHT)
+        assert data["governing_force"] == pytest.approx(ref["resultant_force"])
+        assert data["suggested_poles"] == logic.suggest_pole(ref["resultant_force"])
+
+    def test_condicoes_informadas(self, client):
+        resp = client.post(self._URL, json={"concessionaria": "Enel", "cabos": _ENEL, "condicoes": ["Normal"]})
+        assert resp.status_code == 200
+        data = resp.json()
+        assert [c["condicao"] for c in data["conditions"]] == ["Normal"]
+        assert data["governing_condition"] == "Normal"
+
+    def test_concessionaria_invalida_retorna_422(self, client):
+        resp = client.post(self._URL, json={"concessionaria": "Inexistente", "cabos": _LIGHT})
+        assert resp.status_code == 422
+
+    def test_sem_cabos_retorna_422(self, client):
+        resp = client.post(self._URL, json={"concessionaria": "Light", "cabos": []})
+        assert resp.status_code == 422